@@ -13,9 +13,18 @@
 // limitations under the License.
 
 use criterion::{criterion_group, criterion_main, BenchmarkId, Criterion};
+use evobandits::arm::{arms_from_bytes, arms_to_bytes, Arm, OptimizationFn};
 use evobandits::evobandits::GMAB;
-use rand::rng;
-use rand_distr::{Distribution, Normal};
+use evobandits::genetic::{GeneticAlgorithm, MutationSchedule};
+use evobandits::island::IslandModel;
+use evobandits::multi_objective::MultiObjectiveGMAB;
+use evobandits::parallel::ParallelFn;
+use evobandits::progress::Progress;
+use evobandits::rng::derive_seed;
+use evobandits::surrogate::Surrogate;
+use rand::rngs::StdRng;
+use rand::{rng, Rng, SeedableRng};
+use rand_distr::{Distribution, Normal, Poisson};
 use std::hint::black_box;
 
 pub fn noisy_rosenbrock(x: &[i32]) -> f64 {
@@ -35,6 +44,51 @@ pub fn noisy_rosenbrock(x: &[i32]) -> f64 {
     base_value + noise
 }
 
+// Noisy Rosenbrock, whose evaluations get more expensive with the first dimension, like a
+// simulation with a longer horizon.
+pub fn costly_rosenbrock(x: &[i32]) -> f64 {
+    let n_steps = 1_000 * (x[0] + 100).max(1) as u64;
+    black_box((0..n_steps).fold(0u64, |acc, step| black_box(acc.wrapping_add(step))));
+    noisy_rosenbrock(x)
+}
+
+// (s, S) inventory simulation over 30 periods, see examples/inventory.rs.
+pub fn inventory(x: &[i32]) -> f64 {
+    let s = x[0];
+    let big_s = x[1] + s;
+    let poisson = Poisson::new(25.0).unwrap();
+    let mut rng = rng();
+
+    let mut inventory = big_s;
+    let mut costs = 0.0;
+    for _ in 0..30 {
+        if inventory <= s {
+            costs += 32.0 + 3.0 * (big_s - inventory) as f64;
+            inventory = big_s;
+        }
+        inventory -= poisson.sample(&mut rng) as i32;
+        costs += if inventory >= 0 {
+            inventory as f64
+        } else {
+            5.0 * (-inventory) as f64
+        };
+    }
+    costs / 30.0
+}
+
+// Three noisy objectives with conflicting optima along the diagonal of the search space.
+pub fn noisy_tri_objective(x: &[i32]) -> Vec<f64> {
+    let mut rng = rng();
+    let normal = Normal::new(0.0, 5.0).unwrap();
+    [-25, 0, 25]
+        .iter()
+        .map(|&target| {
+            let distance: f64 = x.iter().map(|&xi| ((xi - target) as f64).powi(2)).sum();
+            distance + normal.sample(&mut rng)
+        })
+        .collect()
+}
+
 fn benchmark_evobandits(c: &mut Criterion) {
     let mut group = c.benchmark_group("Rosenbrock Optimization");
 
@@ -68,5 +122,393 @@ fn benchmark_evobandits(c: &mut Criterion) {
     group.finish();
 }
 
-criterion_group!(benches, benchmark_evobandits);
+fn benchmark_mutation_schedules(c: &mut Criterion) {
+    let mut group = c.benchmark_group("Rosenbrock Optimization (Mutation Schedules)");
+
+    group.measurement_time(std::time::Duration::from_secs(60));
+
+    // Wide bounds, where a fixed mutation span is too coarse late in the run
+    let n_trials = 10_000;
+    for (name, mutation_schedule) in [
+        ("Fixed", MutationSchedule::Fixed),
+        ("SuccessRule", MutationSchedule::SuccessRule),
+        ("Decay", MutationSchedule::Decay),
+    ] {
+        group.bench_with_input(
+            BenchmarkId::new("Noisy", name),
+            &mutation_schedule,
+            |b, &mutation_schedule| {
+                b.iter(|| {
+                    let mut gmab = GMAB::new(Default::default());
+                    gmab.set_mutation_schedule(mutation_schedule);
+                    let bounds = vec![(-5_000, 5_000), (-5_000, 5_000)];
+
+                    // Run the optimization
+                    let result = gmab.optimize(
+                        black_box(noisy_rosenbrock),
+                        black_box(bounds),
+                        black_box(n_trials),
+                        1,
+                        Default::default(),
+                    );
+
+                    result
+                });
+            },
+        );
+    }
+
+    group.finish();
+}
+
+fn benchmark_cost_aware_selection(c: &mut Criterion) {
+    let mut group = c.benchmark_group("Rosenbrock Optimization (Cost-Aware Selection)");
+
+    // The same number of trials takes less time if the selection accounts for the cost
+    let n_trials = 2_000;
+    for cost_aware in [false, true] {
+        group.bench_with_input(
+            BenchmarkId::new("Costly", cost_aware),
+            &cost_aware,
+            |b, &cost_aware| {
+                b.iter(|| {
+                    let mut gmab = GMAB::new(Default::default());
+                    gmab.set_cost_aware(cost_aware);
+                    let bounds = vec![(-100, 100), (-100, 100)];
+
+                    // Run the optimization
+                    let result = gmab.optimize(
+                        black_box(costly_rosenbrock),
+                        black_box(bounds),
+                        black_box(n_trials),
+                        1,
+                        Default::default(),
+                    );
+
+                    result
+                });
+            },
+        );
+    }
+
+    group.finish();
+}
+
+fn benchmark_surrogate_screening(c: &mut Criterion) {
+    let mut group = c.benchmark_group("Inventory Optimization (Surrogate Screening)");
+
+    // The overhead of screening a small budget of trials, which reaches better arms with it
+    let n_trials = 1_000;
+    for oversampling in [None, Some(2), Some(4)] {
+        group.bench_with_input(
+            BenchmarkId::new("Oversampling", format!("{:?}", oversampling)),
+            &oversampling,
+            |b, &oversampling| {
+                b.iter(|| {
+                    let mut gmab = GMAB::new(Default::default());
+                    gmab.set_surrogate(oversampling.map(Surrogate::new));
+                    let bounds = vec![(1, 100), (1, 100)];
+
+                    // Run the optimization
+                    let result = gmab.optimize(
+                        black_box(inventory),
+                        black_box(bounds),
+                        black_box(n_trials),
+                        1,
+                        Default::default(),
+                    );
+
+                    result
+                });
+            },
+        );
+    }
+
+    group.finish();
+}
+
+// Noisy Rosenbrock, whose progress is reported at most once per interval of seconds.
+struct ReportingRosenbrock {
+    interval: Option<f64>,
+}
+
+impl OptimizationFn for ReportingRosenbrock {
+    fn evaluate(&self, action_vector: &[i32]) -> f64 {
+        noisy_rosenbrock(action_vector)
+    }
+
+    fn progress_interval(&self) -> Option<f64> {
+        self.interval
+    }
+
+    fn report_progress(&self, progress: &Progress) {
+        black_box(progress);
+    }
+}
+
+fn benchmark_progress_reporting(c: &mut Criterion) {
+    let mut group = c.benchmark_group("Rosenbrock Optimization (Progress Reporting)");
+
+    group.measurement_time(std::time::Duration::from_secs(60));
+
+    // The overhead of the snapshots, without, once per second, and after every generation
+    let n_trials = 10_000;
+    for interval in [None, Some(1.0), Some(0.0)] {
+        group.bench_with_input(
+            BenchmarkId::new("Interval", format!("{:?}", interval)),
+            &interval,
+            |b, &interval| {
+                b.iter(|| {
+                    let mut gmab = GMAB::new(Default::default());
+                    let bounds = vec![(-50, 50), (-50, 50)];
+
+                    // Run the optimization
+                    let result = gmab.optimize(
+                        black_box(ReportingRosenbrock { interval }),
+                        black_box(bounds),
+                        black_box(n_trials),
+                        1,
+                        Default::default(),
+                    );
+
+                    result
+                });
+            },
+        );
+    }
+
+    group.finish();
+}
+
+fn benchmark_population_sizes(c: &mut Criterion) {
+    let mut group = c.benchmark_group("Rosenbrock Optimization (Population Size)");
+
+    group.sample_size(10);
+
+    // Twenty generations each, so that the cost per generation is comparable across sizes
+    for population_size in [20, 1_000, 10_000] {
+        group.bench_with_input(
+            BenchmarkId::new("Noisy", population_size),
+            &population_size,
+            |b, &population_size| {
+                b.iter(|| {
+                    let mut gmab = GMAB::new(GeneticAlgorithm {
+                        population_size,
+                        ..Default::default()
+                    });
+                    let bounds = vec![(-5_000, 5_000), (-5_000, 5_000)];
+
+                    // Run the optimization
+                    let result = gmab.optimize(
+                        black_box(noisy_rosenbrock),
+                        black_box(bounds),
+                        black_box(40 * population_size),
+                        1,
+                        Default::default(),
+                    );
+
+                    result
+                });
+            },
+        );
+    }
+
+    group.finish();
+}
+
+fn benchmark_parallel_evaluation(c: &mut Criterion) {
+    let mut group = c.benchmark_group("Parallel Evaluation");
+
+    group.measurement_time(std::time::Duration::from_secs(60));
+
+    // Evaluate the candidates of each generation serially, or across all cores
+    let n_trials = 100_000;
+    let objectives: [(&str, fn(&[i32]) -> f64, Vec<(i32, i32)>); 2] = [
+        ("Rosenbrock", noisy_rosenbrock, vec![(-50, 50), (-50, 50)]),
+        ("Inventory", inventory, vec![(1, 100), (1, 100)]),
+    ];
+    for (name, objective, bounds) in objectives.iter() {
+        for parallel in [false, true] {
+            let id = if parallel { "Parallel" } else { "Serial" };
+            group.bench_with_input(BenchmarkId::new(*name, id), &parallel, |b, &parallel| {
+                b.iter(|| {
+                    let mut gmab = GMAB::new(Default::default());
+
+                    // Run the optimization
+                    if parallel {
+                        gmab.optimize(
+                            black_box(ParallelFn::new(*objective)),
+                            black_box(bounds.clone()),
+                            black_box(n_trials),
+                            1,
+                            Default::default(),
+                        )
+                    } else {
+                        gmab.optimize(
+                            black_box(*objective),
+                            black_box(bounds.clone()),
+                            black_box(n_trials),
+                            1,
+                            Default::default(),
+                        )
+                    }
+                });
+            });
+        }
+    }
+
+    group.finish();
+}
+
+fn benchmark_random_streams(c: &mut Criterion) {
+    let mut group = c.benchmark_group("Random Streams");
+
+    // Draw one number per (generation, operator, index), as the genetic operators do
+    let seed = 42;
+    group.bench_function("Sequential", |b| {
+        b.iter(|| {
+            let mut rng = StdRng::seed_from_u64(seed);
+            let mut sum = 0.0;
+            for _generation in 0..100 {
+                for _index in 0..20 {
+                    sum += rng.random::<f64>();
+                }
+            }
+            sum
+        });
+    });
+    group.bench_function("Counter-Based", |b| {
+        b.iter(|| {
+            let mut sum = 0.0;
+            for generation in 0..100 {
+                let generation_seed = derive_seed(seed, &[generation]);
+                for index in 0..20 {
+                    let mut rng = StdRng::seed_from_u64(derive_seed(generation_seed, &[3, index]));
+                    sum += rng.random::<f64>();
+                }
+            }
+            sum
+        });
+    });
+
+    group.finish();
+}
+
+fn benchmark_serialization(c: &mut Criterion) {
+    let mut group = c.benchmark_group("Serialization (100k Arms)");
+
+    // 200k trials on wide bounds leave a state with about 100k arms
+    let mut gmab = GMAB::new(Default::default());
+    let bounds = vec![(-100_000, 100_000); 5];
+    gmab.optimize(noisy_rosenbrock, bounds, 200_000, 1, Some(42));
+    let bytes = gmab.to_bytes();
+    group.bench_function("GMAB to_bytes", |b| b.iter(|| black_box(&gmab).to_bytes()));
+    group.bench_function("GMAB from_bytes", |b| {
+        b.iter(|| GMAB::from_bytes(black_box(&bytes)))
+    });
+
+    let arms: Vec<Arm> = (0..100_000)
+        .map(|i| {
+            let mut arm = Arm::new(&[i, -i, i % 7, i % 11, i % 13]);
+            arm.pull(&noisy_rosenbrock);
+            arm
+        })
+        .collect();
+    let bytes = arms_to_bytes(&arms);
+    group.bench_function("Arms round trip", |b| {
+        b.iter(|| arms_from_bytes(&arms_to_bytes(black_box(&arms))))
+    });
+    group.bench_function("Arms from_bytes", |b| {
+        b.iter(|| arms_from_bytes(black_box(&bytes)))
+    });
+
+    group.finish();
+}
+
+fn benchmark_evobandits_islands(c: &mut Criterion) {
+    let mut group = c.benchmark_group("Rosenbrock Optimization (Islands)");
+
+    group.measurement_time(std::time::Duration::from_secs(60));
+
+    // Simulate different numbers of islands with the same budget
+    let n_trials = 100_000;
+    for n_islands in [1, 2, 4].iter() {
+        group.bench_with_input(
+            BenchmarkId::new("Noisy", n_islands),
+            n_islands,
+            |b, &n_islands| {
+                b.iter(|| {
+                    let gmab = GMAB::new(Default::default());
+                    let island_model = IslandModel {
+                        n_islands,
+                        ..Default::default()
+                    };
+                    let bounds = vec![(-50, 50), (-50, 50)];
+
+                    // Run the optimization
+                    let result = island_model.optimize(
+                        &gmab,
+                        black_box(noisy_rosenbrock),
+                        black_box(bounds),
+                        black_box(n_trials),
+                        1,
+                        Default::default(),
+                    );
+
+                    result
+                });
+            },
+        );
+    }
+
+    group.finish();
+}
+
+fn benchmark_multi_objective(c: &mut Criterion) {
+    let mut group = c.benchmark_group("Tri-Objective Optimization");
+
+    group.measurement_time(std::time::Duration::from_secs(60));
+
+    // Simulate different budgets
+    for n_trials in [10_000, 100_000].iter() {
+        group.bench_with_input(
+            BenchmarkId::new("Noisy", n_trials),
+            n_trials,
+            |b, &n_trials| {
+                b.iter(|| {
+                    let mut gmab = MultiObjectiveGMAB::new(Default::default());
+                    let bounds = vec![(-50, 50), (-50, 50)];
+
+                    // Run the optimization
+                    let result = gmab.optimize(
+                        black_box(noisy_tri_objective),
+                        black_box(bounds),
+                        black_box(n_trials),
+                        3,
+                        Default::default(),
+                    );
+
+                    result
+                });
+            },
+        );
+    }
+
+    group.finish();
+}
+
+criterion_group!(
+    benches,
+    benchmark_evobandits,
+    benchmark_mutation_schedules,
+    benchmark_cost_aware_selection,
+    benchmark_surrogate_screening,
+    benchmark_progress_reporting,
+    benchmark_population_sizes,
+    benchmark_parallel_evaluation,
+    benchmark_random_streams,
+    benchmark_serialization,
+    benchmark_evobandits_islands,
+    benchmark_multi_objective
+);
 criterion_main!(benches);
@@ -0,0 +1,84 @@
+// Copyright 2025 EvoBandits
+//
+// Licensed under the Apache License, Version 2.0 (the "License");
+// you may not use this file except in compliance with the License.
+// You may obtain a copy of the License at
+//
+//     http://www.apache.org/licenses/LICENSE-2.0
+//
+// Unless required by applicable law or agreed to in writing, software
+// distributed under the License is distributed on an "AS IS" BASIS,
+// WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+// See the License for the specific language governing permissions and
+// limitations under the License.
+
+// Reports the peak resident set size (RSS) of GMAB for different limits on the arm memory.
+// Each limit runs in a separate child process, since the peak RSS of a process never decreases.
+//
+// Usage: cargo run --release --example arm_memory [n_trials]
+
+use std::env;
+use std::fs;
+use std::process::Command;
+use std::time::Instant;
+
+use evobandits::evobandits::GMAB;
+
+const DIMENSION: usize = 10;
+const MAX_ARMS: [Option<usize>; 4] = [None, Some(100_000), Some(10_000), Some(1_000)];
+
+fn sphere(action_vector: &[i32]) -> f64 {
+    action_vector.iter().map(|&x| (x as f64).powi(2)).sum()
+}
+
+// Returns the peak RSS of the current process in kB (Linux only).
+fn peak_rss_kb() -> Option<u64> {
+    let status = fs::read_to_string("/proc/self/status").ok()?;
+    status
+        .lines()
+        .find(|line| line.starts_with("VmHWM:"))?
+        .split_whitespace()
+        .nth(1)?
+        .parse()
+        .ok()
+}
+
+fn run(n_trials: usize, max_arms: Option<usize>) {
+    let bounds = vec![(-1_000_000, 1_000_000); DIMENSION];
+    let mut gmab = GMAB::new(Default::default());
+    gmab.set_max_arms(max_arms);
+
+    let start = Instant::now();
+    let best_arms = gmab.optimize(sphere, bounds, n_trials, 1, Some(42));
+    let duration = start.elapsed();
+
+    let peak_rss = peak_rss_kb().map_or("n/a".to_string(), |kb| format!("{} kB", kb));
+    println!(
+        "max_arms: {:>8} | peak RSS: {:>12} | time: {:>10.2?} | best value: {:.3e}",
+        max_arms.map_or("None".to_string(), |n| n.to_string()),
+        peak_rss,
+        duration,
+        best_arms[0].get_value()
+    );
+}
+
+fn main() {
+    let args: Vec<String> = env::args().collect();
+    let n_trials: usize = args.get(1).map_or(1_000_000, |arg| arg.parse().unwrap());
+
+    // Child process: run a single configuration
+    if let Some(max_arms) = args.get(2) {
+        run(n_trials, max_arms.parse().ok());
+        return;
+    }
+
+    println!("n_trials: {}, dimension: {}", n_trials, DIMENSION);
+    for max_arms in MAX_ARMS {
+        let max_arms = max_arms.map_or("None".to_string(), |n| n.to_string());
+        let status = Command::new(env::current_exe().unwrap())
+            .args([n_trials.to_string(), max_arms])
+            .status()
+            .unwrap();
+        assert!(status.success());
+    }
+}
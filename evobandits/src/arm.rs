@@ -12,16 +12,113 @@
 // See the License for the specific language governing permissions and
 // limitations under the License.
 
+use crate::codec::{Decoder, Encoder};
+use crate::progress::Progress;
 use std::hash::{Hash, Hasher};
+use std::time::Instant;
 
 pub trait OptimizationFn {
     fn evaluate(&self, action_vector: &[i32]) -> f64;
+
+    // Evaluates several action vectors at once, e.g. to distribute them to multiple workers.
+    // The default implementation evaluates them one after another. A NaN reward discards the
+    // evaluation, e.g. if it timed out: the budget is spent, but the arm is not updated.
+    fn evaluate_batch(&self, action_vectors: &[Vec<i32>]) -> Vec<f64> {
+        action_vectors
+            .iter()
+            .map(|action_vector| self.evaluate(action_vector))
+            .collect()
+    }
+
+    // Evaluates the action vectors like `evaluate_batch`, and also returns the wall time of each
+    // evaluation in seconds. The default implementation times the whole batch and splits the time
+    // evenly, since the evaluations of a batch might run concurrently. Implementations that know
+    // the time of each evaluation should override it.
+    fn evaluate_batch_timed(&self, action_vectors: &[Vec<i32>]) -> (Vec<f64>, Vec<f64>) {
+        let start = Instant::now();
+        let rewards = self.evaluate_batch(action_vectors);
+        let cost = start.elapsed().as_secs_f64() / action_vectors.len().max(1) as f64;
+        (rewards, vec![cost; action_vectors.len()])
+    }
+
+    // Evaluates the action vectors like `evaluate_batch_timed`, where pulls holds the number of
+    // recorded evaluations of the arm of each action vector, e.g. to key the seed of a noisy
+    // objective by (arm, pull). Unlike a count kept by the objective, the pulls do not depend on
+    // the order in which batches arrive, e.g. from several islands. The default implementation
+    // ignores the pulls.
+    fn evaluate_batch_keyed(
+        &self,
+        action_vectors: &[Vec<i32>],
+        _pulls: &[i32],
+    ) -> (Vec<f64>, Vec<f64>) {
+        self.evaluate_batch_timed(action_vectors)
+    }
+
+    // Checks constraints on the action vector that cannot be expressed as linear constraints.
+    // Infeasible action vectors are never evaluated. The default implementation accepts all.
+    fn is_feasible(&self, _action_vector: &[i32]) -> bool {
+        true
+    }
+
+    // Returns the minimum number of seconds between two reports of the progress of a running
+    // optimization, or None to never report it. The default implementation never reports it.
+    fn progress_interval(&self) -> Option<f64> {
+        None
+    }
+
+    // Receives a snapshot of the progress of a running optimization, see `progress_interval`.
+    fn report_progress(&self, _progress: &Progress) {}
 }
 
 impl<F: Fn(&[i32]) -> f64> OptimizationFn for F {
     fn evaluate(&self, action_vector: &[i32]) -> f64 {
         self(action_vector)
     }
+
+    // Functions evaluate one action vector after another, so each evaluation is timed separately.
+    fn evaluate_batch_timed(&self, action_vectors: &[Vec<i32>]) -> (Vec<f64>, Vec<f64>) {
+        time_each(action_vectors, |action_vector| self(action_vector))
+    }
+}
+
+const ARM_TAG: &[u8; 3] = b"ARM";
+const ARMS_TAG: &[u8; 3] = b"ARL";
+// Smallest encoding of an arm in bytes, i.e. of an arm with an empty action vector
+const MIN_ARM_SIZE: usize = 36;
+
+// Encodes a list of arms, e.g. the result of an optimization, see `codec`.
+pub fn arms_to_bytes(arms: &[Arm]) -> Vec<u8> {
+    let mut encoder = Encoder::new(ARMS_TAG);
+    let dimension = arms.first().map_or(0, |arm| arm.action_vector.len());
+    encoder.reserve(arms.len() * (MIN_ARM_SIZE + 4 * dimension));
+    encoder.length(arms.len());
+    for arm in arms {
+        arm.encode(&mut encoder);
+    }
+    encoder.finish()
+}
+
+pub fn arms_from_bytes(bytes: &[u8]) -> Vec<Arm> {
+    let mut decoder = Decoder::new(bytes, ARMS_TAG);
+    let n_arms = decoder.length(MIN_ARM_SIZE);
+    let arms = (0..n_arms).map(|_| Arm::decode(&mut decoder)).collect();
+    decoder.finish();
+    arms
+}
+
+// Evaluates the action vectors one after another, and measures the wall time of each evaluation.
+pub fn time_each<E: Fn(&[i32]) -> f64>(
+    action_vectors: &[Vec<i32>],
+    evaluate: E,
+) -> (Vec<f64>, Vec<f64>) {
+    action_vectors
+        .iter()
+        .map(|action_vector| {
+            let start = Instant::now();
+            let reward = evaluate(action_vector);
+            (reward, start.elapsed().as_secs_f64())
+        })
+        .unzip()
 }
 
 #[derive(Debug)]
@@ -43,6 +140,10 @@ pub struct Arm {
     n_evaluations: i32,
     value: f64,
     corr_ssq: f64,
+    // Total wall time of the evaluations with a known cost, in seconds. Arms whose statistics are
+    // restored, e.g. after an eviction, have fewer timed evaluations than evaluations.
+    total_cost: f64,
+    n_timed: i32,
 }
 
 impl Arm {
@@ -52,25 +153,98 @@ impl Arm {
             n_evaluations: 0,
             value: 0.0,
             corr_ssq: 0.0,
+            total_cost: 0.0,
+            n_timed: 0,
+        }
+    }
+
+    // Creates an arm from statistics that were previously collected, see `get_stats`.
+    pub(crate) fn with_stats(action_vector: &[i32], stats: (i32, f64, f64)) -> Self {
+        let (n_evaluations, value, corr_ssq) = stats;
+        Self {
+            action_vector: action_vector.to_vec(),
+            n_evaluations,
+            value,
+            corr_ssq,
+            total_cost: 0.0,
+            n_timed: 0,
+        }
+    }
+
+    // Appends the arm to an encoding, see `codec`.
+    pub(crate) fn encode(&self, encoder: &mut Encoder) {
+        encoder.i32s(&self.action_vector);
+        encoder.i32(self.n_evaluations);
+        encoder.f64(self.value);
+        encoder.f64(self.corr_ssq);
+        encoder.f64(self.total_cost);
+        encoder.i32(self.n_timed);
+    }
+
+    pub(crate) fn decode(decoder: &mut Decoder) -> Self {
+        Self {
+            action_vector: decoder.i32s(),
+            n_evaluations: decoder.i32(),
+            value: decoder.f64(),
+            corr_ssq: decoder.f64(),
+            total_cost: decoder.f64(),
+            n_timed: decoder.i32(),
         }
     }
 
-    pub(crate) fn pull<F: OptimizationFn>(&mut self, opt_fn: &F) -> f64 {
+    // Encodes the arm with its statistics, e.g. to send it to another process.
+    pub fn to_bytes(&self) -> Vec<u8> {
+        let mut encoder = Encoder::new(ARM_TAG);
+        self.encode(&mut encoder);
+        encoder.finish()
+    }
+
+    pub fn from_bytes(bytes: &[u8]) -> Self {
+        let mut decoder = Decoder::new(bytes, ARM_TAG);
+        let arm = Self::decode(&mut decoder);
+        decoder.finish();
+        arm
+    }
+
+    // Returns the statistics of the arm as (n_evaluations, value, corr_ssq).
+    pub(crate) fn get_stats(&self) -> (i32, f64, f64) {
+        (self.n_evaluations, self.value, self.corr_ssq)
+    }
+
+    pub fn pull<F: OptimizationFn>(&mut self, opt_fn: &F) -> f64 {
         let g = opt_fn.evaluate(&self.action_vector);
+        self.update(g);
+        g
+    }
 
+    // Records a reward that was observed for this arm, e.g. from a batch evaluation.
+    pub(crate) fn update(&mut self, g: f64) {
         // Update Arm according to Welford's algorithm (see above)
         self.n_evaluations += 1;
         let delta = g - self.value;
         self.value += delta / self.n_evaluations as f64;
         self.corr_ssq += delta * (g - self.value);
+    }
 
-        g
+    // Records the wall time of an evaluation of this arm, in seconds.
+    pub(crate) fn record_cost(&mut self, cost: f64) {
+        self.total_cost += cost;
+        self.n_timed += 1;
+    }
+
+    // Returns the mean wall time of an evaluation in seconds, or 0.0 if it is unknown.
+    pub fn get_mean_cost(&self) -> f64 {
+        if self.n_timed == 0 {
+            return 0.0;
+        }
+        self.total_cost / self.n_timed as f64
     }
 
     pub fn get_n_evaluations(&self) -> i32 {
         self.n_evaluations
     }
 
+    #[cfg(test)]
     pub(crate) fn get_function_value<F: OptimizationFn>(&self, opt_fn: &F) -> f64 {
         opt_fn.evaluate(&self.action_vector)
     }
@@ -102,6 +276,8 @@ impl Clone for Arm {
             n_evaluations: self.n_evaluations,
             value: self.value,
             corr_ssq: self.corr_ssq,
+            total_cost: self.total_cost,
+            n_timed: self.n_timed,
         }
     }
 }
@@ -200,6 +376,19 @@ mod tests {
         assert_eq!(arm.get_value_std_dev(), cloned_arm.get_value_std_dev());
     }
 
+    #[test]
+    fn test_arm_with_stats() {
+        let mut arm = Arm::new(&vec![1, 2]);
+        arm.update(0.0);
+        arm.update(2.0);
+
+        let restored = Arm::with_stats(arm.get_action_vector(), arm.get_stats());
+        assert_eq!(restored.get_action_vector(), arm.get_action_vector());
+        assert_eq!(restored.get_n_evaluations(), 2);
+        assert_eq!(restored.get_value(), 1.0);
+        assert_eq!(restored.get_value_std_dev(), arm.get_value_std_dev());
+    }
+
     #[test]
     fn test_initial_reward_is_zero() {
         let arm = Arm::new(&vec![1, 2]);
@@ -228,4 +417,47 @@ mod tests {
         assert_eq!(arm.get_value(), cloned_arm.get_value());
         assert_eq!(arm.get_value_std_dev(), cloned_arm.get_value_std_dev());
     }
+
+    #[test]
+    fn test_arm_mean_cost() {
+        let mut arm = Arm::new(&vec![1, 2]);
+        assert_eq!(arm.get_mean_cost(), 0.0);
+
+        arm.record_cost(1.0);
+        arm.record_cost(3.0);
+        assert_eq!(arm.get_mean_cost(), 2.0);
+        assert_eq!(arm.clone().get_mean_cost(), 2.0);
+    }
+
+    #[test]
+    fn test_arm_to_bytes() {
+        let mut arm = Arm::new(&vec![1, -2, 3]);
+        arm.update(1.0);
+        arm.update(2.0);
+        arm.record_cost(0.5);
+
+        let decoded = Arm::from_bytes(&arm.to_bytes());
+        assert_eq!(decoded, arm);
+        assert_eq!(decoded.get_stats(), arm.get_stats());
+        assert_eq!(decoded.get_mean_cost(), 0.5);
+
+        let arms = vec![arm, Arm::new(&vec![4, 5, 6])];
+        assert_eq!(arms_from_bytes(&arms_to_bytes(&arms)), arms);
+        assert_eq!(arms_from_bytes(&arms_to_bytes(&[])), vec![]);
+    }
+
+    #[test]
+    #[should_panic = "expected an encoded ARL"]
+    fn test_panic_on_invalid_arms_bytes() {
+        arms_from_bytes(&Arm::new(&vec![1]).to_bytes());
+    }
+
+    #[test]
+    fn test_evaluate_batch_timed() {
+        let action_vectors = vec![vec![1], vec![2], vec![3]];
+        let (rewards, costs) = mock_opti_function.evaluate_batch_timed(&action_vectors);
+        assert_eq!(rewards, vec![5.0; 3]);
+        assert_eq!(costs.len(), 3);
+        assert!(costs.iter().all(|&cost| cost >= 0.0));
+    }
 }
@@ -0,0 +1,271 @@
+// Copyright 2025 EvoBandits
+//
+// Licensed under the Apache License, Version 2.0 (the "License");
+// you may not use this file except in compliance with the License.
+// You may obtain a copy of the License at
+//
+//     http://www.apache.org/licenses/LICENSE-2.0
+//
+// Unless required by applicable law or agreed to in writing, software
+// distributed under the License is distributed on an "AS IS" BASIS,
+// WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+// See the License for the specific language governing permissions and
+// limitations under the License.
+
+// Compact binary encoding of the state of an optimization, e.g. to send a GMAB to another process
+// or to store it in a cache. Each encoding starts with a tag that names its type and the version
+// of the format, followed by the fields in a fixed order. Values are little-endian, and sequences
+// are prefixed with their length as u32. Invalid data causes a panic, like other invalid inputs.
+
+// Version of the format, which is increased whenever the encoding of a type changes.
+pub const FORMAT_VERSION: u8 = 5;
+
+pub struct Encoder {
+    bytes: Vec<u8>,
+}
+
+impl Encoder {
+    pub fn new(tag: &[u8; 3]) -> Self {
+        let mut bytes = Vec::with_capacity(64);
+        bytes.extend_from_slice(tag);
+        bytes.push(FORMAT_VERSION);
+        Encoder { bytes }
+    }
+
+    pub fn reserve(&mut self, additional: usize) {
+        self.bytes.reserve(additional);
+    }
+
+    pub fn u8(&mut self, value: u8) {
+        self.bytes.push(value);
+    }
+
+    pub fn bool(&mut self, value: bool) {
+        self.u8(value as u8);
+    }
+
+    pub fn u32(&mut self, value: u32) {
+        self.bytes.extend_from_slice(&value.to_le_bytes());
+    }
+
+    pub fn u64(&mut self, value: u64) {
+        self.bytes.extend_from_slice(&value.to_le_bytes());
+    }
+
+    pub fn usize(&mut self, value: usize) {
+        self.u64(value as u64);
+    }
+
+    pub fn i32(&mut self, value: i32) {
+        self.bytes.extend_from_slice(&value.to_le_bytes());
+    }
+
+    pub fn f64(&mut self, value: f64) {
+        self.bytes.extend_from_slice(&value.to_le_bytes());
+    }
+
+    pub fn length(&mut self, len: usize) {
+        let len = u32::try_from(len).expect("Sequences longer than u32::MAX cannot be encoded.");
+        self.u32(len);
+    }
+
+    pub fn i32s(&mut self, values: &[i32]) {
+        self.length(values.len());
+        self.bytes.reserve(4 * values.len());
+        for &value in values {
+            self.i32(value);
+        }
+    }
+
+    pub fn f64s(&mut self, values: &[f64]) {
+        self.length(values.len());
+        self.bytes.reserve(8 * values.len());
+        for &value in values {
+            self.f64(value);
+        }
+    }
+
+    pub fn option_usize(&mut self, value: Option<usize>) {
+        self.bool(value.is_some());
+        if let Some(value) = value {
+            self.usize(value);
+        }
+    }
+
+    pub fn finish(self) -> Vec<u8> {
+        self.bytes
+    }
+}
+
+pub struct Decoder<'a> {
+    bytes: &'a [u8],
+    position: usize,
+}
+
+impl<'a> Decoder<'a> {
+    pub fn new(bytes: &'a [u8], tag: &[u8; 3]) -> Self {
+        if bytes.len() < 4 || &bytes[..3] != tag {
+            panic!(
+                "Invalid data: expected an encoded {}.",
+                String::from_utf8_lossy(tag)
+            );
+        }
+        if bytes[3] != FORMAT_VERSION {
+            panic!(
+                "Unsupported format version {} (expected {}).",
+                bytes[3], FORMAT_VERSION
+            );
+        }
+        Decoder { bytes, position: 4 }
+    }
+
+    fn take<const N: usize>(&mut self) -> [u8; N] {
+        let end = self.position + N;
+        if end > self.bytes.len() {
+            panic!(
+                "Invalid data: unexpected end after {} bytes.",
+                self.position
+            );
+        }
+        let mut value = [0u8; N];
+        value.copy_from_slice(&self.bytes[self.position..end]);
+        self.position = end;
+        value
+    }
+
+    pub fn u8(&mut self) -> u8 {
+        self.take::<1>()[0]
+    }
+
+    pub fn bool(&mut self) -> bool {
+        match self.u8() {
+            0 => false,
+            1 => true,
+            value => panic!("Invalid data: {} is not a bool.", value),
+        }
+    }
+
+    pub fn u32(&mut self) -> u32 {
+        u32::from_le_bytes(self.take())
+    }
+
+    pub fn u64(&mut self) -> u64 {
+        u64::from_le_bytes(self.take())
+    }
+
+    pub fn usize(&mut self) -> usize {
+        usize::try_from(self.u64()).expect("Invalid data: value exceeds usize.")
+    }
+
+    pub fn i32(&mut self) -> i32 {
+        i32::from_le_bytes(self.take())
+    }
+
+    pub fn f64(&mut self) -> f64 {
+        f64::from_le_bytes(self.take())
+    }
+
+    // Reads the length of a sequence, and checks that the data holds at least min_size bytes per
+    // element, so that corrupt lengths cannot cause huge allocations.
+    pub fn length(&mut self, min_size: usize) -> usize {
+        let len = self.u32() as usize;
+        if len.saturating_mul(min_size) > self.bytes.len() - self.position {
+            panic!(
+                "Invalid data: unexpected end after {} bytes.",
+                self.position
+            );
+        }
+        len
+    }
+
+    pub fn i32s(&mut self) -> Vec<i32> {
+        let len = self.length(4);
+        (0..len).map(|_| self.i32()).collect()
+    }
+
+    pub fn f64s(&mut self) -> Vec<f64> {
+        let len = self.length(8);
+        (0..len).map(|_| self.f64()).collect()
+    }
+
+    pub fn option_usize(&mut self) -> Option<usize> {
+        if self.bool() {
+            Some(self.usize())
+        } else {
+            None
+        }
+    }
+
+    // Checks that all data was read.
+    pub fn finish(self) {
+        if self.position != self.bytes.len() {
+            panic!(
+                "Invalid data: {} unexpected bytes at the end.",
+                self.bytes.len() - self.position
+            );
+        }
+    }
+}
+
+#[cfg(test)]
+mod tests {
+    use super::*;
+
+    #[test]
+    fn test_round_trip() {
+        let mut encoder = Encoder::new(b"TST");
+        encoder.bool(true);
+        encoder.u64(u64::MAX);
+        encoder.i32(-3);
+        encoder.f64(0.5);
+        encoder.i32s(&[1, -2]);
+        encoder.f64s(&[]);
+        encoder.option_usize(Some(7));
+        encoder.option_usize(None);
+        let bytes = encoder.finish();
+
+        let mut decoder = Decoder::new(&bytes, b"TST");
+        assert!(decoder.bool());
+        assert_eq!(decoder.u64(), u64::MAX);
+        assert_eq!(decoder.i32(), -3);
+        assert_eq!(decoder.f64(), 0.5);
+        assert_eq!(decoder.i32s(), vec![1, -2]);
+        assert_eq!(decoder.f64s(), Vec::<f64>::new());
+        assert_eq!(decoder.option_usize(), Some(7));
+        assert_eq!(decoder.option_usize(), None);
+        decoder.finish();
+    }
+
+    #[test]
+    #[should_panic = "expected an encoded TST"]
+    fn test_panic_on_wrong_tag() {
+        let bytes = Encoder::new(b"ARM").finish();
+        Decoder::new(&bytes, b"TST");
+    }
+
+    #[test]
+    #[should_panic = "Unsupported format version"]
+    fn test_panic_on_wrong_version() {
+        let mut bytes = Encoder::new(b"TST").finish();
+        bytes[3] = FORMAT_VERSION + 1;
+        Decoder::new(&bytes, b"TST");
+    }
+
+    #[test]
+    #[should_panic = "unexpected end"]
+    fn test_panic_on_truncated_data() {
+        let mut encoder = Encoder::new(b"TST");
+        encoder.i32s(&[1, 2, 3]);
+        let bytes = encoder.finish();
+        Decoder::new(&bytes[..bytes.len() - 1], b"TST").i32s();
+    }
+
+    #[test]
+    #[should_panic = "unexpected bytes at the end"]
+    fn test_panic_on_trailing_data() {
+        let mut encoder = Encoder::new(b"TST");
+        encoder.u8(1);
+        let bytes = encoder.finish();
+        Decoder::new(&bytes, b"TST").finish();
+    }
+}
@@ -0,0 +1,87 @@
+// Copyright 2025 EvoBandits
+//
+// Licensed under the Apache License, Version 2.0 (the "License");
+// you may not use this file except in compliance with the License.
+// You may obtain a copy of the License at
+//
+//     http://www.apache.org/licenses/LICENSE-2.0
+//
+// Unless required by applicable law or agreed to in writing, software
+// distributed under the License is distributed on an "AS IS" BASIS,
+// WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+// See the License for the specific language governing permissions and
+// limitations under the License.
+use crate::codec::{Decoder, Encoder};
+
+// Linear constraint over the action vector: sum(coefficients[i] * action_vector[i]) <= upper_bound.
+// Infeasible action vectors are rejected or repaired by the genetic algorithm before they are
+// evaluated, so they never consume a trial.
+#[derive(Debug, PartialEq, Clone)]
+pub struct LinearConstraint {
+    pub coefficients: Vec<f64>,
+    pub upper_bound: f64,
+}
+
+impl LinearConstraint {
+    pub fn new(coefficients: Vec<f64>, upper_bound: f64) -> Self {
+        LinearConstraint {
+            coefficients,
+            upper_bound,
+        }
+    }
+
+    pub fn validate(&self, dimension: usize) {
+        if self.coefficients.len() != dimension {
+            panic!(
+                "A constraint has {} coefficients, but the action vector has {} dimensions.",
+                self.coefficients.len(),
+                dimension
+            );
+        }
+    }
+
+    pub(crate) fn encode(&self, encoder: &mut Encoder) {
+        encoder.f64s(&self.coefficients);
+        encoder.f64(self.upper_bound);
+    }
+
+    pub(crate) fn decode(decoder: &mut Decoder) -> Self {
+        LinearConstraint {
+            coefficients: decoder.f64s(),
+            upper_bound: decoder.f64(),
+        }
+    }
+
+    pub fn is_satisfied(&self, action_vector: &[i32]) -> bool {
+        let lhs: f64 = self
+            .coefficients
+            .iter()
+            .zip(action_vector)
+            .map(|(&coefficient, &action)| coefficient * action as f64)
+            .sum();
+        lhs <= self.upper_bound
+    }
+}
+
+#[cfg(test)]
+mod tests {
+    use super::*;
+
+    #[test]
+    fn test_linear_constraint_is_satisfied() {
+        // x0 - x1 <= 0
+        let constraint = LinearConstraint::new(vec![1.0, -1.0], 0.0);
+        constraint.validate(2);
+
+        assert!(constraint.is_satisfied(&[1, 2]));
+        assert!(constraint.is_satisfied(&[2, 2]));
+        assert!(!constraint.is_satisfied(&[3, 2]));
+    }
+
+    #[test]
+    #[should_panic(expected = "coefficients")]
+    fn test_invalid_linear_constraint_dimension() {
+        let constraint = LinearConstraint::new(vec![1.0, -1.0], 0.0);
+        constraint.validate(3);
+    }
+}
@@ -13,12 +13,72 @@
 // limitations under the License.
 
 use crate::arm::{Arm, OptimizationFn};
-use crate::genetic::GeneticAlgorithm;
+use crate::codec::{Decoder, Encoder};
+use crate::constraint::LinearConstraint;
+use crate::genetic::{
+    GeneticAlgorithm, MutationSchedule, DECAY_FINAL_SCALE, MAX_MUTATION_SCALE, MIN_MUTATION_SCALE,
+    SUCCESS_RULE_FACTOR, SUCCESS_RULE_TARGET,
+};
+use crate::progress::{PhaseTimes, Progress, ProgressReporter};
+use crate::rng::{
+    derive_seed, stream, STREAM_COST, STREAM_CROSSOVER, STREAM_INITIALIZATION, STREAM_MUTATION,
+    STREAM_SHUFFLE, STREAM_SURROGATE,
+};
+use crate::smoothing::Smoothing;
 use crate::sorted_multi_map::{FloatKey, SortedMultiMap};
+use crate::spatial_index::SpatialIndex;
+use crate::surrogate::Surrogate;
 use rand::prelude::SliceRandom;
-use rand::rngs::StdRng;
-use rand::{RngCore, SeedableRng};
-use std::collections::HashMap;
+use rand::{Rng, RngCore};
+use std::collections::{HashMap, HashSet, VecDeque};
+use std::time::Instant;
+
+const FNV_OFFSET_BASIS: u64 = 0xcbf29ce484222325;
+const FNV_PRIME: u64 = 0x100000001b3;
+
+// Compact 64-bit fingerprint of an action vector, used to remember evicted arms. Fingerprints are
+// encoded with the state, so this is FNV-1a over the little-endian bytes of the values, which
+// unlike `DefaultHasher` does not change between builds.
+fn fingerprint(action_vector: &[i32]) -> u64 {
+    action_vector
+        .iter()
+        .flat_map(|value| value.to_le_bytes())
+        .fold(FNV_OFFSET_BASIS, |hash, byte| {
+            (hash ^ u64::from(byte)).wrapping_mul(FNV_PRIME)
+        })
+}
+
+const GMAB_TAG: &[u8; 3] = b"GMB";
+
+// Exploration bonus of the UCB value of an arm, see `GMAB::find_best_ucb`.
+fn ucb_bonus(simulations_used: usize, n_evaluations: f64) -> f64 {
+    (2.0 * (simulations_used as f64).ln() / n_evaluations).sqrt()
+}
+
+fn median(values: &[f64]) -> f64 {
+    let mut sorted = values.to_vec();
+    sorted.sort_by(f64::total_cmp);
+    sorted[sorted.len() / 2]
+}
+
+// Ratio of a reference to a value, or 1.0 if either is unknown (zero).
+fn ratio(reference: f64, value: f64) -> f64 {
+    if reference > 0.0 && value > 0.0 {
+        reference / value
+    } else {
+        1.0
+    }
+}
+
+// Outcome of the offspring of one generation: offspring that became new arms, offspring that
+// matched a known arm and pulled it again, and offspring that were skipped since they are part of
+// the current population, which is pulled again anyway.
+#[derive(Debug, PartialEq, Clone, Copy, Default)]
+pub struct GenerationStats {
+    pub n_new_arms: usize,
+    pub n_repulls: usize,
+    pub n_skipped: usize,
+}
 
 #[derive(Debug, PartialEq, Clone)]
 pub struct GMAB {
@@ -26,6 +86,30 @@ pub struct GMAB {
     arm_memory: Vec<Arm>,
     lookup_table: HashMap<Vec<i32>, i32>,
     genetic_algorithm: GeneticAlgorithm,
+    constraints: Vec<LinearConstraint>,
+    max_arms: Option<usize>,
+    strides: Option<Vec<i32>>,
+    mutation_schedule: MutationSchedule,
+    cost_aware: bool,
+    surrogate: Option<Surrogate>,
+    smoothing: Option<Smoothing>,
+    // Index of the arm memory by action vector, which is only kept with smoothing
+    spatial_index: Option<SpatialIndex>,
+    // Current scale of mutation_span and mutation_rate under the mutation schedule
+    mutation_scale: f64,
+    generation_stats: Vec<GenerationStats>,
+    // Recorded evaluations that created a new arm, or pulled a known arm again, and the time
+    // spent in each phase of the generations, see `Progress`
+    n_new_arms: usize,
+    n_repulls: usize,
+    phase_times: PhaseTimes,
+    // Number of generations of the current optimization, which keys their random streams
+    generation: u64,
+    // Statistics of evicted arms by fingerprint, together with the eviction order. Both are
+    // bounded by max_arms, and the oldest summaries are forgotten first.
+    evicted_arms: HashMap<u64, (u64, (i32, f64, f64))>,
+    eviction_order: VecDeque<(u64, u64)>,
+    n_evictions: u64,
 }
 
 impl GMAB {
@@ -39,14 +123,282 @@ impl GMAB {
             arm_memory,
             lookup_table,
             genetic_algorithm,
+            constraints: Vec::new(),
+            max_arms: None,
+            strides: None,
+            mutation_schedule: MutationSchedule::Fixed,
+            cost_aware: false,
+            surrogate: None,
+            smoothing: None,
+            spatial_index: None,
+            mutation_scale: 1.0,
+            generation_stats: Vec::new(),
+            n_new_arms: 0,
+            n_repulls: 0,
+            phase_times: PhaseTimes::default(),
+            generation: 0,
+            evicted_arms: HashMap::new(),
+            eviction_order: VecDeque::new(),
+            n_evictions: 0,
+        }
+    }
+
+    // Restricts the search to action vectors that satisfy all linear constraints.
+    pub fn set_constraints(&mut self, constraints: Vec<LinearConstraint>) {
+        self.constraints = constraints;
+    }
+
+    // Limits the number of arms that are kept in memory. If the limit is exceeded, arms with a
+    // single evaluation and the worst sample average are evicted first, see `evict_arms`.
+    pub fn set_max_arms(&mut self, max_arms: Option<usize>) {
+        self.max_arms = max_arms;
+    }
+
+    pub fn get_max_arms(&self) -> Option<usize> {
+        self.max_arms
+    }
+
+    // Starts the search on a coarse grid with the given stride per dimension, and refines the
+    // grid whenever a generation produces mostly known arms, see `GeneticAlgorithm::refine`.
+    pub fn set_strides(&mut self, strides: Option<Vec<i32>>) {
+        self.strides = strides;
+    }
+
+    // Adapts mutation_span and mutation_rate during the optimization, see `MutationSchedule`.
+    pub fn set_mutation_schedule(&mut self, mutation_schedule: MutationSchedule) {
+        self.mutation_schedule = mutation_schedule;
+    }
+
+    pub fn get_mutation_schedule(&self) -> MutationSchedule {
+        self.mutation_schedule
+    }
+
+    // Trades the exploration bonus of re-evaluations, and the admission of offspring, against the
+    // expected wall time of their evaluation, so that a time budget is spent on cheaper trials.
+    // Each generation, a member of the population is evaluated again with probability
+    // min(1, (b / b_ref) * (c_ref / c)), where b is its UCB bonus and c its mean cost, and b_ref and
+    // c_ref are the medians of the population. An offspring is admitted with probability
+    // min(1, c_ref / c), where c is the mean cost of its arm if it is known, or of its parents.
+    pub fn set_cost_aware(&mut self, cost_aware: bool) {
+        self.cost_aware = cost_aware;
+    }
+
+    pub fn get_cost_aware(&self) -> bool {
+        self.cost_aware
+    }
+
+    // Screens the offspring of each generation with a surrogate model of the sample averages, so
+    // that the budget of trials is spent on the most promising offspring, see `Surrogate`.
+    pub fn set_surrogate(&mut self, surrogate: Option<Surrogate>) {
+        self.surrogate = surrogate;
+    }
+
+    pub fn get_surrogate(&self) -> Option<Surrogate> {
+        self.surrogate
+    }
+
+    // Identifies the best arms by kernel-smoothed sample averages and numbers of evaluations, see
+    // `Smoothing`. The neighbours of an arm are found with a spatial index of the arm memory.
+    pub fn set_smoothing(&mut self, smoothing: Option<Smoothing>) {
+        self.smoothing = smoothing;
+    }
+
+    pub fn get_smoothing(&self) -> Option<Smoothing> {
+        self.smoothing
+    }
+
+    // Returns the GenerationStats of each generation of the last optimization.
+    pub fn get_generation_stats(&self) -> &[GenerationStats] {
+        &self.generation_stats
+    }
+
+    pub fn get_genetic_algorithm(&self) -> &GeneticAlgorithm {
+        &self.genetic_algorithm
+    }
+
+    // Returns a new instance with the same configuration, but without any arms.
+    pub(crate) fn fresh(&self) -> GMAB {
+        let mut gmab = GMAB::new(self.genetic_algorithm.clone());
+        gmab.set_constraints(self.constraints.clone());
+        gmab.set_max_arms(self.max_arms);
+        gmab.set_strides(self.strides.clone());
+        gmab.set_mutation_schedule(self.mutation_schedule);
+        gmab.set_cost_aware(self.cost_aware);
+        gmab.set_surrogate(self.surrogate);
+        gmab.set_smoothing(self.smoothing);
+        gmab
+    }
+
+    // Appends the full state to an encoding, i.e. the configuration, the arm memory and the state
+    // of the current optimization, see `codec`. The lookup table is rebuilt from the arm memory.
+    pub fn encode(&self, encoder: &mut Encoder) {
+        self.genetic_algorithm.encode(encoder);
+        encoder.length(self.constraints.len());
+        for constraint in &self.constraints {
+            constraint.encode(encoder);
+        }
+        encoder.option_usize(self.max_arms);
+        encoder.bool(self.strides.is_some());
+        if let Some(strides) = &self.strides {
+            encoder.i32s(strides);
+        }
+        self.mutation_schedule.encode(encoder);
+        encoder.bool(self.cost_aware);
+        encoder.bool(self.surrogate.is_some());
+        if let Some(surrogate) = &self.surrogate {
+            surrogate.encode(encoder);
+        }
+        encoder.bool(self.smoothing.is_some());
+        if let Some(smoothing) = &self.smoothing {
+            smoothing.encode(encoder);
+        }
+        encoder.f64(self.mutation_scale);
+        encoder.length(self.generation_stats.len());
+        for stats in &self.generation_stats {
+            encoder.usize(stats.n_new_arms);
+            encoder.usize(stats.n_repulls);
+            encoder.usize(stats.n_skipped);
+        }
+        encoder.usize(self.n_new_arms);
+        encoder.usize(self.n_repulls);
+        self.phase_times.encode(encoder);
+        encoder.u64(self.generation);
+
+        let dimension = self.genetic_algorithm.dimension;
+        encoder.reserve(self.arm_memory.len() * (60 + 4 * dimension));
+        encoder.length(self.arm_memory.len());
+        for arm in &self.arm_memory {
+            arm.encode(encoder);
+        }
+        let (entries, next_sequence) = self.sample_average_tree.entries();
+        let entries: Vec<_> = entries.collect();
+        encoder.length(entries.len());
+        for (key, sequence, arm_index) in entries {
+            encoder.f64(key.value());
+            encoder.u64(sequence);
+            encoder.i32(*arm_index);
+        }
+        encoder.u64(next_sequence);
+
+        // Sort the evicted arms, so that equal states have equal encodings
+        let mut evicted_arms: Vec<_> = self.evicted_arms.iter().collect();
+        evicted_arms.sort_unstable_by_key(|(fingerprint, _)| **fingerprint);
+        encoder.length(evicted_arms.len());
+        for (fingerprint, (id, (n_evaluations, value, corr_ssq))) in evicted_arms {
+            encoder.u64(*fingerprint);
+            encoder.u64(*id);
+            encoder.i32(*n_evaluations);
+            encoder.f64(*value);
+            encoder.f64(*corr_ssq);
+        }
+        encoder.length(self.eviction_order.len());
+        for (fingerprint, id) in &self.eviction_order {
+            encoder.u64(*fingerprint);
+            encoder.u64(*id);
         }
+        encoder.u64(self.n_evictions);
+    }
+
+    pub fn decode(decoder: &mut Decoder) -> GMAB {
+        let mut gmab = GMAB::new(GeneticAlgorithm::decode(decoder));
+        gmab.constraints = (0..decoder.length(12))
+            .map(|_| LinearConstraint::decode(decoder))
+            .collect();
+        gmab.max_arms = decoder.option_usize();
+        gmab.strides = if decoder.bool() {
+            Some(decoder.i32s())
+        } else {
+            None
+        };
+        gmab.mutation_schedule = MutationSchedule::decode(decoder);
+        gmab.cost_aware = decoder.bool();
+        gmab.surrogate = if decoder.bool() {
+            Some(Surrogate::decode(decoder))
+        } else {
+            None
+        };
+        gmab.smoothing = if decoder.bool() {
+            Some(Smoothing::decode(decoder))
+        } else {
+            None
+        };
+        gmab.mutation_scale = decoder.f64();
+        gmab.generation_stats = (0..decoder.length(24))
+            .map(|_| GenerationStats {
+                n_new_arms: decoder.usize(),
+                n_repulls: decoder.usize(),
+                n_skipped: decoder.usize(),
+            })
+            .collect();
+        gmab.n_new_arms = decoder.usize();
+        gmab.n_repulls = decoder.usize();
+        gmab.phase_times = PhaseTimes::decode(decoder);
+        gmab.generation = decoder.u64();
+
+        let n_arms = decoder.length(36);
+        gmab.arm_memory = Vec::with_capacity(n_arms);
+        gmab.lookup_table = HashMap::with_capacity(n_arms);
+        for arm_index in 0..n_arms {
+            let arm = Arm::decode(decoder);
+            gmab.lookup_table
+                .insert(arm.get_action_vector().to_vec(), arm_index as i32);
+            gmab.arm_memory.push(arm);
+        }
+        let entries = (0..decoder.length(20))
+            .map(|_| {
+                let key = FloatKey::new(decoder.f64());
+                let sequence = decoder.u64();
+                let arm_index = decoder.i32();
+                if arm_index < 0 || arm_index as usize >= n_arms {
+                    panic!("Invalid data: arm index {} is out of range.", arm_index);
+                }
+                (key, sequence, arm_index)
+            })
+            .collect();
+        gmab.sample_average_tree = SortedMultiMap::from_entries(entries, decoder.u64());
+
+        gmab.evicted_arms = (0..decoder.length(36))
+            .map(|_| {
+                let fingerprint = decoder.u64();
+                let id = decoder.u64();
+                (
+                    fingerprint,
+                    (id, (decoder.i32(), decoder.f64(), decoder.f64())),
+                )
+            })
+            .collect();
+        gmab.eviction_order = (0..decoder.length(16))
+            .map(|_| (decoder.u64(), decoder.u64()))
+            .collect();
+        gmab.n_evictions = decoder.u64();
+        gmab.build_spatial_index();
+        gmab
+    }
+
+    // Encodes the full state, e.g. to send a GMAB to another process, see `encode`.
+    pub fn to_bytes(&self) -> Vec<u8> {
+        let mut encoder = Encoder::new(GMAB_TAG);
+        self.encode(&mut encoder);
+        encoder.finish()
+    }
+
+    pub fn from_bytes(bytes: &[u8]) -> GMAB {
+        let mut decoder = Decoder::new(bytes, GMAB_TAG);
+        let gmab = GMAB::decode(&mut decoder);
+        decoder.finish();
+        gmab
+    }
+
+    // Checks the linear constraints first, since they are cheap compared to the objective's check.
+    fn is_feasible<F: OptimizationFn>(&self, action_vector: &[i32], opti_function: &F) -> bool {
+        self.constraints
+            .iter()
+            .all(|constraint| constraint.is_satisfied(action_vector))
+            && opti_function.is_feasible(action_vector)
     }
 
     fn get_arm_index(&self, individual: &Arm) -> i32 {
-        match self
-            .lookup_table
-            .get(&individual.get_action_vector().to_vec())
-        {
+        match self.lookup_table.get(individual.get_action_vector()) {
             Some(&index) => index,
             None => -1,
         }
@@ -62,77 +414,111 @@ impl GMAB {
         max_number_pulls
     }
 
-    fn find_best_ucb(&self, simulations_used: usize) -> i32 {
-        let arm_index_ucb_norm_min: i32 = *self.sample_average_tree.iter().next().unwrap().1;
-        let ucb_norm_min: f64 = self.arm_memory[arm_index_ucb_norm_min as usize].get_value();
+    // Indexes the arm memory for smoothing, with the bandwidth as the radius of the queries.
+    fn build_spatial_index(&mut self) {
+        self.spatial_index = self.smoothing.map(|smoothing| {
+            let mut index = SpatialIndex::new(smoothing.radii(
+                &self.genetic_algorithm.lower_bound,
+                &self.genetic_algorithm.upper_bound,
+            ));
+            for (arm_index, arm) in self.arm_memory.iter().enumerate() {
+                index.insert(arm.get_action_vector(), arm_index as i32);
+            }
+            index
+        });
+    }
 
-        let max_number_pulls = self.max_number_pulls();
+    // Returns the sample average and the number of evaluations of an arm, both smoothed over its
+    // neighbours if smoothing is enabled, see `Smoothing`.
+    fn smoothed_stats(&self, arm_index: i32) -> (f64, f64) {
+        let arm = &self.arm_memory[arm_index as usize];
+        let index = match &self.spatial_index {
+            Some(index) => index,
+            None => return (arm.get_value(), arm.get_n_evaluations() as f64),
+        };
+
+        let mut total_weight = 0.0;
+        let mut total = 0.0;
+        let neighbors = index.neighbors(arm.get_action_vector(), |other| {
+            self.arm_memory[other as usize].get_action_vector()
+        });
+        for (other, squared_distance) in neighbors {
+            let other = &self.arm_memory[other as usize];
+            let weight = Smoothing::kernel(squared_distance) * other.get_n_evaluations() as f64;
+            total_weight += weight;
+            total += weight * other.get_value();
+        }
+        (total / total_weight, total_weight)
+    }
 
-        let mut ucb_norm_max: f64 = ucb_norm_min;
+    fn find_best_ucb(&self, simulations_used: usize) -> i32 {
+        let max_number_pulls = self.max_number_pulls();
 
+        // collect the non-dominated set (current mean <= mean_max_pulls) with the (smoothed)
+        // sample averages and numbers of evaluations
+        let mut non_dominated: Vec<(i32, (f64, f64))> = Vec::new();
         for (_ucb_norm, arm_index) in self.sample_average_tree.iter() {
-            ucb_norm_max = f64::max(
-                ucb_norm_max,
-                self.arm_memory[*arm_index as usize].get_value(),
-            );
-
-            // checks if we are still in the non dominated-set (current mean <= mean_max_pulls)
+            non_dominated.push((*arm_index, self.smoothed_stats(*arm_index)));
             if self.arm_memory[*arm_index as usize].get_n_evaluations() == max_number_pulls {
                 break;
             }
         }
 
+        let values = non_dominated.iter().map(|(_arm_index, (value, _))| *value);
+        let ucb_norm_min: f64 = values.clone().fold(f64::INFINITY, f64::min);
+        let ucb_norm_max: f64 = values.fold(f64::NEG_INFINITY, f64::max);
+
         // find the solution of non-dominated set with the lowest associated UCB value
         let mut best_arm_index: i32 = 0;
         let mut best_ucb_value: f64 = f64::MAX;
 
-        for (_ucb_norm, arm_index) in self.sample_average_tree.iter() {
+        for (arm_index, (value, n_evaluations)) in non_dominated {
             if ucb_norm_max == ucb_norm_min {
-                best_arm_index = *arm_index;
+                best_arm_index = arm_index;
             }
 
             // transform sample mean to interval [0,1]
-            let transformed_sample_mean: f64 = (self.arm_memory[*arm_index as usize].get_value()
-                - ucb_norm_min)
-                / (ucb_norm_max - ucb_norm_min);
-            let penalty_term: f64 = (2.0 * (simulations_used as f64).ln()
-                / self.arm_memory[*arm_index as usize].get_n_evaluations() as f64)
-                .sqrt();
+            let transformed_sample_mean: f64 =
+                (value - ucb_norm_min) / (ucb_norm_max - ucb_norm_min);
+            let penalty_term: f64 = ucb_bonus(simulations_used, n_evaluations);
             let ucb_value: f64 = transformed_sample_mean + penalty_term;
 
             // new best solution found
             if ucb_value < best_ucb_value {
-                best_arm_index = *arm_index;
+                best_arm_index = arm_index;
                 best_ucb_value = ucb_value;
             }
-
-            // checks if we are still in the non dominated-set (current mean <= mean_max_pulls)
-            if self.arm_memory[*arm_index as usize].get_n_evaluations() == max_number_pulls {
-                break;
-            }
         }
 
         best_arm_index
     }
 
-    fn sample_and_update<F: OptimizationFn>(
-        &mut self,
-        arm_index: i32,
-        mut individual: Arm,
-        opti_function: &F,
-    ) {
+    // Updates the arm with the reward, adding it to the arm memory if it is new. Returns the index
+    // of the arm.
+    fn update_arm(&mut self, arm_index: i32, mut individual: Arm, g: f64) -> i32 {
         if arm_index >= 0 {
             self.sample_average_tree.delete(
                 &FloatKey::new(self.arm_memory[arm_index as usize].get_value()),
                 &arm_index,
             );
-            self.arm_memory[arm_index as usize].pull(opti_function);
+            self.arm_memory[arm_index as usize].update(g);
             self.sample_average_tree.insert(
                 FloatKey::new(self.arm_memory[arm_index as usize].get_value()),
                 arm_index,
             );
+            arm_index
         } else {
-            individual.pull(opti_function);
+            // Arms that were evicted earlier continue with their previous statistics
+            if let Some((_id, stats)) = self
+                .evicted_arms
+                .remove(&fingerprint(individual.get_action_vector()))
+            {
+                individual = Arm::with_stats(individual.get_action_vector(), stats);
+            }
+            individual.update(g);
+            if let Some(index) = &mut self.spatial_index {
+                index.insert(individual.get_action_vector(), self.arm_memory.len() as i32);
+            }
             self.arm_memory.push(individual.clone());
             self.lookup_table.insert(
                 individual.get_action_vector().to_vec(),
@@ -142,23 +528,104 @@ impl GMAB {
                 FloatKey::new(individual.get_value()),
                 self.arm_memory.len() as i32 - 1,
             );
+            self.arm_memory.len() as i32 - 1
         }
     }
 
-    fn initialize_population<F: OptimizationFn>(&mut self, seed: u64, opti_function: &F) {
-        let mut initial_population = self.genetic_algorithm.generate_new_population(seed);
+    // Evaluates the candidates as one batch and updates the arm memory with the rewards and the
+    // wall time of the evaluations. Requires distinct action vectors, since all rewards are
+    // observed before any update. The objective receives the number of recorded evaluations of
+    // each arm, see `OptimizationFn::evaluate_batch_keyed`. These include the evaluations of an
+    // evicted arm while its statistics are remembered, and restart once they are forgotten.
+    fn sample_and_update_batch<F: OptimizationFn>(
+        &mut self,
+        candidates: Vec<(i32, Arm)>,
+        opti_function: &F,
+    ) -> usize {
+        let action_vectors: Vec<Vec<i32>> = candidates
+            .iter()
+            .map(|(_arm_index, individual)| individual.get_action_vector().to_vec())
+            .collect();
+        let pulls: Vec<i32> = candidates
+            .iter()
+            .map(|(arm_index, individual)| {
+                if *arm_index >= 0 {
+                    return self.arm_memory[*arm_index as usize].get_n_evaluations();
+                }
+                self.evicted_arms
+                    .get(&fingerprint(individual.get_action_vector()))
+                    .map_or(0, |(_id, (n_evaluations, _, _))| *n_evaluations)
+            })
+            .collect();
+        let start = Instant::now();
+        let (rewards, costs) = opti_function.evaluate_batch_keyed(&action_vectors, &pulls);
+        let evaluated = Instant::now();
+        self.phase_times.evaluation += (evaluated - start).as_secs_f64();
+        assert_eq!(
+            rewards.len(),
+            action_vectors.len(),
+            "The objective must return one value per action vector."
+        );
+        assert_eq!(
+            costs.len(),
+            action_vectors.len(),
+            "The objective must return one cost per action vector."
+        );
 
-        for (index, individual) in initial_population.iter_mut().enumerate() {
-            individual.pull(opti_function);
-            self.arm_memory.push(individual.clone());
-            self.lookup_table
-                .insert(individual.get_action_vector().to_vec(), index as i32);
-            self.sample_average_tree
-                .insert(FloatKey::new(individual.get_value()), index as i32);
+        for (((arm_index, individual), g), cost) in candidates.into_iter().zip(rewards).zip(costs) {
+            // Discarded evaluations are not recorded, see `OptimizationFn::evaluate_batch`
+            if !g.is_nan() {
+                if arm_index >= 0 {
+                    self.n_repulls += 1;
+                } else {
+                    self.n_new_arms += 1;
+                }
+                let arm_index = self.update_arm(arm_index, individual, g);
+                self.arm_memory[arm_index as usize].record_cost(cost);
+            }
         }
+        self.phase_times.update += evaluated.elapsed().as_secs_f64();
+        action_vectors.len()
+    }
+
+    // Samples and evaluates the initial population, using the initialization stream of the run.
+    pub(crate) fn initialize_population<F: OptimizationFn>(
+        &mut self,
+        seed: u64,
+        opti_function: &F,
+    ) {
+        let is_feasible = |action_vector: &[i32]| self.is_feasible(action_vector, opti_function);
+        let initial_population = self
+            .genetic_algorithm
+            .generate_new_population(derive_seed(seed, &[STREAM_INITIALIZATION]), &is_feasible);
+        let candidates: Vec<(i32, Arm)> = initial_population
+            .into_iter()
+            .map(|individual| (-1, individual))
+            .collect();
+        self.sample_and_update_batch(candidates, opti_function);
+    }
+
+    // Samples and evaluates a new population within the remaining budget, and returns the number
+    // of used trials.
+    fn resample_population<F: OptimizationFn>(
+        &mut self,
+        seed: u64,
+        opti_function: &F,
+        used_trials: usize,
+        n_trials: usize,
+    ) -> usize {
+        let is_feasible = |action_vector: &[i32]| self.is_feasible(action_vector, opti_function);
+        let mut candidates: Vec<(i32, Arm)> = self
+            .genetic_algorithm
+            .generate_new_population(derive_seed(seed, &[STREAM_INITIALIZATION]), &is_feasible)
+            .into_iter()
+            .map(|individual| (self.get_arm_index(&individual), individual))
+            .collect();
+        candidates.truncate(n_trials.saturating_sub(used_trials));
+        self.sample_and_update_batch(candidates, opti_function)
     }
 
-    fn extract_best_arms(&mut self, used_trials: usize, mut n_best: usize) -> Vec<Arm> {
+    pub(crate) fn extract_best_arms(&mut self, used_trials: usize, mut n_best: usize) -> Vec<Arm> {
         let mut best_arms: Vec<Arm> = Vec::new();
         while n_best > 0 {
             // Return early if there are no more arms to extract
@@ -185,21 +652,20 @@ impl GMAB {
         best_arms
     }
 
-    pub fn optimize<F: OptimizationFn>(
-        &mut self,
-        opti_function: F,
-        bounds: Vec<(i32, i32)>,
-        n_trials: usize,
-        n_best: usize,
-        seed: Option<u64>,
-    ) -> Vec<Arm> {
-        // Unwrap seed or fall back to system entropy
-        let seed = seed.unwrap_or_else(|| rand::rng().next_u64());
-        let mut rng: StdRng = SeedableRng::seed_from_u64(seed);
-
+    pub(crate) fn prepare(&mut self, bounds: Vec<(i32, i32)>, n_trials: usize, n_best: usize) {
         // Set the bounds and check the algorithm configuration
         self.genetic_algorithm.set_bounds(bounds);
+        match &self.strides {
+            Some(strides) => self.genetic_algorithm.set_strides(strides),
+            None => self.genetic_algorithm.resolutions.clear(),
+        }
         self.genetic_algorithm.validate();
+        self.mutation_scale = 1.0;
+        self.generation_stats.clear();
+        self.n_new_arms = 0;
+        self.n_repulls = 0;
+        self.phase_times = PhaseTimes::default();
+        self.generation = 0;
 
         assert!(
             n_trials >= self.genetic_algorithm.population_size,
@@ -207,97 +673,558 @@ impl GMAB {
             self.genetic_algorithm.population_size
         );
         assert!(n_best >= 1, "n_best must be at least 1. ({})", n_best);
+        for constraint in &self.constraints {
+            constraint.validate(self.genetic_algorithm.dimension);
+        }
+        if let Some(max_arms) = self.max_arms {
+            assert!(
+                max_arms >= self.genetic_algorithm.population_size,
+                "max_arms must be at least population_size ({})",
+                self.genetic_algorithm.population_size
+            );
+        }
+        if let Some(surrogate) = &self.surrogate {
+            surrogate.validate();
+        }
+        if let Some(smoothing) = &self.smoothing {
+            smoothing.validate();
+        }
+        self.build_spatial_index();
+    }
 
-        // Initialize the Population for the Optimization
-        let next_seed = rng.next_u64();
-        self.initialize_population(next_seed, &opti_function);
+    pub(crate) fn population_size(&self) -> usize {
+        self.genetic_algorithm.population_size
+    }
 
-        // Run Optimization
-        let verbose = false;
-        let mut used_trials: usize = self.genetic_algorithm.population_size;
-        loop {
-            let mut current_indexes: Vec<i32> = Vec::new();
-            let mut population: Vec<Arm> = Vec::new();
+    // Runs a single generation (selection, crossover, mutation and evaluation), and returns the
+    // updated number of used trials. Stops early as soon as the budget of n_trials is exhausted.
+    // The random streams of the generation are derived from the seed of the run, see `rng`.
+    pub(crate) fn run_generation<F: OptimizationFn>(
+        &mut self,
+        seed: u64,
+        opti_function: &F,
+        used_trials: usize,
+        n_trials: usize,
+    ) -> usize {
+        let start = Instant::now();
+        let population_size = self.genetic_algorithm.population_size;
+        let mut current_indexes: HashSet<i32> = HashSet::with_capacity(population_size);
+        let mut population: Vec<Arm> = Vec::with_capacity(population_size);
+
+        // get first self.population_size elements from sorted tree and use value to get arm
+        self.sample_average_tree
+            .iter()
+            .take(population_size)
+            .for_each(|(_key, arm_index)| {
+                population.push(self.arm_memory[*arm_index as usize].clone());
+                current_indexes.insert(*arm_index);
+            });
+
+        let generation_seed = derive_seed(seed, &[self.generation]);
+        self.generation += 1;
+
+        // Start over with a new sample if all evaluations so far were discarded
+        if population.is_empty() {
+            return used_trials
+                + self.resample_population(generation_seed, opti_function, used_trials, n_trials);
+        }
 
-            // get first self.population_size elements from sorted tree and use value to get arm
-            self.sample_average_tree
-                .iter()
-                .take(self.genetic_algorithm.population_size)
-                .for_each(|(_key, arm_index)| {
-                    population.push(self.arm_memory[*arm_index as usize].clone());
-                    current_indexes.push(*arm_index);
-                });
+        // shuffle population
+        population.shuffle(&mut stream(generation_seed, &[STREAM_SHUFFLE]));
+
+        // Mutation removes duplicates, and retries mutations that match known arms, so that the
+        // budget is spent on new arms wherever possible
+        let is_feasible = |action_vector: &[i32]| self.is_feasible(action_vector, opti_function);
+        let is_known = |action_vector: &[i32]| self.lookup_table.contains_key(action_vector);
+        let breed = |seed: u64| {
+            let crossover_pop = self.genetic_algorithm.crossover(
+                derive_seed(seed, &[STREAM_CROSSOVER]),
+                &population,
+                &is_feasible,
+            );
+            let next_seed = derive_seed(seed, &[STREAM_MUTATION]);
+            if self.mutation_schedule == MutationSchedule::Fixed {
+                self.genetic_algorithm.mutate_with_parents(
+                    next_seed,
+                    &crossover_pop,
+                    &is_feasible,
+                    &is_known,
+                )
+            } else {
+                self.genetic_algorithm
+                    .scaled(self.mutation_scale)
+                    .mutate_with_parents(next_seed, &crossover_pop, &is_feasible, &is_known)
+            }
+        };
+        let mut mutated_pop = breed(generation_seed);
+
+        // Breed more offspring, and keep as many of the most promising ones, see `set_surrogate`
+        if let Some(surrogate) = &self.surrogate {
+            if self.arm_memory.len() >= surrogate.n_neighbors {
+                let n_admitted = mutated_pop
+                    .iter()
+                    .filter(|(_parent, individual)| {
+                        !current_indexes.contains(&self.get_arm_index(individual))
+                    })
+                    .count();
+                for round in 1..surrogate.oversampling {
+                    mutated_pop.extend(breed(derive_seed(
+                        generation_seed,
+                        &[STREAM_SURROGATE, round as u64],
+                    )));
+                }
+                mutated_pop =
+                    self.screen_offspring(surrogate, mutated_pop, n_admitted, &current_indexes);
+            }
+        }
+        let n_mutated = mutated_pop.len();
+
+        // Collect the candidates of this generation, skipping offspring from the current population.
+        // Mutation removes duplicates, so all candidates are distinct and form one batch.
+        let mut candidates: Vec<(i32, Arm)> = Vec::new();
+        let mut parents: Vec<usize> = Vec::new();
+        for (parent, individual) in mutated_pop {
+            let arm_index = self.get_arm_index(&individual);
+
+            // check if arm is in current population
+            if current_indexes.contains(&arm_index) {
+                continue;
+            }
+            candidates.push((arm_index, individual));
+            parents.push(parent);
+        }
+        let n_offspring = candidates.len();
+        let n_skipped = n_mutated - n_offspring;
+
+        for individual in population {
+            let arm_index = self.get_arm_index(&individual);
+            candidates.push((arm_index, individual));
+        }
 
-            // shuffle population
-            population.shuffle(&mut rng);
+        // Refine the grid once the offspring mostly revisit known arms, i.e. the current
+        // resolution is exhausted around the population
+        let n_new_arms = candidates
+            .iter()
+            .filter(|(arm_index, _)| *arm_index < 0)
+            .count();
+        if 2 * n_new_arms < self.genetic_algorithm.population_size {
+            self.genetic_algorithm.refine();
+        }
+
+        let n_offspring = if self.cost_aware {
+            self.select_by_cost(generation_seed, &mut candidates, &parents, used_trials)
+        } else {
+            n_offspring
+        };
+
+        // Adhere to the budget of n_trials
+        candidates.truncate(n_trials.saturating_sub(used_trials));
+        let n_offspring = n_offspring.min(candidates.len());
+        let n_repulls = candidates[..n_offspring]
+            .iter()
+            .filter(|(arm_index, _)| *arm_index >= 0)
+            .count();
+        self.generation_stats.push(GenerationStats {
+            n_new_arms: n_offspring - n_repulls,
+            n_repulls,
+            n_skipped,
+        });
+        let offspring: Vec<Vec<i32>> = candidates
+            .iter()
+            .take(n_offspring)
+            .map(|(_arm_index, individual)| individual.get_action_vector().to_vec())
+            .collect();
+
+        self.phase_times.breeding += start.elapsed().as_secs_f64();
+        let used_trials = used_trials + self.sample_and_update_batch(candidates, opti_function);
+        let start = Instant::now();
+        self.update_mutation_scale(&offspring, used_trials, n_trials);
+        self.evict_arms();
+        self.phase_times.update += start.elapsed().as_secs_f64();
+        used_trials
+    }
+
+    // Ranks the offspring of several rounds of breeding by the sample average that the surrogate
+    // predicts, or their actual sample average if they are known arms, and keeps the n_admitted
+    // best ones. Duplicates and offspring from the current population are removed first.
+    fn screen_offspring(
+        &self,
+        surrogate: &Surrogate,
+        offspring: Vec<(usize, Arm)>,
+        n_admitted: usize,
+        current_indexes: &HashSet<i32>,
+    ) -> Vec<(usize, Arm)> {
+        let mut seen: HashSet<Vec<i32>> = HashSet::with_capacity(offspring.len());
+        let offspring: Vec<(usize, Arm)> = offspring
+            .into_iter()
+            .filter(|(_parent, individual)| {
+                !current_indexes.contains(&self.get_arm_index(individual))
+                    && seen.insert(individual.get_action_vector().to_vec())
+            })
+            .collect();
+        if offspring.len() <= n_admitted {
+            return offspring;
+        }
 
-            let next_seed = rng.next_u64();
-            let crossover_pop = self.genetic_algorithm.crossover(next_seed, &population);
+        let unknown: Vec<&[i32]> = offspring
+            .iter()
+            .map(|(_parent, individual)| individual.get_action_vector())
+            .filter(|action_vector| !self.lookup_table.contains_key(*action_vector))
+            .collect();
+        let scales: Vec<f64> = (0..self.genetic_algorithm.dimension)
+            .map(|i| {
+                (self.genetic_algorithm.upper_bound[i] - self.genetic_algorithm.lower_bound[i])
+                    .max(1) as f64
+            })
+            .collect();
+        let mut predictions = surrogate
+            .predict(&self.arm_memory, &scales, &unknown)
+            .into_iter();
+        let mut ranked: Vec<(f64, (usize, Arm))> = offspring
+            .into_iter()
+            .map(|(parent, individual)| {
+                let prediction = match self.get_arm_index(&individual) {
+                    arm_index if arm_index >= 0 => self.arm_memory[arm_index as usize].get_value(),
+                    _ => predictions.next().unwrap(),
+                };
+                (prediction, (parent, individual))
+            })
+            .collect();
+
+        // A stable sort, so that ties keep the order of breeding
+        ranked.sort_by(|a, b| a.0.total_cmp(&b.0));
+        ranked
+            .into_iter()
+            .take(n_admitted)
+            .map(|(_prediction, offspring)| offspring)
+            .collect()
+    }
 
-            // mutate automatically removes duplicates
-            let next_seed = rng.next_u64();
-            let mutated_pop = self.genetic_algorithm.mutate(next_seed, &crossover_pop);
+    // Thins out the candidates of a generation by the expected cost of their evaluation, see
+    // `set_cost_aware`. The candidates are the offspring, followed by the population in the order
+    // of the crossover, and parents holds the position of each offspring's parent. Offspring of a
+    // crossover have two parents, at the positions p and p ^ 1. Returns the number of offspring
+    // that were admitted.
+    fn select_by_cost(
+        &self,
+        seed: u64,
+        candidates: &mut Vec<(i32, Arm)>,
+        parents: &[usize],
+        used_trials: usize,
+    ) -> usize {
+        let n_offspring = parents.len();
+        let population = &candidates[n_offspring..];
+        let costs: Vec<f64> = population
+            .iter()
+            .map(|(_arm_index, arm)| arm.get_mean_cost())
+            .collect();
+        let bonuses: Vec<f64> = population
+            .iter()
+            .map(|(_arm_index, arm)| ucb_bonus(used_trials, arm.get_n_evaluations() as f64))
+            .collect();
+        let reference_cost = median(&costs);
+        let reference_bonus = median(&bonuses);
+
+        let mut rng = stream(seed, &[STREAM_COST]);
+        let keep: Vec<bool> = candidates
+            .iter()
+            .enumerate()
+            .map(|(position, (arm_index, _individual))| {
+                let probability = if position < n_offspring {
+                    let parent = parents[position];
+                    let known_cost = if *arm_index >= 0 {
+                        self.arm_memory[*arm_index as usize].get_mean_cost()
+                    } else {
+                        0.0
+                    };
+                    let expected_cost = if known_cost > 0.0 {
+                        known_cost
+                    } else {
+                        (costs[parent] + costs[(parent ^ 1).min(costs.len() - 1)]) / 2.0
+                    };
+                    ratio(reference_cost, expected_cost)
+                } else {
+                    let member = position - n_offspring;
+                    ratio(bonuses[member], reference_bonus) * ratio(reference_cost, costs[member])
+                };
+                rng.random::<f64>() < probability
+            })
+            .collect();
+
+        // Keep all candidates rather than stalling the optimization, if none was selected
+        if !keep.contains(&true) {
+            return n_offspring;
+        }
+        let n_admitted = keep[..n_offspring].iter().filter(|&&kept| kept).count();
+        let mut keep = keep.into_iter();
+        candidates.retain(|_candidate| keep.next().unwrap());
+        n_admitted
+    }
 
-            for individual in mutated_pop {
-                if used_trials >= n_trials {
-                    return self.extract_best_arms(used_trials, n_best);
+    // Updates the scale of the mutations after a generation, see `MutationSchedule`. An offspring
+    // is successful if its arm is part of the population after the update.
+    fn update_mutation_scale(
+        &mut self,
+        offspring: &[Vec<i32>],
+        used_trials: usize,
+        n_trials: usize,
+    ) {
+        match self.mutation_schedule {
+            MutationSchedule::Fixed => return,
+            MutationSchedule::SuccessRule => {
+                if offspring.is_empty() {
+                    return;
                 }
+                let population: HashSet<i32> = self
+                    .sample_average_tree
+                    .iter()
+                    .take(self.genetic_algorithm.population_size)
+                    .map(|(_key, arm_index)| *arm_index)
+                    .collect();
+                let n_successes = offspring
+                    .iter()
+                    .filter(|action_vector| {
+                        self.lookup_table
+                            .get(*action_vector)
+                            .is_some_and(|arm_index| population.contains(arm_index))
+                    })
+                    .count();
+                let success_rate = n_successes as f64 / offspring.len() as f64;
+                if success_rate > SUCCESS_RULE_TARGET {
+                    self.mutation_scale /= SUCCESS_RULE_FACTOR;
+                } else if success_rate < SUCCESS_RULE_TARGET {
+                    self.mutation_scale *= SUCCESS_RULE_FACTOR;
+                }
+            }
+            MutationSchedule::Decay => {
+                let progress = used_trials as f64 / n_trials as f64;
+                self.mutation_scale = DECAY_FINAL_SCALE.powf(progress);
+            }
+        }
+        self.mutation_scale = self
+            .mutation_scale
+            .clamp(MIN_MUTATION_SCALE, MAX_MUTATION_SCALE);
+    }
 
-                let arm_index = self.get_arm_index(&individual);
+    // Evicts arms until the arm memory adheres to max_arms. The population (the arms with the
+    // best sample average) is never evicted. Among the remaining arms, those with a single
+    // evaluation and the worst sample average go first, since they are the least likely to be
+    // selected again. A summary of their statistics is kept, so that an evicted arm that is
+    // sampled again continues from its previous estimate instead of starting over.
+    fn evict_arms(&mut self) {
+        let max_arms = match self.max_arms {
+            Some(max_arms) => max_arms,
+            None => return,
+        };
+        let n_excess = self.arm_memory.len().saturating_sub(max_arms);
+        if n_excess == 0 {
+            return;
+        }
 
-                // check if arm is in current population
-                if current_indexes.contains(&arm_index) {
-                    continue;
+        let n_candidates = self
+            .arm_memory
+            .len()
+            .saturating_sub(self.genetic_algorithm.population_size);
+        // Scan from the worst sample average, and stop as soon as enough single-pull arms are found
+        let mut evicted: Vec<i32> = Vec::with_capacity(n_excess);
+        let mut multi_pull: Vec<i32> = Vec::new();
+        for (_key, arm_index) in self.sample_average_tree.iter_rev().take(n_candidates) {
+            if self.arm_memory[*arm_index as usize].get_n_evaluations() == 1 {
+                evicted.push(*arm_index);
+                if evicted.len() == n_excess {
+                    break;
                 }
+            } else if multi_pull.len() < n_excess {
+                multi_pull.push(*arm_index);
+            }
+        }
+
+        // Fall back to arms with more evaluations, if there are not enough single-pull arms
+        let n_missing = n_excess - evicted.len();
+        evicted.extend(multi_pull.into_iter().take(n_missing));
+
+        // Evict from the highest index, so that swap_remove never moves an arm that is evicted
+        evicted.sort_unstable_by(|a, b| b.cmp(a));
+        for arm_index in evicted {
+            self.evict_arm(arm_index);
+        }
+    }
+
+    fn evict_arm(&mut self, arm_index: i32) {
+        let arm = self.arm_memory.swap_remove(arm_index as usize);
+        self.sample_average_tree
+            .delete(&FloatKey::new(arm.get_value()), &arm_index);
+        self.lookup_table.remove(arm.get_action_vector());
+        if let Some(index) = &mut self.spatial_index {
+            index.remove(arm.get_action_vector(), arm_index);
+        }
 
-                self.sample_and_update(arm_index, individual.clone(), &opti_function);
-                used_trials += 1;
+        // The last arm was moved to the position of the evicted arm
+        let moved_index = self.arm_memory.len() as i32;
+        if arm_index != moved_index {
+            let moved = &self.arm_memory[arm_index as usize];
+            if let Some(index) = &mut self.spatial_index {
+                index.remove(moved.get_action_vector(), moved_index);
+                index.insert(moved.get_action_vector(), arm_index);
             }
+            self.sample_average_tree
+                .delete(&FloatKey::new(moved.get_value()), &moved_index);
+            self.sample_average_tree
+                .insert(FloatKey::new(moved.get_value()), arm_index);
+            self.lookup_table
+                .insert(moved.get_action_vector().to_vec(), arm_index);
+        }
 
-            for individual in population {
-                if used_trials >= n_trials {
-                    return self.extract_best_arms(used_trials, n_best);
-                }
+        // Remember the statistics of the evicted arm, and forget the oldest summaries
+        let key = fingerprint(arm.get_action_vector());
+        self.n_evictions += 1;
+        self.evicted_arms
+            .insert(key, (self.n_evictions, arm.get_stats()));
+        self.eviction_order.push_back((key, self.n_evictions));
+        let max_summaries = self.max_arms.unwrap_or(usize::MAX);
+        while self.eviction_order.len() > max_summaries {
+            let (key, id) = self.eviction_order.pop_front().unwrap();
+            if self
+                .evicted_arms
+                .get(&key)
+                .is_some_and(|(other, _)| *other == id)
+            {
+                self.evicted_arms.remove(&key);
+            }
+        }
+    }
+
+    // Returns copies of the n arms with the best sample average, e.g. to migrate them.
+    pub(crate) fn top_arms(&self, n: usize) -> Vec<Arm> {
+        self.sample_average_tree
+            .iter()
+            .take(n)
+            .map(|(_key, arm_index)| self.arm_memory[*arm_index as usize].clone())
+            .collect()
+    }
 
-                let arm_index = self.get_arm_index(&individual);
-                self.sample_and_update(arm_index, individual.clone(), &opti_function);
-                used_trials += 1;
+    // Adds an arm that was evaluated elsewhere (e.g. on another island) to the arm memory.
+    // Known arms are only replaced if the incoming statistics are based on more evaluations, so
+    // that statistics exchanged repeatedly are never counted twice.
+    pub(crate) fn receive_arm(&mut self, arm: Arm) {
+        let arm_index = self.get_arm_index(&arm);
+        if arm_index < 0 {
+            if let Some(index) = &mut self.spatial_index {
+                index.insert(arm.get_action_vector(), self.arm_memory.len() as i32);
             }
+            self.arm_memory.push(arm.clone());
+            self.lookup_table.insert(
+                arm.get_action_vector().to_vec(),
+                self.arm_memory.len() as i32 - 1,
+            );
+            self.sample_average_tree.insert(
+                FloatKey::new(arm.get_value()),
+                self.arm_memory.len() as i32 - 1,
+            );
+        } else if arm.get_n_evaluations() > self.arm_memory[arm_index as usize].get_n_evaluations()
+        {
+            self.sample_average_tree.delete(
+                &FloatKey::new(self.arm_memory[arm_index as usize].get_value()),
+                &arm_index,
+            );
+            self.sample_average_tree
+                .insert(FloatKey::new(arm.get_value()), arm_index);
+            self.arm_memory[arm_index as usize] = arm;
+        }
+    }
 
-            if verbose {
-                let best_arm_index = self.find_best_ucb(used_trials);
-                print!(
-                    "x: {:?}",
-                    self.arm_memory[best_arm_index as usize].get_action_vector()
-                );
-                // get averaged function value over 50 simulations
-                let mut sum = 0.0;
-                for _ in 0..50 {
-                    sum +=
-                        self.arm_memory[best_arm_index as usize].get_function_value(&opti_function);
-                }
-                print!(" f(x): {:.3}", sum / 50.0);
+    pub(crate) fn arms(&self) -> &[Arm] {
+        &self.arm_memory
+    }
 
-                print!(" n: {}", used_trials);
-                // print number of pulls of best arm
-                println!(
-                    " n(x): {}",
-                    self.arm_memory[best_arm_index as usize].get_n_evaluations()
-                );
+    // Takes a snapshot of the optimization after used_trials of n_trials, see `Progress`.
+    pub(crate) fn progress(&self, used_trials: usize, n_trials: usize, elapsed: f64) -> Progress {
+        let mut progress = Progress {
+            n_trials,
+            used_trials,
+            n_generations: self.generation,
+            elapsed,
+            n_arms: self.arm_memory.len(),
+            n_new_arms: self.n_new_arms,
+            n_repulls: self.n_repulls,
+            phase_times: self.phase_times,
+            ..Default::default()
+        }
+        .with_rates();
+        if !self.sample_average_tree.is_empty() {
+            let arm = &self.arm_memory[self.find_best_ucb(used_trials) as usize];
+            progress.set_best(
+                arm.get_action_vector(),
+                arm.get_value(),
+                arm.get_value_std_dev(),
+                arm.get_n_evaluations(),
+            );
+        }
+        progress
+    }
+
+    pub fn optimize<F: OptimizationFn>(
+        &mut self,
+        opti_function: F,
+        bounds: Vec<(i32, i32)>,
+        n_trials: usize,
+        n_best: usize,
+        seed: Option<u64>,
+    ) -> Vec<Arm> {
+        // Unwrap seed or fall back to system entropy
+        let seed = seed.unwrap_or_else(|| rand::rng().next_u64());
+
+        self.prepare(bounds, n_trials, n_best);
+
+        // Initialize the Population for the Optimization
+        self.initialize_population(seed, &opti_function);
+
+        // Run Optimization
+        let mut reporter = ProgressReporter::new(opti_function.progress_interval());
+        let mut used_trials: usize = self.genetic_algorithm.population_size;
+        while used_trials < n_trials {
+            used_trials = self.run_generation(seed, &opti_function, used_trials, n_trials);
+            if reporter.is_due() {
+                opti_function.report_progress(&self.progress(
+                    used_trials,
+                    n_trials,
+                    reporter.elapsed(),
+                ));
             }
         }
+        if reporter.is_enabled() {
+            opti_function.report_progress(&self.progress(
+                used_trials,
+                n_trials,
+                reporter.elapsed(),
+            ));
+        }
+
+        self.extract_best_arms(used_trials, n_best)
     }
 }
 
 #[cfg(test)]
 mod tests {
     use super::*;
+    use crate::genetic::POPULATION_SIZE_DEFAULT;
+    use rand::rngs::StdRng;
+    use rand::SeedableRng;
     use std::cell::RefCell;
+    use std::rc::Rc;
 
     fn mock_opti_function(_vec: &[i32]) -> f64 {
         0.0
     }
 
+    #[test]
+    fn test_fingerprint_is_stable() {
+        // Encoded states depend on these values, see `GMAB::encode`
+        assert_eq!(fingerprint(&[]), FNV_OFFSET_BASIS);
+        assert_eq!(fingerprint(&[1, -2, 300]), 0xd138c7a1bb0bcd62);
+        assert_ne!(fingerprint(&[1, 2]), fingerprint(&[2, 1]));
+    }
+
     #[test]
     fn test_gmab_new() {
         let ga = GeneticAlgorithm {
@@ -308,6 +1235,7 @@ mod tests {
             dimension: 2,
             lower_bound: vec![0, 0],
             upper_bound: vec![10, 10],
+            resolutions: Vec::new(),
         };
         let mut gmab = GMAB::new(ga);
         gmab.initialize_population(0, &mock_opti_function);
@@ -334,6 +1262,7 @@ mod tests {
             dimension: 2,
             lower_bound: vec![0, 0],
             upper_bound: vec![10, 10],
+            resolutions: Vec::new(),
         };
         let mut gmab = GMAB::new(ga);
         let arm = Arm::new(&vec![1, 2]);
@@ -353,6 +1282,7 @@ mod tests {
             dimension: 2,
             lower_bound: vec![0, 0],
             upper_bound: vec![10, 10],
+            resolutions: Vec::new(),
         };
         let mut gmab = GMAB::new(ga);
         gmab.initialize_population(0, &mock_opti_function);
@@ -369,6 +1299,7 @@ mod tests {
             dimension: 2,
             lower_bound: vec![0, 0],
             upper_bound: vec![10, 10],
+            resolutions: Vec::new(),
         };
         let mut gmab = GMAB::new(ga);
         gmab.initialize_population(0, &mock_opti_function);
@@ -385,6 +1316,7 @@ mod tests {
             dimension: 2,
             lower_bound: vec![0, 0],
             upper_bound: vec![10, 10],
+            resolutions: Vec::new(),
         };
         let mut gmab = GMAB::new(ga);
 
@@ -398,14 +1330,18 @@ mod tests {
         gmab.lookup_table
             .insert(arm2.get_action_vector().to_vec(), 1);
 
-        gmab.sample_and_update(0, arm.clone(), &mock_opti_function);
-        gmab.sample_and_update(1, arm2.clone(), &mock_opti_function);
+        gmab.update_arm(0, arm.clone(), mock_opti_function(arm.get_action_vector()));
+        gmab.update_arm(
+            1,
+            arm2.clone(),
+            mock_opti_function(arm2.get_action_vector()),
+        );
 
         assert_eq!(gmab.find_best_ucb(100), 0);
     }
 
     #[test]
-    fn test_gmab_sample_and_update_with_existing() {
+    fn test_gmab_update_arm_with_existing() {
         let ga = GeneticAlgorithm {
             population_size: 10,
             mutation_rate: 0.5,
@@ -414,6 +1350,7 @@ mod tests {
             dimension: 2,
             lower_bound: vec![0, 0],
             upper_bound: vec![10, 10],
+            resolutions: Vec::new(),
         };
         let mut gmab = GMAB::new(ga);
         gmab.initialize_population(0, &mock_opti_function);
@@ -423,7 +1360,7 @@ mod tests {
         gmab.lookup_table
             .insert(arm.get_action_vector().to_vec(), 0);
 
-        gmab.sample_and_update(0, arm.clone(), &mock_opti_function);
+        gmab.update_arm(0, arm.clone(), mock_opti_function(arm.get_action_vector()));
 
         assert_eq!(gmab.arm_memory[0].get_n_evaluations(), 2);
         assert_eq!(gmab.arm_memory[0].get_value(), 0.0);
@@ -491,6 +1428,89 @@ mod tests {
         assert_eq!(n_trials, *used_trials.borrow_mut());
     }
 
+    #[test]
+    fn test_gmab_evaluates_generations_as_batch() {
+        // Mock opti_function that keeps track of the batches it receives
+        struct BatchFn {
+            batch_sizes: Rc<RefCell<Vec<usize>>>,
+        }
+
+        impl OptimizationFn for BatchFn {
+            fn evaluate(&self, _action_vector: &[i32]) -> f64 {
+                panic!("Single evaluations are not expected.");
+            }
+
+            fn evaluate_batch(&self, action_vectors: &[Vec<i32>]) -> Vec<f64> {
+                self.batch_sizes.borrow_mut().push(action_vectors.len());
+                action_vectors
+                    .iter()
+                    .map(|x| x.iter().sum::<i32>() as f64)
+                    .collect()
+            }
+        }
+
+        let batch_sizes = Rc::new(RefCell::new(Vec::new()));
+        let opti_function = BatchFn {
+            batch_sizes: Rc::clone(&batch_sizes),
+        };
+        let n_trials = 1000;
+        let bounds = vec![(1, 100), (1, 100)];
+        let mut gmab = GMAB::new(Default::default());
+        gmab.optimize(opti_function, bounds, n_trials, 1, Some(42));
+
+        // The initial population, and then each generation is evaluated in a single batch
+        let batch_sizes = batch_sizes.borrow();
+        assert_eq!(batch_sizes[0], POPULATION_SIZE_DEFAULT);
+        assert!(batch_sizes
+            .iter()
+            .all(|&n| n <= 2 * POPULATION_SIZE_DEFAULT));
+        assert_eq!(batch_sizes.iter().sum::<usize>(), n_trials);
+    }
+
+    #[test]
+    fn test_gmab_passes_pulls_of_each_arm() {
+        // Mock opti_function that records the pulls it receives per action vector
+        struct KeyedFn {
+            pulls: Rc<RefCell<HashMap<Vec<i32>, Vec<i32>>>>,
+        }
+
+        impl OptimizationFn for KeyedFn {
+            fn evaluate(&self, action_vector: &[i32]) -> f64 {
+                action_vector.iter().map(|&x| (x as f64).powi(2)).sum()
+            }
+
+            fn evaluate_batch_keyed(
+                &self,
+                action_vectors: &[Vec<i32>],
+                pulls: &[i32],
+            ) -> (Vec<f64>, Vec<f64>) {
+                for (action_vector, &pull) in action_vectors.iter().zip(pulls) {
+                    self.pulls
+                        .borrow_mut()
+                        .entry(action_vector.clone())
+                        .or_default()
+                        .push(pull);
+                }
+                self.evaluate_batch_timed(action_vectors)
+            }
+        }
+
+        let pulls = Rc::new(RefCell::new(HashMap::new()));
+        let opti_function = KeyedFn {
+            pulls: Rc::clone(&pulls),
+        };
+        let mut gmab = GMAB::new(Default::default());
+        gmab.optimize(opti_function, vec![(-5, 5), (-5, 5)], 1000, 1, Some(42));
+
+        // Each arm is pulled with the numbers of its previous evaluations
+        let pulls = pulls.borrow();
+        assert_eq!(pulls.values().map(|p| p.len()).sum::<usize>(), 1000);
+        for arm_pulls in pulls.values() {
+            assert_eq!(*arm_pulls, (0..arm_pulls.len() as i32).collect::<Vec<_>>());
+        }
+        assert!(pulls.values().any(|p| p.len() > 1));
+    }
+
     #[test]
     #[should_panic = "n_trials"]
     fn test_panic_on_invalid_n_trials() {
@@ -589,4 +1609,557 @@ mod tests {
         // Ensure the number of best arms returned matches the population size
         assert_eq!(best_arms.len(), sorted_arms.len());
     }
+
+    // Checks that the arm memory, lookup table and sample average tree are consistent.
+    fn assert_consistent(gmab: &GMAB) {
+        assert_eq!(gmab.lookup_table.len(), gmab.arm_memory.len());
+        assert_eq!(
+            gmab.sample_average_tree.iter().count(),
+            gmab.arm_memory.len()
+        );
+        for (key, arm_index) in gmab.sample_average_tree.iter() {
+            let arm = &gmab.arm_memory[*arm_index as usize];
+            assert_eq!(*key, FloatKey::new(arm.get_value()));
+            assert_eq!(gmab.lookup_table[arm.get_action_vector()], *arm_index);
+        }
+        let mut rebuilt = gmab.clone();
+        rebuilt.build_spatial_index();
+        assert_eq!(rebuilt.spatial_index, gmab.spatial_index);
+    }
+
+    #[test]
+    fn test_gmab_max_arms_bounds_arm_memory() {
+        fn mock_opti_function(vec: &[i32]) -> f64 {
+            vec.iter().map(|&x| (x as f64).powi(2)).sum()
+        }
+
+        let max_arms = 100;
+        let bounds = vec![(-10_000, 10_000), (-10_000, 10_000)];
+        let mut gmab = GMAB::new(Default::default());
+        gmab.set_max_arms(Some(max_arms));
+        let result = gmab.optimize(mock_opti_function, bounds, 10_000, 1, Some(42));
+
+        assert_eq!(result.len(), 1);
+        assert!(gmab.arm_memory.len() <= max_arms);
+        assert!(gmab.evicted_arms.len() <= max_arms);
+        assert!(gmab.eviction_order.len() <= max_arms);
+    }
+
+    #[test]
+    fn test_gmab_evict_arms() {
+        let ga = GeneticAlgorithm {
+            population_size: 1,
+            dimension: 1,
+            lower_bound: vec![0],
+            upper_bound: vec![9],
+            ..Default::default()
+        };
+        let mut gmab = GMAB::new(ga);
+        gmab.set_max_arms(Some(2));
+
+        // The single-pull arm with the worst sample average is evicted first
+        gmab.update_arm(-1, Arm::new(&vec![1]), 0.0);
+        gmab.update_arm(-1, Arm::new(&vec![2]), 10.0);
+        gmab.update_arm(-1, Arm::new(&vec![3]), 5.0);
+        gmab.update_arm(1, Arm::new(&vec![2]), 10.0);
+        gmab.evict_arms();
+
+        assert_eq!(gmab.arm_memory.len(), 2);
+        assert_eq!(gmab.get_arm_index(&Arm::new(&vec![3])), -1);
+        assert_consistent(&gmab);
+
+        // Evicted arms continue with their previous statistics if they are sampled again
+        gmab.update_arm(-1, Arm::new(&vec![3]), 15.0);
+        let arm_index = gmab.get_arm_index(&Arm::new(&vec![3]));
+        assert_eq!(gmab.arm_memory[arm_index as usize].get_n_evaluations(), 2);
+        assert_eq!(gmab.arm_memory[arm_index as usize].get_value(), 10.0);
+        assert!(gmab.evicted_arms.is_empty());
+        assert_consistent(&gmab);
+
+        // The population is never evicted, even if it has the worst sample average
+        gmab.evict_arms();
+        assert_eq!(gmab.get_arm_index(&Arm::new(&vec![1])), 0);
+        assert_consistent(&gmab);
+    }
+
+    #[test]
+    #[should_panic(expected = "max_arms")]
+    fn test_panic_on_invalid_max_arms() {
+        let bounds = vec![(1, 100), (1, 100)];
+        let mut gmab = GMAB::new(Default::default());
+        gmab.set_max_arms(Some(POPULATION_SIZE_DEFAULT - 1));
+        gmab.optimize(mock_opti_function, bounds, 100, 1, None);
+    }
+
+    #[test]
+    fn test_gmab_evaluates_only_feasible_arms() {
+        struct ConstrainedFn;
+
+        impl OptimizationFn for ConstrainedFn {
+            fn evaluate(&self, action_vector: &[i32]) -> f64 {
+                assert!(self.is_feasible(action_vector));
+                assert!(action_vector[0] + action_vector[1] <= 100);
+                action_vector.iter().map(|&x| -x as f64).sum()
+            }
+
+            fn is_feasible(&self, action_vector: &[i32]) -> bool {
+                action_vector[0] != action_vector[1]
+            }
+        }
+
+        // x0 + x1 <= 100
+        let bounds = vec![(0, 100), (0, 100)];
+        let mut gmab = GMAB::new(Default::default());
+        gmab.set_constraints(vec![LinearConstraint::new(vec![1.0, 1.0], 100.0)]);
+        let result = gmab.optimize(ConstrainedFn, bounds, 1000, 1, Some(42));
+
+        let best = result[0].get_action_vector();
+        assert!(best[0] + best[1] <= 100 && best[0] != best[1]);
+        assert!(gmab
+            .arm_memory
+            .iter()
+            .all(|arm| gmab.is_feasible(arm.get_action_vector(), &ConstrainedFn)));
+    }
+
+    #[test]
+    #[should_panic(expected = "coefficients")]
+    fn test_panic_on_invalid_constraint() {
+        let bounds = vec![(1, 100), (1, 100)];
+        let mut gmab = GMAB::new(Default::default());
+        gmab.set_constraints(vec![LinearConstraint::new(vec![1.0], 100.0)]);
+        gmab.optimize(mock_opti_function, bounds, 100, 1, None);
+    }
+
+    #[test]
+    fn test_gmab_refines_strides() {
+        fn mock_opti_function(vec: &[i32]) -> f64 {
+            vec.iter().map(|&x| ((x - 333) as f64).powi(2)).sum()
+        }
+
+        let bounds = vec![(0, 1000), (0, 1000)];
+        let mut gmab = GMAB::new(Default::default());
+        gmab.set_strides(Some(vec![100, 100]));
+        let result = gmab.optimize(mock_opti_function, bounds, 2000, 1, Some(42));
+
+        // The search starts on the coarse grid, and refines it once it runs out of new arms
+        assert!(gmab
+            .arm_memory
+            .iter()
+            .any(|arm| arm.get_action_vector().iter().any(|x| x % 100 != 0)));
+        assert!(gmab.genetic_algorithm.resolutions[0].stride < 100);
+
+        // Arms from the coarse grid are recognized when they are revisited
+        assert_eq!(gmab.lookup_table.len(), gmab.arm_memory.len());
+        assert!(result[0].get_n_evaluations() > 1);
+    }
+
+    #[test]
+    fn test_gmab_mutation_schedules() {
+        fn mock_opti_function(vec: &[i32]) -> f64 {
+            vec.iter().map(|&x| (x as f64).powi(2)).sum()
+        }
+
+        let bounds = vec![(-1000, 1000), (-1000, 1000)];
+        for (mutation_schedule, exp_scale) in [
+            (MutationSchedule::Fixed, Some(1.0)),
+            (MutationSchedule::Decay, Some(DECAY_FINAL_SCALE)),
+            (MutationSchedule::SuccessRule, None),
+        ] {
+            let mut gmab = GMAB::new(Default::default());
+            gmab.set_mutation_schedule(mutation_schedule);
+            let result = gmab.optimize(mock_opti_function, bounds.clone(), 5000, 1, Some(42));
+            assert_eq!(result.len(), 1);
+
+            match exp_scale {
+                Some(exp_scale) => assert!((gmab.mutation_scale - exp_scale).abs() < 1e-12),
+                // Most offspring fail to enter the population once the search converges
+                None => assert!(gmab.mutation_scale < 1.0),
+            }
+            assert_eq!(gmab.fresh().mutation_schedule, mutation_schedule);
+        }
+    }
+
+    #[test]
+    fn test_gmab_generation_stats() {
+        fn mock_opti_function(vec: &[i32]) -> f64 {
+            vec.iter().map(|&x| (x as f64).powi(2)).sum()
+        }
+
+        // A small space, where many offspring match known arms
+        let bounds = vec![(0, 9), (0, 9)];
+        let n_trials = 1000;
+        let mut gmab = GMAB::new(Default::default());
+        gmab.optimize(mock_opti_function, bounds, n_trials, 1, Some(42));
+
+        // Every trial after the initial population either pulls an offspring or a member of the
+        // population, which is pulled again in every generation
+        let stats = gmab.get_generation_stats();
+        let n_offspring: usize = stats.iter().map(|s| s.n_new_arms + s.n_repulls).sum();
+        assert!(n_offspring < n_trials - POPULATION_SIZE_DEFAULT);
+        assert_eq!(
+            stats.iter().map(|s| s.n_new_arms).sum::<usize>(),
+            gmab.arm_memory.len() - POPULATION_SIZE_DEFAULT
+        );
+
+        // Offspring are mostly new arms, until the space is exhausted
+        let last = stats.last().unwrap();
+        assert!(stats[0].n_new_arms > stats[0].n_repulls + stats[0].n_skipped);
+        assert!(last.n_new_arms < last.n_repulls + last.n_skipped);
+    }
+
+    #[test]
+    fn test_gmab_discards_nan_rewards() {
+        // Evaluations of x[0] < 0 are discarded, e.g. because they timed out
+        fn mock_opti_function(vec: &[i32]) -> f64 {
+            if vec[0] < 0 {
+                return f64::NAN;
+            }
+            vec.iter().map(|&x| (x as f64).powi(2)).sum()
+        }
+
+        let mut gmab = GMAB::new(Default::default());
+        let result = gmab.optimize(
+            mock_opti_function,
+            vec![(-10, 10), (-10, 10)],
+            500,
+            1,
+            Some(42),
+        );
+
+        assert!(result[0].get_action_vector()[0] >= 0);
+        assert!(gmab
+            .arm_memory
+            .iter()
+            .all(|arm| arm.get_action_vector()[0] >= 0));
+    }
+
+    #[test]
+    fn test_gmab_resamples_if_all_rewards_are_discarded() {
+        let calls = Rc::new(RefCell::new(0));
+        let counter = Rc::clone(&calls);
+        let opti_function = move |vec: &[i32]| -> f64 {
+            *counter.borrow_mut() += 1;
+            // Discard the whole initial population
+            if *counter.borrow() <= POPULATION_SIZE_DEFAULT {
+                return f64::NAN;
+            }
+            vec.iter().map(|&x| (x as f64).powi(2)).sum()
+        };
+
+        let mut gmab = GMAB::new(Default::default());
+        let result = gmab.optimize(opti_function, vec![(-10, 10), (-10, 10)], 200, 1, Some(42));
+        assert_eq!(*calls.borrow(), 200);
+        assert_eq!(result.len(), 1);
+    }
+
+    #[test]
+    fn test_gmab_to_bytes() {
+        fn mock_opti_function(vec: &[i32]) -> f64 {
+            vec.iter().map(|&x| (x as f64).powi(2)).sum()
+        }
+
+        let mut gmab = GMAB::new(Default::default());
+        gmab.set_constraints(vec![LinearConstraint::new(vec![1.0, 1.0], 50.0)]);
+        gmab.set_max_arms(Some(40));
+        gmab.set_strides(Some(vec![2, 2]));
+        gmab.set_mutation_schedule(MutationSchedule::SuccessRule);
+        gmab.set_cost_aware(true);
+        gmab.set_surrogate(Some(Surrogate::new(3)));
+        gmab.set_smoothing(Some(Default::default()));
+        gmab.optimize(
+            mock_opti_function,
+            vec![(-50, 50), (-50, 50)],
+            500,
+            3,
+            Some(42),
+        );
+        assert!(gmab.n_evictions > 0);
+
+        // Verify if the full state survives the round trip, including the arm statistics
+        let decoded = GMAB::from_bytes(&gmab.to_bytes());
+        assert_eq!(decoded, gmab);
+        assert_eq!(decoded.to_bytes(), gmab.to_bytes());
+        for (arm, other) in decoded.arm_memory.iter().zip(&gmab.arm_memory) {
+            assert_eq!(arm.get_stats(), other.get_stats());
+            assert_eq!(arm.get_mean_cost(), other.get_mean_cost());
+        }
+
+        let empty = GMAB::new(Default::default());
+        assert_eq!(GMAB::from_bytes(&empty.to_bytes()), empty);
+    }
+
+    #[test]
+    #[should_panic = "unexpected end"]
+    fn test_panic_on_truncated_bytes() {
+        let mut gmab = GMAB::new(Default::default());
+        gmab.optimize(mock_opti_function, vec![(0, 100)], 100, 1, Some(42));
+        let bytes = gmab.to_bytes();
+        GMAB::from_bytes(&bytes[..bytes.len() / 2]);
+    }
+
+    #[test]
+    fn test_gmab_surrogate_improves_small_budgets() {
+        fn sphere(vec: &[i32]) -> f64 {
+            vec.iter().map(|&x| (x as f64).powi(2)).sum()
+        }
+
+        let mean_best = |surrogate: Option<Surrogate>| {
+            let values: Vec<f64> = (0..10)
+                .map(|seed| {
+                    let mut gmab = GMAB::new(Default::default());
+                    gmab.set_surrogate(surrogate);
+                    assert_eq!(gmab.fresh().get_surrogate(), surrogate);
+                    let result = gmab.optimize(sphere, vec![(-50, 50); 4], 300, 1, Some(seed));
+                    result[0].get_value()
+                })
+                .collect();
+            values.iter().sum::<f64>() / values.len() as f64
+        };
+
+        // Verify if the same budget of trials reaches better arms with the surrogate
+        let without_surrogate = mean_best(None);
+        let with_surrogate = mean_best(Some(Surrogate::new(4)));
+        assert!(
+            with_surrogate < without_surrogate,
+            "{} >= {}",
+            with_surrogate,
+            without_surrogate
+        );
+    }
+
+    #[test]
+    #[should_panic = "oversampling cannot be 0"]
+    fn test_panic_on_invalid_surrogate() {
+        let mut gmab = GMAB::new(Default::default());
+        gmab.set_surrogate(Some(Surrogate::new(0)));
+        gmab.optimize(mock_opti_function, vec![(0, 100)], 100, 1, Some(42));
+    }
+
+    #[test]
+    fn test_gmab_spatial_index_follows_arm_memory() {
+        let mut gmab = GMAB::new(Default::default());
+        gmab.set_max_arms(Some(50));
+        gmab.set_smoothing(Some(Smoothing { bandwidth: 0.1 }));
+        gmab.prepare(vec![(0, 20), (0, 20)], 300, 1);
+        gmab.initialize_population(42, &mock_opti_function);
+        let mut used_trials = gmab.population_size();
+        while used_trials < 300 {
+            used_trials = gmab.run_generation(42, &mock_opti_function, used_trials, 300);
+        }
+        assert!(gmab.n_evictions > 0);
+
+        // Verify if evicted and received arms are (re-)indexed
+        gmab.receive_arm(Arm::with_stats(&[21, 21], (3, 1.0, 0.0)));
+        assert_consistent(&gmab);
+        assert_eq!(gmab.fresh().get_smoothing(), gmab.get_smoothing());
+    }
+
+    #[test]
+    fn test_gmab_smoothing_shares_statistics() {
+        // A smooth objective with heavy noise, from a seeded stream
+        struct NoisySphere {
+            rng: RefCell<StdRng>,
+        }
+        impl OptimizationFn for NoisySphere {
+            fn evaluate(&self, action_vector: &[i32]) -> f64 {
+                let noise: f64 = self.rng.borrow_mut().random_range(-2000.0..2000.0);
+                sphere(action_vector) + noise
+            }
+        }
+        fn sphere(action_vector: &[i32]) -> f64 {
+            action_vector.iter().map(|&x| (x as f64).powi(2)).sum()
+        }
+
+        let mean_best = |smoothing: Option<Smoothing>| {
+            let values: Vec<f64> = (0..10)
+                .map(|seed| {
+                    let opti_function = NoisySphere {
+                        rng: RefCell::new(StdRng::seed_from_u64(seed)),
+                    };
+                    let mut gmab = GMAB::new(Default::default());
+                    gmab.set_smoothing(smoothing);
+                    let result =
+                        gmab.optimize(opti_function, vec![(-50, 50); 4], 1000, 1, Some(seed));
+                    sphere(result[0].get_action_vector())
+                })
+                .collect();
+            values.iter().sum::<f64>() / values.len() as f64
+        };
+
+        // Verify if the same budget of trials finds better arms, since neighbours share their
+        // statistics
+        let without_smoothing = mean_best(None);
+        let with_smoothing = mean_best(Some(Default::default()));
+        assert!(
+            with_smoothing < without_smoothing,
+            "{} >= {}",
+            with_smoothing,
+            without_smoothing
+        );
+    }
+
+    #[test]
+    #[should_panic = "bandwidth must be in (0, 1]"]
+    fn test_panic_on_invalid_smoothing() {
+        let mut gmab = GMAB::new(Default::default());
+        gmab.set_smoothing(Some(Smoothing { bandwidth: 2.0 }));
+        gmab.optimize(mock_opti_function, vec![(0, 100)], 100, 1, Some(42));
+    }
+
+    #[test]
+    fn test_gmab_cost_aware_spends_less_time() {
+        // An objective whose evaluations get more expensive with the first dimension
+        struct SyntheticCost {
+            total_cost: Rc<RefCell<f64>>,
+        }
+        impl OptimizationFn for SyntheticCost {
+            fn evaluate(&self, action_vector: &[i32]) -> f64 {
+                action_vector.iter().map(|&x| (x as f64).powi(2)).sum()
+            }
+
+            fn evaluate_batch_timed(&self, action_vectors: &[Vec<i32>]) -> (Vec<f64>, Vec<f64>) {
+                let rewards = self.evaluate_batch(action_vectors);
+                let costs: Vec<f64> = action_vectors
+                    .iter()
+                    .map(|action_vector| 1.0 + (action_vector[0] + 50) as f64)
+                    .collect();
+                *self.total_cost.borrow_mut() += costs.iter().sum::<f64>();
+                (rewards, costs)
+            }
+        }
+
+        let total_cost = |cost_aware: bool| {
+            let total_cost = Rc::new(RefCell::new(0.0));
+            let opti_function = SyntheticCost {
+                total_cost: Rc::clone(&total_cost),
+            };
+            let mut gmab = GMAB::new(Default::default());
+            gmab.set_cost_aware(cost_aware);
+            gmab.optimize(opti_function, vec![(-50, 50), (-50, 50)], 2000, 1, Some(42));
+            assert_eq!(gmab.fresh().get_cost_aware(), cost_aware);
+            assert!(gmab.arms().iter().all(|arm| arm.get_mean_cost() >= 1.0));
+            let total_cost = *total_cost.borrow();
+            total_cost
+        };
+        assert!(total_cost(true) < total_cost(false));
+    }
+
+    #[test]
+    fn test_gmab_cost_aware_finds_better_solutions_within_budget() {
+        // An objective whose optimum costs more than the average trial, so cost and quality trade off
+        struct Budgeted {
+            budget: f64,
+            total_cost: Rc<RefCell<f64>>,
+            best_value: Rc<RefCell<f64>>,
+        }
+        impl OptimizationFn for Budgeted {
+            fn evaluate(&self, action_vector: &[i32]) -> f64 {
+                action_vector
+                    .iter()
+                    .map(|&x| ((x - 10) as f64).powi(2))
+                    .sum()
+            }
+
+            fn evaluate_batch_timed(&self, action_vectors: &[Vec<i32>]) -> (Vec<f64>, Vec<f64>) {
+                let rewards = self.evaluate_batch(action_vectors);
+                let costs: Vec<f64> = action_vectors
+                    .iter()
+                    .map(|action_vector| 1.0 + (action_vector[0] + 50) as f64)
+                    .collect();
+                // The best value found before the budget is spent, like a wall-clock limit
+                for (&reward, &cost) in rewards.iter().zip(&costs) {
+                    *self.total_cost.borrow_mut() += cost;
+                    if *self.total_cost.borrow() <= self.budget {
+                        let mut best_value = self.best_value.borrow_mut();
+                        *best_value = best_value.min(reward);
+                    }
+                }
+                (rewards, costs)
+            }
+        }
+
+        // Compare the mean best value at equal total cost, over several seeds
+        let mean_best_value = |cost_aware: bool| {
+            let mut sum = 0.0;
+            for seed in 0..10 {
+                let total_cost = Rc::new(RefCell::new(0.0));
+                let best_value = Rc::new(RefCell::new(f64::INFINITY));
+                let opti_function = Budgeted {
+                    budget: 5000.0,
+                    total_cost: Rc::clone(&total_cost),
+                    best_value: Rc::clone(&best_value),
+                };
+                let mut gmab = GMAB::new(Default::default());
+                gmab.set_cost_aware(cost_aware);
+                gmab.optimize(
+                    opti_function,
+                    vec![(-50, 50), (-50, 50)],
+                    1000,
+                    1,
+                    Some(seed),
+                );
+                assert!(*total_cost.borrow() > 5000.0); // the budget was spent
+                sum += *best_value.borrow();
+            }
+            sum / 10.0
+        };
+        assert!(mean_best_value(true) <= mean_best_value(false));
+    }
+
+    #[test]
+    fn test_gmab_reports_progress() {
+        // Mock opti_function that keeps the reported snapshots
+        struct ReportingFn {
+            interval: f64,
+            reports: Rc<RefCell<Vec<Progress>>>,
+        }
+        impl OptimizationFn for ReportingFn {
+            fn evaluate(&self, action_vector: &[i32]) -> f64 {
+                action_vector.iter().map(|&x| (x as f64).powi(2)).sum()
+            }
+
+            fn progress_interval(&self) -> Option<f64> {
+                Some(self.interval)
+            }
+
+            fn report_progress(&self, progress: &Progress) {
+                self.reports.borrow_mut().push(progress.clone());
+            }
+        }
+
+        let reports = |interval: f64| {
+            let reports = Rc::new(RefCell::new(Vec::new()));
+            let opti_function = ReportingFn {
+                interval,
+                reports: Rc::clone(&reports),
+            };
+            let mut gmab = GMAB::new(Default::default());
+            gmab.optimize(opti_function, vec![(-50, 50), (-50, 50)], 1000, 1, Some(42));
+            let reports = reports.borrow().clone();
+            reports
+        };
+
+        // Without rate limit, each generation is reported, and then the final state
+        let all = reports(0.0);
+        let last = all.last().unwrap();
+        assert_eq!(all.len() as u64, last.n_generations + 1);
+        assert!(all.windows(2).all(|w| w[0].used_trials <= w[1].used_trials));
+        assert_eq!(last.used_trials, 1000);
+        assert_eq!(last.n_new_arms + last.n_repulls, 1000);
+        assert_eq!(last.n_new_arms, last.n_arms); // without eviction
+        assert_eq!(
+            last.best_value,
+            last.best_action_vector
+                .iter()
+                .map(|&x| (x as f64).powi(2))
+                .sum()
+        );
+        assert_eq!(last.best_value_ci, (last.best_value, last.best_value)); // no noise
+        assert!(last.phase_times.evaluation > 0.0);
+
+        // A long interval only reports the final state
+        let final_only = reports(3600.0);
+        assert_eq!(final_only.len(), 1);
+        assert_eq!(final_only[0].used_trials, 1000);
+    }
 }
@@ -19,12 +19,75 @@ use rand::{Rng, SeedableRng};
 use rand_distr::{Distribution, Normal};
 
 use crate::arm::Arm;
+use crate::codec::{Decoder, Encoder};
+use crate::rng::stream;
 
 pub const POPULATION_SIZE_DEFAULT: usize = 20;
 pub const MUTATION_RATE_DEFAULT: f64 = 0.25;
 pub const CROSSOVER_RATE_DEFAULT: f64 = 1.0;
 pub const MUTATION_SPAN_DEFAULT: f64 = 0.1;
 
+// Number of attempts to sample a feasible individual, before it is rejected.
+const MAX_FEASIBILITY_ATTEMPTS: usize = 10;
+
+// Parameters of the mutation schedules, see `MutationSchedule`.
+pub(crate) const SUCCESS_RULE_TARGET: f64 = 0.2;
+pub(crate) const SUCCESS_RULE_FACTOR: f64 = 0.85;
+pub(crate) const DECAY_FINAL_SCALE: f64 = 0.1;
+pub(crate) const MIN_MUTATION_SCALE: f64 = 0.01;
+pub(crate) const MAX_MUTATION_SCALE: f64 = 10.0;
+
+// Controls how mutation_span and mutation_rate are scaled over the course of an optimization.
+#[derive(Debug, PartialEq, Clone, Copy, Default)]
+pub enum MutationSchedule {
+    // Uses the configured values for the whole run.
+    #[default]
+    Fixed,
+    // 1/5th success rule: widens the mutations while more than a fifth of the offspring enter the
+    // population, and narrows them otherwise.
+    SuccessRule,
+    // Decays the mutations exponentially to DECAY_FINAL_SCALE of the configured values, over the
+    // budget of trials.
+    Decay,
+}
+
+impl MutationSchedule {
+    pub fn from_name(name: &str) -> MutationSchedule {
+        match name {
+            "fixed" => MutationSchedule::Fixed,
+            "success_rule" => MutationSchedule::SuccessRule,
+            "decay" => MutationSchedule::Decay,
+            _ => panic!(
+                "mutation_schedule must be 'fixed', 'success_rule' or 'decay'. ({})",
+                name
+            ),
+        }
+    }
+
+    pub(crate) fn encode(&self, encoder: &mut Encoder) {
+        encoder.u8(*self as u8);
+    }
+
+    pub(crate) fn decode(decoder: &mut Decoder) -> MutationSchedule {
+        match decoder.u8() {
+            0 => MutationSchedule::Fixed,
+            1 => MutationSchedule::SuccessRule,
+            2 => MutationSchedule::Decay,
+            value => panic!("Invalid data: {} is not a MutationSchedule.", value),
+        }
+    }
+}
+
+// Adaptive resolution of one dimension. Its actions are restricted to a grid with the given
+// stride, which starts at initial_stride and is refined down to 1 over the generations. All grids
+// share the same action encoding, so arms that were found on a coarse grid are still recognized
+// when they are revisited on a finer grid.
+#[derive(Debug, PartialEq, Clone, Copy)]
+pub struct Resolution {
+    pub initial_stride: i32,
+    pub stride: i32,
+}
+
 #[derive(Debug, PartialEq, Clone)]
 pub struct GeneticAlgorithm {
     pub mutation_rate: f64,
@@ -34,15 +97,135 @@ pub struct GeneticAlgorithm {
     pub dimension: usize,
     pub lower_bound: Vec<i32>,
     pub upper_bound: Vec<i32>,
+    // One Resolution per dimension, or empty to use the full resolution in all dimensions.
+    pub resolutions: Vec<Resolution>,
 }
 
 impl GeneticAlgorithm {
+    // Appends the configuration, bounds and resolutions to an encoding, see `codec`.
+    pub(crate) fn encode(&self, encoder: &mut Encoder) {
+        encoder.f64(self.mutation_rate);
+        encoder.f64(self.crossover_rate);
+        encoder.f64(self.mutation_span);
+        encoder.usize(self.population_size);
+        encoder.usize(self.dimension);
+        encoder.i32s(&self.lower_bound);
+        encoder.i32s(&self.upper_bound);
+        encoder.length(self.resolutions.len());
+        for resolution in &self.resolutions {
+            encoder.i32(resolution.initial_stride);
+            encoder.i32(resolution.stride);
+        }
+    }
+
+    pub(crate) fn decode(decoder: &mut Decoder) -> GeneticAlgorithm {
+        GeneticAlgorithm {
+            mutation_rate: decoder.f64(),
+            crossover_rate: decoder.f64(),
+            mutation_span: decoder.f64(),
+            population_size: decoder.usize(),
+            dimension: decoder.usize(),
+            lower_bound: decoder.i32s(),
+            upper_bound: decoder.i32s(),
+            resolutions: (0..decoder.length(8))
+                .map(|_| Resolution {
+                    initial_stride: decoder.i32(),
+                    stride: decoder.i32(),
+                })
+                .collect(),
+        }
+    }
+
     pub fn set_bounds(&mut self, bounds: Vec<(i32, i32)>) {
         self.dimension = bounds.len();
         self.lower_bound = bounds.iter().map(|&(low, _)| low).collect::<Vec<i32>>();
         self.upper_bound = bounds.iter().map(|&(_, high)| high).collect::<Vec<i32>>();
     }
 
+    // Starts each dimension on a grid with the given stride, see `Resolution`.
+    pub fn set_strides(&mut self, strides: &[i32]) {
+        if strides.len() != self.dimension {
+            panic!(
+                "strides has {} values, but the action vector has {} dimensions.",
+                strides.len(),
+                self.dimension
+            );
+        }
+        if let Some(stride) = strides.iter().find(|&&stride| stride < 1) {
+            panic!("strides must be at least 1. ({})", stride);
+        }
+        self.resolutions = strides
+            .iter()
+            .map(|&stride| Resolution {
+                initial_stride: stride,
+                stride,
+            })
+            .collect();
+    }
+
+    // Halves the stride of all dimensions that are not at full resolution yet, and returns
+    // whether any stride was refined.
+    pub(crate) fn refine(&mut self) -> bool {
+        let mut refined = false;
+        for resolution in self.resolutions.iter_mut() {
+            if resolution.stride > 1 {
+                resolution.stride /= 2;
+                refined = true;
+            }
+        }
+        refined
+    }
+
+    // Returns a copy with mutation_span and mutation_rate multiplied by the scale. The values are
+    // limited to mutations of about one action in the widest dimension, and one mutated dimension
+    // per individual, unless the configured values are already smaller.
+    pub(crate) fn scaled(&self, scale: f64) -> GeneticAlgorithm {
+        let max_range = (0..self.dimension)
+            .map(|i| self.upper_bound[i] - self.lower_bound[i])
+            .max()
+            .unwrap_or(1)
+            .max(1);
+        let min_span = self.mutation_span.min(1.0 / max_range as f64);
+        let min_rate = self.mutation_rate.min(1.0 / self.dimension.max(1) as f64);
+        GeneticAlgorithm {
+            mutation_span: (self.mutation_span * scale).clamp(min_span, 1.0),
+            mutation_rate: (self.mutation_rate * scale).clamp(min_rate, 1.0),
+            ..self.clone()
+        }
+    }
+
+    fn stride(&self, i: usize) -> i32 {
+        self.resolutions
+            .get(i)
+            .map_or(1, |resolution| resolution.stride)
+    }
+
+    // Rounds a value to the closest point of the current grid within the bounds.
+    fn snap(&self, i: usize, value: f64) -> i32 {
+        let stride = self.stride(i) as f64;
+        let lower = self.lower_bound[i] as f64;
+        let upper = self.upper_bound[i] as f64;
+        let value = value.max(lower).min(upper);
+        let mut snapped = lower + ((value - lower) / stride).round() * stride;
+        if snapped > upper {
+            snapped -= stride;
+        }
+        snapped.max(lower) as i32
+    }
+
+    // The standard deviation of a mutation scales with the resolution, so that mutations explore
+    // the whole range on a coarse grid, and search locally once the grid was refined.
+    fn mutation_std(&self, i: usize) -> f64 {
+        let range = (self.upper_bound[i] - self.lower_bound[i]) as f64;
+        match self.resolutions.get(i) {
+            Some(resolution) => {
+                self.mutation_span * range * resolution.stride as f64
+                    / resolution.initial_stride as f64
+            }
+            None => self.mutation_span * range,
+        }
+    }
+
     pub fn validate(&self) {
         if self.population_size == 0 {
             panic!("population_size cannot be 0");
@@ -61,7 +244,8 @@ impl GeneticAlgorithm {
         let mut solution_size: usize = 1;
         let mut not_enough_solutions = true;
         for i in 0..self.dimension {
-            solution_size *= (self.upper_bound[i] - self.lower_bound[i] + 1) as usize;
+            solution_size *=
+                ((self.upper_bound[i] - self.lower_bound[i]) / self.stride(i) + 1) as usize;
             if solution_size >= self.population_size {
                 not_enough_solutions = false;
                 break;
@@ -75,31 +259,68 @@ impl GeneticAlgorithm {
         }
     }
 
-    pub(crate) fn generate_new_population(&self, seed: u64) -> Vec<Arm> {
-        let mut individuals: Vec<Arm> = Vec::new();
+    // Samples a population of distinct, feasible individuals. Panics if the feasible region is
+    // too small to be sampled within a reasonable number of attempts.
+    pub(crate) fn generate_new_population<C: Fn(&[i32]) -> bool>(
+        &self,
+        seed: u64,
+        is_feasible: &C,
+    ) -> Vec<Arm> {
+        let mut individuals: Vec<Arm> = Vec::with_capacity(self.population_size);
+        let mut seen: HashSet<Vec<i32>> = HashSet::with_capacity(self.population_size);
         let mut rng: StdRng = SeedableRng::seed_from_u64(seed);
 
+        let max_attempts = MAX_FEASIBILITY_ATTEMPTS * 100 * self.population_size;
+        let mut attempts = 0;
         while individuals.len() < self.population_size {
+            attempts += 1;
+            if attempts > max_attempts {
+                panic!(
+                    "Failed to sample {} feasible individuals for the initial population \
+                     (found {}). The constraints might be too restrictive.",
+                    self.population_size,
+                    individuals.len()
+                );
+            }
+
             let candidate_solution: Vec<i32> = (0..self.dimension)
-                .map(|j| rng.random_range(self.lower_bound[j]..=self.upper_bound[j]))
+                .map(|j| {
+                    if self.resolutions.is_empty() {
+                        return rng.random_range(self.lower_bound[j]..=self.upper_bound[j]);
+                    }
+                    // Sample from the current grid
+                    let n_points = (self.upper_bound[j] - self.lower_bound[j]) / self.stride(j);
+                    self.lower_bound[j] + rng.random_range(0..=n_points) * self.stride(j)
+                })
                 .collect();
 
-            let candidate_arm = Arm::new(&candidate_solution);
+            if !is_feasible(&candidate_solution) {
+                continue;
+            }
 
-            if !individuals.contains(&candidate_arm) {
-                individuals.push(candidate_arm);
+            if !seen.contains(&candidate_solution) {
+                individuals.push(Arm::new(&candidate_solution));
+                seen.insert(candidate_solution);
             }
         }
         individuals
     }
 
-    pub(crate) fn crossover(&self, seed: u64, population: &[Arm]) -> Vec<Arm> {
+    // Infeasible offspring are repaired by replacing them with their parent. The population might
+    // be smaller than population_size, e.g. if evaluations were discarded.
+    pub(crate) fn crossover<C: Fn(&[i32]) -> bool>(
+        &self,
+        seed: u64,
+        population: &[Arm],
+        is_feasible: &C,
+    ) -> Vec<Arm> {
         let mut crossover_pop: Vec<Arm> = Vec::new();
-        let population_size = self.population_size;
-        let mut rng: StdRng = SeedableRng::seed_from_u64(seed);
+        let population_size = population.len();
 
         let step = 2;
         for i in (0..population_size - (population_size % step)).step_by(step) {
+            // Each pair draws from its own stream, keyed by its position in the population
+            let mut rng = stream(seed, &[i as u64]);
             if rng.random::<f64>() < self.crossover_rate && self.dimension > 1 {
                 // Crossover
                 let max_dim_index = self.dimension - 1;
@@ -119,8 +340,16 @@ impl GeneticAlgorithm {
                             &population[i].get_action_vector()[j..=max_dim_index],
                         );
 
-                        let new_individual_1 = Arm::new(&cross_vec_1);
-                        let new_individual_2 = Arm::new(&cross_vec_2);
+                        let new_individual_1 = if is_feasible(&cross_vec_1) {
+                            Arm::new(&cross_vec_1)
+                        } else {
+                            population[i].clone()
+                        };
+                        let new_individual_2 = if is_feasible(&cross_vec_2) {
+                            Arm::new(&cross_vec_2)
+                        } else {
+                            population[i + 1].clone()
+                        };
 
                         crossover_pop.push(new_individual_1);
                         crossover_pop.push(new_individual_2);
@@ -136,39 +365,84 @@ impl GeneticAlgorithm {
         crossover_pop
     }
 
-    pub(crate) fn mutate(&self, seed: u64, population: &[Arm]) -> Vec<Arm> {
+    // Infeasible mutations are retried a few times, and the individual is rejected if none of the
+    // attempts is feasible. Mutations that are known (e.g. arms in the lookup table of a GMAB) or
+    // duplicate another offspring are retried as well, within the same number of attempts. If no
+    // attempt is novel, the first feasible mutation is kept.
+    pub(crate) fn mutate<C: Fn(&[i32]) -> bool, K: Fn(&[i32]) -> bool>(
+        &self,
+        seed: u64,
+        population: &[Arm],
+        is_feasible: &C,
+        is_known: &K,
+    ) -> Vec<Arm> {
+        self.mutate_with_parents(seed, population, is_feasible, is_known)
+            .into_iter()
+            .map(|(_parent, individual)| individual)
+            .collect()
+    }
+
+    // Mutates like `mutate`, and returns the position of each mutation's parent in the population.
+    pub(crate) fn mutate_with_parents<C: Fn(&[i32]) -> bool, K: Fn(&[i32]) -> bool>(
+        &self,
+        seed: u64,
+        population: &[Arm],
+        is_feasible: &C,
+        is_known: &K,
+    ) -> Vec<(usize, Arm)> {
         let mut mutated_population = Vec::new();
-        let mut seen = HashSet::new();
-        let mut rng = StdRng::seed_from_u64(seed);
-
-        for individual in population.iter() {
-            // Clone the action vector
-            let mut new_action_vector = individual.get_action_vector().to_vec(); // Here I assumed `get_action_vector` returns a slice or Vec
-
-            for (i, value) in new_action_vector.iter_mut().enumerate() {
-                if rng.random::<f64>() < self.mutation_rate {
-                    let adjustment = Normal::new(
-                        0.0,
-                        self.mutation_span * (self.upper_bound[i] - self.lower_bound[i]) as f64,
-                    )
-                    .unwrap()
-                    .sample(&mut rng);
-
-                    *value = (*value as f64 + adjustment)
-                        .max(self.lower_bound[i] as f64)
-                        .min(self.upper_bound[i] as f64) as i32;
+        let mut seen: HashSet<Vec<i32>> = HashSet::new();
+
+        for (index, individual) in population.iter().enumerate() {
+            // Each individual draws from its own stream, keyed by its position in the population
+            let mut rng = stream(seed, &[index as u64]);
+            let mut first_feasible: Option<Vec<i32>> = None;
+            let mut novel: Option<Vec<i32>> = None;
+            for _ in 0..MAX_FEASIBILITY_ATTEMPTS {
+                let action_vector =
+                    self.mutate_action_vector(&mut rng, individual.get_action_vector());
+                if !is_feasible(&action_vector) {
+                    continue;
+                }
+                if !seen.contains(&action_vector) && !is_known(&action_vector) {
+                    novel = Some(action_vector);
+                    break;
                 }
+                first_feasible.get_or_insert(action_vector);
             }
+            let new_action_vector = match novel.or(first_feasible) {
+                Some(action_vector) => action_vector,
+                None => continue,
+            };
 
-            let new_individual = Arm::new(new_action_vector.as_slice());
-
-            if seen.insert(new_individual.clone()) {
-                mutated_population.push(new_individual);
+            if seen.insert(new_action_vector.clone()) {
+                mutated_population.push((index, Arm::new(&new_action_vector)));
             }
         }
 
         mutated_population
     }
+
+    fn mutate_action_vector(&self, rng: &mut StdRng, action_vector: &[i32]) -> Vec<i32> {
+        // Clone the action vector
+        let mut new_action_vector = action_vector.to_vec();
+
+        for (i, value) in new_action_vector.iter_mut().enumerate() {
+            if rng.random::<f64>() < self.mutation_rate {
+                let adjustment = Normal::new(0.0, self.mutation_std(i)).unwrap().sample(rng);
+
+                *value = if self.resolutions.is_empty() {
+                    (*value as f64 + adjustment)
+                        .max(self.lower_bound[i] as f64)
+                        .min(self.upper_bound[i] as f64) as i32
+                } else {
+                    self.snap(i, *value as f64 + adjustment)
+                };
+            }
+        }
+
+        new_action_vector
+    }
 }
 
 impl Default for GeneticAlgorithm {
@@ -181,6 +455,7 @@ impl Default for GeneticAlgorithm {
             dimension: 1,
             lower_bound: vec![0],
             upper_bound: vec![1],
+            resolutions: Vec::new(),
         }
     }
 }
@@ -196,6 +471,10 @@ mod tests {
     const MUTATION_SPAN: f64 = 0.0;
     const SEED: u64 = 42;
 
+    fn feasible(_action_vector: &[i32]) -> bool {
+        true
+    }
+
     #[test]
     fn test_ga_default_config() {
         let ga = GeneticAlgorithm::default();
@@ -230,6 +509,7 @@ mod tests {
             dimension: 1,
             lower_bound: vec![0],
             upper_bound: vec![1],
+            resolutions: Vec::new(),
         };
         ga.validate();
 
@@ -333,6 +613,7 @@ mod tests {
             dimension: 2,
             lower_bound: vec![0, 0],
             upper_bound: vec![10, 10],
+            resolutions: Vec::new(),
         };
         assert_eq!(ga.population_size, 10);
     }
@@ -347,11 +628,13 @@ mod tests {
             dimension: 2,
             lower_bound: vec![0, 0],
             upper_bound: vec![10, 10],
+            resolutions: Vec::new(),
         };
 
         let initial_population = vec![Arm::new(&vec![1, 1]), Arm::new(&vec![2, 2])];
 
-        let mutated_population = ga.mutate(SEED, &initial_population);
+        let mutated_population =
+            ga.mutate(SEED, &initial_population, &feasible, &|_: &[i32]| false);
 
         // Assuming the mutation is deterministic and in the expected bounds, you'd check like this:
         for (i, individual) in mutated_population.iter().enumerate() {
@@ -377,6 +660,7 @@ mod tests {
             dimension: 10, // higher dimension for demonstration so low probability of crossover leading to identical individuals
             lower_bound: vec![0, 0, 0, 0, 0, 0, 0, 0, 0, 0],
             upper_bound: vec![10, 10, 10, 10, 10, 10, 10, 10, 10, 10],
+            resolutions: Vec::new(),
         };
 
         let initial_population = vec![
@@ -384,7 +668,7 @@ mod tests {
             Arm::new(&vec![9, 8, 7, 6, 5, 4, 3, 2, 1, 0]),
         ];
 
-        let crossover_population = ga.crossover(SEED, &initial_population);
+        let crossover_population = ga.crossover(SEED, &initial_population, &feasible);
 
         // Since the crossover rate is 100%, the two individuals should not be identical to the original individuals
         assert_ne!(
@@ -407,12 +691,13 @@ mod tests {
             dimension: 1, // Using dimension 1
             lower_bound: vec![0],
             upper_bound: vec![10],
+            resolutions: Vec::new(),
         };
 
         let initial_population = vec![Arm::new(&vec![3]), Arm::new(&vec![7])];
 
         // This should not panic
-        let crossover_population = ga.crossover(SEED, &initial_population);
+        let crossover_population = ga.crossover(SEED, &initial_population, &feasible);
 
         // Verify we have the expected number of individuals
         assert_eq!(crossover_population.len(), 2);
@@ -440,11 +725,12 @@ mod tests {
                 dimension: 2,
                 lower_bound: vec![0, 0],
                 upper_bound: vec![10, 10],
+                resolutions: Vec::new(),
             };
 
-            let mut population = ga.generate_new_population(seed);
-            population = ga.crossover(seed, &population);
-            population = ga.mutate(seed, &population);
+            let mut population = ga.generate_new_population(seed, &feasible);
+            population = ga.crossover(seed, &population, &feasible);
+            population = ga.mutate(seed, &population, &feasible, &|_: &[i32]| false);
 
             return population;
         }
@@ -455,4 +741,176 @@ mod tests {
         // A different seed should not lead to the same population
         assert_ne!(generate_population(SEED), generate_population(SEED + 1));
     }
+
+    #[test]
+    fn test_operators_respect_feasibility() {
+        let ga = GeneticAlgorithm {
+            population_size: 10,
+            mutation_rate: 1.0,
+            crossover_rate: 1.0,
+            mutation_span: 0.5,
+            dimension: 2,
+            lower_bound: vec![0, 0],
+            upper_bound: vec![10, 10],
+            resolutions: Vec::new(),
+        };
+        let is_feasible = |action_vector: &[i32]| action_vector[0] <= action_vector[1];
+
+        let population = ga.generate_new_population(SEED, &is_feasible);
+        assert_eq!(population.len(), 10);
+
+        let crossover_pop = ga.crossover(SEED, &population, &is_feasible);
+        assert_eq!(crossover_pop.len(), 10);
+
+        let mutated_pop = ga.mutate(SEED, &crossover_pop, &is_feasible, &|_: &[i32]| false);
+        for individual in population.iter().chain(&crossover_pop).chain(&mutated_pop) {
+            assert!(is_feasible(individual.get_action_vector()));
+        }
+    }
+
+    #[test]
+    #[should_panic(expected = "feasible")]
+    fn test_panic_on_infeasible_population() {
+        let ga = GeneticAlgorithm {
+            population_size: 10,
+            dimension: 2,
+            lower_bound: vec![0, 0],
+            upper_bound: vec![10, 10],
+            ..Default::default()
+        };
+        ga.generate_new_population(SEED, &|_: &[i32]| false);
+    }
+
+    #[test]
+    fn test_operators_respect_strides() {
+        let mut ga = GeneticAlgorithm {
+            population_size: 10,
+            mutation_rate: 1.0,
+            mutation_span: 0.5,
+            dimension: 2,
+            lower_bound: vec![1, 0],
+            upper_bound: vec![101, 1000],
+            ..Default::default()
+        };
+        ga.set_strides(&[10, 1]);
+
+        // Actions are sampled and mutated on the grid aligned with the lower bound
+        let population = ga.generate_new_population(SEED, &|_: &[i32]| true);
+        let mutated_pop = ga.mutate(SEED, &population, &|_: &[i32]| true, &|_: &[i32]| false);
+        for individual in population.iter().chain(&mutated_pop) {
+            let action_vector = individual.get_action_vector();
+            assert_eq!((action_vector[0] - 1) % 10, 0);
+            assert!((1..=101).contains(&action_vector[0]));
+        }
+
+        // Refinement halves the strides until the full resolution is reached
+        assert!(ga.refine());
+        assert_eq!(ga.stride(0), 5);
+        assert_eq!(ga.snap(0, 99.0), 101);
+        assert!(ga.refine() && ga.refine());
+        assert_eq!(ga.stride(0), 1);
+        assert!(!ga.refine());
+    }
+
+    #[test]
+    fn test_snap_stays_within_bounds() {
+        let mut ga = GeneticAlgorithm {
+            dimension: 1,
+            lower_bound: vec![0],
+            upper_bound: vec![10],
+            ..Default::default()
+        };
+        ga.set_strides(&[4]);
+
+        assert_eq!(ga.snap(0, -3.0), 0);
+        assert_eq!(ga.snap(0, 5.9), 4);
+        assert_eq!(ga.snap(0, 10.0), 8);
+        assert_eq!(ga.snap(0, 25.0), 8);
+    }
+
+    #[test]
+    #[should_panic(expected = "strides must be at least 1")]
+    fn test_panic_on_invalid_strides() {
+        let mut ga = GeneticAlgorithm {
+            dimension: 1,
+            ..Default::default()
+        };
+        ga.set_strides(&[0]);
+    }
+
+    #[test]
+    fn test_scaled_mutation() {
+        let ga = GeneticAlgorithm {
+            mutation_rate: 0.5,
+            mutation_span: 0.1,
+            dimension: 4,
+            lower_bound: vec![0; 4],
+            upper_bound: vec![100; 4],
+            ..Default::default()
+        };
+
+        let wide = ga.scaled(4.0);
+        assert!((wide.mutation_span - 0.4).abs() < 1e-12);
+        assert_eq!(wide.mutation_rate, 1.0);
+
+        // Narrow mutations still move about one action in one dimension per individual
+        let narrow = ga.scaled(0.01);
+        assert_eq!(narrow.mutation_span, 0.01);
+        assert_eq!(narrow.mutation_rate, 0.25);
+        assert_eq!(narrow.lower_bound, ga.lower_bound);
+    }
+
+    #[test]
+    #[should_panic(expected = "mutation_schedule must be")]
+    fn test_panic_on_invalid_mutation_schedule() {
+        MutationSchedule::from_name("linear");
+    }
+
+    #[test]
+    fn test_mutate_avoids_known_arms() {
+        let ga = GeneticAlgorithm {
+            population_size: 4,
+            mutation_rate: 0.5,
+            mutation_span: 0.2,
+            dimension: 2,
+            lower_bound: vec![0, 0],
+            upper_bound: vec![10, 10],
+            ..Default::default()
+        };
+        let population: Vec<Arm> = (0..4).map(|i| Arm::new(&[i, i])).collect();
+
+        // All parents are known, so offspring that merely copy a parent are retried
+        let is_known = |action_vector: &[i32]| action_vector[0] == action_vector[1];
+        let mutated_pop = ga.mutate(SEED, &population, &feasible, &is_known);
+        assert_eq!(mutated_pop.len(), 4);
+        assert!(mutated_pop
+            .iter()
+            .all(|individual| !is_known(individual.get_action_vector())));
+
+        // If every mutation is known, the first feasible one is kept
+        let mutated_pop = ga.mutate(SEED, &population, &feasible, &|_: &[i32]| true);
+        assert!(!mutated_pop.is_empty());
+    }
+
+    #[test]
+    fn test_mutation_streams_are_keyed_by_index() {
+        let ga = GeneticAlgorithm {
+            population_size: 2,
+            mutation_rate: 1.0,
+            dimension: 2,
+            lower_bound: vec![0, 0],
+            upper_bound: vec![100, 100],
+            ..Default::default()
+        };
+        let a = Arm::new(&[10, 10]);
+        let b = Arm::new(&[90, 90]);
+
+        // The mutation of an individual does not depend on the individuals before it
+        let pair = ga.mutate(SEED, &[a.clone(), b.clone()], &feasible, &|_: &[i32]| false);
+        let single = ga.mutate(SEED, &[a.clone()], &feasible, &|_: &[i32]| false);
+        assert_eq!(pair[0], single[0]);
+
+        let swapped = ga.mutate(SEED, &[b, a], &feasible, &|_: &[i32]| false);
+        assert_ne!(swapped[1], pair[0]);
+    }
 }
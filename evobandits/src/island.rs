@@ -0,0 +1,346 @@
+// Copyright 2025 EvoBandits
+//
+// Licensed under the Apache License, Version 2.0 (the "License");
+// you may not use this file except in compliance with the License.
+// You may obtain a copy of the License at
+//
+//     http://www.apache.org/licenses/LICENSE-2.0
+//
+// Unless required by applicable law or agreed to in writing, software
+// distributed under the License is distributed on an "AS IS" BASIS,
+// WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+// See the License for the specific language governing permissions and
+// limitations under the License.
+
+use std::panic;
+use std::thread;
+
+use crate::rng::{derive_seed, STREAM_ISLAND};
+use rand::RngCore;
+
+use crate::arm::{Arm, OptimizationFn};
+use crate::codec::{Decoder, Encoder};
+use crate::evobandits::GMAB;
+use crate::progress::{Progress, ProgressReporter};
+
+pub const N_ISLANDS_DEFAULT: usize = 1;
+pub const MIGRATION_INTERVAL_DEFAULT: usize = 5;
+pub const MIGRATION_SIZE_DEFAULT: usize = 2;
+
+// Island model for GMAB: Several independent GMAB instances (islands) run on separate threads,
+// each with its own genetic algorithm, arm memory and random number generator. Every
+// `migration_interval` generations, each island sends copies of its `migration_size` best arms
+// (including their evaluation statistics) to the next island in a ring topology.
+//
+// Source: Whitley, D., Rana, S. and Heckendorn, R. B. (1999) ‘The Island Model Genetic Algorithm:
+// On Separability, Population Size and Convergence’, Journal of Computing and Information
+// Technology, 7(1), pp. 33–47.
+#[derive(Debug, PartialEq, Clone)]
+pub struct IslandModel {
+    pub n_islands: usize,
+    pub migration_interval: usize,
+    pub migration_size: usize,
+}
+
+impl IslandModel {
+    pub fn validate(&self) {
+        if self.n_islands == 0 {
+            panic!("n_islands cannot be 0");
+        }
+        if self.migration_interval == 0 {
+            panic!("migration_interval cannot be 0");
+        }
+    }
+
+    pub fn encode(&self, encoder: &mut Encoder) {
+        encoder.usize(self.n_islands);
+        encoder.usize(self.migration_interval);
+        encoder.usize(self.migration_size);
+    }
+
+    pub fn decode(decoder: &mut Decoder) -> Self {
+        IslandModel {
+            n_islands: decoder.usize(),
+            migration_interval: decoder.usize(),
+            migration_size: decoder.usize(),
+        }
+    }
+
+    fn migrate(&self, islands: &mut [GMAB]) {
+        if self.n_islands < 2 || self.migration_size == 0 {
+            return;
+        }
+
+        // Collect all emigrants first, so that arms only travel one island per migration
+        let emigrants: Vec<Vec<Arm>> = islands
+            .iter()
+            .map(|island| island.top_arms(self.migration_size))
+            .collect();
+
+        for (i, arms) in emigrants.into_iter().enumerate() {
+            let target = (i + 1) % self.n_islands;
+            for arm in arms {
+                islands[target].receive_arm(arm);
+            }
+        }
+    }
+
+    // Combines the progress of all islands, see `Progress::merge`.
+    fn progress(
+        islands: &[GMAB],
+        used_trials: &[usize],
+        budgets: &[usize],
+        elapsed: f64,
+    ) -> Progress {
+        let progress: Vec<Progress> = islands
+            .iter()
+            .zip(used_trials)
+            .zip(budgets)
+            .map(|((island, &used), &budget)| island.progress(used, budget, elapsed))
+            .collect();
+        Progress::merge(&progress, elapsed)
+    }
+
+    pub fn optimize<F: OptimizationFn + Sync>(
+        &self,
+        gmab: &GMAB,
+        opti_function: F,
+        bounds: Vec<(i32, i32)>,
+        n_trials: usize,
+        n_best: usize,
+        seed: Option<u64>,
+    ) -> Vec<Arm> {
+        self.validate();
+        let population_size = gmab.population_size();
+        assert!(
+            n_trials >= self.n_islands * population_size,
+            "n_trials must be at least n_islands * population_size ({} * {}), since each island \
+             samples its own initial population. ({})",
+            self.n_islands,
+            population_size,
+            n_trials
+        );
+
+        // Unwrap seed or fall back to system entropy
+        let seed = seed.unwrap_or_else(|| rand::rng().next_u64());
+
+        // Every island starts from the configuration of the given GMAB, with its share of n_trials
+        let mut islands: Vec<GMAB> = Vec::with_capacity(self.n_islands);
+        let mut budgets: Vec<usize> = Vec::with_capacity(self.n_islands);
+        for i in 0..self.n_islands {
+            let budget = n_trials / self.n_islands + usize::from(i < n_trials % self.n_islands);
+            let mut island = gmab.fresh();
+            island.prepare(bounds.clone(), budget, n_best);
+            islands.push(island);
+            budgets.push(budget);
+        }
+        // Each island runs on its own random streams, keyed by its index
+        let seeds: Vec<u64> = (0..self.n_islands)
+            .map(|i| derive_seed(seed, &[STREAM_ISLAND, i as u64]))
+            .collect();
+        let mut used_trials: Vec<usize> = vec![0; self.n_islands];
+        let mut reporter = ProgressReporter::new(opti_function.progress_interval());
+
+        // Alternate between running all islands in parallel for one epoch, and migration
+        let opti_function = &opti_function;
+        while used_trials
+            .iter()
+            .zip(budgets.iter())
+            .any(|(used, budget)| used < budget)
+        {
+            thread::scope(|s| {
+                let handles: Vec<_> = islands
+                    .iter_mut()
+                    .zip(seeds.iter())
+                    .zip(used_trials.iter_mut())
+                    .zip(budgets.iter())
+                    .map(|(((island, &seed), used), &budget)| {
+                        s.spawn(move || {
+                            if *used == 0 {
+                                island.initialize_population(seed, opti_function);
+                                *used = island.population_size();
+                            }
+                            for _ in 0..self.migration_interval {
+                                if *used >= budget {
+                                    break;
+                                }
+                                *used = island.run_generation(seed, opti_function, *used, budget);
+                            }
+                        })
+                    })
+                    .collect();
+
+                // Re-raise panics from the islands with their original payload
+                for handle in handles {
+                    if let Err(err) = handle.join() {
+                        panic::resume_unwind(err);
+                    }
+                }
+            });
+
+            self.migrate(&mut islands);
+            if reporter.is_due() {
+                opti_function.report_progress(&Self::progress(
+                    &islands,
+                    &used_trials,
+                    &budgets,
+                    reporter.elapsed(),
+                ));
+            }
+        }
+        if reporter.is_enabled() {
+            opti_function.report_progress(&Self::progress(
+                &islands,
+                &used_trials,
+                &budgets,
+                reporter.elapsed(),
+            ));
+        }
+
+        // Merge the arm memories of all islands to extract the overall best arms
+        let mut merged = gmab.fresh();
+        for island in &islands {
+            for arm in island.arms() {
+                merged.receive_arm(arm.clone());
+            }
+        }
+        merged.extract_best_arms(used_trials.iter().sum(), n_best)
+    }
+}
+
+impl Default for IslandModel {
+    fn default() -> Self {
+        IslandModel {
+            n_islands: N_ISLANDS_DEFAULT,
+            migration_interval: MIGRATION_INTERVAL_DEFAULT,
+            migration_size: MIGRATION_SIZE_DEFAULT,
+        }
+    }
+}
+
+#[cfg(test)]
+mod tests {
+    use super::*;
+    use crate::genetic::GeneticAlgorithm;
+    use std::sync::atomic::{AtomicUsize, Ordering};
+
+    fn mock_opti_function(vec: &[i32]) -> f64 {
+        vec.iter().map(|&x| x as f64).sum()
+    }
+
+    #[test]
+    fn test_island_model_default_config() {
+        let model = IslandModel::default();
+        model.validate();
+
+        assert_eq!(model.n_islands, N_ISLANDS_DEFAULT);
+        assert_eq!(model.migration_interval, MIGRATION_INTERVAL_DEFAULT);
+        assert_eq!(model.migration_size, MIGRATION_SIZE_DEFAULT);
+    }
+
+    #[test]
+    #[should_panic(expected = "n_islands")]
+    fn test_invalid_n_islands() {
+        let model = IslandModel {
+            n_islands: 0,
+            ..Default::default()
+        };
+        model.validate();
+    }
+
+    #[test]
+    #[should_panic(expected = "migration_interval")]
+    fn test_invalid_migration_interval() {
+        let model = IslandModel {
+            migration_interval: 0,
+            ..Default::default()
+        };
+        model.validate();
+    }
+
+    #[test]
+    fn test_island_model_adheres_to_n_trials() {
+        // Mock opti_function that keeps track of used simulations across threads
+        let used_trials = AtomicUsize::new(0);
+        let mock_opti_function = |_: &[i32]| {
+            used_trials.fetch_add(1, Ordering::Relaxed);
+            0.0
+        };
+
+        let n_trials = 1001;
+        let bounds = vec![(1, 100), (1, 100)];
+        let model = IslandModel {
+            n_islands: 4,
+            ..Default::default()
+        };
+        let result = model.optimize(
+            &GMAB::new(Default::default()),
+            mock_opti_function,
+            bounds,
+            n_trials,
+            3,
+            None,
+        );
+
+        assert_eq!(result.len(), 3);
+        assert_eq!(n_trials, used_trials.load(Ordering::Relaxed));
+    }
+
+    #[test]
+    fn test_island_model_reproduction_with_seeding() {
+        fn generate_result(seed: Option<u64>) -> Vec<i32> {
+            let bounds = vec![(1, 100), (1, 100)];
+            let model = IslandModel {
+                n_islands: 3,
+                ..Default::default()
+            };
+            let gmab = GMAB::new(Default::default());
+            let result = model.optimize(&gmab, mock_opti_function, bounds, 300, 1, seed);
+            result[0].get_action_vector().to_vec()
+        }
+
+        // Islands are seeded independently, so thread scheduling must not affect the result
+        let seed = 42;
+        assert_eq!(generate_result(Some(seed)), generate_result(Some(seed)));
+    }
+
+    #[test]
+    fn test_island_model_migration() {
+        let ga = GeneticAlgorithm {
+            population_size: 4,
+            dimension: 2,
+            lower_bound: vec![0, 0],
+            upper_bound: vec![9, 9],
+            ..Default::default()
+        };
+        let model = IslandModel {
+            n_islands: 2,
+            migration_size: 1,
+            ..Default::default()
+        };
+        let mut islands = vec![GMAB::new(ga.clone()), GMAB::new(ga.clone())];
+        islands[0].initialize_population(0, &mock_opti_function);
+        islands[1].initialize_population(1, &mock_opti_function);
+        let best_0 = islands[0].top_arms(1)[0].clone();
+        let best_1 = islands[1].top_arms(1)[0].clone();
+
+        model.migrate(&mut islands);
+
+        // The best arm of each island is now known to the other island
+        assert!(islands[1].arms().contains(&best_0));
+        assert!(islands[0].arms().contains(&best_1));
+    }
+
+    #[test]
+    #[should_panic(expected = "n_trials must be at least n_islands * population_size (2 * 20)")]
+    fn test_panic_on_invalid_n_trials_per_island() {
+        // Each island needs enough trials to sample its initial population
+        let model = IslandModel {
+            n_islands: 2,
+            ..Default::default()
+        };
+        let bounds = vec![(1, 100), (1, 100)];
+        let gmab = GMAB::new(Default::default());
+        model.optimize(&gmab, mock_opti_function, bounds, 30, 1, None);
+    }
+}
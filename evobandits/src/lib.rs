@@ -1,4 +1,16 @@
 pub mod arm;
+pub mod codec;
+pub mod constraint;
 pub mod evobandits;
 pub mod genetic;
+pub mod island;
+pub mod multi_objective;
+pub mod parallel;
+pub mod param_space;
+pub mod pareto;
+pub mod progress;
+pub mod rng;
+pub mod smoothing;
 mod sorted_multi_map;
+mod spatial_index;
+pub mod surrogate;
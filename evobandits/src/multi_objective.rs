@@ -0,0 +1,525 @@
+// Copyright 2025 EvoBandits
+//
+// Licensed under the Apache License, Version 2.0 (the "License");
+// you may not use this file except in compliance with the License.
+// You may obtain a copy of the License at
+//
+//     http://www.apache.org/licenses/LICENSE-2.0
+//
+// Unless required by applicable law or agreed to in writing, software
+// distributed under the License is distributed on an "AS IS" BASIS,
+// WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+// See the License for the specific language governing permissions and
+// limitations under the License.
+
+use crate::arm::Arm;
+use crate::constraint::LinearConstraint;
+use crate::genetic::GeneticAlgorithm;
+use crate::pareto::{crowding_distance, non_dominated_sort, ParetoFront};
+use crate::rng::{
+    derive_seed, stream, STREAM_CROSSOVER, STREAM_INITIALIZATION, STREAM_MUTATION, STREAM_SHUFFLE,
+};
+use rand::prelude::SliceRandom;
+use rand::RngCore;
+use std::cmp::Ordering;
+use std::collections::{HashMap, HashSet};
+
+pub trait MultiObjectiveFn {
+    fn evaluate(&self, action_vector: &[i32]) -> Vec<f64>;
+
+    // Evaluates several action vectors at once, see `OptimizationFn::evaluate_batch`.
+    fn evaluate_batch(&self, action_vectors: &[Vec<i32>]) -> Vec<Vec<f64>> {
+        action_vectors
+            .iter()
+            .map(|action_vector| self.evaluate(action_vector))
+            .collect()
+    }
+
+    // Checks constraints on the action vector, see `OptimizationFn::is_feasible`.
+    fn is_feasible(&self, _action_vector: &[i32]) -> bool {
+        true
+    }
+}
+
+impl<F: Fn(&[i32]) -> Vec<f64>> MultiObjectiveFn for F {
+    fn evaluate(&self, action_vector: &[i32]) -> Vec<f64> {
+        self(action_vector)
+    }
+}
+
+// Arm with one running mean and corrected sum of squares per objective, each tracked with
+// Welford's algorithm as in `Arm`.
+#[derive(Debug, Clone)]
+pub struct MultiObjectiveArm {
+    action_vector: Vec<i32>,
+    n_evaluations: i32,
+    values: Vec<f64>,
+    corr_ssq: Vec<f64>,
+}
+
+impl MultiObjectiveArm {
+    pub fn new(action_vector: &[i32], n_objectives: usize) -> Self {
+        Self {
+            action_vector: action_vector.to_vec(),
+            n_evaluations: 0,
+            values: vec![0.0; n_objectives],
+            corr_ssq: vec![0.0; n_objectives],
+        }
+    }
+
+    pub(crate) fn update(&mut self, g: &[f64]) {
+        self.n_evaluations += 1;
+        for ((value, corr_ssq), &g) in self.values.iter_mut().zip(&mut self.corr_ssq).zip(g) {
+            let delta = g - *value;
+            *value += delta / self.n_evaluations as f64;
+            *corr_ssq += delta * (g - *value);
+        }
+    }
+
+    pub fn get_n_evaluations(&self) -> i32 {
+        self.n_evaluations
+    }
+
+    pub fn get_action_vector(&self) -> &[i32] {
+        &self.action_vector
+    }
+
+    pub fn get_values(&self) -> &[f64] {
+        &self.values
+    }
+
+    pub fn get_value_std_devs(&self) -> Vec<f64> {
+        if self.n_evaluations <= 1 {
+            return vec![0.0; self.values.len()];
+        }
+        self.corr_ssq
+            .iter()
+            .map(|corr_ssq| (corr_ssq / (self.n_evaluations - 1) as f64).sqrt())
+            .collect()
+    }
+}
+
+impl PartialEq for MultiObjectiveArm {
+    fn eq(&self, other: &Self) -> bool {
+        self.action_vector == other.action_vector
+    }
+}
+
+// Multi-objective variant of GMAB. The population is selected with non-dominated sorting and
+// crowding distance among the current population and its offspring, as in NSGA-II. Like GMAB,
+// the population is re-evaluated in each generation, so the sample averages of promising arms
+// become more accurate over time, and noisy outliers drop out of the population again. The
+// non-dominated arms over all sample averages are tracked in an incremental `ParetoFront`.
+#[derive(Debug, PartialEq, Clone)]
+pub struct MultiObjectiveGMAB {
+    arm_memory: Vec<MultiObjectiveArm>,
+    lookup_table: HashMap<Vec<i32>, i32>,
+    pareto_front: ParetoFront,
+    population: Vec<i32>,
+    genetic_algorithm: GeneticAlgorithm,
+    constraints: Vec<LinearConstraint>,
+    n_objectives: usize,
+    generation: u64,
+}
+
+impl MultiObjectiveGMAB {
+    pub fn new(genetic_algorithm: GeneticAlgorithm) -> MultiObjectiveGMAB {
+        MultiObjectiveGMAB {
+            arm_memory: Vec::new(),
+            lookup_table: HashMap::new(),
+            pareto_front: ParetoFront::new(),
+            population: Vec::new(),
+            genetic_algorithm,
+            constraints: Vec::new(),
+            n_objectives: 0,
+            generation: 0,
+        }
+    }
+
+    // Restricts the search to action vectors that satisfy all linear constraints.
+    pub fn set_constraints(&mut self, constraints: Vec<LinearConstraint>) {
+        self.constraints = constraints;
+    }
+
+    fn is_feasible<F: MultiObjectiveFn>(&self, action_vector: &[i32], opti_function: &F) -> bool {
+        self.constraints
+            .iter()
+            .all(|constraint| constraint.is_satisfied(action_vector))
+            && opti_function.is_feasible(action_vector)
+    }
+
+    fn get_arm_index(&self, action_vector: &[i32]) -> i32 {
+        match self.lookup_table.get(action_vector) {
+            Some(&index) => index,
+            None => -1,
+        }
+    }
+
+    fn update_arm(&mut self, arm_index: i32, action_vector: &[i32], g: &[f64]) -> i32 {
+        assert_eq!(
+            g.len(),
+            self.n_objectives,
+            "The objective must return {} values per action vector.",
+            self.n_objectives
+        );
+        // Look up the arm again, in case the batch contained the same new action vector twice
+        let arm_index = if arm_index >= 0 {
+            arm_index
+        } else if let Some(&arm_index) = self.lookup_table.get(action_vector) {
+            arm_index
+        } else {
+            self.arm_memory
+                .push(MultiObjectiveArm::new(action_vector, self.n_objectives));
+            let arm_index = self.arm_memory.len() as i32 - 1;
+            self.lookup_table.insert(action_vector.to_vec(), arm_index);
+            arm_index
+        };
+
+        let arm = &mut self.arm_memory[arm_index as usize];
+        arm.update(g);
+        self.pareto_front.update(arm_index, arm.get_values());
+        arm_index
+    }
+
+    // Evaluates the candidates as one batch, and returns the indexes of their arms. Discarded
+    // evaluations (with a NaN reward) are not recorded, and new arms without a recorded
+    // evaluation are left out.
+    fn sample_and_update_batch<F: MultiObjectiveFn>(
+        &mut self,
+        candidates: Vec<(i32, Vec<i32>)>,
+        opti_function: &F,
+    ) -> Vec<i32> {
+        let action_vectors: Vec<Vec<i32>> = candidates
+            .iter()
+            .map(|(_arm_index, action_vector)| action_vector.clone())
+            .collect();
+        let rewards = opti_function.evaluate_batch(&action_vectors);
+        assert_eq!(
+            rewards.len(),
+            action_vectors.len(),
+            "The objective must return one value per action vector."
+        );
+
+        candidates
+            .into_iter()
+            .zip(rewards)
+            .filter_map(|((arm_index, action_vector), g)| {
+                if g.iter().any(|value| value.is_nan()) {
+                    return (arm_index >= 0).then_some(arm_index);
+                }
+                Some(self.update_arm(arm_index, &action_vector, &g))
+            })
+            .collect()
+    }
+
+    // Selects the next population among the given arms, by the rank of their non-dominated front
+    // first, and by their crowding distance second.
+    fn select_population(&self, mut pool: Vec<i32>) -> Vec<i32> {
+        pool.sort_unstable();
+        pool.dedup();
+        let points: Vec<Vec<f64>> = pool
+            .iter()
+            .map(|&arm_index| self.arm_memory[arm_index as usize].get_values().to_vec())
+            .collect();
+
+        let mut selected: Vec<i32> = Vec::with_capacity(self.genetic_algorithm.population_size);
+        for front in non_dominated_sort(&points) {
+            let n_missing = self.genetic_algorithm.population_size - selected.len();
+            if front.len() <= n_missing {
+                selected.extend(front.iter().map(|&position| pool[position]));
+            } else {
+                let distances = crowding_distance(&points, &front);
+                let mut order: Vec<usize> = (0..front.len()).collect();
+                order.sort_by(|&a, &b| {
+                    distances[b]
+                        .partial_cmp(&distances[a])
+                        .unwrap_or(Ordering::Equal)
+                });
+                selected.extend(order.iter().take(n_missing).map(|&k| pool[front[k]]));
+            }
+            if selected.len() == self.genetic_algorithm.population_size {
+                break;
+            }
+        }
+        selected
+    }
+
+    pub(crate) fn initialize_population<F: MultiObjectiveFn>(
+        &mut self,
+        seed: u64,
+        opti_function: &F,
+    ) {
+        let is_feasible = |action_vector: &[i32]| self.is_feasible(action_vector, opti_function);
+        let candidates: Vec<(i32, Vec<i32>)> = self
+            .genetic_algorithm
+            .generate_new_population(derive_seed(seed, &[STREAM_INITIALIZATION]), &is_feasible)
+            .into_iter()
+            .map(|individual| (-1, individual.get_action_vector().to_vec()))
+            .collect();
+        self.population = self.sample_and_update_batch(candidates, opti_function);
+    }
+
+    // Runs a single generation, and returns the updated number of used trials, see
+    // `GMAB::run_generation`.
+    pub(crate) fn run_generation<F: MultiObjectiveFn>(
+        &mut self,
+        seed: u64,
+        opti_function: &F,
+        used_trials: usize,
+        n_trials: usize,
+    ) -> usize {
+        let mut population: Vec<Arm> = self
+            .population
+            .iter()
+            .map(|&arm_index| Arm::new(self.arm_memory[arm_index as usize].get_action_vector()))
+            .collect();
+        let generation_seed = derive_seed(seed, &[self.generation]);
+        self.generation += 1;
+
+        // Start over with a new sample if all evaluations so far were discarded
+        if population.is_empty() {
+            let is_feasible =
+                |action_vector: &[i32]| self.is_feasible(action_vector, opti_function);
+            let mut candidates: Vec<(i32, Vec<i32>)> = self
+                .genetic_algorithm
+                .generate_new_population(
+                    derive_seed(generation_seed, &[STREAM_INITIALIZATION]),
+                    &is_feasible,
+                )
+                .into_iter()
+                .map(|individual| {
+                    let action_vector = individual.get_action_vector().to_vec();
+                    (self.get_arm_index(&action_vector), action_vector)
+                })
+                .collect();
+            candidates.truncate(n_trials.saturating_sub(used_trials));
+            let n_candidates = candidates.len();
+            let pool = self.sample_and_update_batch(candidates, opti_function);
+            self.population = self.select_population(pool);
+            return used_trials + n_candidates;
+        }
+
+        population.shuffle(&mut stream(generation_seed, &[STREAM_SHUFFLE]));
+
+        let next_seed = derive_seed(generation_seed, &[STREAM_CROSSOVER]);
+        let is_feasible = |action_vector: &[i32]| self.is_feasible(action_vector, opti_function);
+        let crossover_pop = self
+            .genetic_algorithm
+            .crossover(next_seed, &population, &is_feasible);
+        let next_seed = derive_seed(generation_seed, &[STREAM_MUTATION]);
+        let is_known = |action_vector: &[i32]| self.lookup_table.contains_key(action_vector);
+        let mutated_pop =
+            self.genetic_algorithm
+                .mutate(next_seed, &crossover_pop, &is_feasible, &is_known);
+
+        // Offspring first, then the re-evaluation of the current population
+        let current_indexes: HashSet<i32> = self.population.iter().copied().collect();
+        let mut candidates: Vec<(i32, Vec<i32>)> = Vec::new();
+        for individual in mutated_pop {
+            let arm_index = self.get_arm_index(individual.get_action_vector());
+            if current_indexes.contains(&arm_index) {
+                continue;
+            }
+            candidates.push((arm_index, individual.get_action_vector().to_vec()));
+        }
+        for individual in population {
+            let arm_index = self.get_arm_index(individual.get_action_vector());
+            candidates.push((arm_index, individual.get_action_vector().to_vec()));
+        }
+
+        // Adhere to the budget of n_trials
+        candidates.truncate(n_trials.saturating_sub(used_trials));
+        let n_candidates = candidates.len();
+
+        let mut pool = self.sample_and_update_batch(candidates, opti_function);
+        pool.extend(self.population.iter().copied());
+        self.population = self.select_population(pool);
+        used_trials + n_candidates
+    }
+
+    pub(crate) fn prepare(
+        &mut self,
+        bounds: Vec<(i32, i32)>,
+        n_trials: usize,
+        n_objectives: usize,
+    ) {
+        // Adaptive resolutions are not supported, the search always uses the full resolution
+        self.genetic_algorithm.set_bounds(bounds);
+        self.genetic_algorithm.resolutions.clear();
+        self.genetic_algorithm.validate();
+
+        assert!(
+            n_trials >= self.genetic_algorithm.population_size,
+            "n_trials must be at least population_size ({})",
+            self.genetic_algorithm.population_size
+        );
+        assert!(
+            n_objectives >= 2,
+            "n_objectives must be at least 2. ({})",
+            n_objectives
+        );
+        for constraint in &self.constraints {
+            constraint.validate(self.genetic_algorithm.dimension);
+        }
+        self.n_objectives = n_objectives;
+        self.generation = 0;
+    }
+
+    // Returns the arms of the approximated Pareto front, ordered by their first objective.
+    pub(crate) fn extract_pareto_front(&self) -> Vec<MultiObjectiveArm> {
+        let mut front: Vec<MultiObjectiveArm> = self
+            .pareto_front
+            .indices()
+            .into_iter()
+            .map(|arm_index| self.arm_memory[arm_index as usize].clone())
+            .collect();
+        front.sort_by(|a, b| {
+            a.get_values()
+                .partial_cmp(b.get_values())
+                .unwrap_or(Ordering::Equal)
+        });
+        front
+    }
+
+    pub fn optimize<F: MultiObjectiveFn>(
+        &mut self,
+        opti_function: F,
+        bounds: Vec<(i32, i32)>,
+        n_trials: usize,
+        n_objectives: usize,
+        seed: Option<u64>,
+    ) -> Vec<MultiObjectiveArm> {
+        // Unwrap seed or fall back to system entropy
+        let seed = seed.unwrap_or_else(|| rand::rng().next_u64());
+
+        self.prepare(bounds, n_trials, n_objectives);
+        self.initialize_population(seed, &opti_function);
+
+        let mut used_trials: usize = self.genetic_algorithm.population_size;
+        while used_trials < n_trials {
+            used_trials = self.run_generation(seed, &opti_function, used_trials, n_trials);
+        }
+
+        self.extract_pareto_front()
+    }
+}
+
+#[cfg(test)]
+mod tests {
+    use super::*;
+    use crate::pareto::dominates;
+
+    // Two conflicting objectives: the distance to (2, 2) and to (8, 8).
+    fn bi_objective(action_vector: &[i32]) -> Vec<f64> {
+        let distance = |target: i32| {
+            action_vector
+                .iter()
+                .map(|&x| ((x - target) as f64).powi(2))
+                .sum::<f64>()
+        };
+        vec![distance(2), distance(8)]
+    }
+
+    fn ga(population_size: usize) -> GeneticAlgorithm {
+        GeneticAlgorithm {
+            population_size,
+            ..Default::default()
+        }
+    }
+
+    #[test]
+    fn test_multi_objective_arm_update() {
+        let mut arm = MultiObjectiveArm::new(&[1, 2], 2);
+        arm.update(&[1.0, 10.0]);
+        arm.update(&[3.0, 10.0]);
+
+        assert_eq!(arm.get_n_evaluations(), 2);
+        assert_eq!(arm.get_values(), &[2.0, 10.0]);
+        assert_eq!(arm.get_value_std_devs(), vec![2.0_f64.sqrt(), 0.0]);
+    }
+
+    #[test]
+    fn test_multi_objective_gmab_optimize() {
+        let mut gmab = MultiObjectiveGMAB::new(ga(10));
+        let front = gmab.optimize(bi_objective, vec![(0, 10), (0, 10)], 1000, 2, Some(42));
+
+        // The front is non-dominated, and consistent with the index over all sample averages
+        assert!(!front.is_empty());
+        for a in &front {
+            for b in &front {
+                assert!(!dominates(a.get_values(), b.get_values()));
+            }
+        }
+        for arm in &gmab.arm_memory {
+            let dominated = front
+                .iter()
+                .any(|member| dominates(member.get_values(), arm.get_values()));
+            assert!(dominated || front.contains(arm));
+        }
+
+        // The noise-free front lies on the diagonal between both targets
+        assert!(front.contains(&MultiObjectiveArm::new(&[2, 2], 2)));
+        assert!(front.contains(&MultiObjectiveArm::new(&[8, 8], 2)));
+        assert_eq!(gmab.population.len(), 10);
+    }
+
+    #[test]
+    fn test_multi_objective_gmab_with_seed() {
+        let run = |seed| {
+            let mut gmab = MultiObjectiveGMAB::new(ga(10));
+            gmab.optimize(bi_objective, vec![(0, 10), (0, 10)], 200, 2, Some(seed))
+        };
+        let front = run(7);
+        let other = run(7);
+        assert_eq!(front.len(), other.len());
+        for (a, b) in front.iter().zip(&other) {
+            assert_eq!(a.get_action_vector(), b.get_action_vector());
+            assert_eq!(a.get_values(), b.get_values());
+        }
+    }
+
+    #[test]
+    fn test_multi_objective_gmab_with_constraints() {
+        let mut gmab = MultiObjectiveGMAB::new(ga(10));
+        gmab.set_constraints(vec![LinearConstraint::new(vec![1.0, 1.0], 10.0)]);
+        let front = gmab.optimize(bi_objective, vec![(0, 10), (0, 10)], 500, 2, Some(42));
+
+        for arm in &gmab.arm_memory {
+            let action_vector = arm.get_action_vector();
+            assert!(action_vector[0] + action_vector[1] <= 10);
+        }
+        assert!(!front.contains(&MultiObjectiveArm::new(&[8, 8], 2)));
+    }
+
+    #[test]
+    #[should_panic(expected = "must return 3 values")]
+    fn test_panic_on_wrong_number_of_objectives() {
+        let mut gmab = MultiObjectiveGMAB::new(ga(10));
+        gmab.optimize(bi_objective, vec![(0, 10), (0, 10)], 100, 3, Some(42));
+    }
+
+    #[test]
+    #[should_panic(expected = "n_objectives must be at least 2")]
+    fn test_panic_on_single_objective() {
+        let mut gmab = MultiObjectiveGMAB::new(ga(10));
+        gmab.optimize(bi_objective, vec![(0, 10), (0, 10)], 100, 1, Some(42));
+    }
+
+    #[test]
+    fn test_multi_objective_gmab_discards_nan_rewards() {
+        let objective = |action_vector: &[i32]| -> Vec<f64> {
+            if action_vector[0] > 5 {
+                return vec![f64::NAN, 0.0];
+            }
+            bi_objective(action_vector)
+        };
+        let mut gmab = MultiObjectiveGMAB::new(ga(10));
+        let front = gmab.optimize(objective, vec![(0, 10), (0, 10)], 500, 2, Some(42));
+
+        assert!(!front.is_empty());
+        assert!(gmab
+            .arm_memory
+            .iter()
+            .all(|arm| arm.get_action_vector()[0] <= 5));
+    }
+}
@@ -0,0 +1,236 @@
+// Copyright 2025 EvoBandits
+//
+// Licensed under the Apache License, Version 2.0 (the "License");
+// you may not use this file except in compliance with the License.
+// You may obtain a copy of the License at
+//
+//     http://www.apache.org/licenses/LICENSE-2.0
+//
+// Unless required by applicable law or agreed to in writing, software
+// distributed under the License is distributed on an "AS IS" BASIS,
+// WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+// See the License for the specific language governing permissions and
+// limitations under the License.
+
+use std::panic;
+use std::thread;
+
+use crate::arm::OptimizationFn;
+use crate::progress::Progress;
+
+// Evaluates each batch of a thread-safe objective in parallel, e.g. all candidates of a
+// generation. The batch is split into contiguous chunks that are evaluated on scoped threads, and
+// the rewards are returned in the order of the batch. Hence, the optimization remains
+// deterministic given the seed, as long as the objective itself is.
+//
+// Spawning threads costs a few microseconds per batch, so this only pays off for objectives that
+// are more expensive than that, like simulations.
+#[derive(Debug, Clone)]
+pub struct ParallelFn<F> {
+    opti_function: F,
+    n_threads: usize,
+}
+
+impl<F: OptimizationFn + Sync> ParallelFn<F> {
+    // Uses one thread per available core.
+    pub fn new(opti_function: F) -> Self {
+        let n_threads = thread::available_parallelism().map_or(1, |n| n.get());
+        Self::with_threads(opti_function, n_threads)
+    }
+
+    pub fn with_threads(opti_function: F, n_threads: usize) -> Self {
+        if n_threads < 1 {
+            panic!("n_threads must be at least 1. ({})", n_threads);
+        }
+        ParallelFn {
+            opti_function,
+            n_threads,
+        }
+    }
+
+    pub fn get_n_threads(&self) -> usize {
+        self.n_threads
+    }
+
+    // Evaluates contiguous chunks of the batch on scoped threads, and concatenates the results.
+    // Each chunk is passed with the index of its first action vector in the batch.
+    fn in_chunks<T: Send, E: Fn(usize, &[Vec<i32>]) -> Vec<T> + Sync>(
+        &self,
+        action_vectors: &[Vec<i32>],
+        evaluate: E,
+    ) -> Vec<T> {
+        let n_threads = self.n_threads.min(action_vectors.len());
+        if n_threads <= 1 {
+            return evaluate(0, action_vectors);
+        }
+
+        let chunk_size = action_vectors.len().div_ceil(n_threads);
+        let evaluate = &evaluate;
+        thread::scope(|s| {
+            let handles: Vec<_> = action_vectors
+                .chunks(chunk_size)
+                .enumerate()
+                .map(|(i, chunk)| s.spawn(move || evaluate(i * chunk_size, chunk)))
+                .collect();
+
+            // Re-raise panics from the objective with their original payload
+            handles
+                .into_iter()
+                .flat_map(|handle| {
+                    handle
+                        .join()
+                        .unwrap_or_else(|err| panic::resume_unwind(err))
+                })
+                .collect()
+        })
+    }
+}
+
+impl<F: OptimizationFn + Sync> OptimizationFn for ParallelFn<F> {
+    fn evaluate(&self, action_vector: &[i32]) -> f64 {
+        self.opti_function.evaluate(action_vector)
+    }
+
+    fn evaluate_batch(&self, action_vectors: &[Vec<i32>]) -> Vec<f64> {
+        self.in_chunks(action_vectors, |_start, chunk| {
+            self.opti_function.evaluate_batch(chunk)
+        })
+    }
+
+    // Each chunk is timed by the objective, so the costs are those of the serial evaluation.
+    fn evaluate_batch_timed(&self, action_vectors: &[Vec<i32>]) -> (Vec<f64>, Vec<f64>) {
+        self.in_chunks(action_vectors, |_start, chunk| {
+            let (rewards, costs) = self.opti_function.evaluate_batch_timed(chunk);
+            rewards.into_iter().zip(costs).collect()
+        })
+        .into_iter()
+        .unzip()
+    }
+
+    fn evaluate_batch_keyed(
+        &self,
+        action_vectors: &[Vec<i32>],
+        pulls: &[i32],
+    ) -> (Vec<f64>, Vec<f64>) {
+        self.in_chunks(action_vectors, |start, chunk| {
+            let pulls = &pulls[start..start + chunk.len()];
+            let (rewards, costs) = self.opti_function.evaluate_batch_keyed(chunk, pulls);
+            rewards.into_iter().zip(costs).collect()
+        })
+        .into_iter()
+        .unzip()
+    }
+
+    fn is_feasible(&self, action_vector: &[i32]) -> bool {
+        self.opti_function.is_feasible(action_vector)
+    }
+
+    fn progress_interval(&self) -> Option<f64> {
+        self.opti_function.progress_interval()
+    }
+
+    fn report_progress(&self, progress: &Progress) {
+        self.opti_function.report_progress(progress)
+    }
+}
+
+#[cfg(test)]
+mod tests {
+    use super::*;
+    use crate::evobandits::GMAB;
+
+    fn mock_opti_function(vec: &[i32]) -> f64 {
+        vec.iter().map(|&x| (x as f64).powi(2)).sum()
+    }
+
+    #[test]
+    fn test_parallel_fn_preserves_order() {
+        let opti_function = ParallelFn::with_threads(mock_opti_function, 3);
+        let action_vectors: Vec<Vec<i32>> = (0..10).map(|i| vec![i, 1]).collect();
+
+        let rewards = opti_function.evaluate_batch(&action_vectors);
+        let expected: Vec<f64> = action_vectors
+            .iter()
+            .map(|action_vector| mock_opti_function(action_vector))
+            .collect();
+        assert_eq!(rewards, expected);
+        assert_eq!(opti_function.evaluate_batch(&[]), Vec::<f64>::new());
+    }
+
+    #[test]
+    fn test_parallel_fn_evaluate_batch_timed() {
+        let opti_function = ParallelFn::with_threads(mock_opti_function, 3);
+        let action_vectors: Vec<Vec<i32>> = (0..10).map(|i| vec![i, 1]).collect();
+
+        let (rewards, costs) = opti_function.evaluate_batch_timed(&action_vectors);
+        assert_eq!(rewards, opti_function.evaluate_batch(&action_vectors));
+        assert_eq!(costs.len(), action_vectors.len());
+    }
+
+    #[test]
+    fn test_parallel_fn_evaluate_batch_keyed() {
+        // Mock opti_function whose reward is the pull it receives
+        struct PullFn;
+        impl OptimizationFn for PullFn {
+            fn evaluate(&self, _action_vector: &[i32]) -> f64 {
+                panic!("Evaluations without pulls are not expected.");
+            }
+
+            fn evaluate_batch_keyed(
+                &self,
+                action_vectors: &[Vec<i32>],
+                pulls: &[i32],
+            ) -> (Vec<f64>, Vec<f64>) {
+                assert_eq!(action_vectors.len(), pulls.len());
+                let rewards = pulls.iter().map(|&pull| pull as f64).collect();
+                (rewards, vec![0.0; pulls.len()])
+            }
+        }
+
+        // Each chunk receives the pulls of its own action vectors
+        let opti_function = ParallelFn::with_threads(PullFn, 3);
+        let action_vectors: Vec<Vec<i32>> = (0..10).map(|i| vec![i, 1]).collect();
+        let pulls: Vec<i32> = (0..10).map(|i| 10 * i).collect();
+        let (rewards, _costs) = opti_function.evaluate_batch_keyed(&action_vectors, &pulls);
+        assert_eq!(rewards, pulls.iter().map(|&p| p as f64).collect::<Vec<_>>());
+    }
+
+    #[test]
+    fn test_parallel_fn_matches_serial_optimization() {
+        let bounds = vec![(-100, 100), (-100, 100)];
+        let mut serial = GMAB::new(Default::default());
+        let mut parallel = GMAB::new(Default::default());
+
+        let expected = serial.optimize(mock_opti_function, bounds.clone(), 1000, 3, Some(42));
+        let result = parallel.optimize(
+            ParallelFn::with_threads(mock_opti_function, 4),
+            bounds,
+            1000,
+            3,
+            Some(42),
+        );
+        assert_eq!(result, expected);
+    }
+
+    #[test]
+    #[should_panic(expected = "objective failed")]
+    fn test_parallel_fn_propagates_panics() {
+        let opti_function = ParallelFn::with_threads(
+            |vec: &[i32]| -> f64 {
+                if vec[0] == 3 {
+                    panic!("objective failed");
+                }
+                0.0
+            },
+            2,
+        );
+        let action_vectors: Vec<Vec<i32>> = (0..4).map(|i| vec![i]).collect();
+        opti_function.evaluate_batch(&action_vectors);
+    }
+
+    #[test]
+    #[should_panic(expected = "n_threads must be at least 1")]
+    fn test_panic_on_invalid_n_threads() {
+        ParallelFn::with_threads(mock_opti_function, 0);
+    }
+}
@@ -0,0 +1,238 @@
+// Copyright 2025 EvoBandits
+//
+// Licensed under the Apache License, Version 2.0 (the "License");
+// you may not use this file except in compliance with the License.
+// You may obtain a copy of the License at
+//
+//     http://www.apache.org/licenses/LICENSE-2.0
+//
+// Unless required by applicable law or agreed to in writing, software
+// distributed under the License is distributed on an "AS IS" BASIS,
+// WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+// See the License for the specific language governing permissions and
+// limitations under the License.
+
+// Describes how one dimension of the action vector maps to the value of a parameter.
+#[derive(Debug, PartialEq, Clone)]
+pub enum ParamSpec {
+    // An integer in [low, high], equal to the action.
+    Int {
+        low: i32,
+        high: i32,
+    },
+    // A float on a grid of n_steps steps between low and high, optionally on a log scale.
+    Float {
+        low: f64,
+        high: f64,
+        n_steps: i32,
+        log: bool,
+    },
+    // The index of one of n_choices choices.
+    Categorical {
+        n_choices: i32,
+    },
+}
+
+impl ParamSpec {
+    pub fn validate(&self) {
+        match *self {
+            ParamSpec::Int { low, high } => {
+                if high <= low {
+                    panic!("high must be greater than low. ({} <= {})", high, low);
+                }
+            }
+            ParamSpec::Float {
+                low,
+                high,
+                n_steps,
+                log,
+            } => {
+                if high <= low {
+                    panic!("high must be greater than low. ({} <= {})", high, low);
+                }
+                if n_steps <= 0 {
+                    panic!("n_steps must be positive. ({})", n_steps);
+                }
+                if log && low <= 0.0 {
+                    panic!(
+                        "low must be greater than 0 for a log-transformation. ({})",
+                        low
+                    );
+                }
+            }
+            ParamSpec::Categorical { n_choices } => {
+                if n_choices < 1 {
+                    panic!("n_choices must be at least 1. ({})", n_choices);
+                }
+            }
+        }
+    }
+
+    pub fn bounds(&self) -> (i32, i32) {
+        match *self {
+            ParamSpec::Int { low, high } => (low, high),
+            ParamSpec::Float { n_steps, .. } => (0, n_steps),
+            ParamSpec::Categorical { n_choices } => (0, n_choices - 1),
+        }
+    }
+
+    pub fn decode(&self, action: i32) -> f64 {
+        match *self {
+            ParamSpec::Float {
+                low,
+                high,
+                n_steps,
+                log,
+            } => {
+                // Same arithmetic as FloatParam.decode, so that both decode to identical values
+                let (low, high) = if log {
+                    (low.ln(), high.ln())
+                } else {
+                    (low, high)
+                };
+                let value = low + (high - low) / n_steps as f64 * action as f64;
+                if log {
+                    value.exp()
+                } else {
+                    value
+                }
+            }
+            ParamSpec::Int { .. } | ParamSpec::Categorical { .. } => action as f64,
+        }
+    }
+}
+
+// The parameter space of a study, with one ParamSpec per dimension of the action vector. The
+// specs are validated once when they are added, so action vectors can be decoded in batches
+// without further checks.
+#[derive(Debug, PartialEq, Clone, Default)]
+pub struct ParamSpace {
+    dimensions: Vec<ParamSpec>,
+}
+
+impl ParamSpace {
+    pub fn new() -> Self {
+        ParamSpace {
+            dimensions: Vec::new(),
+        }
+    }
+
+    // Adds a parameter with the given number of dimensions.
+    pub fn add(&mut self, spec: ParamSpec, size: usize) {
+        spec.validate();
+        if size < 1 {
+            panic!("size must be at least 1. ({})", size);
+        }
+        self.dimensions.extend(std::iter::repeat(spec).take(size));
+    }
+
+    pub fn dimension(&self) -> usize {
+        self.dimensions.len()
+    }
+
+    pub fn bounds(&self) -> Vec<(i32, i32)> {
+        self.dimensions.iter().map(ParamSpec::bounds).collect()
+    }
+
+    pub fn decode(&self, action_vector: &[i32]) -> Vec<f64> {
+        assert_eq!(
+            action_vector.len(),
+            self.dimensions.len(),
+            "The action vector must have one action per dimension of the parameter space."
+        );
+        self.dimensions
+            .iter()
+            .zip(action_vector)
+            .map(|(spec, &action)| spec.decode(action))
+            .collect()
+    }
+
+    // Decodes a batch of action vectors, and returns one column of values per dimension.
+    pub fn decode_columns(&self, action_vectors: &[Vec<i32>]) -> Vec<Vec<f64>> {
+        let mut columns: Vec<Vec<f64>> =
+            vec![Vec::with_capacity(action_vectors.len()); self.dimensions.len()];
+        for action_vector in action_vectors {
+            for (column, value) in columns.iter_mut().zip(self.decode(action_vector)) {
+                column.push(value);
+            }
+        }
+        columns
+    }
+}
+
+#[cfg(test)]
+mod tests {
+    use super::*;
+
+    fn space() -> ParamSpace {
+        let mut space = ParamSpace::new();
+        space.add(ParamSpec::Int { low: -5, high: 10 }, 2);
+        space.add(
+            ParamSpec::Float {
+                low: 1.0,
+                high: 100.0,
+                n_steps: 2,
+                log: true,
+            },
+            1,
+        );
+        space.add(ParamSpec::Categorical { n_choices: 3 }, 1);
+        space
+    }
+
+    #[test]
+    fn test_param_space_bounds() {
+        let space = space();
+        assert_eq!(space.dimension(), 4);
+        assert_eq!(space.bounds(), vec![(-5, 10), (-5, 10), (0, 2), (0, 2)]);
+    }
+
+    #[test]
+    fn test_param_space_decode() {
+        let space = space();
+        let decoded = space.decode(&[-1, 3, 1, 2]);
+        assert_eq!(decoded[..2], [-1.0, 3.0]);
+        assert!((decoded[2] - 10.0).abs() < 1e-9);
+        assert_eq!(decoded[3], 2.0);
+
+        let linear = ParamSpec::Float {
+            low: 0.0,
+            high: 1.0,
+            n_steps: 4,
+            log: false,
+        };
+        assert_eq!(linear.decode(3), 0.75);
+    }
+
+    #[test]
+    fn test_param_space_decode_columns() {
+        let space = space();
+        let columns = space.decode_columns(&[vec![-1, 3, 0, 2], vec![4, 5, 2, 0]]);
+        assert_eq!(columns.len(), 4);
+        assert_eq!(columns[0], vec![-1.0, 4.0]);
+        assert_eq!(columns[1], vec![3.0, 5.0]);
+        assert_eq!(columns[3], vec![2.0, 0.0]);
+    }
+
+    #[test]
+    #[should_panic(expected = "low must be greater than 0")]
+    fn test_panic_on_invalid_log_scale() {
+        let mut space = ParamSpace::new();
+        space.add(
+            ParamSpec::Float {
+                low: 0.0,
+                high: 1.0,
+                n_steps: 10,
+                log: true,
+            },
+            1,
+        );
+    }
+
+    #[test]
+    #[should_panic(expected = "high must be greater than low")]
+    fn test_panic_on_invalid_int_bounds() {
+        let mut space = ParamSpace::new();
+        space.add(ParamSpec::Int { low: 1, high: 1 }, 1);
+    }
+}
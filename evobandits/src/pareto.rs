@@ -0,0 +1,226 @@
+// Copyright 2025 EvoBandits
+//
+// Licensed under the Apache License, Version 2.0 (the "License");
+// you may not use this file except in compliance with the License.
+// You may obtain a copy of the License at
+//
+//     http://www.apache.org/licenses/LICENSE-2.0
+//
+// Unless required by applicable law or agreed to in writing, software
+// distributed under the License is distributed on an "AS IS" BASIS,
+// WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+// See the License for the specific language governing permissions and
+// limitations under the License.
+
+use std::cmp::Ordering;
+
+// Checks if a dominates b, i.e. a is at least as good in all objectives and strictly better in at
+// least one objective (for minimization).
+pub fn dominates(a: &[f64], b: &[f64]) -> bool {
+    let mut strictly_better = false;
+    for (x, y) in a.iter().zip(b) {
+        if x > y {
+            return false;
+        }
+        if x < y {
+            strictly_better = true;
+        }
+    }
+    strictly_better
+}
+
+// Incremental index of the non-dominated points, e.g. the sample averages of all arms. Each point
+// is identified by the index of its arm. Updates cost O(F * M) for a front of size F and M
+// objectives, so the front never needs to be rebuilt from scratch.
+#[derive(Debug, PartialEq, Clone, Default)]
+pub struct ParetoFront {
+    members: Vec<(i32, Vec<f64>)>,
+}
+
+impl ParetoFront {
+    pub fn new() -> Self {
+        ParetoFront {
+            members: Vec::new(),
+        }
+    }
+
+    // Inserts or updates the point of an arm. The arm only enters the front if no member
+    // dominates it, and members that it dominates are removed.
+    pub fn update(&mut self, index: i32, point: &[f64]) {
+        self.remove(index);
+        if self
+            .members
+            .iter()
+            .any(|(_, member)| dominates(member, point))
+        {
+            return;
+        }
+        self.members.retain(|(_, member)| !dominates(point, member));
+        self.members.push((index, point.to_vec()));
+    }
+
+    pub fn remove(&mut self, index: i32) {
+        if let Some(position) = self.members.iter().position(|(i, _)| *i == index) {
+            self.members.swap_remove(position);
+        }
+    }
+
+    pub fn contains(&self, index: i32) -> bool {
+        self.members.iter().any(|(i, _)| *i == index)
+    }
+
+    pub fn indices(&self) -> Vec<i32> {
+        self.members.iter().map(|(i, _)| *i).collect()
+    }
+
+    pub fn len(&self) -> usize {
+        self.members.len()
+    }
+
+    pub fn is_empty(&self) -> bool {
+        self.members.is_empty()
+    }
+}
+
+// Sorts the points into fronts of non-dominated points, and returns the positions of the points
+// per front, starting with the best front.
+//
+// Source: Deb, K., Pratap, A., Agarwal, S. and Meyarivan, T. (2002) ‘A fast and elitist
+// multiobjective genetic algorithm: NSGA-II’, IEEE Transactions on Evolutionary Computation,
+// 6(2), pp. 182–197. doi: 10.1109/4235.996017.
+pub fn non_dominated_sort(points: &[Vec<f64>]) -> Vec<Vec<usize>> {
+    let n = points.len();
+    let mut dominated_by_count = vec![0; n];
+    let mut dominates_list: Vec<Vec<usize>> = vec![Vec::new(); n];
+
+    for i in 0..n {
+        for j in (i + 1)..n {
+            if dominates(&points[i], &points[j]) {
+                dominates_list[i].push(j);
+                dominated_by_count[j] += 1;
+            } else if dominates(&points[j], &points[i]) {
+                dominates_list[j].push(i);
+                dominated_by_count[i] += 1;
+            }
+        }
+    }
+
+    let mut fronts: Vec<Vec<usize>> = Vec::new();
+    let mut current: Vec<usize> = (0..n).filter(|&i| dominated_by_count[i] == 0).collect();
+    while !current.is_empty() {
+        let mut next = Vec::new();
+        for &i in &current {
+            for &j in &dominates_list[i] {
+                dominated_by_count[j] -= 1;
+                if dominated_by_count[j] == 0 {
+                    next.push(j);
+                }
+            }
+        }
+        fronts.push(current);
+        current = next;
+    }
+    fronts
+}
+
+// Returns the crowding distance of each point in a front, i.e. how isolated a point is from its
+// neighbours. The extreme points of each objective get an infinite distance.
+pub fn crowding_distance(points: &[Vec<f64>], front: &[usize]) -> Vec<f64> {
+    let mut distances = vec![0.0; front.len()];
+    if front.len() <= 2 {
+        return vec![f64::INFINITY; front.len()];
+    }
+
+    let n_objectives = points[front[0]].len();
+    let mut order: Vec<usize> = (0..front.len()).collect();
+    for m in 0..n_objectives {
+        order.sort_by(|&a, &b| {
+            points[front[a]][m]
+                .partial_cmp(&points[front[b]][m])
+                .unwrap_or(Ordering::Equal)
+        });
+
+        let min = points[front[order[0]]][m];
+        let max = points[front[order[front.len() - 1]]][m];
+        distances[order[0]] = f64::INFINITY;
+        distances[order[front.len() - 1]] = f64::INFINITY;
+        if max == min {
+            continue;
+        }
+
+        for k in 1..front.len() - 1 {
+            let gap = points[front[order[k + 1]]][m] - points[front[order[k - 1]]][m];
+            distances[order[k]] += gap / (max - min);
+        }
+    }
+    distances
+}
+
+#[cfg(test)]
+mod tests {
+    use super::*;
+
+    #[test]
+    fn test_dominates() {
+        assert!(dominates(&[1.0, 1.0], &[1.0, 2.0]));
+        assert!(dominates(&[0.0, 1.0], &[1.0, 2.0]));
+        assert!(!dominates(&[1.0, 1.0], &[1.0, 1.0]));
+        assert!(!dominates(&[0.0, 2.0], &[1.0, 1.0]));
+    }
+
+    #[test]
+    fn test_pareto_front_update() {
+        let mut front = ParetoFront::new();
+        front.update(0, &[1.0, 3.0]);
+        front.update(1, &[3.0, 1.0]);
+        front.update(2, &[2.0, 2.0]);
+        assert_eq!(front.len(), 3);
+
+        // Dominated points do not enter the front
+        front.update(3, &[2.0, 4.0]);
+        assert!(!front.contains(3));
+
+        // Points that dominate members replace them
+        front.update(4, &[1.0, 1.0]);
+        assert_eq!(front.indices(), vec![4]);
+
+        // Updated points are re-evaluated
+        front.update(4, &[5.0, 5.0]);
+        assert!(front.contains(4));
+        front.update(5, &[4.0, 4.0]);
+        assert_eq!(front.indices(), vec![5]);
+    }
+
+    #[test]
+    fn test_non_dominated_sort() {
+        let points = vec![
+            vec![1.0, 3.0],
+            vec![2.0, 4.0],
+            vec![3.0, 1.0],
+            vec![4.0, 4.0],
+            vec![2.0, 2.0],
+        ];
+        let fronts = non_dominated_sort(&points);
+
+        assert_eq!(fronts.len(), 3);
+        assert_eq!(fronts[0], vec![0, 2, 4]);
+        assert_eq!(fronts[1], vec![1]);
+        assert_eq!(fronts[2], vec![3]);
+    }
+
+    #[test]
+    fn test_crowding_distance() {
+        let points = vec![
+            vec![0.0, 4.0],
+            vec![1.0, 3.0],
+            vec![3.0, 1.0],
+            vec![4.0, 0.0],
+        ];
+        let distances = crowding_distance(&points, &[0, 1, 2, 3]);
+
+        assert_eq!(distances[0], f64::INFINITY);
+        assert_eq!(distances[3], f64::INFINITY);
+        assert_eq!(distances[1], 1.5);
+        assert_eq!(distances[2], 1.5);
+    }
+}
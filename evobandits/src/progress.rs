@@ -0,0 +1,251 @@
+// Copyright 2025 EvoBandits
+//
+// Licensed under the Apache License, Version 2.0 (the "License");
+// you may not use this file except in compliance with the License.
+// You may obtain a copy of the License at
+//
+//     http://www.apache.org/licenses/LICENSE-2.0
+//
+// Unless required by applicable law or agreed to in writing, software
+// distributed under the License is distributed on an "AS IS" BASIS,
+// WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+// See the License for the specific language governing permissions and
+// limitations under the License.
+
+use crate::codec::{Decoder, Encoder};
+use std::time::Instant;
+
+pub const PROGRESS_INTERVAL_DEFAULT: f64 = 1.0;
+
+// Quantile of the standard normal distribution for two-sided 95% confidence intervals.
+const Z_95: f64 = 1.959964;
+
+// Wall time of the phases of the generations in seconds: breeding (selection, crossover, mutation
+// and screening), evaluation of the objective, and the update of the arm memory.
+#[derive(Debug, PartialEq, Clone, Copy, Default)]
+pub struct PhaseTimes {
+    pub breeding: f64,
+    pub evaluation: f64,
+    pub update: f64,
+}
+
+impl PhaseTimes {
+    pub(crate) fn encode(&self, encoder: &mut Encoder) {
+        encoder.f64(self.breeding);
+        encoder.f64(self.evaluation);
+        encoder.f64(self.update);
+    }
+
+    pub(crate) fn decode(decoder: &mut Decoder) -> Self {
+        PhaseTimes {
+            breeding: decoder.f64(),
+            evaluation: decoder.f64(),
+            update: decoder.f64(),
+        }
+    }
+}
+
+// Snapshot of a running optimization, see `OptimizationFn::report_progress`. The best arm is the
+// arm that would be returned first at this point. Its sample average is NaN while no evaluation
+// was recorded.
+#[derive(Debug, PartialEq, Clone)]
+pub struct Progress {
+    pub n_trials: usize,
+    pub used_trials: usize,
+    pub n_generations: u64,
+    pub elapsed: f64,
+    pub trials_per_second: f64,
+    pub best_action_vector: Vec<i32>,
+    pub best_value: f64,
+    // 95% confidence interval of the sample average of the best arm
+    pub best_value_ci: (f64, f64),
+    pub best_n_evaluations: i32,
+    pub n_arms: usize,
+    // Recorded evaluations that created a new arm, or pulled a known arm again
+    pub n_new_arms: usize,
+    pub n_repulls: usize,
+    // Share of the recorded evaluations that pulled a known arm again
+    pub repull_ratio: f64,
+    pub phase_times: PhaseTimes,
+}
+
+impl Default for Progress {
+    fn default() -> Self {
+        Progress {
+            n_trials: 0,
+            used_trials: 0,
+            n_generations: 0,
+            elapsed: 0.0,
+            trials_per_second: 0.0,
+            best_action_vector: Vec::new(),
+            best_value: f64::NAN,
+            best_value_ci: (f64::NAN, f64::NAN),
+            best_n_evaluations: 0,
+            n_arms: 0,
+            n_new_arms: 0,
+            n_repulls: 0,
+            repull_ratio: 0.0,
+            phase_times: PhaseTimes::default(),
+        }
+    }
+}
+
+impl Progress {
+    // Computes trials_per_second and repull_ratio from the counts.
+    pub(crate) fn with_rates(mut self) -> Self {
+        if self.elapsed > 0.0 {
+            self.trials_per_second = self.used_trials as f64 / self.elapsed;
+        }
+        if self.n_new_arms + self.n_repulls > 0 {
+            self.repull_ratio = self.n_repulls as f64 / (self.n_new_arms + self.n_repulls) as f64;
+        }
+        self
+    }
+
+    pub(crate) fn set_best(
+        &mut self,
+        action_vector: &[i32],
+        value: f64,
+        std_dev: f64,
+        n_evaluations: i32,
+    ) {
+        let half_width = Z_95 * std_dev / (n_evaluations.max(1) as f64).sqrt();
+        self.best_action_vector = action_vector.to_vec();
+        self.best_value = value;
+        self.best_value_ci = (value - half_width, value + half_width);
+        self.best_n_evaluations = n_evaluations;
+    }
+
+    // Combines the progress of several islands that run at the same time. Counts and phase times
+    // are summed up, and the best arm is the best among the islands.
+    pub(crate) fn merge(islands: &[Progress], elapsed: f64) -> Progress {
+        let mut merged = Progress {
+            n_trials: islands.iter().map(|island| island.n_trials).sum(),
+            used_trials: islands.iter().map(|island| island.used_trials).sum(),
+            n_generations: islands
+                .iter()
+                .map(|island| island.n_generations)
+                .max()
+                .unwrap_or(0),
+            elapsed,
+            n_arms: islands.iter().map(|island| island.n_arms).sum(),
+            n_new_arms: islands.iter().map(|island| island.n_new_arms).sum(),
+            n_repulls: islands.iter().map(|island| island.n_repulls).sum(),
+            ..Default::default()
+        }
+        .with_rates();
+        for island in islands {
+            merged.phase_times.breeding += island.phase_times.breeding;
+            merged.phase_times.evaluation += island.phase_times.evaluation;
+            merged.phase_times.update += island.phase_times.update;
+            if island.best_value < merged.best_value || merged.best_value.is_nan() {
+                merged.best_action_vector = island.best_action_vector.clone();
+                merged.best_value = island.best_value;
+                merged.best_value_ci = island.best_value_ci;
+                merged.best_n_evaluations = island.best_n_evaluations;
+            }
+        }
+        merged
+    }
+}
+
+// Limits how often the progress of an optimization is reported, so that snapshots are only taken
+// once per interval of seconds. Without an interval, progress is never reported.
+pub(crate) struct ProgressReporter {
+    interval: Option<f64>,
+    start: Instant,
+    last_report: Instant,
+}
+
+impl ProgressReporter {
+    pub fn new(interval: Option<f64>) -> Self {
+        let start = Instant::now();
+        ProgressReporter {
+            interval,
+            start,
+            last_report: start,
+        }
+    }
+
+    pub fn is_enabled(&self) -> bool {
+        self.interval.is_some()
+    }
+
+    pub fn elapsed(&self) -> f64 {
+        self.start.elapsed().as_secs_f64()
+    }
+
+    // Returns whether a report is due, and if so, restarts the interval.
+    pub fn is_due(&mut self) -> bool {
+        match self.interval {
+            Some(interval) if self.last_report.elapsed().as_secs_f64() >= interval => {
+                self.last_report = Instant::now();
+                true
+            }
+            _ => false,
+        }
+    }
+}
+
+#[cfg(test)]
+mod tests {
+    use super::*;
+
+    fn progress(used_trials: usize, n_new_arms: usize, n_repulls: usize) -> Progress {
+        Progress {
+            n_trials: 100,
+            used_trials,
+            elapsed: 2.0,
+            n_new_arms,
+            n_repulls,
+            phase_times: PhaseTimes {
+                breeding: 1.0,
+                evaluation: 2.0,
+                update: 0.5,
+            },
+            ..Default::default()
+        }
+        .with_rates()
+    }
+
+    #[test]
+    fn test_progress_rates() {
+        let mut progress = progress(50, 30, 10);
+        assert_eq!(progress.trials_per_second, 25.0);
+        assert_eq!(progress.repull_ratio, 0.25);
+        assert!(progress.best_value.is_nan());
+
+        progress.set_best(&[1, 2], 3.0, 2.0, 4);
+        assert_eq!(progress.best_action_vector, vec![1, 2]);
+        assert_eq!(progress.best_value_ci, (3.0 - Z_95, 3.0 + Z_95));
+    }
+
+    #[test]
+    fn test_progress_merge() {
+        let mut first = progress(20, 10, 0);
+        first.set_best(&[1], 5.0, 0.0, 1);
+        let mut second = progress(30, 5, 5);
+        second.set_best(&[2], 4.0, 0.0, 1);
+
+        let merged = Progress::merge(&[first, Progress::default(), second], 2.0);
+        assert_eq!(merged.n_trials, 200);
+        assert_eq!(merged.used_trials, 50);
+        assert_eq!(merged.trials_per_second, 25.0);
+        assert_eq!(merged.repull_ratio, 0.25);
+        assert_eq!(merged.best_action_vector, vec![2]);
+        assert_eq!(merged.best_value, 4.0);
+        assert_eq!(merged.phase_times.evaluation, 4.0);
+    }
+
+    #[test]
+    fn test_progress_reporter() {
+        let mut disabled = ProgressReporter::new(None);
+        assert!(!disabled.is_enabled());
+        assert!(!disabled.is_due());
+
+        let mut reporter = ProgressReporter::new(Some(0.0));
+        assert!(reporter.is_due());
+        let mut reporter = ProgressReporter::new(Some(3600.0));
+        assert!(!reporter.is_due());
+    }
+}
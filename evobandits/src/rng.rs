@@ -0,0 +1,83 @@
+// Copyright 2025 EvoBandits
+//
+// Licensed under the Apache License, Version 2.0 (the "License");
+// you may not use this file except in compliance with the License.
+// You may obtain a copy of the License at
+//
+//     http://www.apache.org/licenses/LICENSE-2.0
+//
+// Unless required by applicable law or agreed to in writing, software
+// distributed under the License is distributed on an "AS IS" BASIS,
+// WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+// See the License for the specific language governing permissions and
+// limitations under the License.
+
+// Counter-based random streams. Instead of drawing the seeds of all random operations one after
+// another from a single generator, the seed of each operation is derived from the seed of the run
+// and a key that identifies the operation, e.g. (generation, operator, index). The random numbers
+// of an operation therefore do not depend on how many numbers other operations drew before, or
+// on the order in which operations ran, e.g. on several threads.
+
+use rand::rngs::StdRng;
+use rand::SeedableRng;
+
+// Keys of the operators that draw random numbers.
+pub(crate) const STREAM_INITIALIZATION: u64 = 0;
+pub(crate) const STREAM_SHUFFLE: u64 = 1;
+pub(crate) const STREAM_CROSSOVER: u64 = 2;
+pub(crate) const STREAM_MUTATION: u64 = 3;
+pub(crate) const STREAM_ISLAND: u64 = 4;
+pub(crate) const STREAM_COST: u64 = 5;
+pub(crate) const STREAM_SURROGATE: u64 = 6;
+
+const GOLDEN_GAMMA: u64 = 0x9e37_79b9_7f4a_7c15;
+
+// Finalizer of SplitMix64, a bijective mix of all input bits into all output bits.
+//
+// Source: Steele, G. L., Lea, D. and Flood, C. H. (2014) 'Fast splittable pseudorandom number
+// generators', ACM SIGPLAN Notices, 49(10), pp. 453–472. doi: 10.1145/2714064.2660195.
+fn mix(mut z: u64) -> u64 {
+    z = (z ^ (z >> 30)).wrapping_mul(0xbf58_476d_1ce4_e5b9);
+    z = (z ^ (z >> 27)).wrapping_mul(0x94d0_49bb_1331_11eb);
+    z ^ (z >> 31)
+}
+
+// Derives the seed of the stream that is identified by the key, from the seed of its parent.
+pub fn derive_seed(seed: u64, key: &[u64]) -> u64 {
+    key.iter().fold(mix(seed), |state, &k| {
+        mix(state.wrapping_add(GOLDEN_GAMMA) ^ mix(k.wrapping_add(GOLDEN_GAMMA)))
+    })
+}
+
+// Returns a generator for the stream that is identified by the key.
+pub(crate) fn stream(seed: u64, key: &[u64]) -> StdRng {
+    StdRng::seed_from_u64(derive_seed(seed, key))
+}
+
+#[cfg(test)]
+mod tests {
+    use super::*;
+    use std::collections::HashSet;
+
+    #[test]
+    fn test_derive_seed_is_deterministic() {
+        assert_eq!(derive_seed(42, &[1, 2, 3]), derive_seed(42, &[1, 2, 3]));
+        assert_eq!(derive_seed(42, &[]), mix(42));
+    }
+
+    #[test]
+    fn test_derive_seed_separates_streams() {
+        // Neighbouring keys and permutations lead to distinct seeds
+        let mut seeds = HashSet::new();
+        for generation in 0..100 {
+            for operator in 0..5 {
+                for index in 0..20 {
+                    assert!(seeds.insert(derive_seed(42, &[generation, operator, index])));
+                }
+            }
+        }
+        assert_ne!(derive_seed(42, &[1, 2]), derive_seed(42, &[2, 1]));
+        assert_ne!(derive_seed(42, &[1]), derive_seed(43, &[1]));
+        assert_ne!(derive_seed(42, &[0]), derive_seed(42, &[0, 0]));
+    }
+}
@@ -0,0 +1,103 @@
+// Copyright 2025 EvoBandits
+//
+// Licensed under the Apache License, Version 2.0 (the "License");
+// you may not use this file except in compliance with the License.
+// You may obtain a copy of the License at
+//
+//     http://www.apache.org/licenses/LICENSE-2.0
+//
+// Unless required by applicable law or agreed to in writing, software
+// distributed under the License is distributed on an "AS IS" BASIS,
+// WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+// See the License for the specific language governing permissions and
+// limitations under the License.
+
+use crate::codec::{Decoder, Encoder};
+
+pub const SMOOTHING_BANDWIDTH_DEFAULT: f64 = 0.05;
+
+// Kernel smoothing of the sample averages, so that neighbouring arms lend each other statistical
+// strength when the best arms are identified by their UCB values. Most arms are evaluated only
+// once or twice, so their sample averages are noisy, and the UCB values would otherwise mostly
+// follow the noise. The population is still selected by the sample averages, since smoothing
+// biases the estimates at the edge of the explored region against the direction of progress.
+//
+// The smoothed sample average of an arm is the Nadaraya-Watson estimate over the arms within the
+// bandwidth, where each arm is weighted by its number of evaluations and the Epanechnikov kernel
+// of its distance. Its number of evaluations is the sum of these weights, which replaces the
+// number of evaluations in the UCB bonus. The bandwidth is a fraction of the range of each
+// dimension. Arms with many evaluations outweigh their neighbours, so the smoothing fades out
+// where the arms are evaluated repeatedly.
+//
+// Source: Nadaraya, E. A. (1964) ‘On estimating regression’, Theory of Probability & Its
+// Applications, 9(1), pp. 141–142.
+#[derive(Debug, PartialEq, Clone, Copy)]
+pub struct Smoothing {
+    pub bandwidth: f64,
+}
+
+impl Default for Smoothing {
+    fn default() -> Self {
+        Smoothing {
+            bandwidth: SMOOTHING_BANDWIDTH_DEFAULT,
+        }
+    }
+}
+
+impl Smoothing {
+    pub fn validate(&self) {
+        if !(self.bandwidth > 0.0 && self.bandwidth <= 1.0) {
+            panic!(
+                "The smoothing bandwidth must be in (0, 1]. ({})",
+                self.bandwidth
+            );
+        }
+    }
+
+    pub(crate) fn encode(&self, encoder: &mut Encoder) {
+        encoder.f64(self.bandwidth);
+    }
+
+    pub(crate) fn decode(decoder: &mut Decoder) -> Self {
+        Smoothing {
+            bandwidth: decoder.f64(),
+        }
+    }
+
+    // Returns the bandwidth in actions per dimension.
+    pub(crate) fn radii(&self, lower_bound: &[i32], upper_bound: &[i32]) -> Vec<f64> {
+        lower_bound
+            .iter()
+            .zip(upper_bound)
+            .map(|(&low, &high)| self.bandwidth * (high as f64 - low as f64).max(1.0))
+            .collect()
+    }
+
+    // Epanechnikov kernel of a squared distance in units of the bandwidth.
+    pub(crate) fn kernel(squared_distance: f64) -> f64 {
+        (1.0 - squared_distance).max(0.0)
+    }
+}
+
+#[cfg(test)]
+mod tests {
+    use super::*;
+
+    #[test]
+    fn test_smoothing_radii() {
+        let smoothing = Smoothing { bandwidth: 0.1 };
+        assert_eq!(
+            smoothing.radii(&[0, -50, 3], &[10, 50, 3]),
+            vec![1.0, 10.0, 0.1]
+        );
+        assert_eq!(Smoothing::kernel(0.0), 1.0);
+        assert_eq!(Smoothing::kernel(0.75), 0.25);
+        assert_eq!(Smoothing::kernel(1.0), 0.0);
+    }
+
+    #[test]
+    #[should_panic = "bandwidth must be in (0, 1]"]
+    fn test_panic_on_invalid_bandwidth() {
+        Smoothing { bandwidth: 0.0 }.validate();
+    }
+}
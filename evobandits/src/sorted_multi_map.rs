@@ -13,7 +13,8 @@
 // limitations under the License.
 
 use std::cmp::Ordering;
-use std::collections::BTreeMap;
+use std::collections::{BTreeMap, HashMap};
+use std::hash::Hash;
 
 #[derive(Debug, PartialEq, PartialOrd, Clone, Copy)]
 pub(crate) struct FloatKey(f64);
@@ -25,6 +26,10 @@ impl FloatKey {
         }
         FloatKey(value)
     }
+
+    pub fn value(&self) -> f64 {
+        self.0
+    }
 }
 
 impl Eq for FloatKey {}
@@ -36,44 +41,94 @@ impl Ord for FloatKey {
     }
 }
 
+// Values are ordered by their key, and values with equal keys by insertion. Each value is stored
+// at most once, so that it can be located by its insertion sequence number, and deleting a value
+// takes O(log n) time even if many values share a key.
 #[derive(Debug, PartialEq, Clone)]
-pub(crate) struct SortedMultiMap<K: Ord, V: PartialEq> {
-    inner: BTreeMap<K, Vec<V>>,
+pub(crate) struct SortedMultiMap<K: Ord + Copy, V: Eq + Hash + Copy> {
+    inner: BTreeMap<(K, u64), V>,
+    sequence: HashMap<V, u64>,
+    next_sequence: u64,
 }
 
-impl<K: Ord, V: PartialEq> SortedMultiMap<K, V> {
+impl<K: Ord + Copy, V: Eq + Hash + Copy> SortedMultiMap<K, V> {
     pub fn new() -> Self {
         SortedMultiMap {
             inner: BTreeMap::new(),
+            sequence: HashMap::new(),
+            next_sequence: 0,
         }
     }
 
     pub fn insert(&mut self, key: K, value: V) {
-        self.inner.entry(key).or_insert_with(Vec::new).push(value);
+        if self.sequence.insert(value, self.next_sequence).is_some() {
+            panic!("SortedMultiMap cannot store a value twice");
+        }
+        self.inner.insert((key, self.next_sequence), value);
+        self.next_sequence += 1;
     }
 
     pub fn delete(&mut self, key: &K, value: &V) -> bool {
-        if let Some(values) = self.inner.get_mut(key) {
-            if let Some(pos) = values.iter().position(|v| v == value) {
-                values.remove(pos);
-                if values.is_empty() {
-                    self.inner.remove(key);
-                }
-                return true;
-            }
+        let sequence = match self.sequence.get(value) {
+            Some(&sequence) => sequence,
+            None => return false,
+        };
+        if self.inner.remove(&(*key, sequence)).is_none() {
+            return false;
         }
-        false
+        self.sequence.remove(value);
+        true
     }
 
     pub fn iter(&self) -> impl Iterator<Item = (&K, &V)> {
+        self.inner.iter().map(|((key, _), value)| (key, value))
+    }
+
+    pub fn iter_rev(&self) -> impl Iterator<Item = (&K, &V)> {
         self.inner
             .iter()
-            .flat_map(|(key, values)| values.iter().map(move |value| (key, value)))
+            .rev()
+            .map(|((key, _), value)| (key, value))
     }
 
     pub fn is_empty(&self) -> bool {
         self.inner.is_empty()
     }
+
+    // Returns the entries in order, with their insertion sequence numbers, and the next sequence
+    // number, so that the map can be restored exactly with `from_entries`.
+    pub fn entries(&self) -> (impl Iterator<Item = (&K, u64, &V)>, u64) {
+        let entries = self
+            .inner
+            .iter()
+            .map(|((key, sequence), value)| (key, *sequence, value));
+        (entries, self.next_sequence)
+    }
+
+    pub fn from_entries(entries: Vec<(K, u64, V)>, next_sequence: u64) -> Self {
+        let mut sequence_of: HashMap<V, u64> = HashMap::with_capacity(entries.len());
+        for &(_key, sequence, value) in &entries {
+            if sequence >= next_sequence {
+                panic!(
+                    "Invalid data: sequence number {} is out of range.",
+                    sequence
+                );
+            }
+            if sequence_of.insert(value, sequence).is_some() {
+                panic!("SortedMultiMap cannot store a value twice");
+            }
+        }
+        // Collecting builds the tree in bulk, which is faster than inserting one entry at a time
+        let inner: BTreeMap<(K, u64), V> = entries
+            .into_iter()
+            .map(|(key, sequence, value)| ((key, sequence), value))
+            .collect();
+        SortedMultiMap {
+            inner,
+            sequence: sequence_of,
+            next_sequence,
+        }
+    }
 }
 
 #[cfg(test)]
@@ -112,6 +167,47 @@ mod tests {
         assert_eq!(iter.next(), None);
     }
 
+    #[test]
+    fn test_sorted_multi_map_iter_rev() {
+        let mut map = SortedMultiMap::new();
+        map.insert(FloatKey::new(1.0), 1);
+        map.insert(FloatKey::new(1.0), 2);
+        map.insert(FloatKey::new(2.0), 3);
+
+        let mut iter = map.iter_rev();
+
+        assert_eq!(iter.next(), Some((&FloatKey::new(2.0), &3)));
+        assert_eq!(iter.next(), Some((&FloatKey::new(1.0), &2)));
+        assert_eq!(iter.next(), Some((&FloatKey::new(1.0), &1)));
+        assert_eq!(iter.next(), None);
+    }
+
+    #[test]
+    fn test_sorted_multi_map_delete_among_equal_keys() {
+        let mut map = SortedMultiMap::new();
+        for value in 0..1000 {
+            map.insert(FloatKey::new(0.0), value);
+        }
+
+        // Deleting and re-inserting a value moves it behind the values with equal keys
+        assert!(map.delete(&FloatKey::new(0.0), &500));
+        assert!(!map.delete(&FloatKey::new(1.0), &501));
+        map.insert(FloatKey::new(0.0), 500);
+        let values: Vec<i32> = map.iter().map(|(_key, value)| *value).collect();
+        assert_eq!(values.len(), 1000);
+        assert_eq!(values[499], 499);
+        assert_eq!(values[500], 501);
+        assert_eq!(values[999], 500);
+    }
+
+    #[test]
+    #[should_panic(expected = "cannot store a value twice")]
+    fn test_sorted_multi_map_panics_on_duplicate_value() {
+        let mut map = SortedMultiMap::new();
+        map.insert(FloatKey::new(1.0), 1);
+        map.insert(FloatKey::new(2.0), 1);
+    }
+
     #[test]
     fn test_sorted_multi_map_is_empty() {
         let mut map = SortedMultiMap::new();
@@ -122,4 +218,18 @@ mod tests {
         map.delete(&FloatKey::new(1.0), &1);
         assert!(map.is_empty());
     }
+
+    #[test]
+    fn test_sorted_multi_map_from_entries() {
+        let mut map = SortedMultiMap::new();
+        map.insert(2, 'a');
+        map.insert(1, 'b');
+        map.insert(2, 'c');
+        map.delete(&1, &'b');
+
+        let (entries, next_sequence) = map.entries();
+        let entries: Vec<(i32, u64, char)> = entries.map(|(k, s, v)| (*k, s, *v)).collect();
+        let restored = SortedMultiMap::from_entries(entries, next_sequence);
+        assert_eq!(restored, map);
+    }
 }
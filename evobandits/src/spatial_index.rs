@@ -0,0 +1,192 @@
+// Copyright 2025 EvoBandits
+//
+// Licensed under the Apache License, Version 2.0 (the "License");
+// you may not use this file except in compliance with the License.
+// You may obtain a copy of the License at
+//
+//     http://www.apache.org/licenses/LICENSE-2.0
+//
+// Unless required by applicable law or agreed to in writing, software
+// distributed under the License is distributed on an "AS IS" BASIS,
+// WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+// See the License for the specific language governing permissions and
+// limitations under the License.
+
+use std::collections::HashMap;
+
+// Spatial index of the arms by their action vectors, for queries of the arms within a radius per
+// dimension. Each action vector is hashed to a cell of a grid over the integer lattice, whose cells
+// are at least as wide as the radius, so that all neighbours are found in the adjacent cells.
+// The arms of each cell are kept sorted, so that equal contents have equal indexes.
+#[derive(Debug, PartialEq, Clone)]
+pub(crate) struct SpatialIndex {
+    radii: Vec<f64>,
+    cell_widths: Vec<i32>,
+    cells: HashMap<Vec<i32>, Vec<i32>>,
+}
+
+impl SpatialIndex {
+    pub fn new(radii: Vec<f64>) -> Self {
+        let cell_widths = radii
+            .iter()
+            .map(|&radius| (radius.ceil() as i32).max(1))
+            .collect();
+        SpatialIndex {
+            radii,
+            cell_widths,
+            cells: HashMap::new(),
+        }
+    }
+
+    fn cell(&self, action_vector: &[i32]) -> Vec<i32> {
+        action_vector
+            .iter()
+            .zip(&self.cell_widths)
+            .map(|(&x, &width)| x.div_euclid(width))
+            .collect()
+    }
+
+    pub fn insert(&mut self, action_vector: &[i32], arm_index: i32) {
+        let arms = self.cells.entry(self.cell(action_vector)).or_default();
+        if let Err(position) = arms.binary_search(&arm_index) {
+            arms.insert(position, arm_index);
+        }
+    }
+
+    pub fn remove(&mut self, action_vector: &[i32], arm_index: i32) {
+        let cell = self.cell(action_vector);
+        if let Some(arms) = self.cells.get_mut(&cell) {
+            if let Ok(position) = arms.binary_search(&arm_index) {
+                arms.remove(position);
+            }
+            if arms.is_empty() {
+                self.cells.remove(&cell);
+            }
+        }
+    }
+
+    // Returns the arms within the radii of the action vector, as pairs of the arm index and the
+    // squared distance in units of the radii, i.e. at most 1.0, ordered by arm index. The action
+    // vector of an arm is looked up with action_vector_of.
+    pub fn neighbors<'a, F: Fn(i32) -> &'a [i32]>(
+        &self,
+        action_vector: &[i32],
+        action_vector_of: F,
+    ) -> Vec<(i32, f64)> {
+        let cell = self.cell(action_vector);
+        let dimension = cell.len();
+        let mut candidates: Vec<i32> = Vec::new();
+
+        // Visit the 3^d adjacent cells, or all occupied cells if there are fewer of them
+        let n_adjacent = 3usize.checked_pow(dimension as u32);
+        if n_adjacent.is_some_and(|n_adjacent| n_adjacent <= self.cells.len()) {
+            let mut offsets = vec![-1; dimension];
+            let mut key = vec![0; dimension];
+            loop {
+                for i in 0..dimension {
+                    key[i] = cell[i].wrapping_add(offsets[i]);
+                }
+                if let Some(arms) = self.cells.get(&key) {
+                    candidates.extend(arms);
+                }
+
+                // Advance the offsets like an odometer
+                let mut i = 0;
+                while i < dimension && offsets[i] == 1 {
+                    offsets[i] = -1;
+                    i += 1;
+                }
+                if i == dimension {
+                    break;
+                }
+                offsets[i] += 1;
+            }
+        } else {
+            for (other, arms) in &self.cells {
+                if other
+                    .iter()
+                    .zip(&cell)
+                    .all(|(&a, &b)| (a as i64 - b as i64).abs() <= 1)
+                {
+                    candidates.extend(arms);
+                }
+            }
+        }
+
+        // Sort, since the order of the cells is arbitrary
+        candidates.sort_unstable();
+        candidates
+            .into_iter()
+            .filter_map(|arm_index| {
+                let distance: f64 = action_vector_of(arm_index)
+                    .iter()
+                    .zip(action_vector)
+                    .zip(&self.radii)
+                    .map(|((&a, &b), &radius)| ((a as f64 - b as f64) / radius).powi(2))
+                    .sum();
+                (distance <= 1.0).then_some((arm_index, distance))
+            })
+            .collect()
+    }
+}
+
+#[cfg(test)]
+mod tests {
+    use super::*;
+    use rand::rngs::StdRng;
+    use rand::{Rng, SeedableRng};
+
+    fn brute_force(points: &[Vec<i32>], action_vector: &[i32], radii: &[f64]) -> Vec<i32> {
+        (0..points.len() as i32)
+            .filter(|&i| {
+                points[i as usize]
+                    .iter()
+                    .zip(action_vector)
+                    .zip(radii)
+                    .map(|((&a, &b), &radius)| ((a - b) as f64 / radius).powi(2))
+                    .sum::<f64>()
+                    <= 1.0
+            })
+            .collect()
+    }
+
+    #[test]
+    fn test_neighbors_match_brute_force() {
+        let mut rng = StdRng::seed_from_u64(42);
+        // Few dimensions visit the adjacent cells, many dimensions scan the occupied cells
+        for (dimension, n_points) in [(1, 50), (2, 500), (7, 200)] {
+            let radii: Vec<f64> = (0..dimension).map(|i| 1.5 + i as f64).collect();
+            let points: Vec<Vec<i32>> = (0..n_points)
+                .map(|_| (0..dimension).map(|_| rng.random_range(-10..10)).collect())
+                .collect();
+            let mut index = SpatialIndex::new(radii.clone());
+            for (i, point) in points.iter().enumerate() {
+                index.insert(point, i as i32);
+            }
+
+            for point in points.iter().take(20) {
+                let neighbors = index.neighbors(point, |i| &points[i as usize]);
+                let arm_indexes: Vec<i32> = neighbors.iter().map(|&(i, _)| i).collect();
+                assert_eq!(arm_indexes, brute_force(&points, point, &radii));
+                assert!(neighbors.iter().all(|&(_, distance)| distance <= 1.0));
+            }
+        }
+    }
+
+    #[test]
+    fn test_remove() {
+        let points = vec![vec![0, 0], vec![1, 0], vec![5, 5]];
+        let mut index = SpatialIndex::new(vec![2.0, 2.0]);
+        for (i, point) in points.iter().enumerate() {
+            index.insert(point, i as i32);
+        }
+
+        index.remove(&points[1], 1);
+        index.remove(&points[2], 2);
+        assert_eq!(
+            index.neighbors(&[0, 1], |i| &points[i as usize]),
+            vec![(0, 0.25)]
+        );
+        assert_eq!(index.cells.len(), 1);
+    }
+}
@@ -0,0 +1,160 @@
+// Copyright 2025 EvoBandits
+//
+// Licensed under the Apache License, Version 2.0 (the "License");
+// you may not use this file except in compliance with the License.
+// You may obtain a copy of the License at
+//
+//     http://www.apache.org/licenses/LICENSE-2.0
+//
+// Unless required by applicable law or agreed to in writing, software
+// distributed under the License is distributed on an "AS IS" BASIS,
+// WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+// See the License for the specific language governing permissions and
+// limitations under the License.
+
+use crate::arm::Arm;
+use crate::codec::{Decoder, Encoder};
+
+pub const SURROGATE_NEIGHBORS_DEFAULT: usize = 5;
+
+// Surrogate model that screens the offspring of a generation before they are evaluated. Each
+// generation breeds `oversampling` times as many offspring as usual, and only the most promising
+// ones are evaluated, so that the budget of trials is spent on fewer obviously poor offspring.
+//
+// The sample average of an offspring is predicted with a k-nearest-neighbours regression over the
+// arm memory: the inverse-distance weighted mean of the sample averages of its `n_neighbors`
+// nearest arms, with the distance in each dimension scaled by the range of its bounds. The arm
+// memory is the training data, so the model is updated with every evaluation for free, and
+// offspring that match a known arm are ranked by its sample average.
+//
+// Source: Jin, Y. (2011) ‘Surrogate-assisted evolutionary computation: Recent advances and future
+// challenges’, Swarm and Evolutionary Computation, 1(2), pp. 61–70.
+#[derive(Debug, PartialEq, Clone, Copy)]
+pub struct Surrogate {
+    pub n_neighbors: usize,
+    pub oversampling: usize,
+}
+
+impl Surrogate {
+    pub fn new(oversampling: usize) -> Self {
+        Surrogate {
+            n_neighbors: SURROGATE_NEIGHBORS_DEFAULT,
+            oversampling,
+        }
+    }
+
+    pub fn validate(&self) {
+        if self.n_neighbors == 0 {
+            panic!("The surrogate's n_neighbors cannot be 0");
+        }
+        if self.oversampling == 0 {
+            panic!("The surrogate's oversampling cannot be 0");
+        }
+    }
+
+    pub(crate) fn encode(&self, encoder: &mut Encoder) {
+        encoder.usize(self.n_neighbors);
+        encoder.usize(self.oversampling);
+    }
+
+    pub(crate) fn decode(decoder: &mut Decoder) -> Self {
+        Surrogate {
+            n_neighbors: decoder.usize(),
+            oversampling: decoder.usize(),
+        }
+    }
+
+    // Predicts the sample average of each action vector from the arms. The scales are the ranges
+    // of the dimensions, which normalize the distances.
+    pub(crate) fn predict(
+        &self,
+        arms: &[Arm],
+        scales: &[f64],
+        action_vectors: &[&[i32]],
+    ) -> Vec<f64> {
+        // The distances to all arms, reused for each action vector
+        let mut neighbors: Vec<(f64, f64)> = Vec::with_capacity(arms.len());
+        action_vectors
+            .iter()
+            .map(|action_vector| {
+                neighbors.clear();
+                neighbors.extend(arms.iter().map(|arm| {
+                    let distance: f64 = arm
+                        .get_action_vector()
+                        .iter()
+                        .zip(action_vector.iter())
+                        .zip(scales)
+                        .map(|((&a, &b), &scale)| ((a - b) as f64 / scale).powi(2))
+                        .sum();
+                    (distance.sqrt(), arm.get_value())
+                }));
+                self.weighted_mean(&mut neighbors)
+            })
+            .collect()
+    }
+
+    // Returns the inverse-distance weighted mean of the values of the nearest neighbors.
+    fn weighted_mean(&self, neighbors: &mut [(f64, f64)]) -> f64 {
+        let k = self.n_neighbors.min(neighbors.len());
+        if k == 0 {
+            return 0.0;
+        }
+        if k < neighbors.len() {
+            neighbors.select_nth_unstable_by(k - 1, |a, b| a.0.total_cmp(&b.0));
+        }
+
+        let mut total_weight = 0.0;
+        let mut total = 0.0;
+        for &(distance, value) in &neighbors[..k] {
+            if distance == 0.0 {
+                return value;
+            }
+            total_weight += 1.0 / distance;
+            total += value / distance;
+        }
+        total / total_weight
+    }
+}
+
+#[cfg(test)]
+mod tests {
+    use super::*;
+
+    fn arm(action_vector: &[i32], value: f64) -> Arm {
+        Arm::with_stats(action_vector, (1, value, 0.0))
+    }
+
+    #[test]
+    fn test_surrogate_predict() {
+        let arms = vec![arm(&[0, 0], 0.0), arm(&[10, 0], 10.0), arm(&[0, 10], 4.0)];
+        let surrogate = Surrogate {
+            n_neighbors: 2,
+            oversampling: 2,
+        };
+        let scales = vec![10.0, 10.0];
+
+        let predictions = surrogate.predict(&arms, &scales, &[&[0, 0], &[8, 0], &[5, 0]]);
+        assert_eq!(predictions[0], 0.0); // a known arm
+        assert!((predictions[1] - 8.0).abs() < 1e-9); // weights 1/0.8 and 1/0.2
+        assert!((predictions[2] - 5.0).abs() < 1e-9); // the arm at [0, 10] is not a neighbor
+
+        // Without arms, nothing is known
+        assert_eq!(surrogate.predict(&[], &scales, &[&[1, 1]]), vec![0.0]);
+    }
+
+    #[test]
+    #[should_panic = "n_neighbors cannot be 0"]
+    fn test_panic_on_invalid_n_neighbors() {
+        Surrogate {
+            n_neighbors: 0,
+            oversampling: 2,
+        }
+        .validate();
+    }
+
+    #[test]
+    #[should_panic = "oversampling cannot be 0"]
+    fn test_panic_on_invalid_oversampling() {
+        Surrogate::new(0).validate();
+    }
+}
@@ -11,6 +11,6 @@ if __name__ == "__main__":
         "max_iter": (100, 200),
         "random_state": (0, 100),
     }
-    clf = EvoBanditsSearchCV(logistic, distributions)
+    clf = EvoBanditsSearchCV(logistic, distributions, seed=42)
     search = clf.fit(iris.data, iris.target)
     print(search.best_params_)
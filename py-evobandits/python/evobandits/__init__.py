@@ -12,12 +12,26 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import importlib
 import importlib.util
+from typing import TYPE_CHECKING, Any
 
 from evobandits import logging
-from evobandits.evobandits import GMAB, Arm
+from evobandits.constraints import LinearConstraint
+from evobandits.evobandits import GMAB, Arm, MultiObjectiveArm
 from evobandits.params import CategoricalParam, FloatParam, IntParam
-from evobandits.study import ALGORITHM_DEFAULT, Study
+from evobandits.storages import InMemoryStorage
+from evobandits.study import ALGORITHM_DEFAULT, Results, Study
+
+if TYPE_CHECKING:
+    from evobandits.search import EvoBanditsSearchCV  # noqa: F401
+    from evobandits.storages import SQLiteStorage
+
+# Attributes that require heavy imports are only loaded on first access, see __getattr__
+_LAZY_ATTRIBUTES = {
+    "EvoBanditsSearchCV": "evobandits.search",
+    "SQLiteStorage": "evobandits.storages.sqlite_storage",
+}
 
 __all__ = [
     "Arm",
@@ -28,10 +42,32 @@ __all__ = [
     "CategoricalParam",
     "FloatParam",
     "IntParam",
+    "LinearConstraint",
+    "MultiObjectiveArm",
+    "Results",
+    "InMemoryStorage",
+    "SQLiteStorage",
 ]
 
 if importlib.util.find_spec("sklearn") is not None:
-    # Only import and expose EvoBanditsSearchCV if sklearn is available
-    from evobandits.search import EvoBanditsSearchCV  # noqa
-
+    # Only expose EvoBanditsSearchCV if sklearn is available
     __all__.append("EvoBanditsSearchCV")
+
+
+def __getattr__(name: str) -> Any:
+    if name not in _LAZY_ATTRIBUTES:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    try:
+        module = importlib.import_module(_LAZY_ATTRIBUTES[name])
+    except ImportError as exc:
+        raise AttributeError(f"{name} requires an optional dependency: {exc}") from exc
+
+    # Cache the attribute, so that __getattr__ is only called on first access
+    value = getattr(module, name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted(set(globals()) | set(__all__))
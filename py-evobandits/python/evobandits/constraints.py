@@ -0,0 +1,86 @@
+# Copyright 2025 EvoBandits
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from collections.abc import Mapping
+
+from evobandits.params import BaseParam
+
+
+class LinearConstraint:
+    """
+    A linear constraint over the parameters of a Study.
+
+    The constraint `sum(coefficients[name] * value) <= upper_bound` is checked on the encoded
+    values of the parameters, i.e., the actions of the optimization algorithm. These equal the
+    values of an IntParam, and the indexes of the choices of a CategoricalParam. The check runs in
+    the optimization algorithm, so infeasible solutions are discarded before any evaluation.
+    """
+
+    def __init__(self, coefficients: Mapping[str, float], upper_bound: float) -> None:
+        """
+        Creates a LinearConstraint.
+
+        Args:
+            coefficients: A mapping of parameter names to their coefficients. The coefficient of
+                a parameter with size > 1 applies to each of its values.
+            upper_bound: The upper bound of the weighted sum.
+
+        Raises:
+            TypeError: If coefficients is not a mapping of str to numbers, or if upper_bound is
+                not a number.
+
+        Example:
+        >>> constraint = LinearConstraint({"n_clusters": 1, "batch_size": -1}, upper_bound=0)
+        >>> print(constraint)
+        LinearConstraint(coefficients={'n_clusters': 1, 'batch_size': -1}, upper_bound=0)
+        """
+        if not isinstance(coefficients, Mapping):
+            raise TypeError(f"coefficients must be a mapping, got {type(coefficients)}.")
+        for name, coefficient in coefficients.items():
+            if not isinstance(name, str):
+                raise TypeError(f"Parameter key must be str, got {type(name)}.")
+            if isinstance(coefficient, bool) or not isinstance(coefficient, int | float):
+                raise TypeError(f"Coefficient of '{name}' must be a number, got {coefficient}.")
+        if isinstance(upper_bound, bool) or not isinstance(upper_bound, int | float):
+            raise TypeError(f"upper_bound must be a number, got {type(upper_bound)}.")
+
+        self.coefficients: dict[str, float] = dict(coefficients)
+        self.upper_bound: float = upper_bound
+
+    def __repr__(self) -> str:
+        return (
+            f"LinearConstraint(coefficients={self.coefficients}, upper_bound={self.upper_bound})"
+        )
+
+    def encode(self, params: Mapping[str, BaseParam]) -> tuple[list[float], float]:
+        """
+        Encodes the constraint over the action vector of the given parameters.
+
+        Args:
+            params: The parameters of the Study.
+
+        Returns:
+            The coefficients for each dimension of the action vector, and the upper bound.
+
+        Raises:
+            ValueError: If the constraint refers to an unknown parameter.
+        """
+        unknown = set(self.coefficients) - set(params)
+        if unknown:
+            raise ValueError(f"LinearConstraint refers to unknown parameters: {sorted(unknown)}.")
+
+        coefficients = []
+        for name, param in params.items():
+            coefficients.extend([float(self.coefficients.get(name, 0.0))] * param.size)
+        return coefficients, float(self.upper_bound)
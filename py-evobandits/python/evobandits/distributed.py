@@ -0,0 +1,387 @@
+# Copyright 2025 EvoBandits
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Coordinator and workers to distribute the evaluations of a Study across processes and nodes.
+
+The coordinator process runs the Study and owns the optimization state, while workers connect to
+it over a local TCP or Unix socket, evaluate the trials they receive and stream results back.
+
+Example:
+    On the coordinator:
+    >>> with Coordinator(("0.0.0.0", 6000), authkey=b"secret") as coordinator:
+    ...     study.optimize(objective, params, n_trials=10_000, executor=coordinator)
+
+    On each worker (the objective must be importable there):
+    $ EVOBANDITS_AUTHKEY=secret python -m evobandits.distributed coordinator-host 6000
+"""
+
+import argparse
+import ipaddress
+import os
+import secrets
+import socket
+import threading
+from collections import deque
+from collections.abc import Callable
+from concurrent.futures import Executor, Future
+from multiprocessing import AuthenticationError
+from multiprocessing.connection import Client, Connection, answer_challenge, deliver_challenge
+from typing import Any
+
+from evobandits import logging
+
+_logger = logging.get_logger(__name__)
+
+_STOP = None  # Message that tells a worker to shut down
+
+MAX_ATTEMPTS_DEFAULT = 3
+HANDSHAKE_TIMEOUT_DEFAULT = 10.0
+
+_ACCEPT_POLL_INTERVAL = 0.1  # Seconds between checks for shutdown while accepting workers
+
+
+def _is_loopback(address: tuple[str, int] | str) -> bool:
+    """Returns whether only the local host can reach the address, e.g., a Unix socket."""
+    if not isinstance(address, tuple):
+        return True
+    host = address[0]
+    if host == "localhost":
+        return True
+    try:
+        return ipaddress.ip_address(host).is_loopback
+    except ValueError:
+        return False  # A host name, which might resolve to any interface
+
+
+def _abort(conn: Connection) -> None:
+    """Shuts down the socket of a connection, which wakes up a thread that is blocked on it."""
+    try:
+        with socket.socket(fileno=os.dup(conn.fileno())) as sock:
+            sock.shutdown(socket.SHUT_RDWR)
+    except OSError:
+        pass  # The connection is already closed.
+
+
+class Coordinator(Executor):
+    """
+    An executor that hands out trials to remote workers.
+
+    Trials are submitted like to any `concurrent.futures.Executor`, and evaluated by the workers
+    that are connected to the coordinator. Each worker evaluates one trial at a time, so the
+    throughput scales with the number of workers. If a worker disconnects, its trial is reissued
+    to the next available worker, until it fails after `max_attempts` disconnects, e.g., if it
+    crashes every worker that evaluates it.
+
+    Workers always authenticate, since the messages of a connection are unpickled, which would
+    allow any peer to run code in the coordinator process otherwise. Each connection
+    authenticates on its own thread, and is closed if it does not complete the handshake within
+    `handshake_timeout`, so that a peer that never answers cannot keep other workers out.
+    """
+
+    def __init__(
+        self,
+        address: tuple[str, int] | str = ("localhost", 0),
+        authkey: bytes | None = None,
+        family: str | None = None,
+        max_attempts: int = MAX_ATTEMPTS_DEFAULT,
+        handshake_timeout: float = HANDSHAKE_TIMEOUT_DEFAULT,
+    ) -> None:
+        """
+        Creates a Coordinator that listens for workers at the given address.
+
+        Args:
+            address: A (host, port) tuple for TCP, or a path for a Unix socket. Defaults to a
+                free port on localhost.
+            authkey: The key that workers use to authenticate. Defaults to None (a random key,
+                see `authkey`), which is only allowed on loopback addresses and Unix sockets.
+            family: The type of socket, 'AF_INET' or 'AF_UNIX'. Defaults to None (inferred
+                from the address).
+            max_attempts: The number of workers a trial is sent to, before it fails since each
+                of them disconnected. Default is 3.
+            handshake_timeout: The number of seconds a worker may take to authenticate, before
+                its connection is closed. Default is 10.
+
+        Raises:
+            TypeError: If max_attempts is not an int.
+            ValueError: If the address is reachable from other hosts, but no authkey is given,
+                if max_attempts is smaller than 1, or if handshake_timeout is not positive.
+        """
+        if authkey is None:
+            if not _is_loopback(address):
+                raise ValueError(
+                    f"A Coordinator that listens on {address!r} requires an authkey, since any "
+                    f"host that can reach it could run code in the coordinator otherwise."
+                )
+            authkey = secrets.token_bytes(32)
+        if isinstance(max_attempts, bool) or not isinstance(max_attempts, int):
+            raise TypeError(f"max_attempts must be an int, got {type(max_attempts)}.")
+        if max_attempts < 1:
+            raise ValueError(f"max_attempts must be at least 1, got {max_attempts}.")
+        if handshake_timeout <= 0:
+            raise ValueError(f"handshake_timeout must be positive, got {handshake_timeout}.")
+        self._max_attempts = max_attempts
+        self._handshake_timeout = handshake_timeout
+
+        # A plain socket, since a multiprocessing Listener authenticates on the accepting thread
+        if family is None:
+            family = "AF_INET" if isinstance(address, tuple) else "AF_UNIX"
+        self._socket = socket.socket(getattr(socket, family), socket.SOCK_STREAM)
+        if family == "AF_INET":
+            self._socket.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+        self._socket.bind(address)
+        self._socket.listen()
+        self._socket.settimeout(_ACCEPT_POLL_INTERVAL)
+        self._address = self._socket.getsockname()
+        self._family = family
+        self._authkey = authkey
+
+        self._tasks: deque = deque()
+        self._condition = threading.Condition()
+        self._shutdown = False
+        self._workers: list[threading.Thread] = []
+
+        self._accept_thread = threading.Thread(target=self._accept, daemon=True)
+        self._accept_thread.start()
+
+    @property
+    def address(self) -> tuple[str, int] | str:
+        """The address that workers connect to."""
+        return self._address
+
+    @property
+    def authkey(self) -> bytes:
+        """The key that workers authenticate with, e.g., to pass a random key to run_worker."""
+        return self._authkey
+
+    @property
+    def n_workers(self) -> int:
+        """The number of workers that are currently connected."""
+        with self._condition:
+            return sum(thread.is_alive() for thread in self._workers)
+
+    def _accept(self) -> None:
+        """Accepts incoming connections until shutdown, and authenticates each one separately."""
+        while not self._shutdown:
+            try:
+                sock, _ = self._socket.accept()
+            except TimeoutError:
+                continue
+            except OSError:
+                return  # The socket was closed.
+            sock.setblocking(True)
+            conn = Connection(sock.detach())
+            threading.Thread(target=self._authenticate, args=(conn,), daemon=True).start()
+
+    def _authenticate(self, conn: Connection) -> None:
+        """Authenticates a worker within the handshake timeout, and then serves it."""
+        timed_out = threading.Event()
+
+        def abort() -> None:
+            timed_out.set()
+            _abort(conn)
+
+        timer = threading.Timer(self._handshake_timeout, abort)
+        timer.start()
+        try:
+            deliver_challenge(conn, self._authkey)
+            answer_challenge(conn, self._authkey)
+            authenticated = True
+        except (AuthenticationError, OSError, EOFError):
+            authenticated = False
+        timer.cancel()
+        timer.join()
+
+        if not authenticated or timed_out.is_set():
+            reason = "timed out" if timed_out.is_set() else "failed"
+            _logger.warning(f"A worker's authentication {reason}, and it was rejected.")
+            conn.close()
+            return
+
+        with self._condition:
+            if self._shutdown:
+                conn.close()
+                return
+            thread = threading.Thread(target=self._serve, args=(conn,), daemon=True)
+            self._workers.append(thread)
+            thread.start()
+
+    def _next_task(self) -> tuple | None:
+        """Blocks until a task is available, or returns None once the coordinator shuts down."""
+        with self._condition:
+            while not self._tasks and not self._shutdown:
+                self._condition.wait()
+            if self._tasks:
+                return self._tasks.popleft()
+            return _STOP
+
+    def _serve(self, conn: Connection) -> None:
+        """Sends tasks to a single worker and collects its results."""
+        _logger.debug("Worker connected.")
+        with conn:
+            while True:
+                task = self._next_task()
+                if task is _STOP:
+                    try:
+                        conn.send(_STOP)
+                    except OSError:
+                        pass
+                    return
+
+                future, fn, args, kwargs, n_attempts = task
+                # Reissued tasks are already running, and new tasks might have been cancelled.
+                if not future.running() and not future.set_running_or_notify_cancel():
+                    continue
+
+                try:
+                    conn.send((fn, args, kwargs))
+                    success, result = conn.recv()
+                except (OSError, EOFError):
+                    n_attempts += 1
+                    if n_attempts >= self._max_attempts:
+                        _logger.warning(
+                            f"Worker disconnected. Its trial failed {n_attempts} times."
+                        )
+                        future.set_exception(
+                            RuntimeError(
+                                f"The trial was sent to {n_attempts} workers, which all "
+                                f"disconnected before returning a result."
+                            )
+                        )
+                        return
+                    _logger.warning("Worker disconnected. Its trial is reissued.")
+                    with self._condition:
+                        self._tasks.appendleft((future, fn, args, kwargs, n_attempts))
+                        self._condition.notify()
+                    return
+                except Exception as exc:  # e.g., if the task cannot be pickled
+                    future.set_exception(exc)
+                    continue
+
+                if success:
+                    future.set_result(result)
+                else:
+                    future.set_exception(result)
+
+    def submit(self, fn: Callable, /, *args: Any, **kwargs: Any) -> Future:
+        """
+        Schedules `fn(*args, **kwargs)` to be evaluated by one of the workers.
+
+        Args:
+            fn: The callable to evaluate. It must be importable by the workers.
+            *args: Positional arguments for fn.
+            **kwargs: Keyword arguments for fn.
+
+        Returns:
+            A Future that represents the result of the evaluation.
+
+        Raises:
+            RuntimeError: If the coordinator has already been shut down.
+        """
+        future: Future = Future()
+        with self._condition:
+            if self._shutdown:
+                raise RuntimeError("Cannot submit new trials after shutdown.")
+            self._tasks.append((future, fn, args, kwargs, 0))
+            self._condition.notify()
+        return future
+
+    def shutdown(self, wait: bool = True, *, cancel_futures: bool = False) -> None:
+        """
+        Stops accepting trials, and tells the workers to shut down once all trials are done.
+
+        Args:
+            wait: Whether to block until all pending trials are evaluated. Default is True.
+            cancel_futures: Whether to cancel all trials that have not started. Default is False.
+        """
+        with self._condition:
+            if self._shutdown:
+                return
+            self._shutdown = True
+            if cancel_futures:
+                while self._tasks:
+                    future, *_ = self._tasks.popleft()
+                    future.cancel()
+            self._condition.notify_all()
+
+        # The accept thread notices the shutdown within its poll interval
+        self._accept_thread.join()
+        self._socket.close()
+        if self._family == "AF_UNIX":
+            try:
+                os.unlink(self._address)
+            except OSError:
+                pass
+
+        if wait:
+            with self._condition:
+                workers = list(self._workers)
+            for thread in workers:
+                thread.join()
+
+
+def run_worker(
+    address: tuple[str, int] | str,
+    authkey: bytes | None = None,
+    family: str | None = None,
+) -> int:
+    """
+    Connects to a Coordinator and evaluates trials until the coordinator shuts down.
+
+    Args:
+        address: The address of the coordinator.
+        authkey: The key to authenticate with the coordinator. Defaults to None.
+        family: The type of socket, 'AF_INET' or 'AF_UNIX'. Defaults to None.
+
+    Returns:
+        The number of trials that the worker has evaluated.
+    """
+    n_trials = 0
+    with Client(address, family=family, authkey=authkey) as conn:
+        while True:
+            try:
+                task = conn.recv()
+            except EOFError:
+                break  # The coordinator has gone away.
+            if task is _STOP:
+                break
+
+            fn, args, kwargs = task
+            try:
+                result = (True, fn(*args, **kwargs))
+            except Exception as exc:
+                result = (False, exc)
+
+            try:
+                conn.send(result)
+            except Exception as exc:  # e.g., if the result cannot be pickled
+                conn.send((False, RuntimeError(f"Failed to send the result: {exc!r}")))
+            n_trials += 1
+    return n_trials
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Run an EvoBandits worker.")
+    parser.add_argument("host", help="Host of the coordinator, or path of its Unix socket.")
+    parser.add_argument("port", nargs="?", type=int, help="Port of the coordinator.")
+    args = parser.parse_args()
+
+    address = args.host if args.port is None else (args.host, args.port)
+    authkey = os.environ.get("EVOBANDITS_AUTHKEY")
+    n_trials = run_worker(address, authkey.encode() if authkey else None)
+    _logger.info(f"Worker finished after {n_trials} trials.")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,128 @@
+# Copyright 2025 EvoBandits
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import math
+import os
+import tempfile
+from collections.abc import Mapping
+from typing import Any
+
+# Gauges exported per snapshot of the progress: (name, key of the progress, help text)
+_GAUGES = (
+    ("trials_used", "used_trials", "Number of trials evaluated so far."),
+    ("trials_total", "n_trials", "Number of trials of the run."),
+    ("generations", "n_generations", "Number of generations so far."),
+    ("elapsed_seconds", "elapsed", "Wall time of the run so far."),
+    ("trials_per_second", "trials_per_second", "Average throughput of the run."),
+    ("best_value", "best_value", "Sample average of the current best solution."),
+    ("best_evaluations", "best_n_evaluations", "Number of evaluations of the best solution."),
+    ("arms", "n_arms", "Number of solutions in the arm memory."),
+    ("new_arms", "n_new_arms", "Number of evaluations of new solutions."),
+    ("repulls", "n_repulls", "Number of repeated evaluations of known solutions."),
+    ("repull_ratio", "repull_ratio", "Share of repeated evaluations of known solutions."),
+)
+
+
+def _format_value(value: float) -> str:
+    """Formats a sample value, with the spelling of special values of the text format."""
+    if math.isnan(value):
+        return "NaN"
+    if math.isinf(value):
+        return "+Inf" if value > 0 else "-Inf"
+    return repr(float(value))
+
+
+def _format_labels(labels: Mapping[str, str]) -> str:
+    """Formats labels as `{name="value",...}`, with escaped values."""
+    if not labels:
+        return ""
+    escaped = (
+        (name, str(value).replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n"))
+        for name, value in labels.items()
+    )
+    return "{" + ",".join(f'{name}="{value}"' for name, value in escaped) + "}"
+
+
+def format_metrics(
+    progress: Mapping[str, Any],
+    labels: Mapping[str, str] | None = None,
+    prefix: str = "evobandits",
+) -> str:
+    """
+    Formats a snapshot of the progress of an optimization in the Prometheus text format.
+
+    Each value of the snapshot is exported as a gauge, the confidence interval of the best value
+    with a `bound` label, and the time per phase as `phase_seconds` with a `phase` label.
+
+    Args:
+        progress: A snapshot of the progress, see `Study.progress`.
+        labels: Labels added to each sample, e.g., the name of the study. Default is None.
+        prefix: The prefix of the metric names. Default is "evobandits".
+
+    Returns:
+        The metrics, one line per sample, preceded by their HELP and TYPE lines.
+    """
+    labels = dict(labels or {})
+    lines = []
+
+    def gauge(name: str, help_text: str, samples: list[tuple[dict[str, str], float]]) -> None:
+        lines.append(f"# HELP {prefix}_{name} {help_text}")
+        lines.append(f"# TYPE {prefix}_{name} gauge")
+        for extra_labels, value in samples:
+            sample_labels = _format_labels({**labels, **extra_labels})
+            lines.append(f"{prefix}_{name}{sample_labels} {_format_value(value)}")
+
+    for name, key, help_text in _GAUGES:
+        gauge(name, help_text, [({}, progress[key])])
+    lower, upper = progress["best_value_ci"]
+    gauge(
+        "best_value_ci",
+        "95% confidence interval of the best value.",
+        [({"bound": "lower"}, lower), ({"bound": "upper"}, upper)],
+    )
+    gauge(
+        "phase_seconds",
+        "Wall time spent per phase of the generations.",
+        [({"phase": phase}, seconds) for phase, seconds in progress["phase_times"].items()],
+    )
+    return "\n".join(lines) + "\n"
+
+
+def write_metrics(
+    path: str | os.PathLike, progress: Mapping[str, Any], labels: Mapping[str, str] | None = None
+) -> None:
+    """
+    Writes a snapshot of the progress to a file in the Prometheus text format.
+
+    The file is replaced atomically, so that a scraper, e.g., the textfile collector of the
+    node exporter, never reads a partially written file. It is readable by all users, since the
+    scraper usually runs as another user.
+
+    Args:
+        path: The path of the file.
+        progress: A snapshot of the progress, see `Study.progress`.
+        labels: Labels added to each sample, e.g., the name of the study. Default is None.
+    """
+    text = format_metrics(progress, labels)
+    directory = os.path.dirname(os.path.abspath(path))
+    with tempfile.NamedTemporaryFile(
+        "w", dir=directory, prefix=".evobandits-", suffix=".tmp", delete=False
+    ) as file:
+        file.write(text)
+    try:
+        os.chmod(file.name, 0o644)  # temporary files are only readable by their owner
+        os.replace(file.name, path)
+    except OSError:
+        os.unlink(file.name)
+        raise
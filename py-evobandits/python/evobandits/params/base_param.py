@@ -14,6 +14,10 @@
 
 from abc import ABC, abstractmethod
 from collections.abc import Callable
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from evobandits.evobandits import ParamSpace
 
 
 class BaseParam(ABC):
@@ -61,6 +65,19 @@ class BaseParam(ABC):
         """
         raise NotImplementedError("Subclasses must implement the 'bounds' property.")
 
+    @property
+    def strides(self) -> list[int]:
+        """
+        The initial grid stride per dimension, in units of the parameter's actions.
+
+        A stride greater than 1 starts the optimization on a coarse grid, which is refined
+        towards the full resolution over the generations.
+
+        Returns:
+            A list with one stride per dimension. Default is the full resolution, i.e. 1.
+        """
+        return [1] * self.size
+
     @abstractmethod
     def decode(self, actions: list[int]) -> bool | int | str | float | Callable | None | list:
         """
@@ -79,3 +96,30 @@ class BaseParam(ABC):
             Returns the value directly in case of `self.size` equals 1, a list of values else.
         """
         raise NotImplementedError("Subclasses must implement the 'map_to_value' method.")
+
+    def add_to(self, space: "ParamSpace") -> bool:
+        """
+        Adds the parameter to a native ParamSpace, which decodes action vectors in batches.
+
+        Parameters that cannot be described by a ParamSpace are decoded with `decode` instead.
+
+        Args:
+            space: The parameter space of a Study.
+
+        Returns:
+            True if the parameter was added to the space, False otherwise.
+        """
+        return False
+
+    def decode_columns(self, columns: list[list[float]]) -> list:
+        """
+        Converts the values that a ParamSpace decoded for a batch of action vectors.
+
+        Args:
+            columns: One column per dimension of the parameter, with the decoded value of each
+            action vector.
+
+        Returns:
+            The parameter value(s) per action vector, like `decode` returns them.
+        """
+        raise NotImplementedError("Subclasses must implement the 'decode_columns' method.")
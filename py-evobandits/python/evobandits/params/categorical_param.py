@@ -13,9 +13,13 @@
 # limitations under the License.
 
 from collections.abc import Callable
+from typing import TYPE_CHECKING
 
 from evobandits.params.base_param import BaseParam
 
+if TYPE_CHECKING:
+    from evobandits.evobandits import ParamSpace
+
 ChoiceType = bool | int | float | str | Callable | None
 
 
@@ -83,3 +87,28 @@ class CategoricalParam(BaseParam):
         if len(values) == 1:
             return values[0]
         return values
+
+    def add_to(self, space: "ParamSpace") -> bool:
+        """
+        Adds the parameter to a native ParamSpace, which decodes the index of the choice.
+
+        Args:
+            space: The parameter space of a Study.
+
+        Returns:
+            True, since categorical parameters are supported.
+        """
+        space.add_categorical(len(self.choices))
+        return True
+
+    def decode_columns(self, columns: list[list[float]]) -> list[ChoiceType]:
+        """
+        Converts the indexes that a ParamSpace decoded for a batch of action vectors.
+
+        Args:
+            columns: A single column with the decoded index of each action vector.
+
+        Returns:
+            The resulting choice per action vector.
+        """
+        return [self.choices[int(idx)] for idx in columns[0]]
@@ -13,9 +13,13 @@
 # limitations under the License.
 
 import math
+from typing import TYPE_CHECKING
 
 from evobandits.params.base_param import BaseParam
 
+if TYPE_CHECKING:
+    from evobandits.evobandits import ParamSpace
+
 
 class FloatParam(BaseParam):
     """
@@ -23,7 +27,13 @@ class FloatParam(BaseParam):
     """
 
     def __init__(
-        self, low: float, high: float, size: int = 1, n_steps: float = 100, log: bool = False
+        self,
+        low: float,
+        high: float,
+        size: int = 1,
+        n_steps: float = 100,
+        log: bool = False,
+        n_initial_steps: int | None = None,
     ) -> None:
         """
         Creates a FloatParam that will suggest float values during the optimization.
@@ -32,19 +42,26 @@ class FloatParam(BaseParam):
         size. The values sampled by the optimization will be limited to the specified granularity,
         lower and upper bounds.
 
+        A fine granularity does not need to blow up the search: with n_initial_steps, the
+        optimization starts on a coarse grid and refines it towards n_steps over the generations,
+        once the coarse grid around the best solutions is exhausted.
+
         Args:
             low: The lower bound of the suggested values.
             high: The upper bound of the suggested values.
             size: The size if the parameter shall be a list of floats. Default is 1.
             n_steps: The number of steps between low and high. Default is 100.
             log: A flag to indicate log-transformation. Default is False.
+            n_initial_steps: The number of steps of the initial, coarse grid. Default is None,
+                which searches all n_steps from the start.
 
         Returns:
             FloatParam: An instance of the parameter with the specified properties.
 
         Raises:
             ValueError: If low is not an float, if high is not an float that is greater than
-            low, or if size is not a positive integer, or if step is not a positive float.
+            low, or if size is not a positive integer, or if step is not a positive float, or if
+            n_initial_steps is not between 1 and n_steps.
 
         Example:
         >>> param = FloatParam(low=1.0, high=10.0, size=3, n_steps=100)
@@ -57,16 +74,24 @@ class FloatParam(BaseParam):
             raise ValueError("steps must be positive integer.")
         if log and low <= 0.0:
             raise ValueError("low must be greater than 0 for a log-transformation.")
+        if n_initial_steps is not None and not 1 <= n_initial_steps <= n_steps:
+            raise ValueError("n_initial_steps must be an integer between 1 and n_steps.")
 
         super().__init__(size)
         self.log: bool = bool(log)
         self.low: float = float(low)
         self.high: float = float(high)
         self.n_steps: int = int(n_steps)
+        self.n_initial_steps: int | None = (
+            None if n_initial_steps is None else int(n_initial_steps)
+        )
 
     def __repr__(self) -> str:
         repr = f"FloatParam(low={self.low}, high={self.high}, size={self.size}, "
-        repr += f"n_steps={self.n_steps}, log={self.log})"
+        repr += f"n_steps={self.n_steps}, log={self.log}"
+        if self.n_initial_steps is not None:
+            repr += f", n_initial_steps={self.n_initial_steps}"
+        repr += ")"
         return repr
 
     @property
@@ -93,6 +118,18 @@ class FloatParam(BaseParam):
         """
         return [(0, self.n_steps)] * self.size
 
+    @property
+    def strides(self) -> list[int]:
+        """
+        The initial grid stride per dimension, derived from n_initial_steps.
+
+        Returns:
+            A list with one stride per dimension.
+        """
+        if self.n_initial_steps is None:
+            return [1] * self.size
+        return [max(1, self.n_steps // self.n_initial_steps)] * self.size
+
     def decode(self, actions: list[int]) -> float | list[float]:
         """
         Decodes an action by the optimization problem to the value of the parameter.
@@ -113,3 +150,30 @@ class FloatParam(BaseParam):
         if len(values) == 1:
             return values[0]
         return values
+
+    def add_to(self, space: "ParamSpace") -> bool:
+        """
+        Adds the parameter to a native ParamSpace.
+
+        Args:
+            space: The parameter space of a Study.
+
+        Returns:
+            True, since float parameters are supported.
+        """
+        space.add_float(self.low, self.high, self.n_steps, log=self.log, size=self.size)
+        return True
+
+    def decode_columns(self, columns: list[list[float]]) -> list[float] | list[list[float]]:
+        """
+        Converts the values that a ParamSpace decoded for a batch of action vectors.
+
+        Args:
+            columns: One column of decoded values per dimension of the parameter.
+
+        Returns:
+            The resulting float value(s) per action vector.
+        """
+        if self.size == 1:
+            return list(columns[0])
+        return [list(row) for row in zip(*columns, strict=True)]
@@ -13,8 +13,13 @@
 # limitations under the License.
 
 
+from typing import TYPE_CHECKING
+
 from evobandits.params.base_param import BaseParam
 
+if TYPE_CHECKING:
+    from evobandits.evobandits import ParamSpace
+
 
 class IntParam(BaseParam):
     """
@@ -82,3 +87,30 @@ class IntParam(BaseParam):
         if len(actions) == 1:
             return actions[0]
         return actions
+
+    def add_to(self, space: "ParamSpace") -> bool:
+        """
+        Adds the parameter to a native ParamSpace.
+
+        Args:
+            space: The parameter space of a Study.
+
+        Returns:
+            True, since integer parameters are supported.
+        """
+        space.add_int(self.low, self.high, self.size)
+        return True
+
+    def decode_columns(self, columns: list[list[float]]) -> list[int] | list[list[int]]:
+        """
+        Converts the values that a ParamSpace decoded for a batch of action vectors.
+
+        Args:
+            columns: One column of decoded values per dimension of the parameter.
+
+        Returns:
+            The resulting integer value(s) per action vector.
+        """
+        if self.size == 1:
+            return [int(x) for x in columns[0]]
+        return [[int(x) for x in row] for row in zip(*columns, strict=True)]
@@ -0,0 +1,323 @@
+# Copyright 2025 EvoBandits
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+A batched objective that evaluates trials with a pool of long-lived simulator processes.
+
+Each worker process is started once, and then evaluates one trial after another, so that the
+cost to start a simulator is paid once per worker instead of once per trial. Trials and results
+are exchanged over the stdin and stdout of the worker, as frames of little-endian values:
+
+    request:  uint32 n, followed by n float64 values (the parameter values of the trial)
+    response: uint32 m, followed by m float64 values (one value per objective)
+
+The parameter values are flattened in the order of the params, followed by the seed if the Study
+has one. A worker exits once its stdin is closed. Python simulators can use `serve`. A worker
+that exits while evaluating a trial, or exceeds the `trial_timeout`, is restarted, and the trial
+is discarded, see `on_crash`.
+
+Example:
+    >>> with ProcessPool(["./simulator", "--quiet"], n_workers=8) as pool:
+    ...     study.optimize(pool, params, n_trials=10_000, batched=True)
+"""
+
+import math
+import os
+import struct
+import subprocess
+import sys
+import threading
+from collections.abc import Callable, Sequence
+from concurrent.futures import ThreadPoolExecutor
+from typing import IO, Any
+
+from evobandits import logging
+
+_logger = logging.get_logger(__name__)
+
+_HEADER = struct.Struct("<I")
+
+ON_CRASH_POLICIES = ("discard", "raise")
+
+
+def write_frame(stream: IO[bytes], values: Sequence[float]) -> None:
+    """
+    Writes a frame of float64 values to a binary stream.
+
+    Args:
+        stream: The stream to write to, e.g., the stdin of a worker.
+        values: The values to write.
+    """
+    stream.write(_HEADER.pack(len(values)) + struct.pack(f"<{len(values)}d", *values))
+    stream.flush()
+
+
+def read_frame(stream: IO[bytes]) -> list[float] | None:
+    """
+    Reads a frame of float64 values from a binary stream.
+
+    Args:
+        stream: The stream to read from, e.g., the stdout of a worker.
+
+    Returns:
+        The values of the frame, or None if the stream ended before a complete frame.
+    """
+    header = stream.read(_HEADER.size)
+    if len(header) < _HEADER.size:
+        return None
+    (n_values,) = _HEADER.unpack(header)
+    payload = stream.read(8 * n_values)
+    if len(payload) < 8 * n_values:
+        return None
+    return list(struct.unpack(f"<{n_values}d", payload))
+
+
+def _flatten(solution: dict[str, Any]) -> list[float]:
+    """Flattens the keyword arguments of a trial into a list of numbers."""
+    values: list[float] = []
+    for key, value in solution.items():
+        for v in value if isinstance(value, list | tuple) else [value]:
+            if not isinstance(v, int | float):
+                raise TypeError(
+                    f"ProcessPool only supports numeric parameter values, got {v!r} for '{key}'."
+                )
+            values.append(float(v))
+    return values
+
+
+class ProcessPool:
+    """
+    A batched objective that evaluates each generation with a pool of simulator processes.
+
+    Trials are handed out to the workers one at a time, in order, and each worker evaluates its
+    next trial as soon as it has returned a result. The processes are started on first use, and
+    stopped with `close`, or when leaving the `with` block.
+    """
+
+    def __init__(
+        self,
+        command: Sequence[str],
+        n_workers: int | None = None,
+        timeout: float = 10.0,
+        on_crash: str = "discard",
+        trial_timeout: float | None = None,
+        **popen_kwargs: Any,
+    ) -> None:
+        """
+        Creates a ProcessPool that starts its workers with the given command.
+
+        Args:
+            command: The program and its arguments, e.g., ["./simulator", "--quiet"].
+            n_workers: The number of worker processes. Defaults to None (one per CPU).
+            timeout: The number of seconds to wait for a worker to exit after its stdin was
+                closed, before it is killed. Default is 10.
+            on_crash: What happens to a trial if its worker exits while evaluating it. The worker
+                is restarted in any case. With "discard", the value of the trial is NaN, which the
+                Study discards, and with "raise", a RuntimeError aborts the batch. Default is
+                "discard".
+            trial_timeout: The number of seconds a worker may take to evaluate a trial, before it
+                is killed and handled like a crash. Default is None (no limit).
+            **popen_kwargs: Further arguments for `subprocess.Popen`, e.g., cwd or env.
+
+        Raises:
+            TypeError: If command is not a sequence of strings, or n_workers is not an int.
+            ValueError: If command is empty, n_workers is smaller than 1, on_crash is unknown, or
+                trial_timeout is not positive.
+        """
+        if isinstance(command, str) or not isinstance(command, Sequence):
+            raise TypeError(f"command must be a sequence of strings, got {type(command)}.")
+        if not command:
+            raise ValueError("command must contain at least the program to run.")
+        if not all(isinstance(arg, str) for arg in command):
+            raise TypeError(f"command must be a sequence of strings, got {command}.")
+        if n_workers is None:
+            n_workers = os.cpu_count() or 1
+        if not isinstance(n_workers, int):
+            raise TypeError(f"n_workers must be an int, got {type(n_workers)}.")
+        if n_workers < 1:
+            raise ValueError(f"n_workers must be at least 1, got {n_workers}.")
+        if on_crash not in ON_CRASH_POLICIES:
+            raise ValueError(f"on_crash must be one of {ON_CRASH_POLICIES}, got {on_crash!r}.")
+        if trial_timeout is not None and trial_timeout <= 0:
+            raise ValueError(f"trial_timeout must be positive, got {trial_timeout}.")
+
+        self.command: list[str] = list(command)
+        self.n_workers: int = n_workers
+        self.timeout: float = timeout
+        self.on_crash: str = on_crash
+        self.trial_timeout: float | None = trial_timeout
+        self._popen_kwargs = popen_kwargs
+        self._workers: list[subprocess.Popen] = []
+        self._threads: ThreadPoolExecutor | None = None
+
+    def _spawn(self) -> subprocess.Popen:
+        """Starts a worker process, and raises a RuntimeError if the command cannot be run."""
+        try:
+            return subprocess.Popen(
+                self.command, stdin=subprocess.PIPE, stdout=subprocess.PIPE, **self._popen_kwargs
+            )
+        except OSError as exc:
+            raise RuntimeError(f"Failed to start a worker with {self.command}: {exc}") from exc
+
+    def start(self) -> None:
+        """Starts the worker processes, unless they are already running."""
+        if self._workers:
+            return
+        self._workers = [self._spawn() for _ in range(self.n_workers)]
+        self._threads = ThreadPoolExecutor(max_workers=self.n_workers)
+
+    def close(self) -> None:
+        """Stops the worker processes, killing those that do not exit within the timeout."""
+        for worker in self._workers:
+            try:
+                worker.stdin.close()
+            except OSError:
+                pass
+        for worker in self._workers:
+            try:
+                worker.wait(timeout=self.timeout)
+            except subprocess.TimeoutExpired:
+                _logger.warning(f"Worker {worker.pid} did not exit and was killed.")
+                worker.kill()
+                worker.wait()
+            worker.stdout.close()
+        self._workers = []
+        if self._threads is not None:
+            self._threads.shutdown()
+            self._threads = None
+
+    def __enter__(self) -> "ProcessPool":
+        self.start()
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self.close()
+
+    def _evaluate(self, index: int, values: list[float]) -> list[float] | None:
+        """
+        Evaluates a trial with a worker, and restarts the worker if it has exited or timed out.
+
+        Returns:
+            The values of the trial, or None if the worker failed and on_crash is "discard".
+        """
+        worker = self._workers[index]
+        timed_out = threading.Event()
+
+        def kill() -> None:
+            timed_out.set()
+            worker.kill()  # which ends the blocking read
+
+        timer = None
+        if self.trial_timeout is not None:
+            timer = threading.Timer(self.trial_timeout, kill)
+            timer.start()
+        try:
+            write_frame(worker.stdin, values)
+            result = read_frame(worker.stdout)
+        except OSError:
+            result = None
+        if timer is not None:
+            timer.cancel()
+            timer.join()
+
+        # A worker that timed out right after its result is restarted, but keeps its result
+        if result is None or timed_out.is_set():
+            worker.kill()
+            returncode = worker.wait()
+            for stream in (worker.stdin, worker.stdout):
+                try:
+                    stream.close()
+                except OSError:
+                    pass
+            self._workers[index] = self._spawn()
+
+        if result is None:
+            if timed_out.is_set():
+                message = f"Worker timed out after {self.trial_timeout}s evaluating {values}."
+            else:
+                message = f"Worker exited with code {returncode} while evaluating {values}."
+            if self.on_crash == "raise":
+                raise RuntimeError(f"{message} It was restarted.")
+            _logger.warning(f"{message} It was restarted, and the trial is discarded.")
+        return result
+
+    def __call__(self, solutions: list[dict[str, Any]]) -> list[float] | list[list[float] | float]:
+        """
+        Evaluates a batch of trials, e.g., a generation of the optimization algorithm.
+
+        Args:
+            solutions: The keyword arguments of each trial, as passed to a batched objective.
+
+        Returns:
+            One value per trial, or a list of values per trial if the workers return several. The
+            value of a trial whose worker failed is a single NaN, unless on_crash is "raise". The
+            Study discards it, whatever the number of objectives.
+
+        Raises:
+            TypeError: If a parameter value is not numeric.
+            RuntimeError: If a worker cannot be restarted, or if a worker exits or times out while
+                evaluating a trial and on_crash is "raise".
+        """
+        requests = [_flatten(solution) for solution in solutions]
+        self.start()
+        assert self._threads is not None
+
+        results: list[list[float] | None] = [None for _ in requests]
+        lock = threading.Lock()
+        pending = iter(range(len(requests)))
+
+        def drain(index: int) -> None:
+            # Each worker takes the next trial as soon as it is done with the previous one
+            while True:
+                with lock:
+                    trial = next(pending, None)
+                if trial is None:
+                    return
+                results[trial] = self._evaluate(index, requests[trial])
+
+        n_threads = min(self.n_workers, len(requests))
+        futures = [self._threads.submit(drain, index) for index in range(n_threads)]
+        for future in futures:
+            future.result()
+
+        if all(result is None or len(result) == 1 for result in results):
+            return [math.nan if result is None else result[0] for result in results]
+        return [math.nan if result is None else result for result in results]
+
+
+def serve(
+    fn: Callable[..., float | Sequence[float]],
+    stdin: IO[bytes] | None = None,
+    stdout: IO[bytes] | None = None,
+) -> int:
+    """
+    Evaluates the requests of a ProcessPool until stdin is closed, e.g., in a Python simulator.
+
+    Args:
+        fn: A function that receives the values of a request as positional arguments, and returns
+            a value, or a sequence of values for multiple objectives.
+        stdin: The stream to read requests from. Defaults to None (`sys.stdin`).
+        stdout: The stream to write results to. Defaults to None (`sys.stdout`).
+
+    Returns:
+        The number of evaluated requests.
+    """
+    stdin = stdin if stdin is not None else sys.stdin.buffer
+    stdout = stdout if stdout is not None else sys.stdout.buffer
+    n_requests = 0
+    while (values := read_frame(stdin)) is not None:
+        result = fn(*values)
+        write_frame(stdout, result if isinstance(result, Sequence) else [result])
+        n_requests += 1
+    return n_requests
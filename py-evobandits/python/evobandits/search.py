@@ -12,10 +12,38 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+from collections.abc import Hashable
+from typing import Any
+
 import numpy as np
+from sklearn.base import clone, is_classifier
+from sklearn.model_selection import check_cv, cross_val_score
 from sklearn.model_selection._search import BaseSearchCV
+from sklearn.utils import indexable
+from sklearn.utils.parallel import Parallel, delayed
 
 from evobandits.evobandits import GMAB
+from evobandits.params import BaseParam, IntParam
+from evobandits.study import Study
+
+
+def _cache_key(candidate: dict[str, Any]) -> tuple[tuple[str, Hashable], ...]:
+    """
+    Returns a hashable key for a candidate, e.g., to look up its cross-validation results.
+
+    Each candidate is decoded from exactly one action vector, so the key identifies its arm.
+    """
+    return tuple(
+        (name, tuple(value) if isinstance(value, list) else value)
+        for name, value in candidate.items()
+    )
+
+
+def _score_fold(estimator, candidate, X, y, split, scoring, error_score) -> float:
+    """Fits the estimator with the candidate's parameters on a single split and scores it."""
+    estimator = clone(estimator).set_params(**candidate)
+    scores = cross_val_score(estimator, X, y, scoring=scoring, cv=[split], error_score=error_score)
+    return scores[0]
 
 
 # https://github.com/scikit-learn/scikit-learn/blob/main/sklearn/model_selection/_search.py#L433
@@ -34,16 +62,32 @@ class EvoBanditsSearchCV(BaseSearchCV):
         error_score=np.nan,
         return_train_score=True,
         n_trials=50,
+        seed=None,
+        algorithm=None,
+        incremental=False,
     ):
         """
         param_distributions: dict
-            Dictionary of parameter_name -> (lower_bound, upper_bound),
-            all of which must be integer bounds.
+            Dictionary of parameter_name -> parameter, where each parameter is an IntParam,
+            FloatParam or CategoricalParam, or an integer (lower_bound, upper_bound) tuple.
         n_trials: int
             How many trials (simulation budget) EvoBandits should run internally.
+        seed: int or None
+            The seed of the underlying Study, for reproducible searches. Default is None.
+        algorithm: GMAB or None
+            The configuration of the optimization algorithm. Default is None (uses GMAB()).
+        incremental: bool
+            If True, each pull of an arm evaluates one additional split of cv, instead of a full
+            cross-validation. The sample average of the arm then builds the cross-validation
+            estimate across pulls, and GMAB decides which candidates deserve more splits. Use a
+            repeated cv (e.g. RepeatedKFold) for more splits than folds. Requires a single
+            metric for scoring. Default is False.
         """
         self.param_distributions = param_distributions
         self.n_trials = n_trials
+        self.seed = seed
+        self.algorithm = algorithm
+        self.incremental = incremental
 
         super().__init__(
             estimator=estimator,
@@ -57,50 +101,127 @@ class EvoBanditsSearchCV(BaseSearchCV):
             return_train_score=return_train_score,
         )
 
-        # A place to stash the last known score from evaluate_candidates
-        self._latest_score = None
+    def _get_params(self) -> dict[str, BaseParam]:
+        """Converts param_distributions into the parameters of a Study."""
+        params = {}
+        for name, param in self.param_distributions.items():
+            if isinstance(param, BaseParam):
+                params[name] = param
+            elif isinstance(param, tuple) and len(param) == 2:
+                params[name] = IntParam(*param)
+            else:
+                raise TypeError(
+                    f"Parameter '{name}' must implement BaseParam or be a (low, high) tuple, "
+                    f"got {type(param)}."
+                )
+        return params
+
+    def fit(self, X, y=None, **params):
+        # The data is needed to evaluate single splits in incremental mode
+        self._data = (X, y, params.get("groups"))
+        try:
+            return super().fit(X, y, **params)
+        finally:
+            del self._data
 
     def _run_search(self, evaluate_candidates):
         """
         Overridden method from BaseSearchCV:
-        1) Builds an integer-bounded search space from self.param_distributions.
-        2) Defines a Python function that calls evaluate_candidates to retrieve
-           cross-validation scores.
-        3) Invokes GMAB to search for the best hyperparameters.
-        4) Finally, calls evaluate_candidates one last time with the best found
-           parameters so they are recorded by scikit-learn.
+        1) Builds the parameters of a Study from self.param_distributions.
+        2) Defines a batched objective that evaluates full cross-validations or, if incremental,
+           single splits for all candidates of a batch at once.
+        3) Invokes the Study to search for the best hyperparameters.
+        4) If incremental, cross-validates the best candidate in full, so that it is recorded
+           by scikit-learn. Otherwise, all evaluated candidates are recorded already.
+        """
+
+        # 1) Collect the parameters, e.g. {"C": FloatParam(0.1, 10.0), "max_iter": (100, 200)}
+        params = self._get_params()
+
+        # 2) Define the batched objective for the Study
+        if self.incremental:
+            evobandits_objective = self._split_objective()
+        else:
+            evobandits_objective = self._cv_objective(evaluate_candidates)
+
+        # 3) Create the Study and search for the best param configuration
+        algorithm = self.algorithm if self.algorithm is not None else GMAB()
+        self.study_ = Study(seed=self.seed, algorithm=algorithm)
+        self.study_.optimize(
+            evobandits_objective, params, self.n_trials, maximize=True, batched=True
+        )
+
+        # 4) Evaluate the best candidate (so scikit-learn knows about it)
+        if self.incremental:
+            evaluate_candidates([self.study_.results[0]["params"]])
+
+    def _cv_objective(self, evaluate_candidates):
         """
+        Returns an objective that cross-validates all new candidates of a batch at once.
+
+        A batch is, e.g., a whole generation of GMAB. We call scikit-learn's evaluate_candidates
+        once for all new candidates, so that joblib can parallelize over candidates x folds. The
+        mean_test_score of each candidate is cached, so that arms that are pulled repeatedly
+        reuse their results instead of refitting.
+        """
+        cache: dict[tuple, float] = {}
+
+        def evobandits_objective(candidates: list[dict[str, Any]]) -> list[float]:
+            keys = [_cache_key(candidate) for candidate in candidates]
+            new_candidates = {}
+            for key, candidate in zip(keys, candidates, strict=True):
+                if key not in cache:
+                    new_candidates.setdefault(key, candidate)
+
+            if new_candidates:
+                # evaluate_candidates returns the results of all candidates evaluated so far,
+                # so the scores of this batch are the last ones
+                results = evaluate_candidates(list(new_candidates.values()))
+                scores = results["mean_test_score"][-len(new_candidates) :]
+                cache.update(zip(new_candidates, scores, strict=True))
+
+            return [cache[key] for key in keys]
+
+        return evobandits_objective
+
+    def _split_objective(self):
+        """
+        Returns an objective that evaluates the next split of cv for each candidate of a batch.
+
+        The n-th pull of an arm evaluates the n-th split, and the splits are evaluated in parallel
+        for all candidates of a batch. Once all splits of an arm are evaluated, further pulls
+        cycle through the cached scores.
+        """
+        if not (self.scoring is None or isinstance(self.scoring, str) or callable(self.scoring)):
+            raise ValueError("Incremental evaluation requires a single metric for scoring.")
+
+        X, y, groups = indexable(*self._data)
+        cv = check_cv(self.cv, y, classifier=is_classifier(self.estimator))
+        splits = list(cv.split(X, y, groups))
+        cache: dict[tuple, dict[int, float]] = {}
+        n_pulls: dict[tuple, int] = {}
+
+        def evobandits_objective(candidates: list[dict[str, Any]]) -> list[float]:
+            # Determine the next split for each candidate, and collect those not evaluated yet
+            pulls = []
+            tasks = {}
+            for candidate in candidates:
+                key = _cache_key(candidate)
+                split_index = n_pulls.get(key, 0) % len(splits)
+                n_pulls[key] = n_pulls.get(key, 0) + 1
+                pulls.append((key, split_index))
+                if split_index not in cache.get(key, {}):
+                    tasks.setdefault((key, split_index), candidate)
+
+            scores = Parallel(n_jobs=self.n_jobs, pre_dispatch=self.pre_dispatch)(
+                delayed(_score_fold)(
+                    self.estimator, candidate, X, y, splits[i], self.scoring, self.error_score
+                )
+                for (_, i), candidate in tasks.items()
+            )
+            for (key, split_index), score in zip(tasks, scores, strict=True):
+                cache.setdefault(key, {})[split_index] = score
+
+            return [cache[key][split_index] for key, split_index in pulls]
 
-        # 1) Collect parameter names and integer bounds
-        #    Example: param_distributions = {"x": (-5, 10), "y": (0, 5)}
-        #    We will map these onto a list-like domain as EvoBandits expects.
-        param_names = list(self.param_distributions.keys())
-        bounds = [self.param_distributions[name] for name in param_names]
-
-        # 2) Define the Python objective function for EvoBandits
-        #    action_vector is a list of i32 from Rust's perspective
-        #    We call scikit-learn's evaluate_candidates([param_dict]) to get scores,
-        #    and return that cross-validation mean_test_score so that EvoBandits can
-        #    attempt to maximize it.
-        def evobandits_objective(action_vector: list) -> float:
-            # Build param_dict from the action vector
-            param_dict = {}
-            for i, name in enumerate(param_names):
-                param_dict[name] = action_vector[i]
-
-            results = evaluate_candidates([param_dict])
-            mean_score = results.get("mean_test_score", np.nan)[0]
-            self._latest_score = mean_score
-            # evobandits minimizes the objective, so we negate the score
-            return mean_score * -1
-
-        # 3) Create the EvoBandits optimizer and search for the best param configuration
-        evobandits_opt = GMAB()
-        best_arms = evobandits_opt.optimize(evobandits_objective, bounds, self.n_trials, n_best=1)
-        best_action_vector = best_arms[0].to_dict.get("action_vector")
-
-        # 4) Evaluate the best param set again (so scikit-learn knows about it)
-        best_dict = {}
-        for i, name in enumerate(param_names):
-            best_dict[name] = best_action_vector[i]
-        evaluate_candidates([best_dict])
+        return evobandits_objective
@@ -0,0 +1,17 @@
+import importlib
+from typing import TYPE_CHECKING, Any
+
+from evobandits.storages.base_storage import BaseStorage
+from evobandits.storages.in_memory_storage import InMemoryStorage
+
+if TYPE_CHECKING:
+    from evobandits.storages.sqlite_storage import SQLiteStorage
+
+__all__ = ["BaseStorage", "InMemoryStorage", "SQLiteStorage"]
+
+
+def __getattr__(name: str) -> Any:
+    # sqlite3 is only imported once SQLiteStorage is used
+    if name == "SQLiteStorage":
+        return importlib.import_module("evobandits.storages.sqlite_storage").SQLiteStorage
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -0,0 +1,154 @@
+# Copyright 2025 EvoBandits
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from abc import ABC, abstractmethod
+from collections.abc import Iterator
+from typing import Any
+
+
+class BaseStorage(ABC):
+    """
+    An abstract base class representing the storage of a Study.
+
+    A storage persists the trials (single evaluations of the objective), the statistics of all
+    evaluated arms, the results (statistics of the best arms) and the metadata of each run for one
+    or multiple studies. Studies are
+    identified by their name, so that several studies can share one storage.
+
+    Trials are written in batches, with one batch per generation of the optimization algorithm.
+    """
+
+    @abstractmethod
+    def create_study(self, study_name: str) -> None:
+        """
+        Creates a new study in the storage, if it does not exist yet.
+
+        Args:
+            study_name: The unique name of the study.
+        """
+        raise NotImplementedError("Subclasses must implement the 'create_study' method.")
+
+    @abstractmethod
+    def get_study_names(self) -> list[str]:
+        """
+        Returns the names of all studies in the storage.
+
+        Returns:
+            A list of study names.
+        """
+        raise NotImplementedError("Subclasses must implement the 'get_study_names' method.")
+
+    @abstractmethod
+    def create_run(self, study_name: str, run: dict[str, Any]) -> None:
+        """
+        Saves the metadata of a new run.
+
+        Args:
+            study_name: The name of the study.
+            run: The run's metadata, with the keys 'run_id', 'seed', 'n_trials', 'n_best' and
+                'maximize'. For multiple objectives, 'maximize' is a list with one bool each.
+        """
+        raise NotImplementedError("Subclasses must implement the 'create_run' method.")
+
+    @abstractmethod
+    def get_runs(self, study_name: str) -> list[dict[str, Any]]:
+        """
+        Returns the metadata of all runs of a study, ordered by their run_id.
+
+        Args:
+            study_name: The name of the study.
+
+        Returns:
+            A list of dictionaries with the metadata of each run.
+        """
+        raise NotImplementedError("Subclasses must implement the 'get_runs' method.")
+
+    @abstractmethod
+    def add_trials(self, study_name: str, trials: list[dict[str, Any]]) -> None:
+        """
+        Saves a batch of trials at once.
+
+        Args:
+            study_name: The name of the study.
+            trials: A list of trials, each with the keys 'run_id', 'trial_id', 'action_vector',
+                'params' and 'value'. For multiple objectives, 'value' is a list of floats.
+        """
+        raise NotImplementedError("Subclasses must implement the 'add_trials' method.")
+
+    @abstractmethod
+    def iter_trials(self, study_name: str, run_id: int | None = None) -> Iterator[dict[str, Any]]:
+        """
+        Iterates over the trials of a study, without loading all of them into memory.
+
+        Args:
+            study_name: The name of the study.
+            run_id: Only yield the trials of this run. Default is None (all runs).
+
+        Returns:
+            An iterator over the trials, ordered by run_id and trial_id.
+        """
+        raise NotImplementedError("Subclasses must implement the 'iter_trials' method.")
+
+    @abstractmethod
+    def add_arms(self, study_name: str, arms: list[dict[str, Any]]) -> None:
+        """
+        Saves the statistics of the arms that were evaluated in a run, using a single write.
+
+        Args:
+            study_name: The name of the study.
+            arms: A list of arms, each with the keys 'run_id', 'action_vector', 'params', 'value',
+                'value_std_dev' and 'n_evaluations'. For multiple objectives, 'value' and
+                'value_std_dev' are lists of floats.
+        """
+        raise NotImplementedError("Subclasses must implement the 'add_arms' method.")
+
+    @abstractmethod
+    def iter_arms(self, study_name: str, run_id: int | None = None) -> Iterator[dict[str, Any]]:
+        """
+        Iterates over the arms of a study, without loading all of them into memory.
+
+        Args:
+            study_name: The name of the study.
+            run_id: Only yield the arms of this run. Default is None (all runs).
+
+        Returns:
+            An iterator over the arms, ordered by run_id and in the order they were saved.
+        """
+        raise NotImplementedError("Subclasses must implement the 'iter_arms' method.")
+
+    @abstractmethod
+    def add_results(self, study_name: str, results: list[dict[str, Any]]) -> None:
+        """
+        Saves the results of a run.
+
+        Args:
+            study_name: The name of the study.
+            results: A list of results, each with the keys 'run_id', 'n_best', 'action_vector',
+                'params', 'value', 'value_std_dev' and 'n_evaluations'. For multiple objectives,
+                'value' and 'value_std_dev' are lists of floats.
+        """
+        raise NotImplementedError("Subclasses must implement the 'add_results' method.")
+
+    @abstractmethod
+    def get_results(self, study_name: str) -> list[dict[str, Any]]:
+        """
+        Returns the results of all runs of a study, ordered by run_id and n_best.
+
+        Args:
+            study_name: The name of the study.
+
+        Returns:
+            A list of results.
+        """
+        raise NotImplementedError("Subclasses must implement the 'get_results' method.")
@@ -0,0 +1,91 @@
+# Copyright 2025 EvoBandits
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import threading
+from collections.abc import Iterator
+from typing import Any
+
+from evobandits.storages.base_storage import BaseStorage
+
+
+class InMemoryStorage(BaseStorage):
+    """
+    A storage that keeps all studies in memory, e.g., for short-lived studies.
+
+    The storage can be shared by several studies within the same process, but its content is lost
+    when the process ends.
+    """
+
+    def __init__(self) -> None:
+        """
+        Creates an empty InMemoryStorage.
+        """
+        self._studies: dict[str, dict[str, list[dict[str, Any]]]] = {}
+        self._lock = threading.Lock()
+
+    def __repr__(self) -> str:
+        return "InMemoryStorage()"
+
+    def _get_study(self, study_name: str) -> dict[str, list[dict[str, Any]]]:
+        if study_name not in self._studies:
+            raise KeyError(f"Study '{study_name}' does not exist.")
+        return self._studies[study_name]
+
+    def create_study(self, study_name: str) -> None:
+        with self._lock:
+            self._studies.setdefault(
+                study_name, {"runs": [], "trials": [], "arms": [], "results": []}
+            )
+
+    def get_study_names(self) -> list[str]:
+        with self._lock:
+            return list(self._studies.keys())
+
+    def create_run(self, study_name: str, run: dict[str, Any]) -> None:
+        with self._lock:
+            self._get_study(study_name)["runs"].append(dict(run))
+
+    def get_runs(self, study_name: str) -> list[dict[str, Any]]:
+        with self._lock:
+            return [dict(run) for run in self._get_study(study_name)["runs"]]
+
+    def add_trials(self, study_name: str, trials: list[dict[str, Any]]) -> None:
+        with self._lock:
+            self._get_study(study_name)["trials"].extend(dict(trial) for trial in trials)
+
+    def iter_trials(self, study_name: str, run_id: int | None = None) -> Iterator[dict[str, Any]]:
+        with self._lock:
+            trials = list(self._get_study(study_name)["trials"])
+        for trial in trials:
+            if run_id is None or trial["run_id"] == run_id:
+                yield dict(trial)
+
+    def add_arms(self, study_name: str, arms: list[dict[str, Any]]) -> None:
+        with self._lock:
+            self._get_study(study_name)["arms"].extend(dict(arm) for arm in arms)
+
+    def iter_arms(self, study_name: str, run_id: int | None = None) -> Iterator[dict[str, Any]]:
+        with self._lock:
+            arms = list(self._get_study(study_name)["arms"])
+        for arm in arms:
+            if run_id is None or arm["run_id"] == run_id:
+                yield dict(arm)
+
+    def add_results(self, study_name: str, results: list[dict[str, Any]]) -> None:
+        with self._lock:
+            self._get_study(study_name)["results"].extend(dict(result) for result in results)
+
+    def get_results(self, study_name: str) -> list[dict[str, Any]]:
+        with self._lock:
+            return [dict(result) for result in self._get_study(study_name)["results"]]
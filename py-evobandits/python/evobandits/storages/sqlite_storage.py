@@ -0,0 +1,325 @@
+# Copyright 2025 EvoBandits
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import json
+import math
+import os
+import sqlite3
+import threading
+from collections.abc import Iterator
+from contextlib import contextmanager
+from datetime import datetime, timezone
+from typing import Any
+
+from evobandits.storages.base_storage import BaseStorage
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS studies (
+    study_id INTEGER PRIMARY KEY,
+    study_name TEXT NOT NULL UNIQUE,
+    created_at TEXT NOT NULL
+);
+CREATE TABLE IF NOT EXISTS runs (
+    study_id INTEGER NOT NULL REFERENCES studies (study_id),
+    run_id INTEGER NOT NULL,
+    seed INTEGER,
+    n_trials INTEGER NOT NULL,
+    n_best INTEGER NOT NULL,
+    maximize INTEGER NOT NULL,
+    created_at TEXT NOT NULL,
+    PRIMARY KEY (study_id, run_id)
+);
+CREATE TABLE IF NOT EXISTS trials (
+    study_id INTEGER NOT NULL REFERENCES studies (study_id),
+    run_id INTEGER NOT NULL,
+    trial_id INTEGER NOT NULL,
+    action_vector TEXT NOT NULL,
+    params TEXT NOT NULL,
+    value REAL NOT NULL,
+    PRIMARY KEY (study_id, run_id, trial_id)
+);
+CREATE TABLE IF NOT EXISTS arms (
+    study_id INTEGER NOT NULL REFERENCES studies (study_id),
+    run_id INTEGER NOT NULL,
+    action_vector TEXT NOT NULL,
+    params TEXT NOT NULL,
+    value REAL NOT NULL,
+    value_std_dev REAL NOT NULL,
+    n_evaluations INTEGER NOT NULL,
+    PRIMARY KEY (study_id, run_id, action_vector)
+);
+CREATE TABLE IF NOT EXISTS results (
+    study_id INTEGER NOT NULL REFERENCES studies (study_id),
+    run_id INTEGER NOT NULL,
+    n_best INTEGER NOT NULL,
+    action_vector TEXT NOT NULL,
+    params TEXT NOT NULL,
+    value REAL NOT NULL,
+    value_std_dev REAL NOT NULL,
+    n_evaluations INTEGER NOT NULL,
+    PRIMARY KEY (study_id, run_id, n_best)
+);
+"""
+
+# Number of rows that are fetched at once while iterating over trials
+_FETCH_SIZE = 1000
+
+
+def _dumps(obj: Any) -> str:
+    # Values that have no JSON representation (e.g., callables) are stored as their repr.
+    return json.dumps(obj, default=repr)
+
+
+def _dump_value(value: Any) -> Any:
+    # Multi-objective studies have one value (or direction) per objective, stored as JSON. NaN is
+    # stored as JSON too, since sqlite3 binds it as NULL.
+    if isinstance(value, list) or (isinstance(value, float) and math.isnan(value)):
+        return _dumps(value)
+    return value
+
+
+def _load_value(value: Any) -> Any:
+    return json.loads(value) if isinstance(value, str) else value
+
+
+class SQLiteStorage(BaseStorage):
+    """
+    A storage that persists studies to an SQLite database file.
+
+    Several studies and processes can share one database file. The database uses write-ahead
+    logging, so that readers (e.g., dashboards) can query the history while a study is running.
+    Each batch of trials is written in a single transaction. A database in memory (":memory:")
+    can only be used by the storage that created it.
+
+    Note:
+        Parameter values are stored as JSON. Values without a JSON representation, like
+        callables, are stored as their string representation.
+    """
+
+    def __init__(self, path: str | os.PathLike, timeout: float = 30.0) -> None:
+        """
+        Opens (or creates) an SQLite database file as a storage.
+
+        Args:
+            path: The path of the database file, or ":memory:" for a temporary database.
+            timeout: Seconds to wait for locks held by other connections. Default is 30.0.
+        """
+        self.path: str = os.fspath(path)
+        self._lock = threading.RLock()
+        self._conn = sqlite3.connect(
+            self.path, timeout=timeout, isolation_level=None, check_same_thread=False
+        )
+        self._conn.row_factory = sqlite3.Row
+        with self._lock:
+            self._conn.execute("PRAGMA journal_mode=WAL")
+            self._conn.execute("PRAGMA foreign_keys=ON")
+            self._conn.executescript(_SCHEMA)
+
+    def __repr__(self) -> str:
+        return f"SQLiteStorage(path={self.path!r})"
+
+    def close(self) -> None:
+        """Closes the connection to the database."""
+        with self._lock:
+            self._conn.close()
+
+    @contextmanager
+    def _transaction(self) -> Iterator[sqlite3.Connection]:
+        with self._lock:
+            self._conn.execute("BEGIN IMMEDIATE")
+            try:
+                yield self._conn
+            except BaseException:
+                self._conn.execute("ROLLBACK")
+                raise
+            self._conn.execute("COMMIT")
+
+    def _get_study_id(self, study_name: str) -> int:
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT study_id FROM studies WHERE study_name = ?", (study_name,)
+            ).fetchone()
+        if row is None:
+            raise KeyError(f"Study '{study_name}' does not exist.")
+        return row["study_id"]
+
+    def create_study(self, study_name: str) -> None:
+        with self._transaction() as conn:
+            conn.execute(
+                "INSERT OR IGNORE INTO studies (study_name, created_at) VALUES (?, ?)",
+                (study_name, datetime.now(timezone.utc).isoformat()),
+            )
+
+    def get_study_names(self) -> list[str]:
+        with self._lock:
+            rows = self._conn.execute("SELECT study_name FROM studies ORDER BY study_id")
+            return [row["study_name"] for row in rows]
+
+    def create_run(self, study_name: str, run: dict[str, Any]) -> None:
+        study_id = self._get_study_id(study_name)
+        with self._transaction() as conn:
+            conn.execute(
+                "INSERT INTO runs VALUES (?, ?, ?, ?, ?, ?, ?)",
+                (
+                    study_id,
+                    run["run_id"],
+                    run["seed"],
+                    run["n_trials"],
+                    run["n_best"],
+                    _dump_value(run["maximize"]),
+                    datetime.now(timezone.utc).isoformat(),
+                ),
+            )
+
+    def get_runs(self, study_name: str) -> list[dict[str, Any]]:
+        study_id = self._get_study_id(study_name)
+        with self._lock:
+            rows = self._conn.execute(
+                "SELECT run_id, seed, n_trials, n_best, maximize FROM runs "
+                "WHERE study_id = ? ORDER BY run_id",
+                (study_id,),
+            ).fetchall()
+        runs = []
+        for row in rows:
+            maximize = _load_value(row["maximize"])
+            runs.append(
+                {
+                    **dict(row),
+                    "maximize": maximize if isinstance(maximize, list) else bool(maximize),
+                }
+            )
+        return runs
+
+    def add_trials(self, study_name: str, trials: list[dict[str, Any]]) -> None:
+        study_id = self._get_study_id(study_name)
+        rows = [
+            (
+                study_id,
+                trial["run_id"],
+                trial["trial_id"],
+                _dumps(trial["action_vector"]),
+                _dumps(trial["params"]),
+                _dump_value(trial["value"]),
+            )
+            for trial in trials
+        ]
+        with self._transaction() as conn:
+            conn.executemany("INSERT INTO trials VALUES (?, ?, ?, ?, ?, ?)", rows)
+
+    def _iter_rows(
+        self, query: str, study_name: str, run_id: int | None, order_by: str
+    ) -> Iterator[sqlite3.Row]:
+        """Iterates over the rows of a query of a study, and optionally of a single run."""
+        args: tuple = (self._get_study_id(study_name),)
+        if run_id is not None:
+            query += " AND run_id = ?"
+            args += (run_id,)
+        query += f" ORDER BY {order_by}"
+
+        # A database in memory only exists for this connection, and is loaded at once.
+        if self.path == ":memory:":
+            with self._lock:
+                rows = self._conn.execute(query, args).fetchall()
+            yield from rows
+            return
+
+        # Use a separate connection, so that writes are not blocked while the iterator is alive.
+        conn = sqlite3.connect(self.path)
+        conn.row_factory = sqlite3.Row
+        try:
+            cursor = conn.execute(query, args)
+            while rows := cursor.fetchmany(_FETCH_SIZE):
+                yield from rows
+        finally:
+            conn.close()
+
+    def iter_trials(self, study_name: str, run_id: int | None = None) -> Iterator[dict[str, Any]]:
+        query = (
+            "SELECT run_id, trial_id, action_vector, params, value FROM trials WHERE study_id = ?"
+        )
+        for row in self._iter_rows(query, study_name, run_id, "run_id, trial_id"):
+            yield {
+                **dict(row),
+                "action_vector": json.loads(row["action_vector"]),
+                "params": json.loads(row["params"]),
+                "value": _load_value(row["value"]),
+            }
+
+    def add_arms(self, study_name: str, arms: list[dict[str, Any]]) -> None:
+        study_id = self._get_study_id(study_name)
+        rows = [
+            (
+                study_id,
+                arm["run_id"],
+                _dumps(arm["action_vector"]),
+                _dumps(arm["params"]),
+                _dump_value(arm["value"]),
+                _dump_value(arm["value_std_dev"]),
+                arm["n_evaluations"],
+            )
+            for arm in arms
+        ]
+        with self._transaction() as conn:
+            conn.executemany("INSERT INTO arms VALUES (?, ?, ?, ?, ?, ?, ?)", rows)
+
+    def iter_arms(self, study_name: str, run_id: int | None = None) -> Iterator[dict[str, Any]]:
+        query = (
+            "SELECT run_id, action_vector, params, value, value_std_dev, n_evaluations FROM arms "
+            "WHERE study_id = ?"
+        )
+        for row in self._iter_rows(query, study_name, run_id, "run_id, rowid"):
+            yield {
+                **dict(row),
+                "action_vector": json.loads(row["action_vector"]),
+                "params": json.loads(row["params"]),
+                "value": _load_value(row["value"]),
+                "value_std_dev": _load_value(row["value_std_dev"]),
+            }
+
+    def add_results(self, study_name: str, results: list[dict[str, Any]]) -> None:
+        study_id = self._get_study_id(study_name)
+        rows = [
+            (
+                study_id,
+                result["run_id"],
+                result["n_best"],
+                _dumps(result["action_vector"]),
+                _dumps(result["params"]),
+                _dump_value(result["value"]),
+                _dump_value(result["value_std_dev"]),
+                result["n_evaluations"],
+            )
+            for result in results
+        ]
+        with self._transaction() as conn:
+            conn.executemany("INSERT INTO results VALUES (?, ?, ?, ?, ?, ?, ?, ?)", rows)
+
+    def get_results(self, study_name: str) -> list[dict[str, Any]]:
+        study_id = self._get_study_id(study_name)
+        with self._lock:
+            rows = self._conn.execute(
+                "SELECT run_id, n_best, action_vector, params, value, value_std_dev, "
+                "n_evaluations FROM results WHERE study_id = ? ORDER BY run_id, n_best",
+                (study_id,),
+            ).fetchall()
+        return [
+            {
+                **dict(row),
+                "action_vector": json.loads(row["action_vector"]),
+                "params": json.loads(row["params"]),
+                "value": _load_value(row["value"]),
+                "value_std_dev": _load_value(row["value_std_dev"]),
+            }
+            for row in rows
+        ]
@@ -1,3 +1,4 @@
+from evobandits.study.results import Results
 from evobandits.study.study import ALGORITHM_DEFAULT, Study
 
-__all__ = ["Study", "ALGORITHM_DEFAULT"]
+__all__ = ["Study", "ALGORITHM_DEFAULT", "Results"]
@@ -0,0 +1,339 @@
+# Copyright 2025 EvoBandits
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from array import array
+from collections.abc import Iterable, Iterator, Sequence
+from typing import Any, overload
+
+# Columns that are stored in typed arrays, with their array typecode and NumPy dtype
+TYPED_COLUMNS: dict[str, tuple[str, str]] = {
+    "value": ("d", "float64"),
+    "value_std_dev": ("d", "float64"),
+    "n_evaluations": ("q", "int64"),
+    "run_id": ("q", "int64"),
+    "n_best": ("q", "int64"),
+}
+
+
+class _Column:
+    """
+    A typed array that grows by reallocation instead of resizing in place.
+
+    Exported views keep referencing the previous allocation, so that appending to the column is
+    possible while views, e.g., NumPy arrays, are alive. The rows in a view never change.
+    """
+
+    def __init__(self, typecode: str) -> None:
+        self.data: array = array(typecode)
+        self.size: int = 0
+
+    def append(self, value: float) -> None:
+        if self.size == len(self.data):
+            data = array(self.data.typecode, self.data)
+            data.extend([0] * max(self.size, 8))
+            self.data = data
+        self.data[self.size] = value
+        self.size += 1
+
+    def __getitem__(self, index: int) -> float:
+        return self.data[index]
+
+
+class _RunStats:
+    """Aggregates of the values of a single run, updated with each result."""
+
+    def __init__(self, index: int, value: float) -> None:
+        self.n_results: int = 1
+        self.total: float = value
+        self.min_index: int = index
+        self.max_index: int = index
+
+
+class Results(Sequence[dict[str, Any]]):
+    """
+    The results of a Study, stored column by column.
+
+    Results behave like a list of dictionaries, one per result, but store the value, standard
+    deviation, number of evaluations, run id and rank (`n_best`) of all results in typed arrays.
+    The best result and the mean value are maintained with each result, overall and per run, so
+    that looking them up does not scan the results. The typed columns can be exported to NumPy
+    without copying, and to pandas or Arrow.
+
+    The value of multi-objective results is a list, and is therefore stored like other columns,
+    i.e., as a list of Python objects. Best results and means are only available for scalar values.
+    """
+
+    def __init__(self, results: Iterable[dict[str, Any]] = ()) -> None:
+        """
+        Initializes Results.
+
+        Args:
+            results: The initial results, e.g., loaded from a storage. Default is no results.
+        """
+        self._keys: list[tuple[str, ...]] = []
+        self._columns: dict[str, _Column | list[Any]] = {}
+        self._n_values: int = 0
+        self._total: float = 0.0
+        self._min_index: int = -1
+        self._max_index: int = -1
+        self._runs: dict[int, _RunStats] = {}
+        for result in results:
+            self.append(result)
+
+    def append(self, result: dict[str, Any]) -> None:
+        """
+        Appends a result and updates the aggregates.
+
+        Args:
+            result: The result as dictionary, e.g., with "value", "params" and "run_id".
+        """
+        index = len(self._keys)
+        keys = tuple(result)
+        # Share the tuple of keys among results with the same keys
+        self._keys.append(self._keys[-1] if self._keys and self._keys[-1] == keys else keys)
+
+        for key, value in result.items():
+            column = self._columns.get(key)
+            if column is None:
+                column = self._new_column(key, value, index)
+            if isinstance(column, _Column) and not self._fits(column, value):
+                column = self._to_list(key)
+            column.append(value)
+
+        # Rows without a column are padded, so that all columns have one entry per result
+        for key, column in self._columns.items():
+            if key not in result:
+                column.append(0 if isinstance(column, _Column) else None)
+
+        self._update_aggregates(index, result)
+
+    def _new_column(self, key: str, value: Any, index: int) -> _Column | list[Any]:
+        """Adds a column for a key that previous results did not have."""
+        if key in TYPED_COLUMNS and self._fits_type(TYPED_COLUMNS[key][0], value):
+            column: _Column | list[Any] = _Column(TYPED_COLUMNS[key][0])
+            for _ in range(index):
+                column.append(0)
+        else:
+            column = [None] * index
+        self._columns[key] = column
+        return column
+
+    @staticmethod
+    def _fits_type(typecode: str, value: Any) -> bool:
+        if isinstance(value, bool):
+            return False
+        if typecode == "d":
+            return isinstance(value, int | float)
+        return isinstance(value, int)
+
+    def _fits(self, column: _Column, value: Any) -> bool:
+        return self._fits_type(column.data.typecode, value)
+
+    def _to_list(self, key: str) -> list[Any]:
+        """Converts a typed column into a list, e.g., for the values of multi-objective results."""
+        column = self._columns[key]
+        assert isinstance(column, _Column)
+        values: list[Any] = [
+            column[i] if key in keys else None for i, keys in enumerate(self._keys[:-1])
+        ]
+        self._columns[key] = values
+        return values
+
+    def _update_aggregates(self, index: int, result: dict[str, Any]) -> None:
+        if not self._scalar or "value" not in result:
+            return
+
+        value = result["value"]
+        self._n_values += 1
+        self._total += value
+        if self._min_index < 0 or value < self._value(self._min_index):
+            self._min_index = index
+        if self._max_index < 0 or value > self._value(self._max_index):
+            self._max_index = index
+
+        run_id = result.get("run_id")
+        if run_id is None:
+            return
+        stats = self._runs.get(run_id)
+        if stats is None:
+            self._runs[run_id] = _RunStats(index, value)
+            return
+        stats.n_results += 1
+        stats.total += value
+        if value < self._value(stats.min_index):
+            stats.min_index = index
+        if value > self._value(stats.max_index):
+            stats.max_index = index
+
+    @property
+    def _scalar(self) -> bool:
+        """Whether all values so far are scalars, which are stored in a typed array."""
+        return isinstance(self._columns.get("value"), _Column)
+
+    def _value(self, index: int) -> float:
+        return self._columns["value"][index]
+
+    def _check_scalar(self) -> None:
+        if not self._keys:
+            raise ValueError("Results are empty.")
+        if not self._scalar or self._n_values == 0:
+            raise ValueError("Results have no scalar values, e.g., of a multi-objective Study.")
+
+    def _stats(self, run_id: int | None) -> tuple[int, float, int, int]:
+        if run_id is None:
+            return self._n_values, self._total, self._min_index, self._max_index
+        if run_id not in self._runs:
+            raise KeyError(f"Results have no run with run_id {run_id}.")
+        stats = self._runs[run_id]
+        return stats.n_results, stats.total, stats.min_index, stats.max_index
+
+    def best_index(self, maximize: bool = False, run_id: int | None = None) -> int:
+        """
+        Returns the index of the best result, i.e., the first result with the best value.
+
+        Args:
+            maximize: Whether higher values are better. Default is False.
+            run_id: The run to consider. Default is None, which considers all runs.
+
+        Returns:
+            The index of the best result in Results.
+
+        Raises:
+            ValueError: If Results are empty or have no scalar values.
+            KeyError: If Results have no run with the given run_id.
+        """
+        self._check_scalar()
+        _, _, min_index, max_index = self._stats(run_id)
+        return max_index if maximize else min_index
+
+    def mean(self, run_id: int | None = None) -> float:
+        """
+        Returns the mean value of the results.
+
+        Args:
+            run_id: The run to consider. Default is None, which considers all runs.
+
+        Returns:
+            The mean value.
+
+        Raises:
+            ValueError: If Results are empty or have no scalar values.
+            KeyError: If Results have no run with the given run_id.
+        """
+        self._check_scalar()
+        n_results, total, _, _ = self._stats(run_id)
+        return total / n_results
+
+    @property
+    def run_ids(self) -> list[int]:
+        """The ids of all runs with scalar values, in the order of their first result."""
+        return list(self._runs)
+
+    def column(self, key: str) -> list[Any]:
+        """
+        Returns the values of a column as a list, e.g., "value" or "params".
+
+        Args:
+            key: The name of the column.
+
+        Returns:
+            One value per result, or None if the result has no such key.
+
+        Raises:
+            KeyError: If no result has the key.
+        """
+        if key not in self._columns:
+            raise KeyError(f"Results have no column {key!r}.")
+        column = self._columns[key]
+        return [column[i] if key in keys else None for i, keys in enumerate(self._keys)]
+
+    def to_numpy(self) -> dict[str, Any]:
+        """
+        Exports the columns to NumPy arrays.
+
+        Typed columns are exported as views without copying, other columns, e.g., "params", as
+        arrays of Python objects. Results that lack a typed column hold 0 in its array.
+
+        Returns:
+            A dictionary of column names and NumPy arrays.
+        """
+        import numpy as np
+
+        arrays = {}
+        for key, column in self._columns.items():
+            if isinstance(column, _Column):
+                dtype = TYPED_COLUMNS[key][1]
+                arrays[key] = np.frombuffer(column.data, dtype=dtype, count=column.size)
+            else:
+                values = np.empty(len(column), dtype=object)
+                values[:] = column
+                arrays[key] = values
+        return arrays
+
+    def to_pandas(self) -> Any:
+        """
+        Exports the results to a pandas DataFrame, with one row per result.
+
+        Returns:
+            A pandas DataFrame.
+        """
+        import pandas as pd
+
+        return pd.DataFrame(self.to_numpy(), copy=False)
+
+    def to_arrow(self) -> Any:
+        """
+        Exports the results to an Arrow table, with one row per result.
+
+        Typed columns are passed to Arrow without copying.
+
+        Returns:
+            A pyarrow Table.
+        """
+        import pyarrow as pa
+
+        columns = {}
+        for key, values in self.to_numpy().items():
+            columns[key] = pa.array(values if values.dtype != object else list(values))
+        return pa.table(columns)
+
+    @overload
+    def __getitem__(self, index: int) -> dict[str, Any]: ...
+
+    @overload
+    def __getitem__(self, index: slice) -> list[dict[str, Any]]: ...
+
+    def __getitem__(self, index: int | slice) -> dict[str, Any] | list[dict[str, Any]]:
+        if isinstance(index, slice):
+            return [self[i] for i in range(*index.indices(len(self)))]
+        if index < 0:
+            index += len(self)
+        if not 0 <= index < len(self):
+            raise IndexError("Results index out of range.")
+        return {key: self._columns[key][index] for key in self._keys[index]}
+
+    def __iter__(self) -> Iterator[dict[str, Any]]:
+        for index in range(len(self)):
+            yield self[index]
+
+    def __len__(self) -> int:
+        return len(self._keys)
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, Sequence) or isinstance(other, str):
+            return NotImplemented
+        return len(self) == len(other) and all(a == b for a, b in zip(self, other, strict=True))
+
+    def __repr__(self) -> str:
+        return f"Results({list(self)!r})"
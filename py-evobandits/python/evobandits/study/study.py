@@ -12,24 +12,58 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
-from collections.abc import Callable, Mapping
+import hashlib
+import math
+import os
+import threading
+import time
+from collections import Counter
+from collections.abc import Callable, Iterable, Mapping, Sequence
+from concurrent.futures import FIRST_COMPLETED, Executor, Future, wait
 from inspect import signature
 from random import Random
-from statistics import mean
 from typing import Any, TypeAlias
+from uuid import uuid4
 
 from evobandits import logging
-from evobandits.evobandits import GMAB
+from evobandits.constraints import LinearConstraint
+from evobandits.evobandits import GMAB, ParamSpace
+from evobandits.metrics import write_metrics
 from evobandits.params import BaseParam
+from evobandits.storages import BaseStorage, InMemoryStorage
+from evobandits.study.results import Results
 
 _logger = logging.get_logger(__name__)
 
 
 ParamsType: TypeAlias = Mapping[str, BaseParam]
+ConstraintsType: TypeAlias = Sequence[Callable[..., bool] | LinearConstraint]
 
 
 ALGORITHM_DEFAULT = GMAB()
 
+ON_TIMEOUT_POLICIES = ("discard", "retry")
+
+# Marks the value of a trial that timed out and is discarded
+_TIMED_OUT = object()
+
+
+def _is_discarded(value: Any) -> bool:
+    """Returns whether the value of a trial is discarded, i.e., timed out or not finite."""
+    if value is _TIMED_OUT:
+        return True
+    try:
+        return not math.isfinite(value)
+    except TypeError:  # a value per objective
+        return not all(math.isfinite(v) for v in value)
+
+
+def _timed_call(objective: Callable, /, **kwargs: Any) -> tuple[Any, float]:
+    """Calls the objective, and returns its value and the wall time of the call in seconds."""
+    start = time.perf_counter()
+    value = objective(**kwargs)
+    return value, time.perf_counter() - start
+
 
 class Study:
     """
@@ -39,29 +73,105 @@ class Study:
     and to manage user-defined attributes related to the study.
     """
 
-    def __init__(self, seed: int | None = None, algorithm: GMAB = ALGORITHM_DEFAULT) -> None:
+    def __init__(
+        self,
+        seed: int | None = None,
+        algorithm: GMAB = ALGORITHM_DEFAULT,
+        storage: BaseStorage | None = None,
+        study_name: str | None = None,
+    ) -> None:
         """
         Initializes a Study instance.
 
+        If the storage already contains a study with the given name, its results are loaded and
+        new runs are added to it.
+
         Args:
             seed: The seed for the Study. Defaults to None (uses system entropy).
             algorithm: The optimization algorithm to use. Defaults to GMAB.
+            storage: The storage for trials and results. Defaults to None (in-memory storage).
+            study_name: The name of the study in the storage. Defaults to None (unique name).
         """
         if seed is None:
             _logger.warning("No seed provided. Results will not be reproducible.")
         elif not isinstance(seed, int):
             raise TypeError(f"Seed must be integer: {seed}")
+        if storage is not None and not isinstance(storage, BaseStorage):
+            raise TypeError(f"storage must implement BaseStorage, got {type(storage)}.")
+        if study_name is not None and not isinstance(study_name, str):
+            raise TypeError(f"study_name must be a str, got {type(study_name)}.")
 
         self.seed: int | None = seed
         self.algorithm: GMAB = algorithm
-        self.results: list[dict[str, Any]] = []
+        self.storage: BaseStorage = storage if storage is not None else InMemoryStorage()
+        self.study_name: str = study_name if study_name is not None else f"study-{uuid4().hex}"
+
+        # Load the results of previous runs, if the study already exists
+        self.storage.create_study(self.study_name)
+        self._results = Results()
+        for result in self.storage.get_results(self.study_name):
+            result.pop("action_vector")
+            self._results.append(result)
+        runs = self.storage.get_runs(self.study_name)
 
         # 1 for minimization, -1 for maximization to avoid repeated branching during optimization.
+        # Multi-objective studies have one direction per objective.
         self._direction: int = 1
+        self._directions: list[int] | None = None
+        if runs:
+            self._set_directions(runs[-1]["maximize"])
+        self._run_id: int = len(runs)
+        self._trial_id: int = 0
+        # Statistics (n_evaluations, means, sums of squared deviations) of the arms of the current
+        # run, which is kept per objective. Trial ids and arm statistics are updated under the
+        # lock, since the islands of the algorithm save their trials from their own threads.
+        self._arm_stats: dict[tuple[int, ...], tuple[int, list[float], list[float]]] = {}
+        self._lock = threading.Lock()
         self._params: ParamsType
         self._objective: Callable
         self._seeded_call = None
         self._rng = None
+        self._run_seed: int = 0
+        self._pulls: Counter[tuple[int, ...]] = Counter()
+        # Wall time of each trial of the last batch per thread, see `_batch_costs`
+        self._last_costs: dict[int, list[float]] = {}
+        self._executor: Executor | None = None
+        self._batched: bool | str = False
+        self._timeout: float | None = None
+        # Trials that timed out, but could not be cancelled, see `_evaluate_with_timeout`
+        self._stragglers: set[Future] = set()
+        self._on_timeout: float | str = "discard"
+        self._space: ParamSpace | None = None
+        self._predicates: list[Callable[..., bool]] = []
+        self._metrics_file: str | os.PathLike | None = None
+        self._progress: dict[str, Any] | None = None
+
+    def _set_directions(self, maximize: bool | Sequence[bool]) -> None:
+        """
+        Sets the direction of the objective, or of each objective of a multi-objective Study.
+
+        Args:
+            maximize: Indicates if the objective, or each objective, is maximized.
+        """
+        if isinstance(maximize, bool):
+            self._direction = -1 if maximize else 1
+            self._directions = None
+        else:
+            self._direction = 1
+            self._directions = [-1 if m else 1 for m in maximize]
+
+    def _build_space(self) -> ParamSpace | None:
+        """
+        Describes the parameters saved to `self._params` as a native ParamSpace.
+
+        Returns:
+            The ParamSpace, or None if a parameter can only be decoded in Python.
+        """
+        space = ParamSpace()
+        for param in self._params.values():
+            if not param.add_to(space):
+                return None
+        return space
 
     def _collect_bounds(self) -> list[tuple[int, int]]:
         """
@@ -70,11 +180,28 @@ class Study:
         Returns:
             The bounds, a list of (lower_bound, upper_bound) tuples for all parameters.
         """
+        if self._space is not None:
+            return self._space.bounds
+
         bounds = []
         for param in self._params.values():
             bounds.extend(param.bounds)
         return bounds
 
+    def _collect_strides(self) -> list[int] | None:
+        """
+        Collects the initial grid strides of the parameters saved to `self._params`.
+
+        Returns:
+            The strides for all parameters, or None if all parameters use the full resolution.
+        """
+        strides = []
+        for param in self._params.values():
+            strides.extend(param.strides)
+        if all(stride == 1 for stride in strides):
+            return None
+        return strides
+
     def _decode(self, action_vector: list[int]) -> dict[str, Any]:
         """
         Decodes an action vector into a dictionary mapping parameter names to their decoded values.
@@ -92,10 +219,101 @@ class Study:
             idx += param.size
         return result
 
+    def _decode_batch(self, action_vectors: list[list[int]]) -> dict[str, list[Any]]:
+        """
+        Decodes a batch of action vectors into the values of each parameter.
+
+        With a native ParamSpace, the whole batch is decoded with a single call, and only the
+        conversion to the parameter types is left to Python.
+
+        Args:
+            action_vectors: The encoded representations of parameter values.
+
+        Returns:
+            A dictionary of parameter names and their decoded values per action vector.
+        """
+        if self._space is None:
+            decoded = [self._decode(action_vector) for action_vector in action_vectors]
+            return {key: [d[key] for d in decoded] for key in self._params}
+
+        columns = self._space.decode(action_vectors)
+        result = {}
+        idx = 0
+        for key, param in self._params.items():
+            result[key] = param.decode_columns(columns[idx : idx + param.size])
+            idx += param.size
+        return result
+
+    def _is_feasible(self, action_vector: list[int]) -> bool:
+        """
+        Checks if an action vector satisfies all predicates of the Study.
+
+        Args:
+            action_vector: The encoded representation of parameter values.
+
+        Returns:
+            True if all predicates accept the decoded parameter values, False otherwise.
+        """
+        params = self._decode(action_vector)
+        return all(predicate(**params) for predicate in self._predicates)
+
     def _generate_seed(self) -> int:
-        """Returns a random seed for objective evaluations."""
+        """Returns a random seed for a run, drawn from `self.rng`."""
         return self.rng.randint(0, 2**32 - 1)
 
+    def _derive_seed(self, action_vector: list[int], pull: int | None = None) -> int:
+        """
+        Returns the seed for an evaluation of an action vector in the current run.
+
+        The seed is derived from the seed of the run, the action vector and the number of previous
+        evaluations of the action vector, instead of being drawn from `self.rng`. Hence, each
+        evaluation receives the same seed regardless of the order in which evaluations take place,
+        e.g., in batches, on an executor or on the threads of several islands.
+
+        Args:
+            action_vector: The encoded representation of parameter values.
+            pull: The number of previous evaluations of the action vector, as recorded by the
+                algorithm. Defaults to None (counted by the Study, in the order of the calls).
+
+        Returns:
+            A seed between 0 and 2**32 - 1.
+        """
+        key = tuple(action_vector)
+        if pull is None:
+            with self._lock:
+                pull = self._pulls[key]
+                self._pulls[key] += 1
+        digest = hashlib.blake2b(repr((self._run_seed, key, pull)).encode(), digest_size=4)
+        return int.from_bytes(digest.digest(), "little")
+
+    def _solutions(
+        self,
+        action_vectors: list[list[int]],
+        columns: dict[str, list[Any]],
+        pulls: list[int] | None = None,
+    ) -> list[dict[str, Any]]:
+        """
+        Converts decoded parameter values into the keyword arguments for the objective function.
+
+        Args:
+            action_vectors: The encoded representations of parameter values.
+            columns: The decoded values of each parameter, see `_decode_batch`. A seed per
+                solution is added if the objective accepts one, see `_derive_seed`.
+            pulls: The number of previous evaluations of each action vector. Defaults to None.
+
+        Returns:
+            The decoded parameter values, and a seed if the objective accepts one, per solution.
+        """
+        n_solutions = len(action_vectors)
+        if self.seeded_call:
+            if pulls is None:
+                pulls = [None] * n_solutions
+            columns["seed"] = [
+                self._derive_seed(vector, pull)
+                for vector, pull in zip(action_vectors, pulls, strict=True)
+            ]
+        return [{key: values[i] for key, values in columns.items()} for i in range(n_solutions)]
+
     def _evaluate(self, action_vector: list[int]) -> float:
         """
         Execute a trial with the given action vector.
@@ -106,22 +324,378 @@ class Study:
         Returns:
             The value from a single evaluation of the objective function.
         """
-        solution = self._decode(action_vector)
+        return self._evaluate_batch([action_vector])[0]
 
-        if self.seeded_call:
-            solution.update({"seed": self._generate_seed()})
+    def _evaluate_batch(
+        self, action_vectors: list[list[int]], pulls: list[int] | None = None
+    ) -> list[float] | list[list[float]]:
+        """
+        Execute a batch of trials, e.g., a generation of the optimization algorithm.
+
+        The trials are passed to the objective at once if it is batched, evaluated in parallel if
+        the Study has an executor, and saved to the storage at once. An objective that is batched
+        by "columns" receives a NumPy array per parameter instead of a list of solutions. The wall
+        time of each trial is kept for the algorithm, see `_batch_costs`.
 
-        evaluation = self._direction * self._objective(**solution)
-        return evaluation
+        Args:
+            action_vectors: The encoded representations of parameter values.
+            pulls: The number of evaluations of each action vector that the algorithm has recorded,
+                which keys the seeds of the trials. Defaults to None (counted by the Study).
+
+        Returns:
+            The values from a single evaluation of the objective function per action vector, or a
+            list of values per action vector for a multi-objective Study.
+        """
+        columns = self._decode_batch(action_vectors)
+        solutions = self._solutions(action_vectors, columns, pulls)
+
+        start = time.perf_counter()
+        if self._batched == "columns":
+            import numpy as np
+
+            values = list(self._objective({key: np.asarray(v) for key, v in columns.items()}))
+        elif self._batched:
+            values = list(self._objective(solutions))
+        elif self._executor is None:
+            values, costs = self._timed_calls(solutions)
+        elif self._timeout is None:
+            futures = [self._executor.submit(_timed_call, self._objective, **s) for s in solutions]
+            values, costs = self._timed_calls(solutions, [future.result() for future in futures])
+        else:
+            values, costs = self._evaluate_with_timeout(solutions)
+        if self._batched:
+            # A batched objective is timed as a whole, and the time is split evenly
+            costs = [(time.perf_counter() - start) / max(len(solutions), 1)] * len(solutions)
+        self._last_costs[threading.get_ident()] = costs
+
+        # Trials that timed out or failed, e.g., with a NaN value, are not saved, and their
+        # evaluation is discarded by the algorithm
+        discarded = [i for i, value in enumerate(values) if _is_discarded(value)]
+        if discarded:
+            n_failed = sum(values[i] is not _TIMED_OUT for i in discarded)
+            if n_failed:
+                _logger.warning(f"{n_failed} trials returned values that are not finite.")
+            return self._discard_trials(action_vectors, solutions, values, discarded)
+
+        if self._directions is None:
+            self._save_trials(action_vectors, solutions, values)
+            return [self._direction * value for value in values]
+
+        values = [list(value) for value in values]
+        self._save_trials(action_vectors, solutions, values)
+        return [
+            [direction * v for direction, v in zip(self._directions, value, strict=True)]
+            for value in values
+        ]
+
+    def _timed_calls(
+        self,
+        solutions: list[dict[str, Any]],
+        timed_values: list[tuple[Any, float]] | None = None,
+    ) -> tuple[list[Any], list[float]]:
+        """
+        Splits the results of `_timed_call` into values and costs.
+
+        Args:
+            solutions: The keyword arguments of each trial.
+            timed_values: The results of `_timed_call` per trial, e.g., from the executor. Default
+                is None, which evaluates the trials one after another.
+
+        Returns:
+            The value and the wall time in seconds of each trial.
+        """
+        if timed_values is None:
+            timed_values = [_timed_call(self._objective, **solution) for solution in solutions]
+        values = [value for value, _ in timed_values]
+        costs = [cost for _, cost in timed_values]
+        return values, costs
+
+    def _batch_costs(self) -> list[float]:
+        """
+        Returns the wall time of each trial of the last batch in seconds, see `_evaluate_batch`.
+
+        The costs are kept per thread, since the islands of the algorithm evaluate their batches
+        from their own threads.
+        """
+        return self._last_costs.pop(threading.get_ident())
+
+    def _on_progress(self, progress: dict[str, Any]) -> None:
+        """
+        Receives a snapshot of the running optimization from the algorithm, see `progress`.
+
+        The snapshots are rate-limited by the algorithm. Each one is reported in the direction of
+        the objective, and written to the metrics file, if any.
+
+        Args:
+            progress: The snapshot, with the best solution as action vector.
+        """
+        lower, upper = progress["best_value_ci"]
+        if self._direction == -1:
+            lower, upper = -upper, -lower
+        progress["best_value"] = self._direction * progress["best_value"]
+        progress["best_value_ci"] = (lower, upper)
+        action_vector = progress.pop("best_action_vector")
+        progress["best_params"] = self._decode(action_vector) if action_vector else None
+        progress["run_id"] = self._run_id
+        self._progress = progress
+
+        if self._metrics_file is not None:
+            labels = {"study": self.study_name, "run_id": str(self._run_id)}
+            try:
+                write_metrics(self._metrics_file, progress, labels)
+            except OSError as exc:  # e.g., a full disk, which must not abort the optimization
+                _logger.warning(f"Failed to write the metrics file: {exc}")
+
+    def _n_workers(self) -> int | None:
+        """Returns the number of workers of the executor, or None if it is unknown."""
+        n_workers = getattr(self._executor, "n_workers", None)  # e.g., a Coordinator
+        if n_workers is None:
+            n_workers = getattr(self._executor, "_max_workers", None)  # e.g., a ProcessPool
+        return n_workers
+
+    def _timed_out_value(self, retry: bool) -> Any:
+        """Returns the value of a trial that timed out, or None if it is retried."""
+        if self._on_timeout == "retry" and retry:
+            return None
+        if isinstance(self._on_timeout, str):
+            return _TIMED_OUT
+        if self._directions is None:
+            return self._on_timeout
+        return [self._on_timeout] * len(self._directions)
+
+    def _evaluate_with_timeout(
+        self, solutions: list[dict[str, Any]]
+    ) -> tuple[list[Any], list[float]]:
+        """
+        Evaluates the trials with the executor, and stops waiting for trials that time out.
+
+        A trial times out once it has been running for longer than the timeout. Since executors
+        hand out trials in order, only the first trials that are running count, one per worker
+        that is not occupied by a trial that timed out before, e.g., since a ProcessPoolExecutor
+        reports queued trials as running. Depending on the policy, a trial that timed out is then
+        retried once, or its value is the penalty, or `_TIMED_OUT` to discard it. The cost of a
+        trial includes the time of its attempts that timed out.
+
+        The generation also has a deadline, counted from submission, after which all pending
+        trials time out, e.g., if all workers are occupied by trials that hang. It allows for
+        `n / n_workers + 1` timeouts, the longest a generation of n trials takes if none of them
+        times out, and twice as many if trials are retried.
+
+        Args:
+            solutions: The keyword arguments of each trial.
+
+        Returns:
+            The value and the wall time in seconds of each trial, in the order of the solutions.
+        """
+        assert self._executor is not None and self._timeout is not None
+        futures: dict[Future, int] = {}
+        for index, solution in enumerate(solutions):
+            futures[self._executor.submit(_timed_call, self._objective, **solution)] = index
+        values: list[Any] = [None] * len(solutions)
+        costs: list[float] = [0.0] * len(solutions)
+        retried: set[int] = set()
+        started: dict[Future, float] = {}
+        poll_interval = min(self._timeout / 10, 0.1)
+
+        n_workers = self._n_workers()
+        n_timeouts = len(solutions) / max(n_workers or 1, 1) + 1
+        if self._on_timeout == "retry":
+            n_timeouts *= 2
+        deadline = time.monotonic() + n_timeouts * self._timeout
+
+        def time_out(future: Future, now: float, retry: bool) -> None:
+            pending.remove(future)
+            index = futures[future]
+            costs[index] += now - started.get(future, now)
+            if not future.cancel():
+                with self._lock:
+                    self._stragglers.add(future)
+
+            values[index] = self._timed_out_value(retry and index not in retried)
+            if values[index] is None:
+                retried.add(index)
+                retry_future = self._executor.submit(
+                    _timed_call, self._objective, **solutions[index]
+                )
+                futures[retry_future] = index
+                pending.add(retry_future)
+
+        pending = set(futures)
+        while pending:
+            done, pending = wait(pending, timeout=poll_interval, return_when=FIRST_COMPLETED)
+            for future in done:
+                index = futures[future]
+                values[index], cost = future.result()
+                costs[index] += cost
+
+            now = time.monotonic()
+            if now >= deadline:
+                _logger.warning(
+                    f"{len(pending)} trials timed out, since the generation did not complete "
+                    f"within {n_timeouts * self._timeout:.1f}s."
+                )
+                for future in [future for future in futures if future in pending]:
+                    time_out(future, now, retry=False)
+                break
+
+            # The first trials in order of submission run on the workers that are not occupied
+            running = [future for future in futures if future in pending and future.running()]
+            if (n_workers := self._n_workers()) is not None:
+                running = running[: max(n_workers - self._n_stragglers(), 0)]
+            for future in running:
+                if now - started.setdefault(future, now) < self._timeout:
+                    continue
+                _logger.warning(
+                    f"Trial timed out after {self._timeout}s: {solutions[futures[future]]}"
+                )
+                time_out(future, now, retry=True)
+        return values, costs
+
+    def _n_stragglers(self) -> int:
+        """Returns the number of trials that timed out, but still occupy a worker."""
+        with self._lock:
+            self._stragglers = {future for future in self._stragglers if not future.done()}
+            return len(self._stragglers)
+
+    def _cancel_stragglers(self) -> None:
+        """Cancels the trials that timed out, and logs those that keep running on the executor."""
+        with self._lock:
+            for future in self._stragglers:
+                future.cancel()
+        if n_stragglers := self._n_stragglers():
+            _logger.warning(
+                f"{n_stragglers} trials that timed out keep running on the executor, since "
+                "they cannot be cancelled."
+            )
+
+    def _discard_trials(
+        self,
+        action_vectors: list[list[int]],
+        solutions: list[dict[str, Any]],
+        values: list[Any],
+        discarded_trials: list[int],
+    ) -> list[float] | list[list[float]]:
+        """
+        Saves the trials that are not discarded, and returns the rewards for the algorithm.
+
+        Args:
+            action_vectors: The encoded representations of parameter values.
+            solutions: The decoded parameter values that were passed to the objective.
+            values: The values returned by the objective, or `_TIMED_OUT`.
+            discarded_trials: The indexes of the trials that timed out or failed, whose values
+                may be a single NaN even for multiple objectives.
+
+        Returns:
+            The rewards like `_evaluate_batch`, with NaN for the discarded trials, which tells
+            the algorithm to discard their evaluation.
+        """
+        discarded = set(discarded_trials)
+        kept = [i for i in range(len(values)) if i not in discarded]
+        if self._directions is not None:
+            values = [value if i in discarded else list(value) for i, value in enumerate(values)]
+        self._save_trials(
+            [action_vectors[i] for i in kept],
+            [solutions[i] for i in kept],
+            [values[i] for i in kept],
+        )
+
+        if self._directions is None:
+            return [
+                math.nan if i in discarded else self._direction * value
+                for i, value in enumerate(values)
+            ]
+        return [
+            [math.nan] * len(self._directions)
+            if i in discarded
+            else [direction * v for direction, v in zip(self._directions, value, strict=True)]
+            for i, value in enumerate(values)
+        ]
+
+    def _save_trials(
+        self,
+        action_vectors: list[list[int]],
+        solutions: list[dict[str, Any]],
+        values: list[float] | list[list[float]],
+    ) -> None:
+        """
+        Saves a batch of trials to the storage, using a single write.
+
+        Args:
+            action_vectors: The encoded representations of parameter values.
+            solutions: The decoded parameter values that were passed to the objective.
+            values: The values returned by the objective.
+        """
+        with self._lock:
+            first_trial_id = self._trial_id
+            self._trial_id += len(action_vectors)
+            for action_vector, value in zip(action_vectors, values, strict=True):
+                self._update_arm_stats(tuple(action_vector), value)
+
+        trials = []
+        for trial_id, (action_vector, solution, value) in enumerate(
+            zip(action_vectors, solutions, values, strict=True), start=first_trial_id
+        ):
+            params = {k: v for k, v in solution.items() if k != "seed"}
+            trials.append(
+                {
+                    "run_id": self._run_id,
+                    "trial_id": trial_id,
+                    "action_vector": list(action_vector),
+                    "params": params,
+                    "value": value,
+                }
+            )
+        self.storage.add_trials(self.study_name, trials)
+
+    def _update_arm_stats(self, key: tuple[int, ...], value: float | list[float]) -> None:
+        """Adds a value to the statistics of an arm, using Welford's online algorithm."""
+        values = value if isinstance(value, list) else [value]
+        n, means, ssqs = self._arm_stats.get(key, (0, [0.0] * len(values), [0.0] * len(values)))
+        n += 1
+        for i, v in enumerate(values):
+            delta = v - means[i]
+            means[i] += delta / n
+            ssqs[i] += delta * (v - means[i])
+        self._arm_stats[key] = (n, means, ssqs)
+
+    def _collect_arms(self) -> list[dict[str, Any]]:
+        """
+        Returns the statistics of all arms that were evaluated in the current run.
+
+        Returns:
+            A list of arms like the results, with a value and value_std_dev per objective for a
+            multi-objective Study.
+        """
+        arms = []
+        for key, (n, means, ssqs) in self._arm_stats.items():
+            std_devs = [math.sqrt(ssq / (n - 1)) if n > 1 else 0.0 for ssq in ssqs]
+            multi = self._directions is not None
+            arms.append(
+                {
+                    "run_id": self._run_id,
+                    "action_vector": list(key),
+                    "params": self._decode(list(key)),
+                    "value": means if multi else means[0],
+                    "value_std_dev": std_devs if multi else std_devs[0],
+                    "n_evaluations": n,
+                }
+            )
+        return arms
 
     def optimize(
         self,
         objective: Callable,
         params: ParamsType,
         n_trials: int,
-        maximize: bool = False,
+        maximize: bool | Sequence[bool] = False,
         n_best: int = 1,
         n_runs: int = 1,
+        executor: Executor | None = None,
+        batched: bool | str = False,
+        constraints: ConstraintsType | None = None,
+        timeout: float | None = None,
+        on_timeout: float | str = "discard",
+        metrics_file: str | os.PathLike | None = None,
     ) -> None:
         """
         Optimize the objective function, saving results to `study.results`.
@@ -130,16 +704,62 @@ class Study:
         specified bounds and running the objective function for a given number of trials.
 
         Args:
-            objective: The objective function to optimize.
+            objective: The objective function to optimize. Trials with values that are not finite,
+                e.g., NaN for a failed evaluation, are neither saved nor counted for their
+                solution.
             params: A dictionary of parameters with their bounds.
             n_trials: The number of evaluations to perform on the objective.
-            maximize: Indicates if objective is maximized. Default is False.
-            n_best: The number of results to return per run. Default is 1.
+            maximize: Indicates if objective is maximized. Default is False. A sequence with one
+                bool per objective optimizes multiple objectives at once. The objective then
+                returns one value per objective, and each run returns the approximated Pareto
+                front, i.e., the solutions that are not dominated in all objectives. The
+                algorithm must then run on a single island, without max_arms, cost_aware, a
+                surrogate, smoothing or a mutation_schedule other than "fixed".
+            n_best: The number of results to return per run. Default is 1. Not applicable to
+                multiple objectives, which return the whole Pareto front.
             n_runs: The number of times optimization is repeated. Default is 1.
+            executor: An executor to evaluate the trials of each generation in parallel, e.g.,
+                a `concurrent.futures.ProcessPoolExecutor` or an
+                `evobandits.distributed.Coordinator`. Default is None (sequential evaluation).
+            batched: Indicates if the objective evaluates a batch of trials at once. It then
+                receives a list with the keyword arguments of each trial, and must return a list
+                with one value per trial. With "columns", it receives the values of each parameter
+                (and the seeds) as a NumPy array over all trials instead. Default is False.
+            constraints: Constraints that all evaluated solutions must satisfy. Each constraint
+                is either a LinearConstraint, which is checked within the algorithm, or a
+                predicate that receives the parameter values like the objective and returns
+                True if they are feasible. Infeasible solutions are discarded before any
+                evaluation. Default is None (no constraints).
+            timeout: The number of seconds a trial may run before it times out. Requires an
+                executor, since a running objective cannot be interrupted otherwise. Trials that
+                time out are not waited for, but keep running on the executor if they cannot be
+                cancelled. All trials of a generation time out once it takes longer than the
+                timeout per trial and worker, e.g., if trials hang on all workers. Default is None
+                (no timeout).
+            on_timeout: What happens to a trial that timed out. With "discard", it is neither
+                saved nor counted for its solution. With "retry", it is retried once, and then
+                discarded. A number is used as the value of the trial instead, e.g., a penalty.
+                Default is "discard".
+            metrics_file: A file that the progress of the optimization is written to in the
+                Prometheus text format, e.g., for the textfile collector of the node exporter.
+                It is replaced at most once per second, see `progress`, and failures to write it
+                are logged. Not applicable to multiple objectives. Default is None (no file).
+
+        Raises:
+            ValueError: If the directory of the metrics_file does not exist.
         """
-        if not isinstance(maximize, bool):
+        if isinstance(maximize, Sequence) and not isinstance(maximize, str):
+            if not all(isinstance(m, bool) for m in maximize):
+                raise TypeError(f"maximize must be a sequence of bools, got {maximize}.")
+            if len(maximize) < 2:
+                raise ValueError(
+                    f"maximize must have one bool per objective for at least 2 objectives, "
+                    f"got {maximize}."
+                )
+            maximize = list(maximize)
+        elif not isinstance(maximize, bool):
             raise TypeError(f"maximize must be a bool, got {type(maximize)}.")
-        self._direction = -1 if maximize else 1
+        self._set_directions(maximize)
 
         if not isinstance(n_runs, int):
             raise TypeError(f"n_runs must be an int larger than 0, got {type(n_runs)}.")
@@ -160,24 +780,141 @@ class Study:
                 "the Study. Please consider renaming this parameter to avoid ambiguity."
             )
         self._params = params
+        self._space = self._build_space()
+
+        if executor is not None and not isinstance(executor, Executor):
+            raise TypeError(f"executor must be an Executor, got {type(executor)}.")
+        self._executor = executor
+
+        if not isinstance(batched, bool) and batched != "columns":
+            raise TypeError(f"batched must be a bool or 'columns', got {batched!r}.")
+        if batched and executor is not None:
+            raise ValueError("An executor cannot be used with a batched objective.")
+        self._batched = batched
+
+        if timeout is not None:
+            if isinstance(timeout, bool) or not isinstance(timeout, int | float):
+                raise TypeError(f"timeout must be a number, got {type(timeout)}.")
+            if timeout <= 0:
+                raise ValueError(f"timeout must be positive, got {timeout}.")
+            if executor is None:
+                raise ValueError(
+                    "A timeout requires an executor, e.g., a ProcessPoolExecutor, since a running "
+                    "objective cannot be interrupted otherwise."
+                )
+        if isinstance(on_timeout, str):
+            if on_timeout not in ON_TIMEOUT_POLICIES:
+                raise ValueError(
+                    f"on_timeout must be one of {ON_TIMEOUT_POLICIES} or a number, "
+                    f"got {on_timeout!r}."
+                )
+        elif isinstance(on_timeout, bool) or not isinstance(on_timeout, int | float):
+            raise TypeError(f"on_timeout must be a str or a number, got {type(on_timeout)}.")
+        elif not math.isfinite(on_timeout):
+            raise ValueError(f"on_timeout must be a finite number, got {on_timeout}.")
+        self._timeout = timeout
+        self._on_timeout = on_timeout
+
+        if metrics_file is not None and not isinstance(metrics_file, str | os.PathLike):
+            raise TypeError(f"metrics_file must be a path, got {type(metrics_file)}.")
+        if metrics_file is not None:
+            directory = os.path.dirname(os.path.abspath(metrics_file))
+            if not os.path.isdir(directory):
+                raise ValueError(f"The directory of the metrics_file does not exist: {directory}")
+        self._metrics_file = metrics_file
+        self._progress = None
+
+        if constraints is None:
+            constraints = []
+        if not isinstance(constraints, Sequence):
+            raise TypeError(f"constraints must be a sequence, got {type(constraints)}.")
+        linear_constraints = []
+        self._predicates = []
+        for constraint in constraints:
+            if isinstance(constraint, LinearConstraint):
+                linear_constraints.append(constraint.encode(params))
+            elif callable(constraint):
+                self._predicates.append(constraint)
+            else:
+                raise TypeError(
+                    f"A constraint must be a LinearConstraint or callable, got {type(constraint)}."
+                )
+        feasible = self._is_feasible if self._predicates else None
 
         # input validation for objective, n_trials, n_best is managed by 'self.algorithm'
         self._objective = objective
 
         bounds = self._collect_bounds()
+        strides = self._collect_strides()
 
-        for run_id in range(n_runs):
+        first_run_id = len(self.storage.get_runs(self.study_name))
+        for run_id in range(first_run_id, first_run_id + n_runs):
             seed = self._generate_seed()  # new entropy for each seeded run
+            self._run_id = run_id
+            self._trial_id = 0
+            self._run_seed = seed
+            self._pulls.clear()
+            self._arm_stats.clear()
+            self.storage.create_run(
+                self.study_name,
+                {
+                    "run_id": run_id,
+                    "seed": seed,
+                    "n_trials": n_trials,
+                    "n_best": n_best,
+                    "maximize": maximize,
+                },
+            )
+
+            # Evaluate generations as batches, so that trials are saved once per generation
             algorithm = self.algorithm.clone()
-            best_arms = algorithm.optimize(self._evaluate, bounds, n_trials, n_best, seed)
+            if self._directions is None:
+                best_arms = algorithm.optimize(
+                    self._evaluate_batch,
+                    bounds,
+                    n_trials,
+                    n_best,
+                    seed,
+                    batched=True,
+                    constraints=linear_constraints,
+                    feasible=feasible,
+                    strides=strides,
+                    costs=self._batch_costs,
+                    pulls=True,
+                    progress=self._on_progress,
+                )
+            else:
+                best_arms = algorithm.optimize_multi(
+                    self._evaluate_batch,
+                    bounds,
+                    n_trials,
+                    len(self._directions),
+                    seed,
+                    batched=True,
+                    constraints=linear_constraints,
+                    feasible=feasible,
+                )
 
-            for n_best, arm in enumerate(best_arms, start=1):
+            run_results = []
+            for rank, arm in enumerate(best_arms, start=1):
                 result = arm.to_dict
                 action_vector = result.pop("action_vector")
+                if self._directions is not None:
+                    # Report each value in the direction of its objective
+                    values = zip(self._directions, result.pop("values"), strict=True)
+                    result = {
+                        "value": [direction * value for direction, value in values],
+                        "value_std_dev": result.pop("value_std_devs"),
+                        "n_evaluations": result["n_evaluations"],
+                    }
                 result["params"] = self._decode(action_vector)
-                result["n_best"] = n_best
+                result["n_best"] = rank
                 result["run_id"] = run_id
                 self.results.append(result)
+                run_results.append({**result, "action_vector": action_vector})
+            self._cancel_stragglers()
+            self.storage.add_arms(self.study_name, self._collect_arms())
+            self.storage.add_results(self.study_name, run_results)
 
     @property
     def seeded_call(self) -> bool:
@@ -209,6 +946,77 @@ class Study:
             self._rng = Random(self.seed) if self.seed else Random()
         return self._rng
 
+    @property
+    def progress(self) -> dict[str, Any] | None:
+        """
+        The latest snapshot of the progress of the running, or the last optimization.
+
+        Snapshots are taken at most once per second while a run is optimized, and once at the
+        end of each run. They are not taken for multiple objectives.
+
+        Returns:
+            A dictionary with the run_id, the number of trials used so far (`used_trials`) of
+            `n_trials`, `n_generations`, the `elapsed` seconds and `trials_per_second`, the
+            `best_params` with their `best_value`, its 95% confidence interval `best_value_ci`
+            and `best_n_evaluations`, the size of the arm memory `n_arms`, the number of
+            evaluations of new (`n_new_arms`) and known solutions (`n_repulls`) with their
+            `repull_ratio`, and the seconds spent per phase in `phase_times`. None if no
+            snapshot was taken yet.
+        """
+        return self._progress
+
+    @property
+    def results(self) -> Results:
+        """
+        The results of all runs, which behave like a list of dictionaries.
+
+        Returns:
+            The Results, with the best results and the mean value maintained per run.
+        """
+        return self._results
+
+    @results.setter
+    def results(self, results: Iterable[dict[str, Any]]) -> None:
+        self._results = Results(results)
+
+    def _check_single_objective(self) -> None:
+        """Raises an AttributeError if the Study has no results, or multiple objectives."""
+        if not self.results:
+            raise AttributeError("Study has no results. Run study.optimize() first.")
+        if self._directions is not None:
+            raise AttributeError(
+                "Study has multiple objectives, which have no single best value. "
+                "Use study.pareto_front instead."
+            )
+
+    @property
+    def pareto_front(self) -> list[dict[str, Any]]:
+        """
+        Returns the approximated Pareto front of a multi-objective Study.
+
+        Returns:
+            The results of all runs that are not dominated by any other result, i.e., no other
+            result is at least as good in all objectives and better in at least one.
+        """
+        if not self.results:
+            raise AttributeError("Study has no results. Run study.optimize() first.")
+        if self._directions is None:
+            raise AttributeError("Study has a single objective. Use study.best_solution instead.")
+
+        points = [
+            [d * v for d, v in zip(self._directions, r["value"], strict=True)]
+            for r in self.results
+        ]
+
+        def dominates(a: list[float], b: list[float]) -> bool:
+            return all(x <= y for x, y in zip(a, b, strict=True)) and a != b
+
+        return [
+            result
+            for result, point in zip(self.results, points, strict=True)
+            if not any(dominates(other, point) for other in points)
+        ]
+
     @property
     def best_value(self) -> float:
         """
@@ -217,9 +1025,7 @@ class Study:
         Returns:
             The best value among `study.results`.
         """
-        if not self.results:
-            raise AttributeError("Study has no results. Run study.optimize() first.")
-        return max(self.results, key=lambda r: -self._direction * r["value"])["value"]
+        return self.best_solution["value"]
 
     @property
     def mean_value(self) -> float:
@@ -229,9 +1035,8 @@ class Study:
         Returns:
             The mean value of `study.results`.
         """
-        if not self.results:
-            raise AttributeError("Study has no results. Run study.optimize() first.")
-        return mean([r["value"] for r in self.results])
+        self._check_single_objective()
+        return self.results.mean()
 
     @property
     def best_solution(self) -> dict[str, Any]:
@@ -241,9 +1046,8 @@ class Study:
         Returns:
             The solution (as a dictionary) that yielded `study.best_value`.
         """
-        if not self.results:
-            raise AttributeError("Study has no results. Run study.optimize() first.")
-        return next(r for r in self.results if r["value"] == self.best_value)
+        self._check_single_objective()
+        return self.results[self.results.best_index(maximize=self._direction == -1)]
 
     @property
     def best_params(self) -> dict[str, Any]:
@@ -14,39 +14,318 @@
 
 use pyo3::exceptions::PyRuntimeError;
 use pyo3::prelude::*;
-use pyo3::types::{PyDict, PyList};
+use pyo3::types::{PyBytes, PyDict, PyList};
 use std::panic;
+use std::time::Instant;
 
-use evobandits_rust::arm::{Arm as RustArm, OptimizationFn};
+use evobandits_rust::arm::{
+    arms_from_bytes, arms_to_bytes, time_each, Arm as RustArm, OptimizationFn,
+};
+use evobandits_rust::codec::{Decoder, Encoder};
+use evobandits_rust::constraint::LinearConstraint;
 use evobandits_rust::evobandits::GMAB as RustGMAB;
 use evobandits_rust::genetic::{
-    GeneticAlgorithm, CROSSOVER_RATE_DEFAULT, MUTATION_RATE_DEFAULT, MUTATION_SPAN_DEFAULT,
-    POPULATION_SIZE_DEFAULT,
+    GeneticAlgorithm, MutationSchedule, CROSSOVER_RATE_DEFAULT, MUTATION_RATE_DEFAULT,
+    MUTATION_SPAN_DEFAULT, POPULATION_SIZE_DEFAULT,
+};
+use evobandits_rust::island::{
+    IslandModel, MIGRATION_INTERVAL_DEFAULT, MIGRATION_SIZE_DEFAULT, N_ISLANDS_DEFAULT,
 };
+use evobandits_rust::multi_objective::{
+    MultiObjectiveArm as RustMultiObjectiveArm, MultiObjectiveFn, MultiObjectiveGMAB,
+};
+use evobandits_rust::param_space::{ParamSpace as RustParamSpace, ParamSpec};
+use evobandits_rust::progress::{Progress, PROGRESS_INTERVAL_DEFAULT};
+use evobandits_rust::smoothing::Smoothing;
+use evobandits_rust::surrogate::{Surrogate, SURROGATE_NEIGHBORS_DEFAULT};
 
 struct PythonOptimizationFn {
     py_func: PyObject,
+    batched: bool,
+    // Passes the number of recorded evaluations of each arm as second argument, see
+    // `OptimizationFn::evaluate_batch_keyed`
+    keyed: bool,
+    py_feasible: Option<PyObject>,
+    // Returns the wall time of each evaluation of the last batch, e.g. as measured by a Study
+    py_costs: Option<PyObject>,
+    // Receives a snapshot of the optimization as dict at most once per progress_interval seconds
+    py_progress: Option<PyObject>,
+    progress_interval: f64,
 }
 
 impl PythonOptimizationFn {
-    fn new(py_func: PyObject) -> Self {
-        Self { py_func }
+    fn new(
+        py_func: PyObject,
+        batched: bool,
+        keyed: bool,
+        py_feasible: Option<PyObject>,
+        py_costs: Option<PyObject>,
+        py_progress: Option<PyObject>,
+        progress_interval: f64,
+    ) -> Self {
+        Self {
+            py_func,
+            batched,
+            keyed,
+            py_feasible,
+            py_costs,
+            py_progress,
+            progress_interval,
+        }
     }
-}
 
-impl OptimizationFn for PythonOptimizationFn {
-    fn evaluate(&self, action_vector: &[i32]) -> f64 {
+    // Calls the Python function with a list of action vectors, if it is batched.
+    fn call_batch<T: for<'py> FromPyObject<'py>>(&self, action_vectors: &[Vec<i32>]) -> Vec<T> {
+        Python::with_gil(|py| {
+            let py_list = PyList::new(py, action_vectors);
+            let result = self
+                .py_func
+                .call1(py, (py_list.unwrap(),))
+                .expect("Failed to call Python function");
+            result
+                .extract::<Vec<T>>(py)
+                .expect("Failed to extract list of results")
+        })
+    }
+
+    // Calls the Python function with a list of action vectors and the pulls of their arms.
+    fn call_batch_keyed(&self, action_vectors: &[Vec<i32>], pulls: &[i32]) -> Vec<f64> {
+        Python::with_gil(|py| {
+            let py_list = PyList::new(py, action_vectors);
+            let result = self
+                .py_func
+                .call1(py, (py_list.unwrap(), pulls.to_vec()))
+                .expect("Failed to call Python function");
+            result
+                .extract::<Vec<f64>>(py)
+                .expect("Failed to extract list of results")
+        })
+    }
+
+    // Calls the Python function with a single action vector and the pull of its arm.
+    fn call_keyed(&self, action_vector: &[i32], pull: i32) -> f64 {
+        Python::with_gil(|py| {
+            let py_list = PyList::new(py, action_vector);
+            let result = self
+                .py_func
+                .call1(py, (py_list.unwrap(), pull))
+                .expect("Failed to call Python function");
+            result.extract::<f64>(py).expect("Failed to extract result")
+        })
+    }
+
+    // Calls the Python function with a single action vector.
+    fn call<T: for<'py> FromPyObject<'py>>(&self, action_vector: &[i32]) -> T {
         Python::with_gil(|py| {
             let py_list = PyList::new(py, action_vector);
             let result = self
                 .py_func
                 .call1(py, (py_list.unwrap(),))
                 .expect("Failed to call Python function");
-            result.extract::<f64>(py).expect("Failed to extract f64")
+            result.extract::<T>(py).expect("Failed to extract result")
+        })
+    }
+
+    // Calls the Python function that returns the costs of the last batch.
+    fn call_costs(&self, py_costs: &PyObject) -> Vec<f64> {
+        Python::with_gil(|py| {
+            let result = py_costs
+                .call0(py)
+                .expect("Failed to call Python costs function");
+            result
+                .extract::<Vec<f64>>(py)
+                .expect("Failed to extract list of costs")
+        })
+    }
+
+    // Calls the Python progress function with a snapshot of the optimization.
+    fn call_progress(&self, py_progress: &PyObject, progress: &Progress) {
+        Python::with_gil(|py| {
+            let phase_times = PyDict::new(py);
+            phase_times
+                .set_item("breeding", progress.phase_times.breeding)
+                .unwrap();
+            phase_times
+                .set_item("evaluation", progress.phase_times.evaluation)
+                .unwrap();
+            phase_times
+                .set_item("update", progress.phase_times.update)
+                .unwrap();
+
+            let dict = PyDict::new(py);
+            dict.set_item("n_trials", progress.n_trials).unwrap();
+            dict.set_item("used_trials", progress.used_trials).unwrap();
+            dict.set_item("n_generations", progress.n_generations)
+                .unwrap();
+            dict.set_item("elapsed", progress.elapsed).unwrap();
+            dict.set_item("trials_per_second", progress.trials_per_second)
+                .unwrap();
+            dict.set_item("best_action_vector", &progress.best_action_vector)
+                .unwrap();
+            dict.set_item("best_value", progress.best_value).unwrap();
+            dict.set_item("best_value_ci", progress.best_value_ci)
+                .unwrap();
+            dict.set_item("best_n_evaluations", progress.best_n_evaluations)
+                .unwrap();
+            dict.set_item("n_arms", progress.n_arms).unwrap();
+            dict.set_item("n_new_arms", progress.n_new_arms).unwrap();
+            dict.set_item("n_repulls", progress.n_repulls).unwrap();
+            dict.set_item("repull_ratio", progress.repull_ratio)
+                .unwrap();
+            dict.set_item("phase_times", phase_times).unwrap();
+            py_progress
+                .call1(py, (dict,))
+                .expect("Failed to call Python progress function");
+        })
+    }
+
+    fn check_feasible(&self, action_vector: &[i32]) -> bool {
+        let py_feasible = match &self.py_feasible {
+            Some(py_feasible) => py_feasible,
+            None => return true,
+        };
+
+        Python::with_gil(|py| {
+            let py_list = PyList::new(py, action_vector);
+            let result = py_feasible
+                .call1(py, (py_list.unwrap(),))
+                .expect("Failed to call Python feasibility function");
+            result.extract::<bool>(py).expect("Failed to extract bool")
         })
     }
 }
 
+impl OptimizationFn for PythonOptimizationFn {
+    fn evaluate(&self, action_vector: &[i32]) -> f64 {
+        if self.batched {
+            return OptimizationFn::evaluate_batch(self, &[action_vector.to_vec()])[0];
+        }
+        self.call(action_vector)
+    }
+
+    fn evaluate_batch(&self, action_vectors: &[Vec<i32>]) -> Vec<f64> {
+        if !self.batched {
+            return action_vectors
+                .iter()
+                .map(|action_vector| OptimizationFn::evaluate(self, action_vector))
+                .collect();
+        }
+
+        // A batched Python function receives a list of action vectors, and returns a list of values
+        self.call_batch(action_vectors)
+    }
+
+    // Prefers the costs reported by Python, since a batched function might evaluate its batch in
+    // parallel. Otherwise, each evaluation is timed if the function is not batched, and the time
+    // of a batched call is split evenly.
+    fn evaluate_batch_timed(&self, action_vectors: &[Vec<i32>]) -> (Vec<f64>, Vec<f64>) {
+        if let Some(py_costs) = &self.py_costs {
+            let rewards = OptimizationFn::evaluate_batch(self, action_vectors);
+            return (rewards, self.call_costs(py_costs));
+        }
+        if !self.batched {
+            return time_each(action_vectors, |action_vector| self.call(action_vector));
+        }
+        let start = Instant::now();
+        let rewards = self.call_batch(action_vectors);
+        let cost = start.elapsed().as_secs_f64() / action_vectors.len().max(1) as f64;
+        (rewards, vec![cost; action_vectors.len()])
+    }
+
+    // Like `evaluate_batch_timed`, but passes the pulls to a keyed Python function.
+    fn evaluate_batch_keyed(
+        &self,
+        action_vectors: &[Vec<i32>],
+        pulls: &[i32],
+    ) -> (Vec<f64>, Vec<f64>) {
+        if !self.keyed {
+            return OptimizationFn::evaluate_batch_timed(self, action_vectors);
+        }
+        let (rewards, costs) = if self.batched {
+            let start = Instant::now();
+            let rewards = self.call_batch_keyed(action_vectors, pulls);
+            let cost = start.elapsed().as_secs_f64() / action_vectors.len().max(1) as f64;
+            (rewards, vec![cost; action_vectors.len()])
+        } else {
+            action_vectors
+                .iter()
+                .zip(pulls)
+                .map(|(action_vector, &pull)| {
+                    let start = Instant::now();
+                    let reward = self.call_keyed(action_vector, pull);
+                    (reward, start.elapsed().as_secs_f64())
+                })
+                .unzip()
+        };
+        match &self.py_costs {
+            Some(py_costs) => (rewards, self.call_costs(py_costs)),
+            None => (rewards, costs),
+        }
+    }
+
+    fn is_feasible(&self, action_vector: &[i32]) -> bool {
+        self.check_feasible(action_vector)
+    }
+
+    fn progress_interval(&self) -> Option<f64> {
+        self.py_progress
+            .as_ref()
+            .map(|_py_progress| self.progress_interval)
+    }
+
+    fn report_progress(&self, progress: &Progress) {
+        if let Some(py_progress) = &self.py_progress {
+            self.call_progress(py_progress, progress);
+        }
+    }
+}
+
+impl MultiObjectiveFn for PythonOptimizationFn {
+    fn evaluate(&self, action_vector: &[i32]) -> Vec<f64> {
+        if self.batched {
+            return MultiObjectiveFn::evaluate_batch(self, &[action_vector.to_vec()]).remove(0);
+        }
+        self.call(action_vector)
+    }
+
+    fn evaluate_batch(&self, action_vectors: &[Vec<i32>]) -> Vec<Vec<f64>> {
+        if !self.batched {
+            return action_vectors
+                .iter()
+                .map(|action_vector| MultiObjectiveFn::evaluate(self, action_vector))
+                .collect();
+        }
+
+        // A batched Python function receives a list of action vectors, and returns one list of
+        // values per action vector
+        self.call_batch(action_vectors)
+    }
+
+    fn is_feasible(&self, action_vector: &[i32]) -> bool {
+        self.check_feasible(action_vector)
+    }
+}
+
+// Converts a panic of the EvoBandits Core into a Python exception.
+fn panic_to_py_err(err: Box<dyn std::any::Any + Send>) -> PyErr {
+    if let Some(s) = err.downcast_ref::<&str>() {
+        PyRuntimeError::new_err(format!("{}", s))
+    } else if let Some(s) = err.downcast_ref::<String>() {
+        PyRuntimeError::new_err(format!("{}", s))
+    } else {
+        PyRuntimeError::new_err("EvoBandits Core raised an Error with unknown cause.")
+    }
+}
+
+// Converts the (coefficients, upper_bound) tuples from Python into linear constraints.
+fn to_linear_constraints(constraints: Option<Vec<(Vec<f64>, f64)>>) -> Vec<LinearConstraint> {
+    constraints
+        .unwrap_or_default()
+        .into_iter()
+        .map(|(coefficients, upper_bound)| LinearConstraint::new(coefficients, upper_bound))
+        .collect()
+}
+
 #[pyclass]
 struct Arm {
     arm: RustArm,
@@ -92,6 +371,47 @@ impl Arm {
             .unwrap();
         dict.into()
     }
+
+    // Mean wall time of an evaluation in seconds, or 0.0 if it is unknown.
+    #[getter]
+    fn mean_cost(&self) -> f64 {
+        self.arm.get_mean_cost()
+    }
+
+    // Encodes the arm with its statistics, e.g. to send it to another process.
+    fn to_bytes(&self, py: Python) -> Py<PyBytes> {
+        PyBytes::new(py, &self.arm.to_bytes()).into()
+    }
+
+    #[staticmethod]
+    fn from_bytes(data: &[u8]) -> PyResult<Self> {
+        panic::catch_unwind(|| RustArm::from_bytes(data))
+            .map(Arm::from)
+            .map_err(panic_to_py_err)
+    }
+
+    // Encodes a list of arms at once, which is more compact than pickling each arm.
+    #[staticmethod]
+    fn list_to_bytes(py: Python, arms: Vec<PyRef<Arm>>) -> Py<PyBytes> {
+        let arms: Vec<RustArm> = arms.iter().map(|arm| arm.arm.clone()).collect();
+        PyBytes::new(py, &arms_to_bytes(&arms)).into()
+    }
+
+    #[staticmethod]
+    fn list_from_bytes(data: &[u8]) -> PyResult<Vec<Arm>> {
+        panic::catch_unwind(|| arms_from_bytes(data))
+            .map(|arms| arms.into_iter().map(Arm::from).collect())
+            .map_err(panic_to_py_err)
+    }
+
+    // Pickles the arm as its encoding, see `to_bytes`.
+    fn __reduce__<'py>(
+        slf: &Bound<'py, Self>,
+    ) -> PyResult<(Bound<'py, PyAny>, (Bound<'py, PyBytes>,))> {
+        let from_bytes = slf.get_type().getattr("from_bytes")?;
+        let data = PyBytes::new(slf.py(), &slf.borrow().arm.to_bytes());
+        Ok((from_bytes, (data,)))
+    }
 }
 
 // Wraps a RustArm as python-compatible Arm instance.
@@ -102,10 +422,135 @@ impl From<RustArm> for Arm {
     }
 }
 
+#[pyclass]
+struct MultiObjectiveArm {
+    arm: RustMultiObjectiveArm,
+}
+
+#[pymethods]
+impl MultiObjectiveArm {
+    #[getter]
+    fn n_evaluations(&self) -> i32 {
+        self.arm.get_n_evaluations()
+    }
+
+    #[getter]
+    fn values(&self) -> Vec<f64> {
+        self.arm.get_values().to_vec()
+    }
+
+    #[getter]
+    fn value_std_devs(&self) -> Vec<f64> {
+        self.arm.get_value_std_devs()
+    }
+
+    #[getter]
+    fn action_vector(&self) -> Vec<i32> {
+        self.arm.get_action_vector().to_vec()
+    }
+
+    #[getter]
+    fn to_dict(&self, py: Python) -> Py<PyDict> {
+        let dict = PyDict::new(py);
+        dict.set_item("action_vector", self.arm.get_action_vector().to_vec())
+            .unwrap();
+        dict.set_item("values", self.arm.get_values().to_vec())
+            .unwrap();
+        dict.set_item("value_std_devs", self.arm.get_value_std_devs())
+            .unwrap();
+        dict.set_item("n_evaluations", self.arm.get_n_evaluations())
+            .unwrap();
+        dict.into()
+    }
+}
+
+impl From<RustMultiObjectiveArm> for MultiObjectiveArm {
+    fn from(arm: RustMultiObjectiveArm) -> Self {
+        MultiObjectiveArm { arm }
+    }
+}
+
+// Native description of a parameter space, which validates the parameters once and decodes
+// action vectors in batches.
+#[pyclass(eq)]
+#[derive(Debug, PartialEq, Clone)]
+struct ParamSpace {
+    space: RustParamSpace,
+}
+
+impl ParamSpace {
+    fn add(&mut self, spec: ParamSpec, size: usize) -> PyResult<()> {
+        let space = &mut self.space;
+        panic::catch_unwind(std::panic::AssertUnwindSafe(|| space.add(spec, size)))
+            .map_err(panic_to_py_err)
+    }
+}
+
+#[pymethods]
+impl ParamSpace {
+    #[new]
+    fn new() -> Self {
+        ParamSpace {
+            space: RustParamSpace::new(),
+        }
+    }
+
+    #[pyo3(signature = (low, high, size=1))]
+    fn add_int(&mut self, low: i32, high: i32, size: usize) -> PyResult<()> {
+        self.add(ParamSpec::Int { low, high }, size)
+    }
+
+    #[pyo3(signature = (low, high, n_steps, log=false, size=1))]
+    fn add_float(
+        &mut self,
+        low: f64,
+        high: f64,
+        n_steps: i32,
+        log: bool,
+        size: usize,
+    ) -> PyResult<()> {
+        self.add(
+            ParamSpec::Float {
+                low,
+                high,
+                n_steps,
+                log,
+            },
+            size,
+        )
+    }
+
+    fn add_categorical(&mut self, n_choices: i32) -> PyResult<()> {
+        self.add(ParamSpec::Categorical { n_choices }, 1)
+    }
+
+    #[getter]
+    fn dimension(&self) -> usize {
+        self.space.dimension()
+    }
+
+    #[getter]
+    fn bounds(&self) -> Vec<(i32, i32)> {
+        self.space.bounds()
+    }
+
+    // Decodes a batch of action vectors, and returns one list of values per dimension.
+    fn decode(&self, action_vectors: Vec<Vec<i32>>) -> PyResult<Vec<Vec<f64>>> {
+        panic::catch_unwind(std::panic::AssertUnwindSafe(|| {
+            self.space.decode_columns(&action_vectors)
+        }))
+        .map_err(panic_to_py_err)
+    }
+}
+
+// Tag of the encoding of a GMAB with its island model, see `codec`.
+const GMAB_TAG: &[u8; 3] = b"PGM";
+
 #[pyclass(eq)]
 #[derive(Debug, PartialEq, Clone)]
 struct GMAB {
     gmab: RustGMAB,
+    island_model: IslandModel,
 }
 
 #[pymethods]
@@ -116,13 +561,45 @@ impl GMAB {
         mutation_rate=MUTATION_RATE_DEFAULT,
         crossover_rate=CROSSOVER_RATE_DEFAULT,
         mutation_span=MUTATION_SPAN_DEFAULT,
+        islands=N_ISLANDS_DEFAULT,
+        migration_interval=MIGRATION_INTERVAL_DEFAULT,
+        migration_size=MIGRATION_SIZE_DEFAULT,
+        max_arms=None,
+        mutation_schedule="fixed",
+        cost_aware=false,
+        surrogate_oversampling=None,
+        surrogate_neighbors=SURROGATE_NEIGHBORS_DEFAULT,
+        smoothing_bandwidth=None,
     ))]
     fn new(
         population_size: Option<usize>,
         mutation_rate: Option<f64>,
         crossover_rate: Option<f64>,
         mutation_span: Option<f64>,
+        islands: Option<usize>,
+        migration_interval: Option<usize>,
+        migration_size: Option<usize>,
+        max_arms: Option<usize>,
+        mutation_schedule: &str,
+        cost_aware: bool,
+        surrogate_oversampling: Option<usize>,
+        surrogate_neighbors: usize,
+        smoothing_bandwidth: Option<f64>,
     ) -> PyResult<Self> {
+        let mutation_schedule =
+            panic::catch_unwind(|| MutationSchedule::from_name(mutation_schedule))
+                .map_err(panic_to_py_err)?;
+        let surrogate = surrogate_oversampling.map(|oversampling| Surrogate {
+            n_neighbors: surrogate_neighbors,
+            oversampling,
+        });
+        if let Some(surrogate) = surrogate {
+            panic::catch_unwind(|| surrogate.validate()).map_err(panic_to_py_err)?;
+        }
+        let smoothing = smoothing_bandwidth.map(|bandwidth| Smoothing { bandwidth });
+        if let Some(smoothing) = smoothing {
+            panic::catch_unwind(|| smoothing.validate()).map_err(panic_to_py_err)?;
+        }
         let genetic_algorithm = GeneticAlgorithm {
             population_size: population_size.unwrap(),
             mutation_rate: mutation_rate.unwrap(),
@@ -130,8 +607,18 @@ impl GMAB {
             mutation_span: mutation_span.unwrap(),
             ..Default::default()
         };
-        let gmab = RustGMAB::new(genetic_algorithm);
-        Ok(GMAB { gmab })
+        let mut gmab = RustGMAB::new(genetic_algorithm);
+        gmab.set_max_arms(max_arms);
+        gmab.set_mutation_schedule(mutation_schedule);
+        gmab.set_cost_aware(cost_aware);
+        gmab.set_surrogate(surrogate);
+        gmab.set_smoothing(smoothing);
+        let island_model = IslandModel {
+            n_islands: islands.unwrap(),
+            migration_interval: migration_interval.unwrap(),
+            migration_size: migration_size.unwrap(),
+        };
+        Ok(GMAB { gmab, island_model })
     }
 
     #[pyo3(signature = (
@@ -140,21 +627,63 @@ impl GMAB {
         n_trials,
         n_best,
         seed=None,
+        batched=false,
+        constraints=None,
+        feasible=None,
+        strides=None,
+        costs=None,
+        pulls=false,
+        progress=None,
+        progress_interval=PROGRESS_INTERVAL_DEFAULT,
     ))]
     fn optimize(
         &mut self,
+        py: Python<'_>,
         py_func: PyObject,
         bounds: Vec<(i32, i32)>,
         n_trials: usize,
         n_best: usize,
         seed: Option<u64>,
+        batched: bool,
+        constraints: Option<Vec<(Vec<f64>, f64)>>,
+        feasible: Option<PyObject>,
+        strides: Option<Vec<i32>>,
+        costs: Option<PyObject>,
+        pulls: bool,
+        progress: Option<PyObject>,
+        progress_interval: f64,
     ) -> PyResult<Vec<Arm>> {
-        let py_opti_function = PythonOptimizationFn::new(py_func);
+        let py_opti_function = PythonOptimizationFn::new(
+            py_func,
+            batched,
+            pulls,
+            feasible,
+            costs,
+            progress,
+            progress_interval,
+        );
 
-        let result = panic::catch_unwind(std::panic::AssertUnwindSafe(|| {
-            self.gmab
-                .optimize(py_opti_function, bounds, n_trials, n_best, seed)
-        }));
+        // Linear constraints (coefficients, upper_bound) are checked in Rust
+        self.gmab
+            .set_constraints(to_linear_constraints(constraints));
+        // Initial grid strides per dimension, which are refined during the optimization
+        self.gmab.set_strides(strides);
+
+        let result = if self.island_model.n_islands == 1 {
+            panic::catch_unwind(std::panic::AssertUnwindSafe(|| {
+                self.gmab
+                    .optimize(py_opti_function, bounds, n_trials, n_best, seed)
+            }))
+        } else {
+            // Release the GIL, so that the islands can call the objective from their own threads
+            let gmab = &self.gmab;
+            let island_model = &self.island_model;
+            py.allow_threads(|| {
+                panic::catch_unwind(std::panic::AssertUnwindSafe(|| {
+                    island_model.optimize(gmab, py_opti_function, bounds, n_trials, n_best, seed)
+                }))
+            })
+        };
 
         match result {
             // Convert rust-only Vec<RustArm> into Python-compatible Vec<Arm> wrappers,
@@ -163,23 +692,122 @@ impl GMAB {
                 let py_result: Vec<Arm> = result.into_iter().map(Arm::from).collect();
                 Ok(py_result)
             }
-            Err(err) => {
-                if let Some(s) = err.downcast_ref::<&str>() {
-                    Err(PyRuntimeError::new_err(format!("{}", s)))
-                } else if let Some(s) = err.downcast_ref::<String>() {
-                    Err(PyRuntimeError::new_err(format!("{}", s)))
-                } else {
-                    Err(PyRuntimeError::new_err(
-                        "EvoBandits Core raised an Error with unknown cause.",
-                    ))
-                }
-            }
+            Err(err) => Err(panic_to_py_err(err)),
         }
     }
 
+    // Optimizes an objective that returns one value per objective (to be minimized), and returns
+    // the arms of the approximated Pareto front. Islands, max_arms, a mutation_schedule other than
+    // "fixed", cost_aware, the surrogate and smoothing are not supported yet, and rejected.
+    #[pyo3(signature = (
+        py_func,
+        bounds,
+        n_trials,
+        n_objectives,
+        seed=None,
+        batched=false,
+        constraints=None,
+        feasible=None,
+    ))]
+    fn optimize_multi(
+        &mut self,
+        py_func: PyObject,
+        bounds: Vec<(i32, i32)>,
+        n_trials: usize,
+        n_objectives: usize,
+        seed: Option<u64>,
+        batched: bool,
+        constraints: Option<Vec<(Vec<f64>, f64)>>,
+        feasible: Option<PyObject>,
+    ) -> PyResult<Vec<MultiObjectiveArm>> {
+        // Progress is not reported for multi-objective optimization yet
+        let py_opti_function =
+            PythonOptimizationFn::new(py_func, batched, false, feasible, None, None, 0.0);
+
+        let result = panic::catch_unwind(std::panic::AssertUnwindSafe(|| {
+            let options = [
+                ("islands", self.island_model.n_islands > 1),
+                ("max_arms", self.gmab.get_max_arms().is_some()),
+                (
+                    "mutation_schedule",
+                    self.gmab.get_mutation_schedule() != MutationSchedule::Fixed,
+                ),
+                ("cost_aware", self.gmab.get_cost_aware()),
+                (
+                    "surrogate_oversampling",
+                    self.gmab.get_surrogate().is_some(),
+                ),
+                ("smoothing_bandwidth", self.gmab.get_smoothing().is_some()),
+            ];
+            let unsupported: Vec<&str> = options
+                .iter()
+                .filter(|(_, is_set)| *is_set)
+                .map(|(name, _)| *name)
+                .collect();
+            assert!(
+                unsupported.is_empty(),
+                "Multi-objective optimization does not support {}.",
+                unsupported.join(", ")
+            );
+            let mut gmab = MultiObjectiveGMAB::new(self.gmab.get_genetic_algorithm().clone());
+            gmab.set_constraints(to_linear_constraints(constraints));
+            gmab.optimize(py_opti_function, bounds, n_trials, n_objectives, seed)
+        }));
+
+        match result {
+            Ok(result) => Ok(result.into_iter().map(MultiObjectiveArm::from).collect()),
+            Err(err) => Err(panic_to_py_err(err)),
+        }
+    }
+
+    // Outcome of the offspring per generation of the last optimization, see `GenerationStats`.
+    // Only available if the optimization ran on a single island.
+    #[getter]
+    fn generation_stats(&self, py: Python) -> Vec<Py<PyDict>> {
+        self.gmab
+            .get_generation_stats()
+            .iter()
+            .map(|stats| {
+                let dict = PyDict::new(py);
+                dict.set_item("n_new_arms", stats.n_new_arms).unwrap();
+                dict.set_item("n_repulls", stats.n_repulls).unwrap();
+                dict.set_item("n_skipped", stats.n_skipped).unwrap();
+                dict.into()
+            })
+            .collect()
+    }
+
     fn clone(&self) -> PyResult<Self> {
         let gmab = self.gmab.clone(); // Uses the derived clone() from Clone trait
-        Ok(GMAB { gmab })
+        let island_model = self.island_model.clone();
+        Ok(GMAB { gmab, island_model })
+    }
+
+    // Encodes the full state, i.e. the configuration, the island model and the arm memory, e.g.
+    // to send the GMAB to another process or to store it in a cache.
+    fn to_bytes(&self, py: Python) -> Py<PyBytes> {
+        let mut encoder = Encoder::new(GMAB_TAG);
+        self.island_model.encode(&mut encoder);
+        self.gmab.encode(&mut encoder);
+        PyBytes::new(py, &encoder.finish()).into()
+    }
+
+    #[staticmethod]
+    fn from_bytes(data: &[u8]) -> PyResult<Self> {
+        panic::catch_unwind(|| {
+            let mut decoder = Decoder::new(data, GMAB_TAG);
+            let island_model = IslandModel::decode(&mut decoder);
+            let gmab = RustGMAB::decode(&mut decoder);
+            decoder.finish();
+            GMAB { gmab, island_model }
+        })
+        .map_err(panic_to_py_err)
+    }
+
+    // Pickles the GMAB as its encoding, see `to_bytes`.
+    fn __reduce__<'py>(slf: &Bound<'py, Self>) -> PyResult<(Bound<'py, PyAny>, (Py<PyBytes>,))> {
+        let from_bytes = slf.get_type().getattr("from_bytes")?;
+        Ok((from_bytes, (slf.borrow().to_bytes(slf.py()),)))
     }
 }
 
@@ -187,11 +815,16 @@ impl GMAB {
 fn evobandits(m: &Bound<'_, PyModule>) -> PyResult<()> {
     m.add_class::<GMAB>()?;
     m.add_class::<Arm>()?;
+    m.add_class::<MultiObjectiveArm>()?;
+    m.add_class::<ParamSpace>()?;
 
     m.add("POPULATION_SIZE_DEFAULT", POPULATION_SIZE_DEFAULT)?;
     m.add("MUTATION_RATE_DEFAULT", MUTATION_RATE_DEFAULT)?;
     m.add("CROSSOVER_RATE_DEFAULT", CROSSOVER_RATE_DEFAULT)?;
     m.add("MUTATION_SPAN_DEFAULT", MUTATION_SPAN_DEFAULT)?;
+    m.add("N_ISLANDS_DEFAULT", N_ISLANDS_DEFAULT)?;
+    m.add("MIGRATION_INTERVAL_DEFAULT", MIGRATION_INTERVAL_DEFAULT)?;
+    m.add("MIGRATION_SIZE_DEFAULT", MIGRATION_SIZE_DEFAULT)?;
 
     Ok(())
 }
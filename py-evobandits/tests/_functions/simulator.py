@@ -0,0 +1,50 @@
+# Copyright 2025 EvoBandits
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+A standalone simulator for ProcessPool tests, which speaks the frame protocol without importing
+evobandits, like an external binary would.
+
+It returns the rosenbrock function of the first two values of each request, and exits with code 3
+if it receives a NaN, or a first value above `--crash-above`. With `--hang`, it hangs instead.
+"""
+
+import argparse
+import math
+import struct
+import sys
+import time
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--crash-above", type=float, default=math.inf)
+    parser.add_argument("--hang", action="store_true")
+    args = parser.parse_args()
+
+    stdin, stdout = sys.stdin.buffer, sys.stdout.buffer
+    while len(header := stdin.read(4)) == 4:
+        (n_values,) = struct.unpack("<I", header)
+        x = struct.unpack(f"<{n_values}d", stdin.read(8 * n_values))
+        if any(math.isnan(v) for v in x) or x[0] > args.crash_above:
+            if args.hang:
+                time.sleep(60)
+            sys.exit(3)
+        value = 100 * (x[1] - x[0] ** 2) ** 2 + (1 - x[0]) ** 2
+        stdout.write(struct.pack("<Id", 1, value))
+        stdout.flush()
+
+
+if __name__ == "__main__":
+    main()
@@ -12,10 +12,13 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import pickle
+from concurrent.futures import ProcessPoolExecutor
 from contextlib import nullcontext
 
 import pytest
-from evobandits import GMAB, Arm
+from evobandits import GMAB, Arm, MultiObjectiveArm
+from evobandits.evobandits import ParamSpace
 
 from tests._functions import rosenbrock as rb
 
@@ -37,6 +40,40 @@ def test_arm():
     assert arm.to_dict == exp_dict
 
 
+def test_arm_pickle():
+    arms = GMAB().optimize(rb.function, [(-5, 10), (-5, 10)], 200, 3, 42)
+
+    # Verify if arms keep their statistics when they are pickled, alone or as list
+    for arm in arms:
+        restored = pickle.loads(pickle.dumps(arm))
+        assert restored.to_dict == arm.to_dict
+        assert restored.mean_cost == arm.mean_cost
+    assert [a.to_dict for a in Arm.list_from_bytes(Arm.list_to_bytes(arms))] == [
+        a.to_dict for a in arms
+    ]
+    with pytest.raises(RuntimeError):
+        Arm.from_bytes(b"invalid")
+
+
+def test_param_space():
+    space = ParamSpace()
+    space.add_int(-5, 10, size=2)
+    space.add_float(1.0, 100.0, 2, log=True)
+    space.add_categorical(3)
+
+    assert space.dimension == 4
+    assert space.bounds == [(-5, 10), (-5, 10), (0, 2), (0, 2)]
+    columns = space.decode([[-1, 3, 1, 2], [4, 5, 0, 0]])
+    assert columns[:2] == [[-1.0, 4.0], [3.0, 5.0]]
+    assert columns[2] == pytest.approx([10.0, 1.0])
+    assert columns[3] == [2.0, 0.0]
+
+    with pytest.raises(RuntimeError):
+        space.add_int(1, 1)
+    with pytest.raises(RuntimeError):
+        space.decode([[0]])
+
+
 @pytest.mark.parametrize(
     "kwargs",
     [
@@ -45,6 +82,17 @@ def test_arm():
         {"mutation_rate": 0.1},
         {"crossover_rate": 0.9},
         {"mutation_span": 1.0},
+        {"islands": 4, "migration_interval": 2, "migration_size": 1},
+        {"max_arms": 1000},
+        {"mutation_schedule": "success_rule"},
+        {"mutation_schedule": "decay"},
+        {"mutation_schedule": "linear", "exp": pytest.raises(RuntimeError)},
+        {"cost_aware": True},
+        {"surrogate_oversampling": 4},
+        {"surrogate_oversampling": 2, "surrogate_neighbors": 10},
+        {"surrogate_oversampling": 0, "exp": pytest.raises(RuntimeError)},
+        {"smoothing_bandwidth": 0.05},
+        {"smoothing_bandwidth": 0.0, "exp": pytest.raises(RuntimeError)},
     ],
     ids=[
         "default",
@@ -52,6 +100,17 @@ def test_arm():
         "with_mutation_rate",
         "with_crossover_rate",
         "with_mutation_span",
+        "with_islands",
+        "with_max_arms",
+        "with_success_rule",
+        "with_decay",
+        "fail_mutation_schedule_value",
+        "with_cost_aware",
+        "with_surrogate",
+        "with_surrogate_neighbors",
+        "fail_surrogate_oversampling_value",
+        "with_smoothing",
+        "fail_smoothing_bandwidth_value",
     ],
 )
 def test_gmab_init(kwargs):
@@ -67,6 +126,10 @@ def test_gmab_init(kwargs):
         [[(0, 100), (0, 100)] * 5, 100, {}],
         [[(0, 100), (0, 100)] * 5, 100, {"seed": 42}],
         [[(0, 100), (0, 100)] * 5, 100, {"n_best": 2}],
+        [[(0, 100), (0, 100)] * 5, 100, {"islands": 2, "population_size": 10, "seed": 42}],
+        [[(0, 100), (0, 100)] * 5, 1000, {"max_arms": 50, "population_size": 10}],
+        [[(0, 100), (0, 100)], 100, {"constraints": [([1.0, 1.0], 100.0)]}],
+        [[(0, 100), (0, 100)], 100, {"feasible": lambda x: x[0] != x[1]}],
         [[(0, 100), (0, 100)] * 5, 1, {"population_size": 2, "exp": pytest.raises(RuntimeError)}],
         [[(0, 100), (0, 100)] * 5, 1, {"n_best": 0, "exp": pytest.raises(RuntimeError)}],
         [[(0, 10), (0, 10)], 100, {"population_size": 0, "exp": pytest.raises(RuntimeError)}],
@@ -74,11 +137,28 @@ def test_gmab_init(kwargs):
         [[(0, 10), (0, 10)], 100, {"crossover_rate": 1.1, "exp": pytest.raises(RuntimeError)}],
         [[(0, 10), (0, 10)], 100, {"mutation_span": -0.1, "exp": pytest.raises(RuntimeError)}],
         [[(0, 1), (0, 1)], 100, {"exp": pytest.raises(RuntimeError)}],
+        [[(0, 100), (0, 100)] * 5, 30, {"islands": 2, "exp": pytest.raises(RuntimeError)}],
+        [[(0, 10), (0, 10)], 100, {"islands": 0, "exp": pytest.raises(RuntimeError)}],
+        [[(0, 10), (0, 10)], 100, {"max_arms": 1, "exp": pytest.raises(RuntimeError)}],
+        [
+            [(0, 10), (0, 10)],
+            100,
+            {"constraints": [([1.0], 10.0)], "exp": pytest.raises(RuntimeError)},
+        ],
+        [
+            [(0, 10), (0, 10)],
+            100,
+            {"feasible": lambda x: False, "exp": pytest.raises(RuntimeError)},
+        ],
     ],
     ids=[
         "success",
         "success_with_seed",
         "success_with_n_best",
+        "success_with_islands",
+        "success_with_max_arms",
+        "success_with_constraints",
+        "success_with_feasible",
         "fail_n_trials_value",
         "fail_n_best_value",
         "fail_population_size_value",  # ToDo Issue #57: Err should be raised in the constructor
@@ -86,28 +166,202 @@ def test_gmab_init(kwargs):
         "fail_crossover_rate_value",  # ToDo Issue #57: Err should be raised in the constructor
         "fail_mutation_span_value",  # ToDo Issue #57: Err should be raised in the constructor
         "fail_population_size_solution_size",
+        "fail_n_trials_per_island",
+        "fail_islands_value",
+        "fail_max_arms_value",
+        "fail_constraints_dimension",
+        "fail_infeasible",
     ],
 )
 def test_gmab(bounds, n_trials, kwargs):
     expectation = kwargs.pop("exp", nullcontext())
     seed = kwargs.pop("seed", None)
     n_best = kwargs.pop("n_best", 1)
+    constraints = kwargs.pop("constraints", None)
+    feasible = kwargs.pop("feasible", None)
     with expectation:
         gmab = GMAB(**kwargs)
-        result = gmab.optimize(rb.function, bounds, n_trials, n_best, seed)
+        result = gmab.optimize(
+            rb.function, bounds, n_trials, n_best, seed, constraints=constraints, feasible=feasible
+        )
 
         assert all(isinstance(r, Arm) for r in result)
         assert len(result) == n_best
 
 
+def test_gmab_generation_stats():
+    gmab = GMAB()
+    assert gmab.generation_stats == []
+
+    # Offspring that match known arms are retried, so most of them are new arms
+    gmab.optimize(rb.function, [(0, 100), (0, 100)], 200, 1, 42)
+    stats = gmab.generation_stats
+    assert len(stats) >= 1
+    assert all(s.keys() == {"n_new_arms", "n_repulls", "n_skipped"} for s in stats)
+    assert sum(s["n_new_arms"] for s in stats) > sum(s["n_repulls"] for s in stats)
+
+
+def test_gmab_optimize_with_costs():
+    def batched(action_vectors):
+        return [rb.function(action_vector) for action_vector in action_vectors]
+
+    # Verify if the costs reported for each batch are recorded per arm
+    batches = []
+
+    def costs():
+        return [float(action_vector[0]) for action_vector in batches.pop()]
+
+    def recording(action_vectors):
+        batches.append(action_vectors)
+        return batched(action_vectors)
+
+    gmab = GMAB(cost_aware=True)
+    result = gmab.optimize(recording, [(1, 100), (1, 100)], 200, 1, 42, batched=True, costs=costs)
+    assert result[0].mean_cost == result[0].action_vector[0]
+    assert "mean_cost" not in result[0].to_dict
+
+    # Without reported costs, the evaluations are timed
+    result = GMAB().optimize(rb.function, [(1, 100), (1, 100)], 200, 1, 42)
+    assert result[0].mean_cost >= 0.0
+
+
+@pytest.mark.parametrize("batched", [True, False], ids=["batched", "single"])
+def test_gmab_optimize_with_pulls(batched):
+    # Verify if the function receives the number of previous evaluations of each arm
+    pulls_per_arm = {}
+
+    def record(action_vector, pull):
+        pulls_per_arm.setdefault(tuple(action_vector), []).append(pull)
+        return rb.function(action_vector)
+
+    def func(action_vectors, pulls):
+        if not batched:
+            return record(action_vectors, pulls)
+        return [record(av, pull) for av, pull in zip(action_vectors, pulls, strict=True)]
+
+    result = GMAB().optimize(func, [(1, 20), (1, 20)], 200, 1, 42, batched=batched, pulls=True)
+    assert all(pulls == list(range(len(pulls))) for pulls in pulls_per_arm.values())
+    assert len(pulls_per_arm[tuple(result[0].action_vector)]) == result[0].n_evaluations
+
+
+@pytest.mark.parametrize("islands", [1, 2], ids=["single_island", "islands"])
+def test_gmab_optimize_with_progress(islands):
+    # Without rate limit, a snapshot is reported after each generation, and at the end
+    snapshots = []
+    gmab = GMAB(islands=islands)
+    gmab.optimize(
+        rb.function,
+        [(0, 100), (0, 100)],
+        200,
+        1,
+        42,
+        progress=snapshots.append,
+        progress_interval=0,
+    )
+    assert len(snapshots) >= 2
+    last = snapshots[-1]
+    assert last["used_trials"] == last["n_trials"] == 200
+    assert last["n_new_arms"] + last["n_repulls"] == 200
+    assert last["best_value"] == rb.function(last["best_action_vector"])
+    assert last["best_value_ci"][0] <= last["best_value"] <= last["best_value_ci"][1]
+    assert last["phase_times"].keys() == {"breeding", "evaluation", "update"}
+
+    # Rate-limited, only the final snapshot is reported
+    snapshots.clear()
+    gmab.optimize(rb.function, [(0, 100), (0, 100)], 200, 1, 42, progress=snapshots.append)
+    assert len(snapshots) == 1
+
+
+def bi_objective(action_vector: list):
+    return [rb.function(action_vector), sum(x**2 for x in action_vector)]
+
+
+@pytest.mark.parametrize(
+    "bounds, n_trials, kwargs",
+    [
+        [[(0, 100), (0, 100)], 100, {}],
+        [[(0, 100), (0, 100)], 100, {"seed": 42}],
+        [[(0, 100), (0, 100)], 100, {"constraints": [([1.0, 1.0], 100.0)]}],
+        [[(0, 100), (0, 100)], 100, {"n_objectives": 1, "exp": pytest.raises(RuntimeError)}],
+        [[(0, 100), (0, 100)], 100, {"n_objectives": 3, "exp": pytest.raises(RuntimeError)}],
+        [[(0, 100), (0, 100)], 100, {"islands": 2, "exp": pytest.raises(RuntimeError)}],
+        [[(0, 100), (0, 100)], 100, {"max_arms": 50, "exp": pytest.raises(RuntimeError)}],
+        [
+            [(0, 100), (0, 100)],
+            100,
+            {"mutation_schedule": "decay", "exp": pytest.raises(RuntimeError)},
+        ],
+        [[(0, 100), (0, 100)], 100, {"cost_aware": True, "exp": pytest.raises(RuntimeError)}],
+        [
+            [(0, 100), (0, 100)],
+            100,
+            {"surrogate_oversampling": 4, "exp": pytest.raises(RuntimeError)},
+        ],
+        [
+            [(0, 100), (0, 100)],
+            100,
+            {"smoothing_bandwidth": 2.0, "exp": pytest.raises(RuntimeError)},
+        ],
+    ],
+    ids=[
+        "success",
+        "success_with_seed",
+        "success_with_constraints",
+        "fail_n_objectives_value",
+        "fail_n_objectives_mismatch",
+        "fail_islands",
+        "fail_max_arms",
+        "fail_mutation_schedule",
+        "fail_cost_aware",
+        "fail_surrogate",
+        "fail_smoothing",
+    ],
+)
+def test_gmab_optimize_multi(bounds, n_trials, kwargs):
+    expectation = kwargs.pop("exp", nullcontext())
+    seed = kwargs.pop("seed", None)
+    n_objectives = kwargs.pop("n_objectives", 2)
+    constraints = kwargs.pop("constraints", None)
+    with expectation:
+        gmab = GMAB(**kwargs)
+        front = gmab.optimize_multi(
+            bi_objective, bounds, n_trials, n_objectives, seed, constraints=constraints
+        )
+
+        assert all(isinstance(arm, MultiObjectiveArm) for arm in front)
+        assert all(len(arm.values) == n_objectives for arm in front)
+        assert len(front) >= 1
+
+
 @pytest.mark.parametrize(
     "this, other, expected_eq",
     [
         [GMAB(), GMAB(), True],
         [GMAB(population_size=1), GMAB(population_size=1), True],
         [GMAB(), GMAB(population_size=1), False],
+        [GMAB(), GMAB(islands=2), False],
+        [GMAB(), GMAB(max_arms=1000), False],
     ],
-    ids=["default_eq", "modified_eq", "not_eq"],
+    ids=["default_eq", "modified_eq", "not_eq", "not_eq_islands", "not_eq_max_arms"],
 )
 def test_gmab_eq(this, other, expected_eq):
     assert (this == other) == expected_eq
+
+
+def optimize_in_process(gmab):
+    gmab.optimize(rb.function, [(-5, 10), (-5, 10)], 100, 1, 42)
+    return gmab
+
+
+def test_gmab_pickle():
+    gmab = GMAB(population_size=10, islands=1, max_arms=50, cost_aware=True)
+    gmab.optimize(rb.function, [(-5, 10), (-5, 10)], 200, 1, 42)
+
+    # Verify if the full state survives pickling, and a GMAB can be sent to other processes
+    assert pickle.loads(pickle.dumps(gmab)) == gmab
+    assert GMAB.from_bytes(gmab.to_bytes()) == gmab
+    with ProcessPoolExecutor(max_workers=1) as executor:
+        restored = executor.submit(optimize_in_process, GMAB(population_size=10)).result()
+    assert restored == optimize_in_process(GMAB(population_size=10))
+    with pytest.raises(RuntimeError):
+        GMAB.from_bytes(gmab.to_bytes()[:-1])
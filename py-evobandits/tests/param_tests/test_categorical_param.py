@@ -1,6 +1,7 @@
 from contextlib import nullcontext
 
 import pytest
+from evobandits.evobandits import ParamSpace
 from evobandits.params import CategoricalParam
 
 
@@ -46,3 +47,19 @@ def test_cat_param(choices, exp_bounds, expectation):
             exp_value = choices[idx]
             assert value == exp_value
             assert isinstance(value, type(exp_value))
+
+
+test_categorical_param_decode_columns_data = [
+    pytest.param(CategoricalParam(["a", "b", None]), [[0], [1], [2]], id="base"),
+]
+
+
+@pytest.mark.parametrize("param, action_vectors", test_categorical_param_decode_columns_data)
+def test_categorical_param_decode_columns(param, action_vectors):
+    space = ParamSpace()
+    assert param.add_to(space)
+    assert space.bounds == param.bounds
+
+    # A batch decoded by the native ParamSpace equals the values decoded one by one
+    values = param.decode_columns(space.decode(action_vectors))
+    assert values == [param.decode(action_vector) for action_vector in action_vectors]
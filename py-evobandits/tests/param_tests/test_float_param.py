@@ -15,6 +15,7 @@
 from contextlib import nullcontext
 
 import pytest
+from evobandits.evobandits import ParamSpace
 from evobandits.params import FloatParam
 
 test_float_param_new_data = [
@@ -26,6 +27,14 @@ test_float_param_new_data = [
     pytest.param(0, 1, {"size": 0, "exp": pytest.raises(ValueError)}, None, id="size_value"),
     pytest.param(0, 1, {"n_steps": 0, "exp": pytest.raises(ValueError)}, None, id="n_steps_value"),
     pytest.param(0, 1, {"log": True, "exp": pytest.raises(ValueError)}, None, id="log_value"),
+    pytest.param(0, 1, {"n_initial_steps": 10}, [(0, 100)], id="n_initial_steps"),
+    pytest.param(
+        0,
+        1,
+        {"n_initial_steps": 101, "exp": pytest.raises(ValueError)},
+        None,
+        id="n_initial_steps_value",
+    ),
 ]
 
 
@@ -64,3 +73,34 @@ def test_float_param_mapping(param, action, exp_value):
     for _ in range(100):
         values.append(param.decode([action]))
     assert all(exp_value == x for x in values)
+
+
+test_float_param_decode_columns_data = [
+    pytest.param(FloatParam(0, 1), [[0], [5], [100]], id="base"),
+    pytest.param(FloatParam(0.123, 4.567, size=2), [[0, 17], [99, 100]], id="vector"),
+    pytest.param(FloatParam(1, 2, log=True, n_steps=1000), [[0], [333], [1000]], id="log"),
+]
+
+
+@pytest.mark.parametrize("param, action_vectors", test_float_param_decode_columns_data)
+def test_float_param_decode_columns(param, action_vectors):
+    space = ParamSpace()
+    assert param.add_to(space)
+    assert space.bounds == param.bounds
+
+    # A batch decoded by the native ParamSpace equals the values decoded one by one
+    values = param.decode_columns(space.decode(action_vectors))
+    assert values == [param.decode(action_vector) for action_vector in action_vectors]
+
+
+@pytest.mark.parametrize(
+    "param, exp_strides",
+    [
+        pytest.param(FloatParam(0, 1), [1], id="full_resolution"),
+        pytest.param(FloatParam(0, 1, n_initial_steps=10), [10], id="coarse"),
+        pytest.param(FloatParam(0, 1, size=2, n_initial_steps=30), [3, 3], id="vector"),
+        pytest.param(FloatParam(0, 1, n_steps=10, n_initial_steps=10), [1], id="no_refinement"),
+    ],
+)
+def test_float_param_strides(param, exp_strides):
+    assert param.strides == exp_strides
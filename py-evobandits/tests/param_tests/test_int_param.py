@@ -1,6 +1,7 @@
 from contextlib import nullcontext
 
 import pytest
+from evobandits.evobandits import ParamSpace
 from evobandits.params import IntParam
 
 test_int_param_data = [
@@ -25,3 +26,20 @@ def test_int_param(low, high, kwargs, exp_bounds, exp_values):
         for x in range(bounds[0][0], bounds[0][1] + 1):
             values.append(param.decode([x]))
         assert values == exp_values
+
+
+test_int_param_decode_columns_data = [
+    pytest.param(IntParam(0, 10), [[0], [5], [10]], id="base"),
+    pytest.param(IntParam(-5, 5, size=2), [[-5, 0], [3, 5]], id="vector"),
+]
+
+
+@pytest.mark.parametrize("param, action_vectors", test_int_param_decode_columns_data)
+def test_int_param_decode_columns(param, action_vectors):
+    space = ParamSpace()
+    assert param.add_to(space)
+    assert space.bounds == param.bounds
+
+    # A batch decoded by the native ParamSpace equals the values decoded one by one
+    values = param.decode_columns(space.decode(action_vectors))
+    assert values == [param.decode(action_vector) for action_vector in action_vectors]
@@ -0,0 +1,154 @@
+# Copyright 2025 EvoBandits
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import math
+
+import pytest
+from evobandits.storages import InMemoryStorage, SQLiteStorage
+
+RUN = {"run_id": 0, "seed": 42, "n_trials": 100, "n_best": 1, "maximize": False}
+TRIALS = [
+    {"run_id": 0, "trial_id": 0, "action_vector": [1, 2], "params": {"a": [1, 2]}, "value": 3.0},
+    {"run_id": 0, "trial_id": 1, "action_vector": [0, 1], "params": {"a": [0, 1]}, "value": 1.0},
+    {"run_id": 1, "trial_id": 0, "action_vector": [2, 2], "params": {"a": [2, 2]}, "value": 4.0},
+]
+ARMS = [
+    {
+        "run_id": 0,
+        "action_vector": [1, 2],
+        "params": {"a": [1, 2]},
+        "value": 3.0,
+        "value_std_dev": 0.5,
+        "n_evaluations": 2,
+    },
+    {
+        "run_id": 1,
+        "action_vector": [2, 2],
+        "params": {"a": [2, 2]},
+        "value": [4.0, 1.0],
+        "value_std_dev": [0.0, 0.0],
+        "n_evaluations": 1,
+    },
+]
+RESULTS = [
+    {
+        "run_id": 0,
+        "n_best": 1,
+        "action_vector": [0, 1],
+        "params": {"a": [0, 1]},
+        "value": 1.0,
+        "value_std_dev": 0.0,
+        "n_evaluations": 1,
+    }
+]
+
+
+@pytest.fixture(params=["in_memory", "sqlite", "sqlite_in_memory"])
+def storage(request, tmp_path):
+    if request.param == "in_memory":
+        return InMemoryStorage()
+    if request.param == "sqlite_in_memory":
+        return SQLiteStorage(":memory:")
+    return SQLiteStorage(tmp_path / "studies.db")
+
+
+def test_create_study(storage):
+    storage.create_study("a")
+    storage.create_study("b")
+    storage.create_study("a")  # creating an existing study has no effect
+
+    assert storage.get_study_names() == ["a", "b"]
+
+
+def test_runs(storage):
+    storage.create_study("a")
+    storage.create_run("a", RUN)
+
+    assert storage.get_runs("a") == [RUN]
+
+
+def test_trials(storage):
+    storage.create_study("a")
+    storage.add_trials("a", TRIALS[:2])
+    storage.add_trials("a", TRIALS[2:])
+
+    assert list(storage.iter_trials("a")) == TRIALS
+    assert list(storage.iter_trials("a", run_id=1)) == TRIALS[2:]
+
+
+def test_arms(storage):
+    storage.create_study("a")
+    storage.add_arms("a", ARMS)
+
+    assert list(storage.iter_arms("a")) == ARMS
+    assert list(storage.iter_arms("a", run_id=0)) == ARMS[:1]
+
+
+def test_nan_values(storage):
+    storage.create_study("a")
+    storage.add_trials("a", [{**TRIALS[0], "value": math.nan}])
+    storage.add_arms("a", [{**ARMS[0], "value": math.nan, "value_std_dev": math.inf}])
+    storage.add_results("a", [{**RESULTS[0], "value": [math.nan, 1.0]}])
+
+    # NaN values are loaded back as NaN, e.g., the values of failed evaluations
+    assert math.isnan(next(storage.iter_trials("a"))["value"])
+    arm = next(storage.iter_arms("a"))
+    assert math.isnan(arm["value"]) and arm["value_std_dev"] == math.inf
+    value = storage.get_results("a")[0]["value"]
+    assert math.isnan(value[0]) and value[1] == 1.0
+
+
+def test_results(storage):
+    storage.create_study("a")
+    storage.add_results("a", RESULTS)
+
+    assert storage.get_results("a") == RESULTS
+
+
+def test_studies_are_separated(storage):
+    storage.create_study("a")
+    storage.create_study("b")
+    storage.create_run("a", RUN)
+    storage.add_trials("a", TRIALS)
+    storage.add_arms("a", ARMS)
+    storage.add_results("a", RESULTS)
+
+    assert storage.get_runs("b") == []
+    assert list(storage.iter_trials("b")) == []
+    assert list(storage.iter_arms("b")) == []
+    assert storage.get_results("b") == []
+
+
+def test_unknown_study(storage):
+    with pytest.raises(KeyError):
+        storage.get_results("unknown")
+
+
+def test_sqlite_storage_shared_file(tmp_path):
+    # A second connection to the same file reads what the first one has written
+    writer = SQLiteStorage(tmp_path / "studies.db")
+    writer.create_study("a")
+    writer.add_trials("a", TRIALS)
+
+    reader = SQLiteStorage(tmp_path / "studies.db")
+    assert list(reader.iter_trials("a")) == TRIALS
+
+
+def test_sqlite_storage_serializes_callables(tmp_path):
+    storage = SQLiteStorage(tmp_path / "studies.db")
+    storage.create_study("a")
+    storage.add_trials("a", [{**TRIALS[0], "params": {"a": len}}])
+
+    trial = next(storage.iter_trials("a"))
+    assert trial["params"] == {"a": repr(len)}
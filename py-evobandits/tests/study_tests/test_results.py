@@ -0,0 +1,96 @@
+# Copyright 2025 EvoBandits
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import numpy as np
+import pytest
+from evobandits.study.results import Results
+
+RESULTS = [
+    {"value": 2.0, "value_std_dev": 0.1, "n_evaluations": 5, "params": {"x": 2}, "run_id": 0},
+    {"value": 1.0, "value_std_dev": 0.2, "n_evaluations": 3, "params": {"x": 1}, "run_id": 0},
+    {"value": 3.0, "value_std_dev": 0.3, "n_evaluations": 7, "params": {"x": 3}, "run_id": 1},
+    {"value": 1.0, "value_std_dev": 0.0, "n_evaluations": 1, "params": {"x": 4}, "run_id": 1},
+]
+
+
+def test_results_behave_like_a_list():
+    results = Results(RESULTS)
+
+    # Verify if Results return the dictionaries they were given
+    assert len(results) == 4
+    assert results == RESULTS
+    assert list(results) == RESULTS
+    assert results[-1] == RESULTS[-1]
+    assert results[1:3] == RESULTS[1:3]
+    assert results.column("params") == [r["params"] for r in RESULTS]
+    with pytest.raises(IndexError):
+        results[4]
+
+    # Verify if results with other keys or values keep them
+    results.append({"value": 4, "params": {"x": 5}, "num_pulls": 10})
+    assert results[-1] == {"value": 4, "params": {"x": 5}, "num_pulls": 10}
+    assert results[:4] == RESULTS
+
+
+def test_results_aggregates():
+    results = Results(RESULTS)
+
+    # Verify if the first of equally good results is the best one, overall and per run
+    assert results.best_index() == 1
+    assert results.best_index(maximize=True) == 2
+    assert results.best_index(run_id=1) == 3
+    assert results.best_index(maximize=True, run_id=0) == 0
+    assert results.mean() == 1.75
+    assert results.mean(run_id=0) == 1.5
+    assert results.run_ids == [0, 1]
+
+    with pytest.raises(KeyError):
+        results.mean(run_id=2)
+    with pytest.raises(ValueError):
+        Results().best_index()
+
+
+def test_results_with_multiple_objectives():
+    results = Results([{"value": 1.0, "params": {}}])
+    results.append({"value": [1.0, 2.0], "params": {}})
+
+    # Verify if vector values are kept, and scalar aggregates are unavailable
+    assert results == [{"value": 1.0, "params": {}}, {"value": [1.0, 2.0], "params": {}}]
+    with pytest.raises(ValueError):
+        results.mean()
+
+
+def test_results_to_numpy():
+    results = Results(RESULTS)
+    arrays = results.to_numpy()
+
+    # Verify if typed columns are exported as views, and stay valid while appending
+    assert arrays["value"].dtype == np.float64
+    assert arrays["n_evaluations"].dtype == np.int64
+    assert arrays["value"].base is not None
+    np.testing.assert_array_equal(arrays["run_id"], [0, 0, 1, 1])
+    assert list(arrays["params"]) == [r["params"] for r in RESULTS]
+
+    for result in RESULTS * 10:
+        results.append(result)
+    np.testing.assert_array_equal(arrays["value"], [2.0, 1.0, 3.0, 1.0])
+    assert len(results.to_numpy()["value"]) == 44
+
+
+def test_results_to_pandas():
+    pd = pytest.importorskip("pandas")
+    df = Results(RESULTS).to_pandas()
+
+    assert isinstance(df, pd.DataFrame)
+    assert df["value"].tolist() == [r["value"] for r in RESULTS]
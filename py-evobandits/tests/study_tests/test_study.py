@@ -12,11 +12,22 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import math
+from concurrent.futures import ThreadPoolExecutor
 from contextlib import nullcontext
-from unittest.mock import create_autospec
+from types import SimpleNamespace
+from unittest.mock import ANY, create_autospec
 
 import pytest
-from evobandits import ALGORITHM_DEFAULT, GMAB, Study
+from evobandits import (
+    ALGORITHM_DEFAULT,
+    GMAB,
+    Arm,
+    FloatParam,
+    LinearConstraint,
+    SQLiteStorage,
+    Study,
+)
 from evobandits.params.int_param import IntParam
 
 from tests._functions import clustering as cl
@@ -34,11 +45,15 @@ def test_algorithm_default():
         [None, {"log": ("WARNING", "No seed provided")}, ALGORITHM_DEFAULT],
         [42, {}, ALGORITHM_DEFAULT],
         [42.0, {"exp": pytest.raises(TypeError)}, ALGORITHM_DEFAULT],
+        [42, {"storage": "db.sqlite", "exp": pytest.raises(TypeError)}, ALGORITHM_DEFAULT],
+        [42, {"study_name": 1, "exp": pytest.raises(TypeError)}, ALGORITHM_DEFAULT],
     ],
     ids=[
         "default",
         "default_with_seed",
         "fail_seed_type",
+        "fail_storage_type",
+        "fail_study_name_type",
     ],
 )
 def test_study_init(seed, kwargs, exp_algorithm, caplog):
@@ -103,8 +118,50 @@ def test_study_init(seed, kwargs, exp_algorithm, caplog):
         [rb.function, {"number": "BaseParam"}, 1, {"exp": pytest.raises(TypeError)}],
         [rb.function, {"seed": IntParam(0, 100)}, 1, {"exp": pytest.raises(ValueError)}],
         [rb.function, rb.PARAMS, 1, {"maximize": "False", "exp": pytest.raises(TypeError)}],
+        [rb.function, rb.PARAMS, 1, {"maximize": [True, 1], "exp": pytest.raises(TypeError)}],
+        [rb.function, rb.PARAMS, 1, {"maximize": [True], "exp": pytest.raises(ValueError)}],
         [rb.function, rb.PARAMS, 1, {"n_runs": "2", "exp": pytest.raises(TypeError)}],
         [rb.function, rb.PARAMS, 1, {"n_runs": 0, "exp": pytest.raises(ValueError)}],
+        [rb.function, rb.PARAMS, 1, {"executor": "pool", "exp": pytest.raises(TypeError)}],
+        [rb.function, rb.PARAMS, 1, {"batched": 1, "exp": pytest.raises(TypeError)}],
+        [rb.function, rb.PARAMS, 1, {"constraints": [lambda number: number[0] < 5]}],
+        [rb.function, rb.PARAMS, 1, {"constraints": 1, "exp": pytest.raises(TypeError)}],
+        [rb.function, rb.PARAMS, 1, {"constraints": [1], "exp": pytest.raises(TypeError)}],
+        [
+            rb.function,
+            rb.PARAMS,
+            1,
+            {"constraints": [LinearConstraint({"x": 1}, 0)], "exp": pytest.raises(ValueError)},
+        ],
+        [
+            rb.function,
+            rb.PARAMS,
+            1,
+            {"batched": True, "executor": ThreadPoolExecutor(), "exp": pytest.raises(ValueError)},
+        ],
+        [rb.function, rb.PARAMS, 1, {"timeout": 1.0, "exp": pytest.raises(ValueError)}],
+        [
+            rb.function,
+            rb.PARAMS,
+            1,
+            {"timeout": "1", "executor": ThreadPoolExecutor(), "exp": pytest.raises(TypeError)},
+        ],
+        [
+            rb.function,
+            rb.PARAMS,
+            1,
+            {"timeout": 0, "executor": ThreadPoolExecutor(), "exp": pytest.raises(ValueError)},
+        ],
+        [rb.function, rb.PARAMS, 1, {"on_timeout": "skip", "exp": pytest.raises(ValueError)}],
+        [rb.function, rb.PARAMS, 1, {"on_timeout": None, "exp": pytest.raises(TypeError)}],
+        [rb.function, rb.PARAMS, 1, {"on_timeout": math.inf, "exp": pytest.raises(ValueError)}],
+        [rb.function, rb.PARAMS, 1, {"metrics_file": 1, "exp": pytest.raises(TypeError)}],
+        [
+            rb.function,
+            rb.PARAMS,
+            1,
+            {"metrics_file": "missing/evobandits.prom", "exp": pytest.raises(ValueError)},
+        ],
     ],
     ids=[
         "valid_default_testcase",
@@ -116,8 +173,25 @@ def test_study_init(seed, kwargs, exp_algorithm, caplog):
         "invalid_params_not_a_BaseParam_value",
         "invalid_params_contains_seed",
         "invalid_maximize_type",
+        "invalid_maximize_objective_type",
+        "invalid_maximize_objective_count",
         "invalid_n_runs_type",
         "invalid_n_runs_value",
+        "invalid_executor_type",
+        "invalid_batched_type",
+        "valid_constraints",
+        "invalid_constraints_type",
+        "invalid_constraint_type",
+        "invalid_constraint_param",
+        "invalid_batched_with_executor",
+        "invalid_timeout_without_executor",
+        "invalid_timeout_type",
+        "invalid_timeout_value",
+        "invalid_on_timeout_value",
+        "invalid_on_timeout_type",
+        "invalid_on_timeout_penalty",
+        "invalid_metrics_file_type",
+        "invalid_metrics_file_directory",
     ],
 )
 def test_optimize(objective, params, n_trials, kwargs):
@@ -140,6 +214,246 @@ def test_optimize(objective, params, n_trials, kwargs):
         assert mock_algorithm.optimize.call_count == kwargs.get("n_runs", 1)
 
 
+def test_optimize_with_executor():
+    # Mock dependencies
+    mock_algorithm = create_autospec(GMAB, instance=True)
+    mock_algorithm.optimize.return_value = rb.ARM_BEST
+    mock_algorithm.clone.return_value = mock_algorithm
+    study = Study(seed=42, algorithm=mock_algorithm)  # seeding to avoid warning log
+
+    # With an executor, the algorithm must hand out trials in batches
+    with ThreadPoolExecutor() as executor:
+        study.optimize(rb.function, rb.PARAMS, 1, executor=executor)
+
+    mock_algorithm.optimize.assert_called_once_with(
+        study._evaluate_batch,
+        ANY,
+        1,
+        1,
+        ANY,
+        batched=True,
+        constraints=[],
+        feasible=None,
+        strides=None,
+        costs=study._batch_costs,
+        pulls=True,
+        progress=study._on_progress,
+    )
+    assert study.results == rb.TRIAL_BEST
+
+
+def test_optimize_with_constraints():
+    # Mock dependencies
+    mock_algorithm = create_autospec(GMAB, instance=True)
+    mock_algorithm.optimize.return_value = rb.ARM_BEST
+    mock_algorithm.clone.return_value = mock_algorithm
+    study = Study(seed=42, algorithm=mock_algorithm)  # seeding to avoid warning log
+
+    # Linear constraints are passed to the algorithm, predicates are checked by the study
+    constraints = [LinearConstraint({"number": 1}, 10), lambda number: number[0] < number[1]]
+    study.optimize(rb.function, rb.PARAMS, 1, constraints=constraints)
+
+    mock_algorithm.optimize.assert_called_once_with(
+        study._evaluate_batch,
+        ANY,
+        1,
+        1,
+        ANY,
+        batched=True,
+        constraints=[([1.0, 1.0], 10.0)],
+        feasible=study._is_feasible,
+        strides=None,
+        costs=study._batch_costs,
+        pulls=True,
+        progress=study._on_progress,
+    )
+    assert study._is_feasible([0, 1])
+    assert not study._is_feasible([1, 0])
+
+
+def test_optimize_with_strides():
+    # Mock dependencies
+    mock_algorithm = create_autospec(GMAB, instance=True)
+    mock_algorithm.optimize.return_value = [Arm([1, 100])]
+    mock_algorithm.clone.return_value = mock_algorithm
+    study = Study(seed=42, algorithm=mock_algorithm)  # seeding to avoid warning log
+
+    # Floats with an initial resolution start the algorithm on a coarse grid
+    params = {"n": IntParam(0, 10), "x": FloatParam(0.0, 1.0, n_steps=1000, n_initial_steps=10)}
+    study.optimize(lambda n, x: n + x, params, 1)
+
+    _, kwargs = mock_algorithm.optimize.call_args
+    assert kwargs["strides"] == [1, 100]
+    assert study.best_params == {"n": 1, "x": 0.1}
+
+
+PROGRESS = {
+    "n_trials": 10,
+    "used_trials": 10,
+    "n_generations": 1,
+    "elapsed": 0.5,
+    "trials_per_second": 20.0,
+    "best_action_vector": [1, 1],
+    "best_value": -3.0,
+    "best_value_ci": (-4.0, -1.0),
+    "best_n_evaluations": 2,
+    "n_arms": 8,
+    "n_new_arms": 8,
+    "n_repulls": 2,
+    "repull_ratio": 0.2,
+    "phase_times": {"breeding": 0.1, "evaluation": 0.3, "update": 0.1},
+}
+
+
+def test_optimize_with_progress(tmp_path):
+    # Mock dependencies, where the algorithm reports a single snapshot
+    def optimize(*args, progress, **kwargs):
+        progress(dict(PROGRESS))
+        return rb.ARM_BEST
+
+    mock_algorithm = create_autospec(GMAB, instance=True)
+    mock_algorithm.optimize.side_effect = optimize
+    mock_algorithm.clone.return_value = mock_algorithm
+    study = Study(seed=42, algorithm=mock_algorithm, study_name="rb")
+    assert study.progress is None
+
+    # The snapshot is reported in the direction of the objective, and exported to the file
+    metrics_file = tmp_path / "evobandits.prom"
+    study.optimize(rb.function, rb.PARAMS, 10, maximize=True, metrics_file=metrics_file)
+    assert study.progress["best_params"] == {"number": [1, 1]}
+    assert study.progress["best_value"] == 3.0
+    assert study.progress["best_value_ci"] == (1.0, 4.0)
+    assert study.progress["run_id"] == 0
+    metrics = metrics_file.read_text()
+    assert 'evobandits_best_value{study="rb",run_id="0"} 3.0' in metrics
+    assert 'evobandits_phase_seconds{study="rb",run_id="0",phase="evaluation"} 0.3' in metrics
+
+
+def test_optimize_with_failing_metrics_file(tmp_path):
+    # Mock dependencies, where the metrics file cannot be written once the optimization runs
+    metrics_dir = tmp_path / "metrics"
+    metrics_dir.mkdir()
+
+    def optimize(*args, progress, **kwargs):
+        metrics_dir.rmdir()
+        progress(dict(PROGRESS))
+        return rb.ARM_BEST
+
+    mock_algorithm = create_autospec(GMAB, instance=True)
+    mock_algorithm.optimize.side_effect = optimize
+    mock_algorithm.clone.return_value = mock_algorithm
+    study = Study(seed=42, algorithm=mock_algorithm)
+
+    # The failure is logged, and the optimization completes
+    study.optimize(rb.function, rb.PARAMS, 10, metrics_file=metrics_dir / "evobandits.prom")
+    assert study.progress["run_id"] == 0
+    assert study.results == rb.TRIAL_BEST
+
+
+def test_optimize_with_storage(tmp_path):
+    # Mock dependencies
+    mock_algorithm = create_autospec(GMAB, instance=True)
+    mock_algorithm.optimize.return_value = rb.ARM_BEST
+    mock_algorithm.clone.return_value = mock_algorithm
+    storage = SQLiteStorage(tmp_path / "studies.db")
+
+    # Optimize a study, and save its results to the storage
+    study = Study(seed=42, algorithm=mock_algorithm, storage=storage, study_name="rb")
+    study.optimize(rb.function, rb.PARAMS, 1, maximize=True)
+    assert study.results == rb.TRIAL_BEST
+
+    # A new study with the same name continues where the first one stopped
+    resumed = Study(seed=42, algorithm=mock_algorithm, storage=storage, study_name="rb")
+    assert resumed.results == rb.TRIAL_BEST
+    assert resumed._direction == -1
+
+    resumed.optimize(rb.function, rb.PARAMS, 1, maximize=True)
+    assert [r["run_id"] for r in resumed.results] == [0, 1]
+    assert [run["run_id"] for run in storage.get_runs("rb")] == [0, 1]
+
+
+def test_optimize_saves_arms(tmp_path):
+    def objective(number: list):
+        return float(number[0])
+
+    # The statistics of each evaluated arm are saved per run
+    storage = SQLiteStorage(tmp_path / "studies.db")
+    study = Study(seed=42, storage=storage, study_name="arms")
+    study.optimize(objective, {"number": IntParam(0, 3, 2)}, 100)
+
+    trials = list(storage.iter_trials("arms"))
+    arms = list(storage.iter_arms("arms", run_id=0))
+    assert sum(arm["n_evaluations"] for arm in arms) == len(trials) == 100
+    assert len({tuple(arm["action_vector"]) for arm in arms}) == len(arms)
+    for arm in arms:
+        assert arm["value"] == arm["action_vector"][0] == arm["params"]["number"][0]
+        assert arm["value_std_dev"] == 0.0
+
+
+def test_optimize_multi_objective(tmp_path):
+    def objective(number: list):
+        return sum(number), max(number)  # minimize the sum, maximize the largest number
+
+    def optimize_multi(func, bounds, n_trials, n_objectives, seed, **kwargs):
+        # Values are passed to the algorithm in the direction of each objective
+        assert func([[1, 2], [3, 0]]) == [[3, -2], [3, -3]]
+        return [
+            SimpleNamespace(
+                to_dict={
+                    "action_vector": [3, 0],
+                    "values": [3.0, -3.0],
+                    "value_std_devs": [0.0, 0.0],
+                    "n_evaluations": 1,
+                }
+            )
+        ]
+
+    # Mock dependencies
+    mock_algorithm = create_autospec(GMAB, instance=True)
+    mock_algorithm.optimize_multi.side_effect = optimize_multi
+    mock_algorithm.clone.return_value = mock_algorithm
+    storage = SQLiteStorage(tmp_path / "studies.db")
+    study = Study(seed=42, algorithm=mock_algorithm, storage=storage, study_name="mo")
+
+    study.optimize(objective, rb.PARAMS, 10, maximize=[False, True])
+    exp_front = [
+        {
+            "run_id": 0,
+            "n_best": 1,
+            "value": [3.0, 3.0],
+            "value_std_dev": [0.0, 0.0],
+            "n_evaluations": 1,
+            "params": {"number": [3, 0]},
+        }
+    ]
+    assert study.results == exp_front
+    assert study.pareto_front == exp_front
+    assert [t["value"] for t in storage.iter_trials("mo")] == [[3, 2], [3, 3]]
+    mock_algorithm.optimize.assert_not_called()
+
+    # Single-objective properties are not defined, and the directions are restored on resume
+    with pytest.raises(AttributeError):
+        _ = study.best_value
+    resumed = Study(seed=42, algorithm=mock_algorithm, storage=storage, study_name="mo")
+    assert resumed.results == exp_front
+    assert resumed._directions == [1, -1]
+
+
+def test_pareto_front():
+    # Mock dependencies
+    mock_algorithm = create_autospec(GMAB, instance=True)
+    study = Study(seed=42, algorithm=mock_algorithm)  # seeding to avoid warning log
+    study._directions = [1, -1]
+    study.results = [
+        {"value": [1.0, 1.0], "params": {"x": 1}},
+        {"value": [2.0, 3.0], "params": {"x": 2}},
+        {"value": [2.0, 2.0], "params": {"x": 3}},  # dominated by x=2
+        {"value": [3.0, 3.0], "params": {"x": 4}},  # dominated by x=2
+    ]
+
+    assert [r["params"]["x"] for r in study.pareto_front] == [1, 2]
+
+
 @pytest.mark.parametrize(
     "direction, best_solution, best_params, best_value, mean_value",
     [
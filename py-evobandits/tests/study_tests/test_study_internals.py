@@ -12,10 +12,16 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import math
+import threading
+import time
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
 from random import Random
 
+import numpy as np
 import pytest
-from evobandits import CategoricalParam, IntParam
+from evobandits import CategoricalParam, FloatParam, IntParam
+from evobandits.storages import SQLiteStorage
 from evobandits.study.study import Study
 
 
@@ -69,6 +75,19 @@ def test_decode(params, action_vector, exp_solution):
     assert solution == exp_solution
 
 
+def test_is_feasible():
+    # Mock or patch dependencies
+    study = Study(seed=42)  # with seed to avoid warning logs
+    study._params = {"a": IntParam(0, 1, 2), "b": CategoricalParam([False, True])}
+    study._predicates = [lambda a, b: sum(a) <= 1, lambda a, b: b or a[0] == 0]
+
+    # Verify if all predicates are checked with the decoded parameter values
+    assert study._is_feasible([0, 1, 0])
+    assert study._is_feasible([1, 0, 1])
+    assert not study._is_feasible([1, 1, 1])
+    assert not study._is_feasible([1, 0, 0])
+
+
 @pytest.mark.parametrize(
     "params, action_vector, exp_result, kwargs",
     [
@@ -97,6 +116,244 @@ def test_evaluate(params, action_vector, exp_result, kwargs):
     assert result == exp_result
 
 
+def test_evaluate_batch():
+    # Mock or patch dependencies
+    def dummy_objective(a: list):
+        return -sum(a) * 0.5
+
+    study = Study(seed=42)  # with seed to avoid warning logs
+    study._params = {"a": IntParam(0, 1, 2)}
+    study._objective = dummy_objective
+
+    # Verify if study evaluates the batch in order, using the executor
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        study._executor = executor
+        result = study._evaluate_batch([[0, 1], [1, 1], [0, 0]])
+    assert result == [-0.5, -1.0, 0.0]
+
+    # Verify if the batch of trials was saved to the storage
+    trials = list(study.storage.iter_trials(study.study_name))
+    assert [t["action_vector"] for t in trials] == [[0, 1], [1, 1], [0, 0]]
+    assert [t["params"] for t in trials] == [{"a": [0, 1]}, {"a": [1, 1]}, {"a": [0, 0]}]
+    assert [t["value"] for t in trials] == [-0.5, -1.0, 0.0]
+
+
+def test_evaluate_batch_with_batched_objective():
+    # Mock or patch dependencies
+    def dummy_objective(solutions: list[dict]):
+        return [-sum(solution["a"]) * 0.5 for solution in solutions]
+
+    study = Study(seed=42)  # with seed to avoid warning logs
+    study._params = {"a": IntParam(0, 1, 2)}
+    study._objective = dummy_objective
+    study._batched = True
+
+    # Verify if study passes the whole batch to the objective
+    result = study._evaluate_batch([[0, 1], [1, 1], [0, 0]])
+    assert result == [-0.5, -1.0, 0.0]
+
+
+def test_evaluate_batch_with_param_space():
+    # Mock or patch dependencies
+    def dummy_objective(columns: dict[str, np.ndarray]):
+        a, b, c = columns["a"], columns["b"], columns["c"]
+        assert a.dtype.kind == "i" and a.shape == (3, 2)
+        assert b.dtype.kind == "f" and b.shape == (3,)
+        return list(a.sum(axis=1) * b + (c == "y"))
+
+    params = {
+        "a": IntParam(0, 1, 2),
+        "b": FloatParam(0, 1, n_steps=2),
+        "c": CategoricalParam(["x", "y"]),
+    }
+    study = Study(seed=42)  # with seed to avoid warning logs
+    study._params = params
+    study._space = study._build_space()
+    study._objective = dummy_objective
+    study._batched = "columns"
+
+    # Verify if the native ParamSpace decodes the batch like the params, column by column
+    action_vectors = [[0, 1, 2, 0], [1, 1, 1, 1], [0, 0, 0, 1]]
+    assert study._collect_bounds() == [(0, 1), (0, 1), (0, 2), (0, 1)]
+    assert study._decode_batch(action_vectors) == {
+        "a": [[0, 1], [1, 1], [0, 0]],
+        "b": [1.0, 0.5, 0.0],
+        "c": ["x", "y", "y"],
+    }
+    assert study._evaluate_batch(action_vectors) == [1.0, 2.0, 1.0]
+
+
+@pytest.mark.parametrize(
+    "on_timeout, exp_result, exp_saved",
+    [
+        ["discard", [0.0, math.nan, 2.0], [0.0, 2.0]],
+        [100.0, [0.0, 100.0, 2.0], [0.0, 100.0, 2.0]],
+        ["retry", [0.0, math.nan, 2.0], [0.0, 2.0]],
+    ],
+    ids=["discard", "penalty", "retry"],
+)
+def test_evaluate_batch_with_timeout(on_timeout, exp_result, exp_saved):
+    # Mock or patch dependencies
+    calls = []
+    release = threading.Event()
+
+    def dummy_objective(a: int):
+        calls.append(a)
+        if a == 1:
+            release.wait(timeout=10)  # a trial that hangs
+        return float(a)
+
+    study = Study(seed=42)  # with seed to avoid warning logs
+    study._params = {"a": IntParam(0, 2)}
+    study._objective = dummy_objective
+    study._timeout = 0.2
+    study._on_timeout = on_timeout
+
+    # Verify if the batch completes despite the hanging trial, and applies the policy
+    with ThreadPoolExecutor(max_workers=3) as executor:
+        study._executor = executor
+        result = study._evaluate_batch([[0], [1], [2]])
+        release.set()
+    np.testing.assert_array_equal(result, exp_result)
+    assert [t["value"] for t in study.storage.iter_trials(study.study_name)] == exp_saved
+    assert calls.count(1) == (2 if on_timeout == "retry" else 1)
+    assert study._batch_costs()[1] >= 0.2  # the time until the trial timed out
+
+
+@pytest.mark.parametrize("on_timeout", ["discard", "retry"])
+def test_evaluate_batch_with_more_hanging_trials_than_workers(on_timeout):
+    # Mock or patch dependencies
+    release = threading.Event()
+
+    def dummy_objective(a: int):
+        if a > 0:
+            release.wait(timeout=10)  # trials that hang
+        return float(a)
+
+    study = Study(seed=42)  # with seed to avoid warning logs
+    study._params = {"a": IntParam(0, 3)}
+    study._objective = dummy_objective
+    study._timeout = 0.2
+    study._on_timeout = on_timeout
+
+    # Verify if the queued trials time out once the hanging trials occupy all workers
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        study._executor = executor
+        start = time.monotonic()
+        result = study._evaluate_batch([[1], [2], [3], [0]])
+        elapsed = time.monotonic() - start
+        assert study._n_stragglers() == 2
+        release.set()
+    np.testing.assert_array_equal(result, [math.nan, math.nan, math.nan, math.nan])
+    assert elapsed < (2.5 if on_timeout == "retry" else 1.5)  # the deadline of the generation
+    assert study._n_stragglers() == 0
+
+
+def sleeping_objective(a: int) -> float:
+    time.sleep(0.15)
+    return float(a)
+
+
+def test_evaluate_batch_with_timeout_on_process_pool():
+    study = Study(seed=42)  # with seed to avoid warning logs
+    study._params = {"a": IntParam(0, 2)}
+    study._objective = sleeping_objective
+    study._timeout = 0.25
+
+    # Verify if queued trials, which the executor reports as running, do not time out
+    with ProcessPoolExecutor(max_workers=1) as executor:
+        executor.submit(int).result()  # start the worker
+        study._executor = executor
+        result = study._evaluate_batch([[0], [1], [2]])
+    assert result == [0.0, 1.0, 2.0]
+
+
+@pytest.mark.parametrize("directions", [None, [1, -1]], ids=["single", "multi"])
+def test_evaluate_batch_discards_values_that_are_not_finite(directions):
+    # Mock or patch dependencies
+    def dummy_objective(solutions: list):
+        values = [math.nan, math.inf, 2.0]
+        if directions is None:
+            return values
+        return [math.nan, [1.0, math.inf], [2.0, 3.0]]  # a single NaN of a failed trial
+
+    study = Study(seed=42, storage=SQLiteStorage(":memory:"))
+    study._params = {"a": IntParam(0, 2)}
+    study._objective = dummy_objective
+    study._batched = True
+    study._directions = directions
+
+    # Verify if only the trial with finite values is saved, and the others are discarded
+    result = study._evaluate_batch([[0], [1], [2]])
+    exp_value = 2.0 if directions is None else [2.0, 3.0]
+    if directions is None:
+        assert math.isnan(result[0]) and math.isnan(result[1]) and result[2] == 2.0
+    else:
+        assert all(math.isnan(v) for v in result[0] + result[1]) and result[2] == [2.0, -3.0]
+    assert [t["value"] for t in study.storage.iter_trials(study.study_name)] == [exp_value]
+    assert list(study._arm_stats) == [(2,)]
+
+
+@pytest.mark.parametrize("mode", ["sequential", "executor", "batched"])
+def test_evaluate_batch_records_costs(mode):
+    # Mock or patch dependencies
+    def dummy_objective(a: int):
+        time.sleep(0.01 * a)
+        return float(a)
+
+    study = Study(seed=42)  # with seed to avoid warning logs
+    study._params = {"a": IntParam(0, 3)}
+    study._objective = dummy_objective
+    if mode == "batched":
+        study._objective = lambda solutions: [dummy_objective(**s) for s in solutions]
+        study._batched = True
+
+    # Verify if the wall time of each trial is kept for the algorithm, once per batch
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        study._executor = executor if mode == "executor" else None
+        study._evaluate_batch([[0], [3]])
+    costs = study._batch_costs()
+    assert len(costs) == 2
+    if mode == "batched":
+        assert costs[0] == costs[1] >= 0.015  # split evenly
+    else:
+        assert costs[0] < 0.03 <= costs[1]
+    with pytest.raises(KeyError):
+        study._batch_costs()
+
+
+def test_evaluate_batch_with_keyed_seeds():
+    # Mock or patch dependencies
+    def dummy_objective(a: list, seed: int):
+        return seed
+
+    def make_study():
+        study = Study(seed=42)
+        study._params = {"a": IntParam(0, 1, 2)}
+        study._objective = dummy_objective
+        study._run_seed = 7
+        return study
+
+    # Verify if the seeds only depend on the action vector and the number of its pulls
+    study = make_study()
+    seeds = study._evaluate_batch([[0, 1], [1, 1], [0, 1]])
+    assert seeds[0] != seeds[2]
+    assert study._evaluate_batch([[1, 1]])[0] != seeds[1]
+
+    other_study = make_study()
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        other_study._executor = executor
+        other_seeds = other_study._evaluate_batch([[1, 1], [0, 1]])
+    other_study._executor = None
+    other_seeds += other_study._evaluate_batch([[0, 1]])
+    assert other_seeds == [seeds[1], seeds[0], seeds[2]]
+
+    # Pulls recorded by the algorithm key the seeds, regardless of the Study's own count
+    keyed_study = make_study()
+    assert keyed_study._evaluate_batch([[0, 1], [1, 1]], pulls=[1, 0]) == [seeds[2], seeds[1]]
+    assert keyed_study._evaluate_batch([[0, 1]], pulls=[0]) == [seeds[0]]
+
+
 @pytest.mark.parametrize(
     "study, other_study, expected_eq",
     [
@@ -116,3 +373,22 @@ def test_study_seed_generator(study, other_study, expected_eq):
     # Verify seeded / unseeded behaviour
     seed_eq = seed == other_study._generate_seed()
     assert seed_eq == expected_eq
+
+
+def test_save_trials_from_several_threads(tmp_path):
+    # Islands save their batches from their own threads, which must not reuse trial ids
+    study = Study(seed=42, storage=SQLiteStorage(tmp_path / "studies.db"), study_name="s")
+    study._params = {"a": IntParam(0, 10)}
+    study.storage.create_run(
+        "s", {"run_id": 0, "seed": 1, "n_trials": 1, "n_best": 1, "maximize": False}
+    )
+
+    def save(i):
+        study._save_trials([[i]] * 50, [{"a": i}] * 50, [float(i)] * 50)
+
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        list(executor.map(save, range(8)))
+
+    trial_ids = [trial["trial_id"] for trial in study.storage.iter_trials("s")]
+    assert trial_ids == list(range(400))
+    assert all(n == 50 for n, *_ in study._arm_stats.values())
@@ -0,0 +1,34 @@
+from contextlib import nullcontext
+
+import pytest
+from evobandits import CategoricalParam, IntParam, LinearConstraint
+
+PARAMS = {"a": IntParam(0, 10, 2), "b": CategoricalParam(["x", "y"]), "c": IntParam(0, 5)}
+
+
+@pytest.mark.parametrize(
+    "coefficients, upper_bound, kwargs",
+    [
+        [{"a": 1, "c": -0.5}, 2, {"exp_encoded": ([1.0, 1.0, 0.0, -0.5], 2.0)}],
+        [{"b": 2}, 1.5, {"exp_encoded": ([0.0, 0.0, 2.0, 0.0], 1.5)}],
+        [[1, 2], 0, {"exp": pytest.raises(TypeError)}],
+        [{1: 1}, 0, {"exp": pytest.raises(TypeError)}],
+        [{"a": "1"}, 0, {"exp": pytest.raises(TypeError)}],
+        [{"a": 1}, None, {"exp": pytest.raises(TypeError)}],
+        [{"d": 1}, 0, {"exp": pytest.raises(ValueError)}],
+    ],
+    ids=[
+        "valid_int_params",
+        "valid_categorical_param",
+        "invalid_coefficients_type",
+        "invalid_key_type",
+        "invalid_coefficient_type",
+        "invalid_upper_bound_type",
+        "invalid_unknown_param",
+    ],
+)
+def test_linear_constraint(coefficients, upper_bound, kwargs):
+    expectation = kwargs.pop("exp", nullcontext())
+    with expectation:
+        constraint = LinearConstraint(coefficients, upper_bound)
+        assert constraint.encode(PARAMS) == kwargs["exp_encoded"]
@@ -0,0 +1,164 @@
+# Copyright 2025 EvoBandits
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import multiprocessing
+import socket
+import threading
+from multiprocessing.connection import Client
+
+import pytest
+from evobandits import Study
+from evobandits.distributed import Coordinator, run_worker
+
+from tests._functions import rosenbrock as rb
+
+AUTHKEY = b"evobandits"
+
+
+def start_worker_threads(coordinator, n_workers):
+    threads = [
+        threading.Thread(target=run_worker, args=(coordinator.address, AUTHKEY), daemon=True)
+        for _ in range(n_workers)
+    ]
+    for thread in threads:
+        thread.start()
+    return threads
+
+
+def test_coordinator_map():
+    with Coordinator(authkey=AUTHKEY) as coordinator:
+        start_worker_threads(coordinator, 2)
+        results = list(coordinator.map(pow, [1, 2, 3, 4], [2, 2, 2, 2]))
+
+    assert results == [1, 4, 9, 16]
+
+
+def test_coordinator_raises_objective_errors():
+    with Coordinator(authkey=AUTHKEY) as coordinator:
+        start_worker_threads(coordinator, 1)
+        future = coordinator.submit(int, "not a number")
+
+        with pytest.raises(ValueError):
+            future.result(timeout=10)
+
+
+def test_coordinator_reissues_trials_of_disconnected_workers():
+    with Coordinator(authkey=AUTHKEY) as coordinator:
+        # A faulty worker receives the trial, but disconnects without returning a result
+        faulty_worker = Client(coordinator.address, authkey=AUTHKEY)
+        future = coordinator.submit(pow, 3, 2)
+        faulty_worker.recv()
+        faulty_worker.close()
+
+        # The trial is reissued to the next worker that connects
+        start_worker_threads(coordinator, 1)
+        assert future.result(timeout=10) == 9
+
+
+def test_coordinator_fails_trials_that_disconnect_every_worker():
+    with Coordinator(authkey=AUTHKEY, max_attempts=2) as coordinator:
+        # Each worker receives the trial, but crashes without returning a result
+        future = coordinator.submit(pow, 3, 2)
+        for _ in range(2):
+            faulty_worker = Client(coordinator.address, authkey=AUTHKEY)
+            faulty_worker.recv()
+            faulty_worker.close()
+
+        with pytest.raises(RuntimeError, match="2 workers"):
+            future.result(timeout=10)
+
+
+def test_coordinator_authentication():
+    # Without a key, a random key is generated, which workers must use
+    with Coordinator() as coordinator:
+        assert len(coordinator.authkey) == 32
+        worker = threading.Thread(
+            target=run_worker, args=(coordinator.address, coordinator.authkey), daemon=True
+        )
+        worker.start()
+        assert coordinator.submit(pow, 3, 2).result(timeout=10) == 9
+
+    # Addresses that other hosts can reach require a key
+    with pytest.raises(ValueError, match="requires an authkey"):
+        Coordinator(("0.0.0.0", 0))
+    with pytest.raises(ValueError):
+        Coordinator(authkey=AUTHKEY, max_attempts=0)
+    with pytest.raises(ValueError):
+        Coordinator(authkey=AUTHKEY, handshake_timeout=0)
+
+
+def test_coordinator_rejects_silent_connections():
+    with Coordinator(authkey=AUTHKEY, handshake_timeout=0.5) as coordinator:
+        # A peer that connects, but never answers the challenge, does not keep workers out
+        silent = socket.create_connection(coordinator.address)
+        start_worker_threads(coordinator, 1)
+        assert coordinator.submit(pow, 3, 2).result(timeout=10) == 9
+
+        # Its connection is closed once the handshake times out
+        silent.settimeout(10)
+        while silent.recv(1024):
+            pass
+        silent.close()
+
+
+def test_coordinator_shutdown_while_workers_connect():
+    # Verify if leaving the context returns while a worker and a silent peer are connecting
+    coordinator = Coordinator(authkey=AUTHKEY, handshake_timeout=0.5)
+    silent = socket.create_connection(coordinator.address)
+
+    def connect():
+        try:
+            run_worker(coordinator.address, AUTHKEY)
+        except (OSError, EOFError):
+            pass  # the coordinator shut down during the handshake
+
+    worker = threading.Thread(target=connect, daemon=True)
+    worker.start()
+    shutdown = threading.Thread(target=coordinator.__exit__, args=(None, None, None))
+    shutdown.start()
+
+    shutdown.join(timeout=5)
+    assert not shutdown.is_alive()
+    worker.join(timeout=5)
+    assert not worker.is_alive()
+    silent.close()
+
+
+def test_coordinator_rejects_submit_after_shutdown():
+    coordinator = Coordinator(authkey=AUTHKEY)
+    coordinator.shutdown()
+
+    with pytest.raises(RuntimeError):
+        coordinator.submit(pow, 3, 2)
+
+
+def test_study_with_worker_processes():
+    n_trials = 100
+    with Coordinator(authkey=AUTHKEY) as coordinator:
+        workers = [
+            multiprocessing.Process(target=run_worker, args=(coordinator.address, AUTHKEY))
+            for _ in range(2)
+        ]
+        for worker in workers:
+            worker.start()
+
+        study = Study(seed=42)
+        study.optimize(rb.function, rb.PARAMS, n_trials, executor=coordinator)
+
+    for worker in workers:
+        worker.join(timeout=10)
+        assert worker.exitcode == 0
+
+    assert len(study.results) == 1
+    assert study.best_value >= 0.0
@@ -0,0 +1,52 @@
+import subprocess
+import sys
+
+import evobandits
+import pytest
+
+IMPORT_TIME_BUDGET = 0.2  # Maximum time for `import evobandits` in seconds
+HEAVY_MODULES = ["evobandits.search", "sklearn", "numpy", "sqlite3"]
+
+
+def run_python(code: str) -> str:
+    # Imports are measured in a fresh interpreter, since this process has imported everything
+    return subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", code],
+        capture_output=True,
+        text=True,
+        check=True,
+    ).stderr
+
+
+def test_import_is_lazy():
+    stderr = run_python("import evobandits")
+    imported = {line.rsplit("|", 1)[-1].strip() for line in stderr.splitlines()}
+    assert not imported.intersection(HEAVY_MODULES)
+
+
+def test_import_time_budget():
+    def import_time() -> float:
+        stderr = run_python("import evobandits")
+        line = next(line for line in stderr.splitlines() if line.endswith("| evobandits"))
+        return int(line.split("|")[1]) / 1e6  # Cumulative import time in microseconds
+
+    # Use the best of several runs to reduce the noise from the system
+    assert min(import_time() for _ in range(3)) < IMPORT_TIME_BUDGET
+
+
+def test_lazy_attributes():
+    from evobandits.storages.sqlite_storage import SQLiteStorage
+
+    assert evobandits.SQLiteStorage is SQLiteStorage
+    assert "SQLiteStorage" in dir(evobandits)
+
+    with pytest.raises(AttributeError):
+        evobandits.UnknownAttribute  # noqa: B018
+
+
+def test_lazy_search_cv():
+    pytest.importorskip("sklearn")
+    from evobandits.search import EvoBanditsSearchCV
+
+    assert evobandits.EvoBanditsSearchCV is EvoBanditsSearchCV
+    assert "EvoBanditsSearchCV" in evobandits.__all__
@@ -0,0 +1,60 @@
+import math
+import os
+import stat
+
+import pytest
+from evobandits.metrics import format_metrics, write_metrics
+
+PROGRESS = {
+    "n_trials": 100,
+    "used_trials": 40,
+    "n_generations": 1,
+    "elapsed": 2.0,
+    "trials_per_second": 20.0,
+    "best_value": math.nan,
+    "best_value_ci": (math.nan, math.nan),
+    "best_n_evaluations": 0,
+    "n_arms": 30,
+    "n_new_arms": 30,
+    "n_repulls": 10,
+    "repull_ratio": 0.25,
+    "phase_times": {"breeding": 0.5, "evaluation": 1.25, "update": math.inf},
+}
+
+
+def test_format_metrics():
+    lines = format_metrics(PROGRESS, {"study": 'a "b"\n'}).splitlines()
+
+    # Each gauge is described, and each sample is labeled
+    assert "# TYPE evobandits_trials_used gauge" in lines
+    assert 'evobandits_trials_used{study="a \\"b\\"\\n"} 40.0' in lines
+    assert 'evobandits_repull_ratio{study="a \\"b\\"\\n"} 0.25' in lines
+    assert 'evobandits_best_value{study="a \\"b\\"\\n"} NaN' in lines
+    assert 'evobandits_best_value_ci{study="a \\"b\\"\\n",bound="upper"} NaN' in lines
+    assert 'evobandits_phase_seconds{study="a \\"b\\"\\n",phase="update"} +Inf' in lines
+    assert all(line.startswith(("# ", "evobandits_")) for line in lines)
+
+    # Without labels, the samples have none
+    assert "evobandits_arms 30.0" in format_metrics(PROGRESS).splitlines()
+
+
+def test_write_metrics(tmp_path):
+    path = tmp_path / "evobandits.prom"
+    path.write_text("stale")
+    write_metrics(path, PROGRESS, {"study": "s"})
+
+    # The file is replaced, without leaving temporary files behind
+    assert path.read_text() == format_metrics(PROGRESS, {"study": "s"})
+    assert [p.name for p in tmp_path.iterdir()] == ["evobandits.prom"]
+
+    with pytest.raises(OSError):
+        write_metrics(tmp_path / "missing" / "evobandits.prom", PROGRESS)
+
+
+@pytest.mark.skipif(os.name == "nt", reason="File modes are not supported on Windows.")
+def test_write_metrics_is_readable_by_all_users(tmp_path):
+    path = tmp_path / "evobandits.prom"
+    write_metrics(path, PROGRESS)
+
+    # Temporary files are created with mode 0o600, which would hide the file from a scraper
+    assert stat.S_IMODE(path.stat().st_mode) == 0o644
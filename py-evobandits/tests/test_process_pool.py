@@ -0,0 +1,163 @@
+# Copyright 2025 EvoBandits
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import io
+import math
+import sys
+import time
+from pathlib import Path
+
+import pytest
+from evobandits import SQLiteStorage, Study
+from evobandits.process_pool import ProcessPool, read_frame, serve, write_frame
+
+from tests._functions import rosenbrock as rb
+
+SIMULATOR = [sys.executable, str(Path(__file__).parent / "_functions" / "simulator.py")]
+
+
+def test_frames():
+    stream = io.BytesIO()
+    write_frame(stream, [1.0, -2.5])
+    write_frame(stream, [])
+    stream.write(b"\x01\x00")  # an incomplete frame
+
+    stream.seek(0)
+    assert read_frame(stream) == [1.0, -2.5]
+    assert read_frame(stream) == []
+    assert read_frame(stream) is None
+
+
+def test_serve():
+    requests = io.BytesIO()
+    write_frame(requests, [1.0, 2.0])
+    write_frame(requests, [3.0, 4.0])
+    requests.seek(0)
+
+    responses = io.BytesIO()
+    assert serve(lambda x, y: [x + y, x * y], requests, responses) == 2
+
+    responses.seek(0)
+    assert read_frame(responses) == [3.0, 2.0]
+    assert read_frame(responses) == [7.0, 12.0]
+
+
+def test_process_pool():
+    solutions = [{"number": [x, x + 1]} for x in range(-5, 6)]
+
+    # Verify if the workers evaluate the trials in order
+    with ProcessPool(SIMULATOR, n_workers=3) as pool:
+        values = pool(solutions)
+        pids = [worker.pid for worker in pool._workers]
+        assert pool(solutions) == values
+        assert [worker.pid for worker in pool._workers] == pids  # the workers were reused
+    assert values == [rb.function(solution["number"]) for solution in solutions]
+    assert pool._workers == []
+
+
+def test_process_pool_restarts_failed_workers():
+    # By default, the trial of a crashed worker is discarded, and the batch continues
+    with ProcessPool(SIMULATOR, n_workers=1) as pool:
+        values = pool([{"x": 1, "y": 1}, {"x": float("nan"), "y": 0}, {"x": 1, "y": 1}])
+        assert values[0] == values[2] == 0.0
+        assert math.isnan(values[1])
+
+    with ProcessPool(SIMULATOR, n_workers=1, on_crash="raise") as pool:
+        with pytest.raises(RuntimeError, match="exited with code 3"):
+            pool([{"x": float("nan"), "y": 0}])
+
+        # The worker was restarted, and evaluates the next trials
+        assert pool([{"x": 1, "y": 1}]) == [0.0]
+
+
+def test_process_pool_with_crashes_only():
+    # A trial of a crashed worker is a single NaN, which the Study sizes to its objectives
+    with ProcessPool(SIMULATOR, n_workers=2) as pool:
+        values = pool([{"x": float("nan"), "y": 0}] * 3)
+    assert len(values) == 3 and all(math.isnan(value) for value in values)
+
+
+def test_process_pool_restarts_workers_that_time_out():
+    with ProcessPool(SIMULATOR + ["--hang"], n_workers=1, trial_timeout=0.5) as pool:
+        start = time.monotonic()
+        values = pool([{"x": float("nan"), "y": 0}, {"x": 1, "y": 1}])
+        assert time.monotonic() - start < 10
+        assert math.isnan(values[0]) and values[1] == 0.0
+
+    with ProcessPool(
+        SIMULATOR + ["--hang"], n_workers=1, trial_timeout=0.5, on_crash="raise"
+    ) as p:
+        with pytest.raises(RuntimeError, match="timed out after 0.5s"):
+            p([{"x": float("nan"), "y": 0}])
+
+
+def test_process_pool_fails_if_workers_cannot_be_restarted(tmp_path):
+    with ProcessPool(SIMULATOR, n_workers=1) as pool:
+        pool.command = [str(tmp_path / "missing")]
+        with pytest.raises(RuntimeError, match="Failed to start a worker"):
+            pool([{"x": float("nan"), "y": 0}])
+
+
+@pytest.mark.parametrize(
+    "kwargs, expectation",
+    [
+        [{"command": "simulator"}, pytest.raises(TypeError)],
+        [{"command": []}, pytest.raises(ValueError)],
+        [{"command": SIMULATOR, "n_workers": 1.5}, pytest.raises(TypeError)],
+        [{"command": SIMULATOR, "n_workers": 0}, pytest.raises(ValueError)],
+        [{"command": SIMULATOR, "on_crash": "ignore"}, pytest.raises(ValueError)],
+        [{"command": SIMULATOR, "trial_timeout": 0}, pytest.raises(ValueError)],
+    ],
+    ids=[
+        "command_str",
+        "command_empty",
+        "n_workers_type",
+        "n_workers_value",
+        "on_crash_value",
+        "trial_timeout_value",
+    ],
+)
+def test_process_pool_validation(kwargs, expectation):
+    with expectation:
+        ProcessPool(**kwargs)
+
+
+def test_process_pool_rejects_non_numeric_values():
+    pool = ProcessPool(SIMULATOR, n_workers=1)
+    with pytest.raises(TypeError):
+        pool([{"x": "a", "y": 1}])
+    assert pool._workers == []  # no worker was started
+
+
+def test_study_with_process_pool():
+    with ProcessPool(SIMULATOR, n_workers=2) as pool:
+        study = Study(seed=42)
+        study.optimize(pool, rb.PARAMS, 100, batched=True)
+
+    assert len(study.results) == 1
+    assert study.best_value >= 0.0
+
+
+def test_study_with_crashing_process_pool(tmp_path):
+    # Trials of crashed workers are neither saved nor counted, and the Study completes
+    storage = SQLiteStorage(tmp_path / "studies.db")
+    with ProcessPool(SIMULATOR + ["--crash-above", "5"], n_workers=2) as pool:
+        study = Study(seed=42, storage=storage)
+        study.optimize(pool, rb.PARAMS, 100, batched=True)
+
+    trials = list(storage.iter_trials(study.study_name))
+    assert trials and all(trial["params"]["number"][0] <= 5 for trial in trials)
+    arms = list(storage.iter_arms(study.study_name))
+    assert all(math.isfinite(arm["value"]) for arm in arms)
+    assert study.best_params["number"][0] <= 5
@@ -0,0 +1,109 @@
+from contextlib import nullcontext
+
+import numpy as np
+import pytest
+
+pytest.importorskip("sklearn")
+
+from evobandits import Arm, CategoricalParam, FloatParam, IntParam  # noqa: E402
+from evobandits.search import EvoBanditsSearchCV  # noqa: E402
+from sklearn.datasets import load_iris  # noqa: E402
+from sklearn.neighbors import KNeighborsClassifier  # noqa: E402
+
+
+class BatchGMAB:
+    """Mock algorithm that evaluates fixed batches of action vectors."""
+
+    def __init__(self, batches, best):
+        self.batches = batches
+        self.best = best
+
+    def clone(self):
+        return self
+
+    def optimize(self, objective, bounds, n_trials, n_best, seed, batched=False, **kwargs):
+        assert batched
+        self.values = [objective(batch) for batch in self.batches]
+        return [Arm(self.best)]
+
+
+def test_search_evaluates_batches():
+    X, y = load_iris(return_X_y=True)
+    algorithm = BatchGMAB([[[1], [5], [5]], [[5], [9]]], best=[9])
+    search = EvoBanditsSearchCV(
+        KNeighborsClassifier(), {"n_neighbors": (1, 15)}, cv=3, seed=42, algorithm=algorithm
+    )
+    search.fit(X, y)
+
+    # Each candidate is evaluated once, and the best one is not evaluated again
+    params = [p["n_neighbors"] for p in search.cv_results_["params"]]
+    assert params == [1, 5, 9]
+
+    # The cached scores are mapped back to the action vectors of each batch
+    scores = dict(zip(params, search.cv_results_["mean_test_score"], strict=True))
+    assert algorithm.values[0] == pytest.approx([-scores[1], -scores[5], -scores[5]])
+    assert algorithm.values[1] == pytest.approx([-scores[5], -scores[9]])
+    assert search.study_.results[0]["params"] == {"n_neighbors": 9}
+
+
+def test_search_evaluates_splits_incrementally():
+    X, y = load_iris(return_X_y=True)
+    algorithm = BatchGMAB([[[1], [5]], [[1]], [[1], [5]], [[1]]], best=[1])
+    search = EvoBanditsSearchCV(
+        KNeighborsClassifier(),
+        {"n_neighbors": (1, 15)},
+        cv=3,
+        seed=42,
+        algorithm=algorithm,
+        incremental=True,
+    )
+    search.fit(X, y)
+
+    # Each pull of an arm evaluates the next split, and cycles once all splits are evaluated
+    split_scores = [-values[0] for values in algorithm.values]
+    assert split_scores[3] == split_scores[0]
+
+    # Only the best candidate is cross-validated in full, matching the mean of its splits
+    assert search.cv_results_["params"] == [{"n_neighbors": 1}]
+    assert search.best_score_ == pytest.approx(np.mean(split_scores[:3]))
+
+
+@pytest.mark.parametrize(
+    "param_distributions, kwargs",
+    [
+        [{"n_neighbors": (1, 50)}, {}],
+        [
+            {
+                "n_neighbors": IntParam(1, 50),
+                "weights": CategoricalParam(["uniform", "distance"]),
+                "p": FloatParam(1.0, 2.0),
+            },
+            {},
+        ],
+        [{"n_neighbors": (1, 50)}, {"incremental": True, "cv": 5}],
+        [{"n_neighbors": [1, 50]}, {"exp": pytest.raises(TypeError)}],
+        [
+            {"n_neighbors": (1, 50)},
+            {"incremental": True, "scoring": ["accuracy"], "exp": pytest.raises(ValueError)},
+        ],
+    ],
+    ids=[
+        "valid_int_bounds",
+        "valid_mixed_params",
+        "valid_incremental",
+        "invalid_param_type",
+        "invalid_incremental_scoring",
+    ],
+)
+def test_search(param_distributions, kwargs):
+    X, y = load_iris(return_X_y=True)
+    expectation = kwargs.pop("exp", nullcontext())
+    with expectation:
+        search = EvoBanditsSearchCV(
+            KNeighborsClassifier(), param_distributions, n_trials=40, seed=42, **kwargs
+        )
+        search.fit(X, y)
+
+        assert search.best_params_.keys() == param_distributions.keys()
+        assert 1 <= len(search.cv_results_["params"]) <= 40
+        assert len(search.study_.results) == 1